@@ -0,0 +1,8 @@
+from vedro import scenario
+
+def update_user():
+    print("User updated")
+
+@scenario("update user")
+def _():
+    pass
\ No newline at end of file
@@ -0,0 +1,5 @@
+from vedro import scenario
+
+@scenario
+def _():
+    pass
\ No newline at end of file
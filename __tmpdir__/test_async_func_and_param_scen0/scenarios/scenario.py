@@ -0,0 +1,10 @@
+
+from vedro import scenario, params
+
+@scenario
+async def create_user():
+    return 0
+
+@scenario([params(1), params(2)])
+async def update_user(idx):
+    return idx
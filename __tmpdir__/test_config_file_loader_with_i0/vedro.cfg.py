@@ -0,0 +1,3 @@
+import vedro
+class Cfg(vedro.Config):
+    pass
\ No newline at end of file
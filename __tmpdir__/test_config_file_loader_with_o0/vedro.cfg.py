@@ -0,0 +1,5 @@
+import vedro
+class LocalConfig:
+    pass
+class Config(vedro.Config):
+    pass
\ No newline at end of file
@@ -0,0 +1,2 @@
+class Config:
+    pass
\ No newline at end of file
@@ -0,0 +1,21 @@
+
+from vedro.core import set_scenario_meta
+from vedro.plugins.functioner import FunctionerPlugin
+
+def scenario_decorator(key, value):
+    def wrapper(scn):
+        set_scenario_meta(scn, key, value, plugin=FunctionerPlugin)
+        return scn
+    return wrapper
+
+from vedro import scenario, params
+
+@scenario[
+    scenario_decorator("decorated1", 1),
+    scenario_decorator("decorated2", 2)
+]([
+    params('Bob'),
+    params('Alice')
+])
+def create_user(name):
+    pass
@@ -0,0 +1,3 @@
+from vedro import scenario
+
+scenario()(len)
\ No newline at end of file
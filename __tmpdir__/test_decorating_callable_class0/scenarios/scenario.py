@@ -0,0 +1,9 @@
+from vedro import scenario
+
+class MyCallable:
+    def __call__(self):
+        pass
+
+obj = MyCallable()
+
+scenario()(obj)
\ No newline at end of file
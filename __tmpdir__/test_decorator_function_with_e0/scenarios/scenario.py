@@ -0,0 +1,6 @@
+from vedro import scenario
+
+def fn():
+    pass
+
+scenario()(fn, "extra_arg")
\ No newline at end of file
@@ -0,0 +1,9 @@
+from vedro import scenario
+
+@scenario
+def create_user():
+    pass
+
+@scenario
+def create_user():
+    pass
\ No newline at end of file
@@ -0,0 +1,9 @@
+from vedro import scenario
+
+@scenario("update user")
+def _():
+    pass
+
+@scenario("update user")
+def _():
+    pass
\ No newline at end of file
@@ -0,0 +1,5 @@
+from vedro import scenario, params
+
+@scenario()
+def create_user():
+    pass
\ No newline at end of file
@@ -0,0 +1,3 @@
+
+def main():
+  1 / 0
\ No newline at end of file
@@ -0,0 +1,3 @@
+from another_module.__main__ import call_nested
+def call_another():
+  call_nested()
\ No newline at end of file
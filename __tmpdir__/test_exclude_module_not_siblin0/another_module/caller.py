@@ -0,0 +1,3 @@
+from another_module2.nested import do_smth
+def call_another():
+  do_smth()
\ No newline at end of file
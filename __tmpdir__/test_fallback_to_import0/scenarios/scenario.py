@@ -0,0 +1,9 @@
+
+import vedro
+from enum import Enum
+
+class Tag(Enum):
+    API = "API"
+
+class Scenario(vedro.Scenario):
+    tags = [Tag.API]
@@ -0,0 +1,3 @@
+
+def do_smth():
+  __tracebackhide__ = True; 1 / 0
\ No newline at end of file
@@ -0,0 +1,5 @@
+from vedro import scenario
+@scenario
+def create_user():
+    """Create a user scenario."""
+    pass
\ No newline at end of file
@@ -0,0 +1,5 @@
+from vedro import scenario
+
+@scenario()
+def _fn():
+    pass
\ No newline at end of file
@@ -0,0 +1,5 @@
+from vedro import scenario
+
+@scenario("subject")
+def _fn():
+    pass
\ No newline at end of file
@@ -0,0 +1,4 @@
+
+import vedro
+class TestScenario(vedro.Scenario):
+    pass
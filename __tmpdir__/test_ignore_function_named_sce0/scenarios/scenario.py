@@ -0,0 +1,6 @@
+
+import vedro
+class UserScenario(vedro.Scenario):
+    pass
+def Scenario():
+    pass
@@ -0,0 +1,3 @@
+
+def fn():
+    assert 1 == 2
@@ -0,0 +1,5 @@
+from vedro import scenario
+
+@scenario(cases="not_a_list")
+def create_user():
+    pass
\ No newline at end of file
@@ -0,0 +1,5 @@
+from vedro import scenario
+
+@scenario(123)
+def create_user():
+    pass
\ No newline at end of file
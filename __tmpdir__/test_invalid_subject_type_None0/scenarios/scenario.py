@@ -0,0 +1,5 @@
+from vedro import scenario
+
+@scenario(subject=None)
+def create_user():
+    pass
\ No newline at end of file
@@ -0,0 +1,12 @@
+
+import vedro
+class Scenario(vedro.Scenario):
+    subject = "register {user}"
+
+    @vedro.params("Bob")
+    @vedro.params[vedro.skip]("Alice")
+    def __init__(self, user):
+        pass
+
+    def given(self):
+        pass
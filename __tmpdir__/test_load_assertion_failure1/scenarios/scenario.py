@@ -0,0 +1,5 @@
+
+import vedro
+class Scenario(vedro.Scenario):
+    def step(self):
+        assert 1 == 2
@@ -0,0 +1,7 @@
+
+from __future__ import annotations
+
+import vedro
+class Scenario(vedro.Scenario):
+    def step(self):
+        assert 1 == 2
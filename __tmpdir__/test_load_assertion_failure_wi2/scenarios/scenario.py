@@ -0,0 +1,10 @@
+
+"""
+Module docstring
+"""
+from __future__ import annotations
+
+import vedro
+class Scenario(vedro.Scenario):
+    def step(self):
+        assert 1 == 2
@@ -0,0 +1,12 @@
+
+import vedro
+class Scenario(vedro.Scenario):
+    def __init__(self):
+        self.calls = []
+
+    def value(self, val):
+        self.calls.append(val)
+        return val
+
+    def step(self):
+        assert self.value(1) < self.value(2) < self.value(2), self.value("msg")
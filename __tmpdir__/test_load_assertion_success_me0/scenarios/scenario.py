@@ -0,0 +1,6 @@
+
+import vedro
+class Scenario(vedro.Scenario):
+    def step(self):
+        for row in [{"id": 1}, {"id": 2}]:
+            assert row["id"] in (1, 2), 1 / 0
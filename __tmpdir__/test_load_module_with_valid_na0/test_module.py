@@ -0,0 +1 @@
+x = 42
\ No newline at end of file
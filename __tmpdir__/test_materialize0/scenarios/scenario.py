@@ -0,0 +1,14 @@
+
+import vedro
+from vedro import params
+
+class Scenario(vedro.Scenario):
+    subject = "get status {status}"
+
+    @params(200)
+    @params(404)
+    def __init__(self, status):
+        self.status = status
+
+    def then(self):
+        pass
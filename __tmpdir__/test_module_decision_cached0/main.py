@@ -0,0 +1,3 @@
+from another_module.__main__ import do_smth
+def main():
+  do_smth()
\ No newline at end of file
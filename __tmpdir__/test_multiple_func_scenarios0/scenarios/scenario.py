@@ -0,0 +1,8 @@
+
+from vedro import scenario
+@scenario
+def create_user():
+    pass
+@scenario
+def update_user():
+    pass
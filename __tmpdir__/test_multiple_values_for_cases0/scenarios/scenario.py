@@ -0,0 +1,5 @@
+from vedro import scenario, params
+
+@scenario([params(1)], cases=[params(2)])
+def create_user(idx):
+    pass
\ No newline at end of file
@@ -0,0 +1,5 @@
+from vedro import scenario
+
+@scenario("positional_subject", subject="keyword_subject")
+def create_user():
+    pass
\ No newline at end of file
@@ -0,0 +1,3 @@
+import json
+def main():
+  json.loads('...')
\ No newline at end of file
@@ -0,0 +1,3 @@
+from another_module.nested import do_smth
+def call_nested():
+  do_smth()
\ No newline at end of file
@@ -0,0 +1,4 @@
+
+import vedro
+class Scenario(vedro.Scenario):
+    pass
@@ -0,0 +1,8 @@
+from vedro import scenario, params
+
+@scenario([
+    params(1),
+    params(2),
+])
+def create_user(idx: int):
+    pass
\ No newline at end of file
@@ -0,0 +1,8 @@
+
+from vedro import scenario, params
+@scenario([
+    params(1),
+    params(2),
+])
+def create_user(user_id):
+    pass
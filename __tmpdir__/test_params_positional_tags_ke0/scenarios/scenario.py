@@ -0,0 +1,5 @@
+from vedro import scenario, params
+
+@scenario([params(idx=1)], tags={"API"})
+def create_user(idx: int):
+    pass
\ No newline at end of file
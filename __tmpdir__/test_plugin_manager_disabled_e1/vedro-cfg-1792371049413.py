@@ -0,0 +1,10 @@
+import vedro
+import vedro.plugins.tagger
+
+
+class Config(vedro.Config):
+
+    class Plugins(vedro.Config.Plugins):
+
+        class Tagger(vedro.plugins.tagger.Tagger):
+            enabled = False
@@ -0,0 +1,5 @@
+
+from vedro import scenario
+@scenario
+def _create_user():
+    pass
@@ -0,0 +1,12 @@
+
+import vedro
+raise RuntimeError("must not be imported")
+
+@vedro.skip("reason")
+class Scenario(vedro.Scenario):
+    """Scenario doc"""
+    subject = "register user"
+    tags = ["API"]
+
+    def given(self):
+        pass
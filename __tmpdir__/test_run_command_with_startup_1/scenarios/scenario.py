@@ -0,0 +1 @@
+raise RuntimeError('boom')
\ No newline at end of file
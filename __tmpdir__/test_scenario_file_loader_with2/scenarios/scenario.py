@@ -0,0 +1,6 @@
+
+import vedro
+class User:
+    pass
+class Scenario(vedro.Scenario):
+    pass
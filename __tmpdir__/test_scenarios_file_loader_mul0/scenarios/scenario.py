@@ -0,0 +1,6 @@
+
+import vedro
+class CreateUserScenario(vedro.Scenario):
+    pass
+class UpdatedUserScenario(vedro.Scenario):
+    pass
@@ -0,0 +1,8 @@
+from vedro import scenario
+
+def update_user():
+    print("User updated")
+
+@scenario()
+def update_user():
+    pass
\ No newline at end of file
@@ -0,0 +1,4 @@
+
+import vedro
+class ScenarioTmp(vedro.Scenario):
+    pass
@@ -0,0 +1,4 @@
+
+import vedro
+class Scenario_1(vedro.Scenario):
+    pass
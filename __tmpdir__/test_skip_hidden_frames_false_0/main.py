@@ -0,0 +1,3 @@
+from some_module.caller import call_another
+def main():
+  call_another()
\ No newline at end of file
@@ -0,0 +1,3 @@
+
+def do_smth():
+  __traceback_hide__ = True; 1 / 0
\ No newline at end of file
@@ -0,0 +1,3 @@
+from another_module.__main__ import do_smth
+def call_another():
+  do_smth()
\ No newline at end of file
@@ -0,0 +1,4 @@
+import vedro as v
+@v.scenario()
+def create_user():
+    pass
\ No newline at end of file
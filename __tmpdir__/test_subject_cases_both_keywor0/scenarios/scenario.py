@@ -0,0 +1,8 @@
+from vedro import scenario, params
+
+@scenario(subject="create user", cases=[
+    params(idx=1),
+    params(idx=2),
+])
+def _(idx: int):
+    pass
\ No newline at end of file
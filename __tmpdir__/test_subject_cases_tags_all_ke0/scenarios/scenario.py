@@ -0,0 +1,5 @@
+from vedro import scenario, params
+
+@scenario(subject="create user", cases=[params(idx=1)], tags={"API"})
+def _(idx: int):
+    pass
\ No newline at end of file
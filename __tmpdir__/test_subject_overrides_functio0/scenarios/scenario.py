@@ -0,0 +1,8 @@
+from vedro import scenario
+
+@scenario("create user")
+def create_user_with_name():
+    pass
+
+# Access the function to ensure object with name 'create_user_with_name' still exists
+print(create_user_with_name)
\ No newline at end of file
@@ -0,0 +1,5 @@
+from vedro import scenario, params
+
+@scenario("create user")
+def _():
+    pass
\ No newline at end of file
@@ -0,0 +1,5 @@
+from vedro import scenario, params
+
+@scenario("create user", cases=[params(idx=1)], tags={"API", "P0"})
+def _(idx: int):
+    pass
\ No newline at end of file
@@ -0,0 +1,5 @@
+from vedro import scenario, params
+
+@scenario("subject", [params(1), params(2)], "extra")
+def create_user():
+    pass
\ No newline at end of file
@@ -0,0 +1,5 @@
+from vedro import scenario, params
+
+@scenario(123, [params(1), params(2)])
+def create_user(idx):
+    pass
\ No newline at end of file
@@ -0,0 +1,4 @@
+
+from vedro import scenario
+def create_user():
+    pass
@@ -0,0 +1,5 @@
+from vedro import scenario
+
+@scenario(unexpected="value", another="arg")
+def create_user():
+    pass
\ No newline at end of file
@@ -0,0 +1,63 @@
+"""
+Benchmark passing assertions rewritten by the assert rewriter.
+
+Runs a loop of passing asserts (as in data-validation scenarios) in three forms:
+plain Python asserts, one AssertionTool call per assert (the former rewriting),
+and the current rewriting (inline checks calling AssertionTool only on failure).
+
+Usage:
+    python3 benchmarks/bench_assert_rewriter.py [--asserts 1000000]
+"""
+import ast
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import Any, Callable, Dict, List
+
+from vedro.plugins.assert_rewriter import AssertRewriterLoader, NodeAssertRewriter, assert_
+
+SOURCE = """
+def validate(rows, expected_status):
+    for row in rows:
+        assert row["status"] == expected_status
+        assert row["id"] > 0
+"""
+
+CALL_SOURCE = """
+def validate(rows, expected_status):
+    for row in rows:
+        assert_.assert_equal(row["status"], expected_status)
+        assert_.assert_greater(row["id"], 0)
+"""
+
+
+def make_validate(tree: ast.Module) -> Callable[..., None]:
+    namespace: Dict[str, Any] = {"assert_": assert_}
+    exec(compile(tree, "<bench>", "exec"), namespace)
+    return namespace["validate"]  # type: ignore
+
+
+def measure(validate: Callable[..., None], rows: List[Dict[str, Any]]) -> float:
+    started_at = perf_counter()
+    validate(rows, "ok")
+    return perf_counter() - started_at
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--asserts", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rows = [{"id": idx + 1, "status": "ok"} for idx in range(args.asserts // 2)]
+    rewriter = NodeAssertRewriter(AssertRewriterLoader.assert_tool,
+                                  AssertRewriterLoader.assert_methods)
+
+    print(f"{len(rows) * 2} passing asserts")
+    for name, tree in [("plain", ast.parse(SOURCE)),
+                       ("call", ast.parse(CALL_SOURCE)),
+                       ("inline", rewriter.visit(ast.parse(SOURCE)))]:
+        elapsed = measure(make_validate(tree), rows)
+        print(f"{name:<7} {elapsed * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
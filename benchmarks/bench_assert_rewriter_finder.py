@@ -0,0 +1,79 @@
+"""
+Benchmark process startup (module imports) with and without assert rewriting enabled.
+
+Each run is a fresh interpreter that optionally installs AssertRewriterFinder
+(as the AssertRewriter plugin does) and then imports a set of standard library
+and third-party modules, plus a few project modules from the rewrite directory.
+The finder is consulted on every one of those imports.
+
+Usage:
+    python3 benchmarks/bench_assert_rewriter_finder.py [--runs 10] [--modules 20]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+from argparse import ArgumentParser
+from pathlib import Path
+from statistics import median
+from typing import List
+
+LIBRARIES = ["asyncio", "json", "email.mime.multipart", "http.client", "logging.handlers",
+             "unittest.mock", "xml.etree.ElementTree", "rich.console", "rich.traceback",
+             "vedro", "vedro.plugins.director"]
+
+SCRIPT = """
+import sys
+from pathlib import Path
+from time import perf_counter
+
+started_at = perf_counter()
+if sys.argv[1] == "enabled":
+    from vedro.plugins.assert_rewriter import AssertRewriterFinder
+    sys.meta_path.insert(0, AssertRewriterFinder([Path(sys.argv[2]).resolve()]))
+
+{imports}
+print(perf_counter() - started_at)
+"""
+
+
+def make_project(project_dir: Path, modules: int) -> List[str]:
+    effects_dir = project_dir / "effects"
+    effects_dir.mkdir()
+    (effects_dir / "__init__.py").write_text("")
+    names = []
+    for idx in range(modules):
+        (effects_dir / f"effect_{idx}.py").write_text(f"def effect_{idx}(x):\n    assert x\n")
+        names.append(f"effects.effect_{idx}")
+    return names
+
+
+def run(mode: str, script: Path, project_dir: Path) -> float:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(project_dir), os.getcwd()]))
+    output = subprocess.check_output([sys.executable, str(script), mode,
+                                      str(project_dir / "effects")], env=env)
+    return float(output)
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--modules", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project_dir = Path(tmp_dir)
+        imports = "\n".join(f"import {name}" for name in LIBRARIES +
+                            make_project(project_dir, args.modules))
+        script = project_dir / "startup.py"
+        script.write_text(SCRIPT.format(imports=imports))
+
+        print(f"{len(LIBRARIES)} libraries + {args.modules} project modules, {args.runs} runs")
+        for mode in ("disabled", "enabled"):
+            timings = [run(mode, script, project_dir) for _ in range(args.runs)]
+            print(f"{mode:<9} median {median(timings) * 1000:7.1f} ms, "
+                  f"min {min(timings) * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
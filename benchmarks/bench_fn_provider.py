@@ -0,0 +1,94 @@
+"""
+Benchmark collection of parameterized function-based scenarios.
+
+Usage:
+    python3 benchmarks/bench_fn_provider.py [--cases 10000] [--descriptors 10]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+from argparse import ArgumentParser
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, List, Tuple
+
+from vedro.core import ModuleFileLoader, MonotonicScenarioRunner, VirtualScenario
+from vedro.core.scenario_collector import LazyVirtualScenario, ScenarioSource
+from vedro.plugins.functioner import FuncBasedScenarioProvider
+from vedro.plugins.functioner._step_recorder import StepRecorder
+
+
+def make_module(descriptors: int, cases: int) -> str:
+    lines = ["from vedro import scenario, params, given, when, then", ""]
+    per_descriptor = cases // descriptors
+    for idx in range(descriptors):
+        lines.append("@scenario([")
+        lines.extend(f"    params({case}, 'user_{case}')," for case in range(per_descriptor))
+        lines.append("])")
+        lines.append(f"def create_user_{idx}(user_id, name):")
+        lines.append("    with given: pass")
+        lines.append("    with when: pass")
+        lines.append("    with then: pass")
+        lines.append("")
+    return "\n".join(lines)
+
+
+async def collect(project_dir: Path, path: Path) -> List[VirtualScenario]:
+    source = ScenarioSource(path, project_dir, ModuleFileLoader())
+    return await FuncBasedScenarioProvider().provide(source)
+
+
+async def materialize(scenarios: List[VirtualScenario]) -> None:
+    for scenario in scenarios:
+        if isinstance(scenario, LazyVirtualScenario):
+            await scenario.materialize()
+
+
+def create_step_results(scenarios: List[VirtualScenario]) -> None:
+    runner = MonotonicScenarioRunner(dispatcher=None, step_recorder=StepRecorder())  # type: ignore
+    for scenario in scenarios:
+        orig_step = scenario.steps[0]._orig_step
+        for name in ("given", "when", "then"):
+            runner._create_fn_step_result(name, orig_step)
+
+
+def measure(name: str, fn: Callable[[], object]) -> Tuple[str, float]:
+    started_at = perf_counter()
+    fn()
+    return name, perf_counter() - started_at
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--cases", type=int, default=10_000)
+    parser.add_argument("--descriptors", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project_dir = Path(tmp).resolve()
+        path = project_dir / "scenarios" / "bench_scenario.py"
+        path.parent.mkdir()
+        path.write_text(make_module(args.descriptors, args.cases))
+        # Scenario modules are loaded relative to the project directory
+        os.chdir(project_dir)
+        sys.path.insert(0, str(project_dir))
+
+        scenarios: List[VirtualScenario] = []
+
+        def run_collect() -> None:
+            scenarios.extend(asyncio.run(collect(project_dir, path)))
+
+        results = [
+            measure("collect", run_collect),
+            measure("materialize", lambda: asyncio.run(materialize(scenarios))),
+            measure("step results", lambda: create_step_results(scenarios)),
+        ]
+
+    print(f"{len(scenarios)} scenarios ({args.descriptors} descriptors)")
+    for name, elapsed in results:
+        print(f"{name:>14}: {elapsed * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark local storage backends with per-scenario keys.
+
+Measures the cost of the first read and of a flush after updating a few keys,
+when the storage already holds data for many scenarios.
+
+Usage:
+    python3 benchmarks/bench_local_storage.py [--keys 50000] [--updates 100]
+"""
+import asyncio
+import tempfile
+from argparse import ArgumentParser
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from vedro.core import Plugin, PluginConfig
+from vedro.core.exp.local_storage import BaseLocalStorage, LocalStorage, SQLiteLocalStorage
+
+
+class BenchPlugin(Plugin):
+    pass
+
+
+class BenchPluginConfig(PluginConfig):
+    plugin = BenchPlugin
+
+
+def make_items(keys: int) -> Dict[str, Any]:
+    return {f"scenarios/path/scenario_{idx}.py::Scenario": {"durations": [0.1] * 20,
+                                                            "history": [idx, 32]}
+            for idx in range(keys)}
+
+
+async def measure(name: str, fn: Callable[[], Awaitable[Any]]) -> Tuple[str, float]:
+    started_at = perf_counter()
+    await fn()
+    return name, perf_counter() - started_at
+
+
+async def bench(factory: Callable[[Plugin, Path], BaseLocalStorage],
+                items: Dict[str, Any], updates: int) -> List[Tuple[str, float]]:
+    with tempfile.TemporaryDirectory() as tmp:
+        project_dir = Path(tmp).resolve()
+        plugin = BenchPlugin(BenchPluginConfig)
+
+        storage = factory(plugin, project_dir)
+        await storage.put_many(items)
+        await storage.flush()
+
+        keys = list(items)[:updates]
+        storage = factory(plugin, project_dir)
+        return [
+            await measure("first read", lambda: storage.get_many(keys)),
+            await measure("put", lambda: storage.put_many({key: [] for key in keys})),
+            await measure("flush", storage.flush),
+        ]
+
+
+async def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--keys", type=int, default=50_000)
+    parser.add_argument("--updates", type=int, default=100)
+    args = parser.parse_args()
+
+    items = make_items(args.keys)
+    print(f"{args.keys} keys stored, {args.updates} keys read and updated")
+    for backend in (LocalStorage, SQLiteLocalStorage):
+        for name, elapsed in await bench(backend, items, args.updates):
+            print(f"{backend.__name__:>18} {name:>10}: {elapsed * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,70 @@
+"""
+Benchmark rendering of assertion diffs with large operands, as done by RichPrinter.
+
+Renders PrettyDiff for long lists (with an insertion, a deletion and a change),
+for large nested payloads (with a couple of changed leaves) and for unrelated lists
+(the worst case, bounded by the time limit), and measures each rendering.
+
+Usage:
+    python3 benchmarks/bench_pretty_diff.py [--items 50000] [--context 1] [--time-limit 1.0]
+"""
+import random
+from argparse import ArgumentParser
+from io import StringIO
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from rich.console import Console
+
+from vedro.plugins.director.rich._pretty_diff import PrettyDiff
+
+
+def make_lists(items: int) -> Tuple[List[int], List[int]]:
+    left = list(range(items))
+    right = left[:10] + [-1] + left[10:items // 2] + left[items // 2 + 1:]
+    right[-10] = -2
+    return left, right
+
+
+def make_payloads(items: int) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def make_user(idx: int) -> Dict[str, Any]:
+        return {"id": idx, "name": f"user {idx}", "tags": ["a", "b"], "meta": {"x": [idx] * 5}}
+
+    left = {f"user_{i}": make_user(i) for i in range(items // 10)}
+    right = {f"user_{i}": make_user(i) for i in range(items // 10)}
+    right["user_5"]["name"] = "changed"
+    right[f"user_{items // 20}"]["tags"].append("c")
+    return left, right
+
+
+def make_unrelated(items: int) -> Tuple[List[float], List[float]]:
+    rnd = random.Random(0)
+    return [rnd.random() for _ in range(items)], [rnd.random() for _ in range(items)]
+
+
+def render(left: Any, right: Any, context: Optional[int], time_limit: float) -> float:
+    console = Console(file=StringIO(), width=120)
+    started_at = perf_counter()
+    console.print(PrettyDiff(left, right, "==", max_context_lines=context,
+                             time_limit=time_limit))
+    return perf_counter() - started_at
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--items", type=int, default=50_000)
+    parser.add_argument("--context", type=int, default=1)
+    parser.add_argument("--time-limit", type=float, default=1.0)
+    args = parser.parse_args()
+
+    print(f"{args.items} items, context {args.context}, time limit {args.time_limit}s")
+    for name, make in [("lists", make_lists),
+                       ("payloads", make_payloads),
+                       ("unrelated", make_unrelated)]:
+        left, right = make(args.items)  # type: ignore
+        elapsed = render(left, right, args.context, args.time_limit)
+        print(f"{name:<10} {elapsed * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark the cold start of the vedro command line on an empty project.
+
+Each run is a fresh interpreter, so it includes importing vedro, loading the config
+and registering plugins. `vedro run` registers every enabled plugin, `vedro version`
+registers none.
+
+Usage:
+    python3 benchmarks/bench_startup.py [--runs 10] [--disabled-plugins Tagger,LastFailed]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+from argparse import ArgumentParser
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+from typing import List
+
+CONFIG_TEMPLATE = """
+import vedro
+
+class Config(vedro.Config):
+    class Plugins(vedro.Config.Plugins):
+{plugins}
+"""
+
+
+def make_project(project_dir: Path, disabled_plugins: List[str]) -> None:
+    (project_dir / "scenarios").mkdir()
+    plugins = [f"        class {name}(vedro.Config.Plugins.{name}):\n"
+               f"            enabled = False"
+               for name in disabled_plugins]
+    config = CONFIG_TEMPLATE.format(plugins="\n".join(plugins) or "        pass")
+    (project_dir / "vedro.cfg.py").write_text(config)
+
+
+def run(args: List[str], project_dir: Path) -> float:
+    env = dict(os.environ, PYTHONPATH=os.getcwd())
+    started_at = perf_counter()
+    subprocess.run([sys.executable, "-m", "vedro", *args], cwd=project_dir, env=env,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return perf_counter() - started_at
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--disabled-plugins", default="",
+                        help="Comma-separated names of built-in plugin configs to disable")
+    args = parser.parse_args()
+
+    disabled_plugins = [name for name in args.disabled_plugins.split(",") if name]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project_dir = Path(tmp_dir)
+        make_project(project_dir, disabled_plugins)
+
+        print(f"{args.runs} runs, disabled plugins: {', '.join(disabled_plugins) or '-'}")
+        for command in (["version"], ["run"]):
+            timings = [run(command, project_dir) for _ in range(args.runs)]
+            print(f"vedro {command[0]:<8} median {median(timings) * 1000:7.1f} ms, "
+                  f"min {min(timings) * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark filtering of deep tracebacks, as done by reporters for failed scenarios.
+
+Builds tracebacks that pass through functions from many (fake) library files,
+then measures TracebackFilter.filter_tb over all of them.
+
+Usage:
+    python3 benchmarks/bench_traceback_filter.py [--failures 1000] [--depth 80] [--files 40]
+"""
+from argparse import ArgumentParser
+from time import perf_counter
+from types import TracebackType
+from typing import Any, Callable, Dict, List
+
+from vedro.core.exc_info import TracebackFilter
+
+LIBS_DIR = "/venv/lib/python3.11/site-packages"
+FILTERED_MODULES = [f"{LIBS_DIR}/{name}" for name in ("httpx", "httpcore", "anyio", "vedro")]
+
+SOURCE = """
+def call(depth, fns):
+    if depth == 0:
+        raise AssertionError("boom")
+    fns[depth % len(fns)](depth - 1, fns)
+"""
+
+
+def make_functions(files: int) -> List[Callable[..., None]]:
+    libs = ("httpx", "httpcore", "anyio", "vedro", "app", "scenarios")
+    fns = []
+    for idx in range(files):
+        filename = f"{LIBS_DIR}/{libs[idx % len(libs)]}/_module_{idx}.py"
+        namespace: Dict[str, Any] = {}
+        exec(compile(SOURCE, filename, "exec"), namespace)
+        fns.append(namespace["call"])
+    return fns
+
+
+def make_tracebacks(failures: int, depth: int, files: int) -> List[TracebackType]:
+    fns = make_functions(files)
+    tracebacks = []
+    for _ in range(failures):
+        try:
+            fns[0](depth - 1, fns)
+        except AssertionError as e:
+            assert e.__traceback__ is not None
+            tracebacks.append(e.__traceback__)
+    return tracebacks
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--failures", type=int, default=1000)
+    parser.add_argument("--depth", type=int, default=80)
+    parser.add_argument("--files", type=int, default=40)
+    args = parser.parse_args()
+
+    # filter_tb relinks the traceback, so every run needs fresh tracebacks
+    tracebacks = make_tracebacks(args.failures, args.depth, args.files)
+    tb_filter = TracebackFilter(FILTERED_MODULES)
+
+    started_at = perf_counter()
+    for tb in tracebacks:
+        tb_filter.filter_tb(tb)
+    elapsed = perf_counter() - started_at
+
+    print(f"{args.failures} failures x {args.depth} frames ({args.files} files)")
+    print(f"filter_tb: {elapsed * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+from pathlib import Path
+from time import monotonic_ns
+from typing import Any, List, Optional, Type
+
+from vedro import Scenario
+from vedro.commands import CommandArgumentParser
+from vedro.core import (
+    AggregatedResult,
+    Dispatcher,
+    PluginConfig,
+    Report,
+    ScenarioResult,
+    VirtualScenario,
+)
+from vedro.events import CleanupEvent, ScenarioReportedEvent
+from vedro.plugins.director import Reporter
+from vedro.plugins.result_writer import ResultsFileWriter
+
+__all__ = ("ArgumentParser", "make_vscenario", "write_results", "Recorder", "RecorderPlugin",)
+
+
+class ArgumentParser(CommandArgumentParser):
+    def __init__(self, argv: List[str], **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._argv = argv
+
+    def parse_known_args(self, *args, **kwargs):
+        return super().parse_known_args(self._argv, None)
+
+
+class RecorderPlugin(Reporter):
+    def __init__(self, config: Type["Recorder"]) -> None:
+        super().__init__(config)
+        self._reported = config.reported
+        self._reports = config.reports
+
+    def subscribe(self, dispatcher: Dispatcher) -> None:
+        super().subscribe(dispatcher)
+        dispatcher.listen(ScenarioReportedEvent, self.on_scenario_reported) \
+                  .listen(CleanupEvent, self.on_cleanup)
+
+    def on_chosen(self) -> None:
+        pass
+
+    def on_scenario_reported(self, event: ScenarioReportedEvent) -> None:
+        self._reported.append(event.aggregated_result)
+
+    def on_cleanup(self, event: CleanupEvent) -> None:
+        self._reports.append(event.report)
+
+
+class Recorder(PluginConfig):
+    plugin = RecorderPlugin
+    reported: List[AggregatedResult] = []
+    reports: List[Report] = []
+
+
+def make_vscenario(project_dir: Path, *, subject: Optional[str] = None) -> VirtualScenario:
+    class _Scenario(Scenario):
+        __file__ = project_dir / "scenarios" / f"scenario_{monotonic_ns()}.py"
+
+    if subject is not None:
+        _Scenario.subject = subject
+
+    return VirtualScenario(_Scenario, steps=[], project_dir=project_dir)
+
+
+def write_results(path: Path, scenario_results: List[ScenarioResult],
+                  report: Optional[Report] = None) -> Path:
+    writer = ResultsFileWriter(path)
+    writer.open()
+    if report is None:
+        report = Report()
+    for scenario_result in scenario_results:
+        aggregated_result = AggregatedResult.from_existing(scenario_result, [scenario_result])
+        report.add_result(aggregated_result)
+        writer.write_result(aggregated_result)
+    writer.close(report)
+    return path
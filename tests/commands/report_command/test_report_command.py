@@ -0,0 +1,159 @@
+import sys
+from pathlib import Path
+from typing import List
+
+from baby_steps import given, then, when
+from pytest import raises
+
+import vedro
+from vedro.commands.report_command import ReportCommand
+from vedro.core import (
+    AggregatedResult,
+    Config,
+    Dispatcher,
+    ExcInfo,
+    Factory,
+    Report,
+    ScenarioResult,
+)
+
+from ._utils import ArgumentParser, Recorder, make_vscenario, write_results
+
+
+def make_config(tmp_path: Path, reported_: List[AggregatedResult], reports_: List[Report]):
+    class CustomConfig(Config):
+        validate_plugins_configs = False
+        project_dir = tmp_path
+
+        class Registry(vedro.Config.Registry):
+            Dispatcher = Factory[Dispatcher](Dispatcher)
+
+        class Plugins(Config.Plugins):
+            class CustomRecorder(Recorder):
+                enabled = True
+                reported = reported_
+                reports = reports_
+
+            class Seeder(vedro.Config.Plugins.Seeder):
+                pass
+
+            class Terminator(vedro.Config.Plugins.Terminator):
+                pass
+
+    return CustomConfig
+
+
+def make_scenario_result(scenario, started_at: float, ended_at: float) -> ScenarioResult:
+    return ScenarioResult(scenario).set_started_at(started_at).set_ended_at(ended_at)
+
+
+async def test_merge(tmp_path: Path):
+    with given:
+        scn1, scn2, scn3 = [make_vscenario(tmp_path, subject=f"scn {i}") for i in range(3)]
+        path1 = write_results(tmp_path / "1.jsonl", [
+            make_scenario_result(scn1, 100.0, 101.0).mark_passed(),
+            make_scenario_result(scn2, 101.0, 103.0).mark_skipped(),
+        ])
+        path2 = write_results(tmp_path / "2.jsonl", [
+            make_scenario_result(scn3, 200.0, 201.0).mark_passed(),
+        ])
+
+        reported, reports = [], []
+        config = make_config(tmp_path, reported, reports)
+        command = ReportCommand(config, ArgumentParser(["merge", str(path1), str(path2)]))
+
+    with when, raises(BaseException) as exc:
+        await command.run()
+
+    with then:
+        assert exc.type is SystemExit
+        assert str(exc.value) == "0"
+
+        assert [x.scenario.unique_id for x in reported] == [scn1.unique_id, scn2.unique_id,
+                                                            scn3.unique_id]
+        assert [x.scenario.subject for x in reported] == ["scn 0", "scn 1", "scn 2"]
+        assert [x.status.value for x in reported] == ["PASSED", "SKIPPED", "PASSED"]
+
+        report, = reports
+        assert (report.total, report.passed, report.failed, report.skipped) == (3, 2, 0, 1)
+        # The elapsed time is the one of the longest run
+        assert (report.started_at, report.ended_at) == (100.0, 103.0)
+        assert report.interrupted is None
+
+
+async def test_merge_failed(tmp_path: Path):
+    with given:
+        scn1, scn2 = [make_vscenario(tmp_path) for _ in range(2)]
+        path1 = write_results(tmp_path / "1.jsonl", [
+            make_scenario_result(scn1, 1.0, 2.0).mark_passed(),
+        ])
+        path2 = write_results(tmp_path / "2.jsonl", [
+            make_scenario_result(scn2, 1.0, 2.0).mark_failed(),
+        ])
+
+        reported, reports = [], []
+        config = make_config(tmp_path, reported, reports)
+        command = ReportCommand(config, ArgumentParser(["merge", str(path1), str(path2)]))
+
+    with when, raises(BaseException) as exc:
+        await command.run()
+
+    with then:
+        assert exc.type is SystemExit
+        assert str(exc.value) == "1"
+
+        report, = reports
+        assert (report.total, report.passed, report.failed) == (2, 1, 1)
+
+
+async def test_merge_interrupted(tmp_path: Path):
+    with given:
+        scn = make_vscenario(tmp_path)
+        interrupted = Report()
+        try:
+            raise KeyboardInterrupt()
+        except KeyboardInterrupt:
+            interrupted.set_interrupted(ExcInfo(*sys.exc_info()))
+        path = write_results(tmp_path / "1.jsonl", [
+            make_scenario_result(scn, 1.0, 2.0).mark_passed(),
+        ], interrupted)
+
+        reported, reports = [], []
+        config = make_config(tmp_path, reported, reports)
+        command = ReportCommand(config, ArgumentParser(["merge", str(path)]))
+
+    with when, raises(BaseException) as exc:
+        await command.run()
+
+    with then:
+        assert exc.type is SystemExit
+        assert str(exc.value) == "130"
+
+        report, = reports
+        assert report.interrupted.type.__name__ == "KeyboardInterrupt"
+
+
+async def test_merge_missing_file(tmp_path: Path):
+    with given:
+        path = tmp_path / "missing.jsonl"
+        config = make_config(tmp_path, [], [])
+        command = ReportCommand(config, ArgumentParser(["merge", str(path)]))
+
+    with when, raises(BaseException) as exc:
+        await command.run()
+
+    with then:
+        assert exc.type is FileNotFoundError
+        assert str(exc.value) == f"Results file '{path}' does not exist"
+
+
+def test_report_plugins(tmp_path: Path):
+    with given:
+        config = make_config(tmp_path, [], [])
+        command = ReportCommand(config, ArgumentParser([]))
+
+    with when:
+        plugins = command._get_report_plugins()
+
+    with then:
+        assert plugins == [config.Plugins.CustomRecorder, config.Plugins.Terminator]
@@ -0,0 +1,90 @@
+from unittest.mock import AsyncMock, Mock, call
+
+import pytest
+from baby_steps import given, then, when
+
+from vedro.commands.run_command._profiling_dispatcher import ProfilingDispatcher
+from vedro.core import Dispatcher, Plugin, PluginConfig
+from vedro.core.startup_profiler import StartupProfiler
+from vedro.events import StartupEvent
+
+
+@pytest.fixture()
+def dispatcher() -> Dispatcher:
+    return Dispatcher()
+
+
+@pytest.fixture()
+def profiler() -> StartupProfiler:
+    return StartupProfiler()
+
+
+class CustomPlugin(Plugin):
+    def __init__(self, config, *, on_startup) -> None:
+        super().__init__(config)
+        self.on_startup = on_startup
+
+    def subscribe(self, dispatcher: Dispatcher) -> None:
+        dispatcher.listen(StartupEvent, self.on_startup)
+
+
+def make_plugin(handler) -> CustomPlugin:
+    handler.__qualname__ = "CustomPlugin.on_startup"
+    return CustomPlugin(PluginConfig, on_startup=handler)
+
+
+async def test_fire_sync_handler(dispatcher: Dispatcher, profiler: StartupProfiler):
+    with given:
+        handler_ = Mock()
+        profiling_dispatcher = ProfilingDispatcher(dispatcher, profiler)
+        profiling_dispatcher.register(make_plugin(handler_))
+
+        profiler.start()
+        event = StartupEvent(Mock())
+
+    with when:
+        await dispatcher.fire(event)
+
+    with then:
+        assert handler_.mock_calls == [call(event)]
+        assert [(s.name, s.category) for s in profiler.spans] == [
+            ("StartupEvent: CustomPlugin.on_startup", "handler"),
+        ]
+
+
+async def test_fire_async_handler(dispatcher: Dispatcher, profiler: StartupProfiler):
+    with given:
+        handler_ = AsyncMock()
+        profiling_dispatcher = ProfilingDispatcher(dispatcher, profiler)
+        profiling_dispatcher.register(make_plugin(handler_))
+
+        profiler.start()
+        event = StartupEvent(Mock())
+
+    with when:
+        await profiling_dispatcher.fire(event)
+
+    with then:
+        assert handler_.mock_calls == [call(event)]
+        assert handler_.await_count == 1
+        assert [(s.name, s.category) for s in profiler.spans] == [
+            ("StartupEvent: CustomPlugin.on_startup", "handler"),
+        ]
+
+
+async def test_fire_after_profiler_stopped(dispatcher: Dispatcher, profiler: StartupProfiler):
+    with given:
+        handler_ = Mock()
+        profiling_dispatcher = ProfilingDispatcher(dispatcher, profiler)
+        profiling_dispatcher.register(make_plugin(handler_))
+
+        profiler.start()
+        profiler.stop()
+        event = StartupEvent(Mock())
+
+    with when:
+        await dispatcher.fire(event)
+
+    with then:
+        assert handler_.mock_calls == [call(event)]
+        assert profiler.spans == []
@@ -1,4 +1,5 @@
 from pathlib import Path
+from unittest.mock import Mock, patch
 
 from baby_steps import given, then, when
 from pytest import raises
@@ -6,6 +7,7 @@ from pytest import raises
 import vedro
 from vedro.commands.run_command import RunCommand
 from vedro.core import Config, Dispatcher, Factory
+from vedro.core.startup_profiler import StartupProfiler
 
 from ._utils import ArgumentParser, arg_parser, create_scenario, tmp_dir
 
@@ -52,3 +54,82 @@ async def test_run_command_with_scenarios(tmp_dir: Path, arg_parser: ArgumentPar
     with then:
         assert exc.type is SystemExit
         assert str(exc.value) == "0"
+
+
+async def test_run_command_with_startup_profiler(tmp_dir: Path, arg_parser: ArgumentParser):
+    with given:
+        class CustomConfigProject(CustomConfig):
+            project_dir = tmp_dir
+
+        profiler = StartupProfiler()
+        command = RunCommand(CustomConfigProject, arg_parser, startup_profiler=profiler)
+        create_scenario(tmp_dir, "scenario.py")
+
+    with when, raises(BaseException) as exc:
+        await command.run()
+
+    with then:
+        assert exc.type is SystemExit
+        assert profiler.is_running is False
+
+        spans = profiler.spans
+        assert [s.name for s in spans if s.category == "phase"] == [
+            "validate config",
+            "register plugins",
+            "fire ConfigLoadedEvent",
+            "parse args",
+            "discover scenarios",
+            "fire StartupEvent",
+        ]
+        assert [s.name for s in spans if s.category == "import"] == ["scenarios/scenario.py"]
+        assert "ArgParseEvent: TerminatorPlugin.on_arg_parse" in [s.name for s in spans]
+
+
+async def test_run_command_with_startup_profiler_discovery_error(tmp_dir: Path,
+                                                                 arg_parser: ArgumentParser):
+    with given:
+        class CustomConfigProject(CustomConfig):
+            project_dir = tmp_dir
+
+        profiler = StartupProfiler()
+        command = RunCommand(CustomConfigProject, arg_parser, startup_profiler=profiler)
+        (tmp_dir / "scenarios" / "scenario.py").write_text("raise RuntimeError('boom')")
+
+    with when, raises(BaseException) as exc:
+        await command.run()
+
+    with then:
+        assert exc.type is RuntimeError
+        assert profiler.is_running is False
+
+        spans = profiler.spans
+        assert [s.name for s in spans if s.category == "phase"] == [
+            "validate config",
+            "register plugins",
+            "fire ConfigLoadedEvent",
+            "parse args",
+            "discover scenarios",
+        ]
+
+
+async def test_run_command_with_startup_profiler_reports_before_args(tmp_dir: Path,
+                                                                     arg_parser: ArgumentParser):
+    with given:
+        class CustomConfigProject(CustomConfig):
+            project_dir = tmp_dir
+
+        profiler = StartupProfiler()
+        config_validator_ = Mock(validate=Mock(side_effect=ValueError("invalid config")))
+        command = RunCommand(CustomConfigProject, arg_parser, startup_profiler=profiler,
+                             config_validator_factory=lambda config: config_validator_)
+
+        trace_path = tmp_dir / "startup.json"
+        argv = ["vedro", "run", "--profile-startup-trace", str(trace_path)]
+
+    with when, patch("sys.argv", argv), raises(BaseException) as exc:
+        await command.run()
+
+    with then:
+        assert exc.type is ValueError
+        assert profiler.is_running is False
+        assert trace_path.exists()
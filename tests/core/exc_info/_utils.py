@@ -10,8 +10,10 @@ from typing import List, Tuple, Type
 
 import pytest
 
+from vedro.core.exc_info import TracebackSnapshot
+
 __all__ = ("create_call_stack", "run_module_function", "import_module", "get_frames_info",
-           "tmp_dir",)
+           "take_snapshot", "get_snapshot_frames_info", "tmp_dir",)
 
 
 FrameInfo = Tuple[str, str]  # (file_path, function_name)
@@ -114,6 +116,32 @@ def get_frames_info(tb: TracebackType) -> List[FrameInfo]:
     return frames_info
 
 
+def take_snapshot(tb: TracebackType) -> TracebackSnapshot:
+    """
+    Take a snapshot of a traceback returned by `run_module_function`.
+
+    :param tb: The traceback object.
+    :return: The traceback snapshot.
+    """
+    return TracebackSnapshot.capture(ZeroDivisionError, ZeroDivisionError(), tb)
+
+
+def get_snapshot_frames_info(snapshot: TracebackSnapshot) -> List[FrameInfo]:
+    """
+    Extract frame information from a traceback snapshot.
+
+    :param snapshot: The traceback snapshot.
+    :return: A list of tuples containing file paths and function names from the snapshot.
+    """
+    frames_info = []
+    for frame in snapshot.frames:
+        filename = frame.filename
+        if sys.version_info < (3, 10):
+            filename = abspath(filename)
+        frames_info.append((filename, frame.name))
+    return frames_info
+
+
 @pytest.fixture()
 def tmp_dir(tmp_path: Path) -> Path:
     """
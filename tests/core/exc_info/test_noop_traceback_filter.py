@@ -6,7 +6,7 @@ from baby_steps import given, then, when
 
 from vedro.core.exc_info import NoOpTracebackFilter
 
-from ._utils import create_call_stack, get_frames_info, run_module_function, tmp_dir
+from ._utils import create_call_stack, get_frames_info, run_module_function, take_snapshot, tmp_dir
 
 __all__ = ("tmp_dir",)  # pytest fixtures
 
@@ -84,3 +84,19 @@ def test_noop_filter_with_entire_module_in_filter_list(tmp_dir: Path):
             (abspath("another_module/__main__.py"), "call_nested"),
             (abspath("another_module/nested.py"), "do_smth"),
         ]
+
+
+def test_noop_filter_preserves_snapshot(tmp_dir: Path):
+    with given:
+        create_call_stack(tmp_dir, [
+            ("main.py", "main"),
+            ("another_module/nested.py", "do_smth"),
+        ])
+        tb = run_module_function(tmp_dir / "main.py", func="main")
+        snapshot = take_snapshot(tb)
+
+    with when:
+        filtered = NoOpTracebackFilter(modules=["another_module"]).filter_snapshot(snapshot)
+
+    with then:
+        assert filtered is snapshot
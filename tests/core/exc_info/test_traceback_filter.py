@@ -9,7 +9,14 @@ from pytest import raises
 
 from vedro.core.exc_info import TracebackFilter
 
-from ._utils import create_call_stack, get_frames_info, run_module_function, tmp_dir
+from ._utils import (
+    create_call_stack,
+    get_frames_info,
+    get_snapshot_frames_info,
+    run_module_function,
+    take_snapshot,
+    tmp_dir,
+)
 
 __all__ = ("tmp_dir",)  # pytest fixtures
 
@@ -220,3 +227,109 @@ def test_skip_hidden_frames_with_hide_flag_false(tmp_dir: Path, hide_flag: str):
             (abspath("some_module/caller.py"), "call_another"),
             (abspath("another_module/__main__.py"), "do_smth"),
         ]
+
+
+def test_exclude_module_not_sibling(tmp_dir: Path):
+    with given:
+        create_call_stack(tmp_dir, [
+            ("main.py", "main"),
+            ("another_module/caller.py", "call_another"),
+            ("another_module2/nested.py", "do_smth"),
+        ])
+        tb = run_module_function(tmp_dir / "main.py", func="main")
+
+    with when:
+        filtered_tb = TracebackFilter(["another_module"]).filter_tb(tb)
+
+    with then:
+        assert get_frames_info(filtered_tb) == [
+            (getfile(run_module_function), "run_module_function"),
+            (abspath("main.py"), "main"),
+            (abspath("another_module2/nested.py"), "do_smth"),
+        ]
+
+
+def test_exclude_all_frames(tmp_dir: Path):
+    with given:
+        create_call_stack(tmp_dir, [
+            ("main.py", "main"),
+        ])
+        tb = run_module_function(tmp_dir / "main.py", func="main")
+
+        modules = [getfile(run_module_function), "main.py"]
+
+    with when:
+        filtered_tb = TracebackFilter(modules).filter_tb(tb)
+
+    with then:
+        assert filtered_tb is None
+
+
+def test_module_decision_cached(tmp_dir: Path):
+    with given:
+        create_call_stack(tmp_dir, [
+            ("main.py", "main"),
+            ("another_module/__main__.py", "do_smth"),
+        ])
+        traceback_filter = TracebackFilter(["another_module"])
+        traceback_filter.filter_tb(run_module_function(tmp_dir / "main.py", func="main"))
+
+    with when:
+        filtered_tb = traceback_filter.filter_tb(
+            run_module_function(tmp_dir / "main.py", func="main")
+        )
+
+    with then:
+        assert get_frames_info(filtered_tb) == [
+            (getfile(run_module_function), "run_module_function"),
+            (abspath("main.py"), "main"),
+        ]
+        cache_info = traceback_filter._is_module_file.cache_info()
+        assert cache_info.misses == 3
+        assert cache_info.hits == 3
+
+
+def test_filter_snapshot_exclude_module(tmp_dir: Path):
+    with given:
+        create_call_stack(tmp_dir, [
+            ("main.py", "main"),
+            ("some_module/caller.py", "call_another"),
+            ("another_module/__main__.py", "call_nested"),
+            ("another_module/nested.py", "do_smth"),
+        ])
+        tb = run_module_function(tmp_dir / "main.py", func="main")
+        snapshot = take_snapshot(tb)
+
+    with when:
+        filtered = TracebackFilter(modules=["another_module"]).filter_snapshot(snapshot)
+
+    with then:
+        assert get_snapshot_frames_info(filtered) == [
+            (getfile(run_module_function), "run_module_function"),
+            (abspath("main.py"), "main"),
+            (abspath("some_module/caller.py"), "call_another"),
+        ]
+        assert len(snapshot.frames) == 5
+
+
+@pytest.mark.parametrize(("skip_hidden_frames", "expected"), [
+    (True, ["run_module_function", "main", "call_another"]),
+    (False, ["run_module_function", "main", "call_another", "do_smth"]),
+])
+def test_filter_snapshot_hidden_frames(skip_hidden_frames: bool, expected: list, *,
+                                       tmp_dir: Path):
+    with given:
+        create_call_stack(tmp_dir, [
+            ("main.py", "main"),
+            ("some_module/caller.py", "call_another"),
+            ("another_module/__main__.py", "do_smth"),
+        ], call_statement="__tracebackhide__ = True; 1 / 0")
+        tb = run_module_function(tmp_dir / "main.py", func="main")
+        snapshot = take_snapshot(tb)
+        tb_filter = TracebackFilter(modules=[], skip_hidden_frames=skip_hidden_frames)
+
+    with when:
+        filtered = tb_filter.filter_snapshot(snapshot)
+
+    with then:
+        assert [name for _, name in get_snapshot_frames_info(filtered)] == expected
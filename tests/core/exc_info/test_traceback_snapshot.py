@@ -0,0 +1,221 @@
+import gc
+import sys
+import weakref
+from traceback import format_exception
+
+import pytest
+from baby_steps import given, then, when
+from rich.pretty import traverse
+
+from vedro.core import ExcInfo
+from vedro.core.exc_info import TracebackSnapshot
+
+
+class Payload:
+    def __repr__(self) -> str:
+        return "<Payload>"
+
+
+def fail(value):
+    payload = Payload()  # noqa: F841
+    body = "x" * 1000  # noqa: F841
+    raise KeyError(value)
+
+
+def fail_hidden():
+    __tracebackhide__ = True  # noqa: F841
+    fail("hidden")
+
+
+def fail_with_cause():
+    try:
+        fail("cause")
+    except KeyError as e:
+        raise ValueError("error") from e
+
+
+def fail_with_context():
+    try:
+        fail("context")
+    except KeyError:
+        raise ValueError("error")
+
+
+def fail_with_suppressed_context():
+    try:
+        fail("context")
+    except KeyError:
+        raise ValueError("error") from None
+
+
+def make_exc_info(fn, *args) -> ExcInfo:
+    try:
+        fn(*args)
+    except BaseException:
+        return ExcInfo(*sys.exc_info())
+
+
+def test_capture():
+    with given:
+        exc_info = make_exc_info(fail, "key")
+
+    with when:
+        snapshot = TracebackSnapshot.capture(exc_info.type, exc_info.value, exc_info.traceback)
+
+    with then:
+        assert [(frame.name, frame.line) for frame in snapshot.frames] == [
+            ("make_exc_info", "fn(*args)"),
+            ("fail", "raise KeyError(value)"),
+        ]
+        assert snapshot.frames[-1].filename == __file__
+        assert snapshot.frames[-1].lineno == exc_info.traceback.tb_next.tb_lineno
+        assert snapshot.frames[-1].hidden is False
+        assert snapshot.cause is None
+        assert snapshot.context is None
+
+
+def test_capture_locals():
+    with given:
+        exc_info = make_exc_info(fail, "key")
+
+    with when:
+        snapshot = TracebackSnapshot.capture(exc_info.type, exc_info.value, exc_info.traceback,
+                                             locals_max_string=20)
+
+    with then:
+        locals_ = snapshot.frames[-1].locals
+        assert {name: str(node) for name, node in locals_.items()} == {
+            "value": "'key'",
+            "payload": "<Payload>",
+            "body": "'xxxxxxxxxxxxxxxxxxxx'+980",
+        }
+
+
+def test_capture_locals_as_rich_does():
+    with given:
+        exc_info = make_exc_info(fail, ["key"] * 100)
+
+    with when:
+        snapshot = TracebackSnapshot.capture(exc_info.type, exc_info.value, exc_info.traceback)
+
+    with then:
+        value = snapshot.frames[-1].locals["value"]
+        assert value == traverse(["key"] * 100, max_length=10, max_string=80)
+
+
+def test_capture_without_locals():
+    with given:
+        exc_info = make_exc_info(fail, "key")
+
+    with when:
+        snapshot = TracebackSnapshot.capture(exc_info.type, exc_info.value, exc_info.traceback,
+                                             capture_locals=False)
+
+    with then:
+        assert all(frame.locals is None for frame in snapshot.frames)
+
+
+def test_capture_hidden_frame():
+    with given:
+        exc_info = make_exc_info(fail_hidden)
+
+    with when:
+        snapshot = TracebackSnapshot.capture(exc_info.type, exc_info.value, exc_info.traceback)
+
+    with then:
+        assert [(frame.name, frame.hidden) for frame in snapshot.frames] == [
+            ("make_exc_info", False),
+            ("fail_hidden", True),
+            ("fail", False),
+        ]
+
+
+@pytest.mark.parametrize("fn", [fail_with_cause, fail_with_context])
+def test_capture_chained(fn):
+    with given:
+        exc_info = make_exc_info(fn)
+
+    with when:
+        snapshot = TracebackSnapshot.capture(exc_info.type, exc_info.value, exc_info.traceback)
+
+    with then:
+        chained = snapshot.cause or snapshot.context
+        assert [frame.name for frame in chained.frames] == [fn.__name__, "fail"]
+
+
+@pytest.mark.parametrize("fn", [fail, fail_with_cause, fail_with_context,
+                                fail_with_suppressed_context])
+@pytest.mark.parametrize("limit", [None, 1, -1])
+def test_format(fn, limit):
+    with given:
+        exc_info = make_exc_info(fn, "key") if fn is fail else make_exc_info(fn)
+        formatted = format_exception(exc_info.type, exc_info.value, exc_info.traceback,
+                                     limit=limit)
+        snapshot = exc_info.snapshot_traceback()
+
+    with when:
+        result = snapshot.format(exc_info.type, exc_info.value, limit=limit)
+
+    with then:
+        assert result == formatted
+
+
+def test_with_frames():
+    with given:
+        exc_info = make_exc_info(fail_with_cause)
+        snapshot = TracebackSnapshot.capture(exc_info.type, exc_info.value, exc_info.traceback)
+
+    with when:
+        result = snapshot.with_frames(snapshot.frames[1:])
+
+    with then:
+        assert result.frames == snapshot.frames[1:]
+        assert result.cause is snapshot.cause
+
+
+def test_snapshot_traceback_releases_frames():
+    with given:
+        refs = []
+
+        def step():
+            payload = Payload()
+            refs.append(weakref.ref(payload))
+            fail("key")
+
+        exc_info = make_exc_info(step)
+
+    with when:
+        snapshot = exc_info.snapshot_traceback()
+        gc.collect()
+
+    with then:
+        assert refs[0]() is None
+        assert exc_info.traceback is None
+        assert exc_info.value.__traceback__ is None
+        assert exc_info.snapshot is snapshot
+        assert [frame.name for frame in snapshot.frames] == ["make_exc_info", "step", "fail"]
+
+
+def test_snapshot_traceback_releases_chained():
+    with given:
+        exc_info = make_exc_info(fail_with_cause)
+        cause = exc_info.value.__cause__
+
+    with when:
+        exc_info.snapshot_traceback()
+
+    with then:
+        assert cause.__traceback__ is None
+        assert exc_info.snapshot.cause is not None
+
+
+def test_snapshot_traceback_twice():
+    with given:
+        exc_info = make_exc_info(fail, "key")
+        snapshot = exc_info.snapshot_traceback()
+
+    with when:
+        result = exc_info.snapshot_traceback()
+
+    with then:
+        assert result is snapshot
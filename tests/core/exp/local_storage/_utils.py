@@ -3,9 +3,9 @@ from pathlib import Path
 import pytest
 
 from vedro.core import Plugin, PluginConfig
-from vedro.core.exp.local_storage import LocalStorage
+from vedro.core.exp.local_storage import LocalStorage, SQLiteLocalStorage
 
-__all__ = ("plugin", "local_storage",)
+__all__ = ("plugin", "local_storage", "sqlite_local_storage",)
 
 
 @pytest.fixture()
@@ -22,3 +22,10 @@ def plugin() -> Plugin:
 @pytest.fixture()
 def local_storage(plugin: Plugin, tmp_path: Path):
     return LocalStorage(plugin, project_dir=tmp_path)
+
+
+@pytest.fixture()
+def sqlite_local_storage(plugin: Plugin, tmp_path: Path):
+    storage = SQLiteLocalStorage(plugin, project_dir=tmp_path)
+    yield storage
+    storage.close()
@@ -1,6 +1,8 @@
+import asyncio
 from pathlib import Path
 
 from baby_steps import given, then, when
+from filelock import FileLock, Timeout
 from niltype import Nil
 from pytest import raises
 
@@ -114,3 +116,61 @@ def test_create_local_storage_incorrect_type(*, tmp_path: Path):
     with then:
         assert isinstance(exc.value, TypeError)
         assert str(exc.value) == "Expected Plugin instance, but got <class 'NoneType'>"
+
+
+async def test_put_many_get_many(*, local_storage: LocalStorage):
+    with given:
+        await local_storage.put_many({"<key1>": 1, "<key2>": [2]})
+
+    with when:
+        res = await local_storage.get_many(["<key1>", "<key2>", "<key3>"])
+
+    with then:
+        assert res == {"<key1>": 1, "<key2>": [2], "<key3>": Nil}
+
+
+async def test_get_waits_for_lock(*, plugin: Plugin, tmp_path: Path):
+    with given:
+        local_storage = LocalStorage(plugin, project_dir=tmp_path)
+        lock_path = tmp_path / ".vedro" / "local_storage" / f"{type(plugin).__name__}.lock"
+        lock_path.parent.mkdir(parents=True)
+
+        lock = FileLock(lock_path)
+        lock.acquire()
+        asyncio.get_running_loop().call_later(0.3, lock.release)
+
+    with when:
+        res = await local_storage.get("<key>")
+
+    with then:
+        assert res is Nil
+        assert not lock.is_locked
+
+
+async def test_get_lock_timeout(*, plugin: Plugin, tmp_path: Path):
+    with given:
+        local_storage = LocalStorage(plugin, project_dir=tmp_path, lock_timeout=0.2)
+        lock_path = tmp_path / ".vedro" / "local_storage" / f"{type(plugin).__name__}.lock"
+        lock_path.parent.mkdir(parents=True)
+
+        lock = FileLock(lock_path)
+        lock.acquire()
+
+    with when, raises(BaseException) as exc:
+        await local_storage.get("<key>")
+
+    with then:
+        assert exc.type is Timeout
+        lock.release()
+
+
+async def test_concurrent_flush(*, plugin: Plugin, tmp_path: Path):
+    with given:
+        storages = [LocalStorage(plugin, project_dir=tmp_path) for _ in range(5)]
+
+    with when:
+        await asyncio.gather(*(storage.flush() for storage in storages))
+
+    with then:
+        local_storage = LocalStorage(plugin, project_dir=tmp_path)
+        assert await local_storage.get("<key>") is Nil
@@ -0,0 +1,153 @@
+import sqlite3
+from pathlib import Path
+
+from baby_steps import given, then, when
+from niltype import Nil
+from pytest import raises
+
+from vedro.core import Plugin
+from vedro.core.exp.local_storage import SQLiteLocalStorage, create_sqlite_local_storage
+
+from ._utils import plugin, sqlite_local_storage
+
+__all__ = ("plugin", "sqlite_local_storage",)  # fixtures
+
+
+async def test_get(*, sqlite_local_storage: SQLiteLocalStorage):
+    with given:
+        key, value = "<key>", {"value": [1, 2]}
+        await sqlite_local_storage.put(key, value)
+
+    with when:
+        res = await sqlite_local_storage.get(key)
+
+    with then:
+        assert res == value
+
+
+async def test_get_nonexisting_key(*, sqlite_local_storage: SQLiteLocalStorage):
+    with when:
+        res = await sqlite_local_storage.get("<key>")
+
+    with then:
+        assert res is Nil
+
+
+async def test_get_without_flush(*, plugin: Plugin, tmp_path: Path):
+    with given:
+        local_storage1 = SQLiteLocalStorage(plugin, project_dir=tmp_path)
+        await local_storage1.put("<key>", "<value>")
+
+        local_storage2 = SQLiteLocalStorage(plugin, project_dir=tmp_path)
+
+    with when:
+        res = await local_storage2.get("<key>")
+
+    with then:
+        assert res is Nil
+
+
+async def test_get_with_flush(*, plugin: Plugin, tmp_path: Path):
+    with given:
+        local_storage1 = SQLiteLocalStorage(plugin, project_dir=tmp_path)
+        await local_storage1.put("<key>", "<value>")
+        await local_storage1.flush()
+
+        local_storage2 = SQLiteLocalStorage(plugin, project_dir=tmp_path)
+
+    with when:
+        res = await local_storage2.get("<key>")
+
+    with then:
+        assert res == "<value>"
+
+
+async def test_get_many(*, plugin: Plugin, tmp_path: Path):
+    with given:
+        local_storage1 = SQLiteLocalStorage(plugin, project_dir=tmp_path)
+        await local_storage1.put_many({f"<key{i}>": i for i in range(1200)})
+        await local_storage1.flush()
+
+        local_storage2 = SQLiteLocalStorage(plugin, project_dir=tmp_path)
+        await local_storage2.put("<key0>", "<pending>")
+
+    with when:
+        res = await local_storage2.get_many(["<key0>", "<key1>", "<key1199>", "<unknown>"])
+
+    with then:
+        assert res == {
+            "<key0>": "<pending>",
+            "<key1>": 1,
+            "<key1199>": 1199,
+            "<unknown>": Nil,
+        }
+
+
+async def test_flush_writes_changed_keys(*, plugin: Plugin, tmp_path: Path):
+    with given:
+        local_storage1 = SQLiteLocalStorage(plugin, project_dir=tmp_path)
+        local_storage2 = SQLiteLocalStorage(plugin, project_dir=tmp_path)
+
+        await local_storage1.put("<key1>", 1)
+        await local_storage2.put("<key2>", 2)
+
+    with when:
+        await local_storage1.flush()
+        await local_storage2.flush()
+
+    with then:
+        local_storage3 = SQLiteLocalStorage(plugin, project_dir=tmp_path)
+        assert await local_storage3.get_many(["<key1>", "<key2>"]) == {"<key1>": 1, "<key2>": 2}
+
+
+async def test_flush_wal_mode(*, sqlite_local_storage: SQLiteLocalStorage, tmp_path: Path):
+    with given:
+        await sqlite_local_storage.put("<key>", "<value>")
+
+    with when:
+        await sqlite_local_storage.flush()
+
+    with then:
+        db_path, = (tmp_path / ".vedro" / "local_storage").glob("*.db")
+        with sqlite3.connect(str(db_path)) as connection:
+            journal_mode, = connection.execute("PRAGMA journal_mode").fetchone()
+        assert journal_mode == "wal"
+
+
+async def test_flush_empty_storage(*, sqlite_local_storage: SQLiteLocalStorage,
+                                   tmp_path: Path):
+    with when:
+        res = await sqlite_local_storage.flush()
+
+    with then:
+        assert res is None
+        assert not (tmp_path / ".vedro").exists()
+
+
+async def test_close(*, sqlite_local_storage: SQLiteLocalStorage):
+    with given:
+        await sqlite_local_storage.put("<key>", "<value>")
+        await sqlite_local_storage.flush()
+
+    with when:
+        sqlite_local_storage.close()
+
+    with then:
+        assert await sqlite_local_storage.get("<missing>") is Nil
+
+
+def test_create_sqlite_local_storage(*, plugin: Plugin, tmp_path: Path):
+    with when:
+        local_storage = create_sqlite_local_storage(plugin, tmp_path)
+
+    with then:
+        assert isinstance(local_storage, SQLiteLocalStorage)
+
+
+def test_create_sqlite_local_storage_incorrect_type(*, tmp_path: Path):
+    with when, raises(BaseException) as exc:
+        create_sqlite_local_storage(None, tmp_path)
+
+    with then:
+        assert exc.type is TypeError
+        assert str(exc.value) == "Expected Plugin instance, but got <class 'NoneType'>"
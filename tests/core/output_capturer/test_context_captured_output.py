@@ -0,0 +1,103 @@
+import asyncio
+import sys
+from io import StringIO
+from threading import Thread
+from typing import Tuple
+
+import pytest
+from baby_steps import given, then, when
+
+from vedro.core.output_capturer import ContextCapturedOutput
+
+
+def patch_streams(monkeypatch: pytest.MonkeyPatch) -> Tuple[StringIO, StringIO]:
+    # Patched within the test itself, since pytest replaces sys streams after fixture setup
+    stdout, stderr = StringIO(), StringIO()
+    monkeypatch.setattr(sys, "stdout", stdout)
+    monkeypatch.setattr(sys, "stderr", stderr)
+    return stdout, stderr
+
+
+def test_capture(monkeypatch: pytest.MonkeyPatch):
+    with given:
+        stdout, stderr = patch_streams(monkeypatch)
+        captured = ContextCapturedOutput()
+
+    with when:
+        with captured:
+            print("banana")
+            print("error", file=sys.stderr)
+        print("outside")
+
+    with then:
+        assert captured.stdout.get_value() == "banana\n"
+        assert captured.stderr.get_value() == "error\n"
+        assert stdout.getvalue() == "outside\n"
+        assert stderr.getvalue() == ""
+
+
+def test_capture_limit(monkeypatch: pytest.MonkeyPatch):
+    with given:
+        stdout, stderr = patch_streams(monkeypatch)
+        captured = ContextCapturedOutput(capture_limit=3)
+
+    with when:
+        with captured:
+            sys.stdout.write("banana")
+
+    with then:
+        assert captured.stdout.get_value() == "ana"
+
+
+def test_nested_capture(monkeypatch: pytest.MonkeyPatch):
+    with given:
+        stdout, stderr = patch_streams(monkeypatch)
+        outer, inner = ContextCapturedOutput(), ContextCapturedOutput()
+
+    with when:
+        with outer:
+            print("before")
+            with inner:
+                print("inner")
+            print("after")
+
+    with then:
+        assert outer.stdout.get_value() == "before\nafter\n"
+        assert inner.stdout.get_value() == "inner\n"
+        assert stdout.getvalue() == ""
+
+
+async def test_concurrent_tasks(monkeypatch: pytest.MonkeyPatch):
+    with given:
+        stdout, stderr = patch_streams(monkeypatch)
+
+        async def task(name: str) -> ContextCapturedOutput:
+            with ContextCapturedOutput() as captured:
+                for _ in range(3):
+                    print(name)
+                    await asyncio.sleep(0)
+            return captured
+
+    with when:
+        first, second = await asyncio.gather(task("first"), task("second"))
+
+    with then:
+        assert first.stdout.get_value() == "first\n" * 3
+        assert second.stdout.get_value() == "second\n" * 3
+        assert stdout.getvalue() == ""
+
+
+def test_other_thread_not_captured(monkeypatch: pytest.MonkeyPatch):
+    with given:
+        stdout, stderr = patch_streams(monkeypatch)
+        captured = ContextCapturedOutput()
+        thread = Thread(target=lambda: print("thread"))
+
+    with when:
+        with captured:
+            thread.start()
+            thread.join()
+
+    with then:
+        assert captured.stdout.get_value() == ""
+        assert stdout.getvalue() == "thread\n"
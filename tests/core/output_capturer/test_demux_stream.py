@@ -0,0 +1,107 @@
+import sys
+from io import StringIO
+from typing import Tuple
+
+import pytest
+from baby_steps import given, then, when
+
+from vedro.core.output_capturer import DemuxStream, install_demux_stream
+
+
+def patch_streams(monkeypatch: pytest.MonkeyPatch) -> Tuple[StringIO, StringIO]:
+    # Patched within the test itself, since pytest replaces sys streams after fixture setup
+    stdout, stderr = StringIO(), StringIO()
+    monkeypatch.setattr(sys, "stdout", stdout)
+    monkeypatch.setattr(sys, "stderr", stderr)
+    return stdout, stderr
+
+
+def test_install(monkeypatch: pytest.MonkeyPatch):
+    with given:
+        stdout, _ = patch_streams(monkeypatch)
+
+    with when:
+        demux = install_demux_stream("stdout")
+
+    with then:
+        assert sys.stdout is demux
+        assert demux.stream is stdout
+
+
+def test_install_once(monkeypatch: pytest.MonkeyPatch):
+    with given:
+        patch_streams(monkeypatch)
+        demux = install_demux_stream("stdout")
+
+    with when:
+        res = install_demux_stream("stdout")
+
+    with then:
+        assert res is demux
+
+
+def test_reinstall_if_replaced(monkeypatch: pytest.MonkeyPatch):
+    with given:
+        patch_streams(monkeypatch)
+        install_demux_stream("stdout")
+        replaced = StringIO()
+        monkeypatch.setattr(sys, "stdout", replaced)
+
+    with when:
+        demux = install_demux_stream("stdout")
+
+    with then:
+        assert demux.stream is replaced
+
+
+def test_write_without_target():
+    with given:
+        stream = StringIO()
+        demux = DemuxStream(stream, "stdout")
+
+    with when:
+        demux.write("banana")
+
+    with then:
+        assert stream.getvalue() == "banana"
+
+
+def test_write_with_target():
+    with given:
+        stream, target = StringIO(), StringIO()
+        demux = DemuxStream(stream, "stdout")
+        demux.redirect(target)
+
+    with when:
+        demux.writelines(["banana", "\n"])
+
+    with then:
+        assert target.getvalue() == "banana\n"
+        assert stream.getvalue() == ""
+
+
+def test_restore():
+    with given:
+        stream, target = StringIO(), StringIO()
+        demux = DemuxStream(stream, "stdout")
+        token = demux.redirect(target)
+
+    with when:
+        demux.restore(token)
+        demux.write("banana")
+
+    with then:
+        assert stream.getvalue() == "banana"
+        assert target.getvalue() == ""
+
+
+def test_delegate_attrs():
+    with given:
+        stream = StringIO()
+        demux = DemuxStream(stream, "stdout")
+
+    with when:
+        res = demux.getvalue
+
+    with then:
+        assert res == stream.getvalue
@@ -0,0 +1,105 @@
+import os
+import subprocess
+import sys
+from io import StringIO
+from typing import Tuple
+
+import pytest
+from baby_steps import given, then, when
+
+from vedro.core.output_capturer import FdCapturedOutput, FdRedirect
+
+
+def patch_streams(monkeypatch: pytest.MonkeyPatch) -> Tuple[StringIO, StringIO]:
+    # Patched within the test itself, since pytest replaces sys streams after fixture setup
+    stdout, stderr = StringIO(), StringIO()
+    monkeypatch.setattr(sys, "stdout", stdout)
+    monkeypatch.setattr(sys, "stderr", stderr)
+    return stdout, stderr
+
+
+def test_capture_python_output(monkeypatch: pytest.MonkeyPatch):
+    with given:
+        stdout, stderr = patch_streams(monkeypatch)
+        captured = FdCapturedOutput()
+
+    with when:
+        with captured:
+            print("banana")
+
+    with then:
+        assert captured.stdout.get_value() == "banana\n"
+        assert stdout.getvalue() == ""
+
+
+def test_capture_fd_output(monkeypatch: pytest.MonkeyPatch):
+    with given:
+        stdout, stderr = patch_streams(monkeypatch)
+        captured = FdCapturedOutput()
+
+    with when:
+        with captured:
+            os.write(1, b"fd stdout\n")
+            os.write(2, b"fd stderr\n")
+
+    with then:
+        assert captured.stdout.get_value() == "fd stdout\n"
+        assert captured.stderr.get_value() == "fd stderr\n"
+
+
+def test_capture_subprocess_output(monkeypatch: pytest.MonkeyPatch):
+    with given:
+        stdout, stderr = patch_streams(monkeypatch)
+        captured = FdCapturedOutput()
+
+    with when:
+        with captured:
+            subprocess.run([sys.executable, "-c", "print('subprocess')"], check=True)
+
+    with then:
+        assert captured.stdout.get_value() == "subprocess\n"
+
+
+def test_capture_limit(monkeypatch: pytest.MonkeyPatch):
+    with given:
+        stdout, stderr = patch_streams(monkeypatch)
+        captured = FdCapturedOutput(capture_limit=3)
+
+    with when:
+        with captured:
+            os.write(1, b"banana")
+
+    with then:
+        assert captured.stdout.get_value() == "ana"
+
+
+def test_nested_capture(monkeypatch: pytest.MonkeyPatch):
+    with given:
+        stdout, stderr = patch_streams(monkeypatch)
+        outer, inner = FdCapturedOutput(), FdCapturedOutput()
+
+    with when:
+        with outer:
+            os.write(1, b"before\n")
+            with inner:
+                os.write(1, b"inner\n")
+
+    with then:
+        assert outer.stdout.get_value() == "before\ninner\n"
+        assert inner.stdout.get_value() == "inner\n"
+
+
+def test_redirect_restored():
+    with given:
+        redirect = FdRedirect(1)
+        fd_stat = os.fstat(1)
+
+    with when:
+        offset = redirect.start()
+        os.write(1, b"banana")
+        data = redirect.stop(offset)
+
+    with then:
+        assert data == b"banana"
+        assert redirect.active is False
+        assert os.path.samestat(os.fstat(1), fd_stat)
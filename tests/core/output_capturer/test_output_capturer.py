@@ -1,6 +1,15 @@
-from baby_steps import given, then, when
+from typing import Type
 
-from vedro.core.output_capturer import CapturedOutput, OutputCapturer
+import pytest
+from baby_steps import given, then, when
+from pytest import raises
+
+from vedro.core.output_capturer import (
+    CapturedOutput,
+    ContextCapturedOutput,
+    FdCapturedOutput,
+    OutputCapturer,
+)
 from vedro.core.output_capturer._output_capturer import NoOpCapturedOutput
 
 
@@ -47,3 +56,37 @@ def test_output_capturer_capture_when_enabled():
     with then:
         assert isinstance(captured, CapturedOutput)
         assert not isinstance(captured, NoOpCapturedOutput)
+
+
+def test_output_capturer_default_mode():
+    with when:
+        capturer = OutputCapturer()
+
+    with then:
+        assert capturer.mode == "redirect"
+
+
+@pytest.mark.parametrize(("mode", "expected"), [
+    ("redirect", CapturedOutput),
+    ("context", ContextCapturedOutput),
+    ("fd", FdCapturedOutput),
+])
+def test_output_capturer_capture_mode(mode: str, expected: Type[CapturedOutput]):
+    with given:
+        capturer = OutputCapturer(enabled=True, mode=mode)
+
+    with when:
+        captured = capturer.capture()
+
+    with then:
+        assert type(captured) is expected
+
+
+def test_output_capturer_unknown_mode():
+    with when, raises(BaseException) as exc:
+        OutputCapturer(enabled=True, mode="unknown")
+
+    with then:
+        assert exc.type is ValueError
+        assert str(exc.value) == ("Unknown capture mode 'unknown', "
+                                  "expected one of 'redirect', 'context', 'fd'")
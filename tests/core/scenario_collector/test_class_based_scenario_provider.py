@@ -6,7 +6,11 @@ from baby_steps import given, then, when
 from pytest import raises
 
 from vedro.core import ModuleFileLoader, ModuleLoader
-from vedro.core.scenario_collector import ClassBasedScenarioProvider, ScenarioSource
+from vedro.core.scenario_collector import (
+    ClassBasedScenarioProvider,
+    LazyTemplateScenario,
+    ScenarioSource,
+)
 
 from ._utils import tmp_dir
 
@@ -91,6 +95,61 @@ async def test_parametrized_scenarios(provider: ClassBasedScenarioProvider,
         assert len(scenarios) == 2
 
 
+async def test_lazy_parametrized_scenarios(scenario_source: ScenarioSource):
+    with given:
+        provider = ClassBasedScenarioProvider(lazy_templates=True)
+        scenario_source.path.write_text(dedent('''
+            import vedro
+            class Scenario(vedro.Scenario):
+                subject = "register {user}"
+
+                @vedro.params("Bob")
+                @vedro.params[vedro.skip]("Alice")
+                def __init__(self, user):
+                    pass
+
+                def given(self):
+                    pass
+        '''))
+
+    with when:
+        scenarios = await provider.provide(scenario_source)
+
+    with then:
+        assert [x.unique_id for x in scenarios] == [
+            "scenarios/scenario.py::Scenario#1",
+            "scenarios/scenario.py::Scenario#2",
+        ]
+        assert [x.subject for x in scenarios] == ["register Bob", "register Alice"]
+        assert [x.name for x in scenarios[0].steps] == ["given"]
+
+        assert isinstance(scenarios[0], LazyTemplateScenario)
+        assert scenarios[0].is_materialized() is False
+        assert not isinstance(scenarios[1], LazyTemplateScenario)
+
+
+async def test_materialize_lazy_parametrized_scenario(scenario_source: ScenarioSource):
+    with given:
+        provider = ClassBasedScenarioProvider(lazy_templates=True)
+        scenario_source.path.write_text(dedent('''
+            import vedro
+            class Scenario(vedro.Scenario):
+                @vedro.params("Bob")
+                @vedro.params("Alice")
+                def __init__(self, user):
+                    self.user = user
+        '''))
+        scenarios = await provider.provide(scenario_source)
+
+    with when:
+        await scenarios[1].materialize()
+
+    with then:
+        assert scenarios[0].is_materialized() is False
+        assert scenarios[1].unique_id == "scenarios/scenario.py::Scenario#2"
+        assert scenarios[1]().user == "Alice"
+
+
 async def test_error_on_non_inheriting_scenario_class(provider: ClassBasedScenarioProvider,
                                                       scenario_source: ScenarioSource):
     with given:
@@ -0,0 +1,191 @@
+from pathlib import Path
+from textwrap import dedent
+from unittest.mock import AsyncMock
+
+import pytest
+from baby_steps import given, then, when
+from pytest import raises
+
+from vedro.core import ModuleFileLoader, ModuleLoader, Plugin, PluginConfig
+from vedro.core._virtual_scenario import ScenarioInitError
+from vedro.core.scenario_collector import LazyScenarioProvider, LazyVirtualScenario, ScenarioSource
+
+from ._utils import tmp_dir
+
+__all__ = ("tmp_dir",)  # fixtures
+
+
+@pytest.fixture()
+def module_loader() -> ModuleLoader:
+    return AsyncMock(ModuleLoader, wraps=ModuleFileLoader())
+
+
+@pytest.fixture()
+def provider() -> LazyScenarioProvider:
+    return LazyScenarioProvider()
+
+
+@pytest.fixture()
+def scenario_source(tmp_dir: Path, module_loader: ModuleLoader) -> ScenarioSource:
+    project_dir = tmp_dir
+    path = project_dir / "scenarios" / "scenario.py"
+    return ScenarioSource(path, project_dir, module_loader)
+
+
+async def test_provide_without_import(provider: LazyScenarioProvider,
+                                      scenario_source: ScenarioSource,
+                                      module_loader: AsyncMock):
+    with given:
+        scenario_source.path.write_text(dedent('''
+            import vedro
+            raise RuntimeError("must not be imported")
+
+            @vedro.skip("reason")
+            class Scenario(vedro.Scenario):
+                """Scenario doc"""
+                subject = "register user"
+                tags = ["API"]
+
+                def given(self):
+                    pass
+        '''))
+
+    with when:
+        scenarios = await provider.provide(scenario_source)
+
+    with then:
+        assert len(scenarios) == 1
+        scenario = scenarios[0]
+        assert isinstance(scenario, LazyVirtualScenario)
+        assert scenario.is_materialized() is False
+        assert scenario.unique_id == "scenarios/scenario.py::Scenario"
+        assert scenario.subject == "register user"
+        assert scenario.doc == "Scenario doc"
+        assert scenario.tags == ["API"]
+        assert scenario.lineno == 6
+        assert [x.name for x in scenario.steps] == ["given"]
+        assert scenario.get_meta("skipped", plugin=Plugin(PluginConfig), default=False,
+                                 fallback_key="__vedro__skipped__") is True
+
+        assert module_loader.load.mock_calls == []
+
+
+async def test_provide_template(provider: LazyScenarioProvider,
+                                scenario_source: ScenarioSource):
+    with given:
+        scenario_source.path.write_text(dedent('''
+            import vedro
+            from vedro import params
+
+            class Scenario(vedro.Scenario):
+                subject = "get status {status}"
+
+                @params(200)
+                @params(404)
+                def __init__(self, status):
+                    self.status = status
+        '''))
+
+    with when:
+        scenarios = await provider.provide(scenario_source)
+
+    with then:
+        assert [x.unique_id for x in scenarios] == [
+            "scenarios/scenario.py::Scenario#1",
+            "scenarios/scenario.py::Scenario#2",
+        ]
+        assert [x.subject for x in scenarios] == ["get status 200", "get status 404"]
+        assert [x.template_total for x in scenarios] == [2, 2]
+
+
+async def test_materialize(provider: LazyScenarioProvider, scenario_source: ScenarioSource,
+                           module_loader: AsyncMock):
+    with given:
+        scenario_source.path.write_text(dedent('''
+            import vedro
+            from vedro import params
+
+            class Scenario(vedro.Scenario):
+                subject = "get status {status}"
+
+                @params(200)
+                @params(404)
+                def __init__(self, status):
+                    self.status = status
+
+                def then(self):
+                    pass
+        '''))
+        scenarios = await provider.provide(scenario_source)
+
+        plugin = Plugin(PluginConfig)
+        scenarios[1].set_meta("key", "value", plugin=plugin)
+
+    with when:
+        await scenarios[0].materialize()
+        await scenarios[1].materialize()
+
+    with then:
+        assert len(module_loader.load.mock_calls) == 1
+        assert [x.is_materialized() for x in scenarios] == [True, True]
+
+        scenario = scenarios[1]
+        assert scenario._orig_scenario.__name__ == "Scenario_2_VedroScenario"
+        assert scenario.template_args.arguments == {"self": None, "status": 404}
+        assert scenario.steps[0]._orig_step is scenario._orig_scenario.then
+        assert scenario.get_meta("key", plugin=plugin) == "value"
+        assert scenario().status == 404
+
+
+async def test_orig_scenario_before_materialize(provider: LazyScenarioProvider,
+                                                scenario_source: ScenarioSource):
+    with given:
+        scenario_source.path.write_text(dedent('''
+            import vedro
+            class Scenario(vedro.Scenario):
+                pass
+        '''))
+        scenarios = await provider.provide(scenario_source)
+
+    with when, raises(BaseException) as exc:
+        scenarios[0]()
+
+    with then:
+        assert exc.type is ScenarioInitError
+
+
+async def test_fallback_to_import(provider: LazyScenarioProvider,
+                                  scenario_source: ScenarioSource,
+                                  module_loader: AsyncMock):
+    with given:
+        scenario_source.path.write_text(dedent('''
+            import vedro
+            from enum import Enum
+
+            class Tag(Enum):
+                API = "API"
+
+            class Scenario(vedro.Scenario):
+                tags = [Tag.API]
+        '''))
+
+    with when:
+        scenarios = await provider.provide(scenario_source)
+
+    with then:
+        assert len(scenarios) == 1
+        assert not isinstance(scenarios[0], LazyVirtualScenario)
+        assert len(module_loader.load.mock_calls) == 1
+
+
+async def test_not_py_file(provider: LazyScenarioProvider, tmp_dir: Path,
+                           module_loader: ModuleLoader):
+    with given:
+        path = tmp_dir / "scenarios" / "scenario.txt"
+        source = ScenarioSource(path, tmp_dir, module_loader)
+
+    with when:
+        scenarios = await provider.provide(source)
+
+    with then:
+        assert scenarios == []
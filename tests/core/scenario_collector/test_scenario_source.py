@@ -7,6 +7,7 @@ from baby_steps import given, then, when
 
 from vedro.core import ModuleLoader
 from vedro.core.scenario_collector import ScenarioSource
+from vedro.core.startup_profiler import StartupProfiler
 
 from ._utils import loaded_module, module_loader, tmp_dir
 
@@ -60,6 +61,26 @@ async def test_get_module_uses_cache(tmp_dir: Path, module_loader: ModuleLoader,
         assert module_loader.load.await_count == 1
 
 
+async def test_get_module_with_startup_profiler(tmp_dir: Path, module_loader: ModuleLoader,
+                                                loaded_module: ModuleType):
+    with given:
+        project_dir = tmp_dir
+        path = project_dir / "scenarios" / "scenario.py"
+        source = ScenarioSource(path, project_dir, module_loader)
+
+        profiler = StartupProfiler()
+        profiler.start()
+
+    with when, profiler.activate():
+        module = await source.get_module()
+
+    with then:
+        assert module is loaded_module
+        assert [(s.name, s.category) for s in profiler.spans] == [
+            ("scenarios/scenario.py", "import"),
+        ]
+
+
 async def test_get_content_first_time(tmp_dir: Path, module_loader: ModuleLoader):
     with given:
         project_dir = tmp_dir
@@ -0,0 +1,166 @@
+import ast
+from textwrap import dedent
+
+import pytest
+from baby_steps import given, then, when
+from niltype import Nil
+
+from vedro.core.scenario_collector import StaticScenarioParser
+
+
+@pytest.fixture()
+def parser() -> StaticScenarioParser:
+    return StaticScenarioParser()
+
+
+def parse(parser: StaticScenarioParser, source: str):
+    return parser.parse(ast.parse(dedent(source)))
+
+
+def test_plain_scenario(parser: StaticScenarioParser):
+    with given:
+        source = '''
+            import vedro
+
+            class Scenario(vedro.Scenario):
+                """Scenario doc"""
+                subject = "register user"
+
+                def given(self):
+                    """Given doc"""
+
+                async def when(self):
+                    pass
+
+                def _helper(self):
+                    pass
+        '''
+
+    with when:
+        scenarios = parse(parser, source)
+
+    with then:
+        assert len(scenarios) == 1
+        scenario = scenarios[0]
+        assert scenario.name == "Scenario"
+        assert scenario.lineno == 4
+        assert scenario.doc == "Scenario doc"
+        assert scenario.subject == "register user"
+        assert scenario.tags is Nil
+        assert [(x.name, x.doc, x.is_coro) for x in scenario.steps] == [
+            ("given", "Given doc", False),
+            ("when", None, True),
+        ]
+        assert scenario.cases == ()
+        assert (scenario.skipped, scenario.skip_reason, scenario.only) == (False, None, False)
+
+
+@pytest.mark.parametrize("imports", [
+    "from vedro import Scenario, params, skip, only",
+    "import vedro\nfrom vedro import Scenario, params, skip, only",
+])
+def test_from_imports(imports: str, *, parser: StaticScenarioParser):
+    with given:
+        source = imports + dedent('''
+
+            @skip("flaky")
+            @only
+            class RegisterUserScenario(Scenario):
+                tags = ["P0", "API"]
+
+                @params("Bob", age=20)
+                @params("Alice")
+                def __init__(self, name, age=18):
+                    self.name = name
+        ''')
+
+    with when:
+        scenarios = parse(parser, source)
+
+    with then:
+        assert len(scenarios) == 1
+        scenario = scenarios[0]
+        assert scenario.tags == ["P0", "API"]
+        assert (scenario.skipped, scenario.skip_reason, scenario.only) == (True, "flaky", True)
+        assert [x.arguments for x in scenario.cases] == [
+            {"self": None, "name": "Bob", "age": 20},
+            {"self": None, "name": "Alice", "age": 18},
+        ]
+
+
+def test_non_literal_params(parser: StaticScenarioParser):
+    with given:
+        source = '''
+            import vedro
+            from http import HTTPStatus
+
+            class Scenario(vedro.Scenario):
+                subject = "get status"
+
+                @vedro.params(HTTPStatus.OK)
+                @vedro.params(200)
+                def __init__(self, status):
+                    self.status = status
+        '''
+
+    with when:
+        scenarios = parse(parser, source)
+
+    with then:
+        assert len(scenarios) == 1
+        assert scenarios[0].cases[0] is None
+        assert scenarios[0].cases[1].arguments == {"self": None, "status": 200}
+
+
+def test_non_scenario_classes(parser: StaticScenarioParser):
+    with given:
+        source = '''
+            import vedro
+            from enum import Enum
+
+            class Tag(Enum):
+                API = "API"
+
+            class _PrivateScenario(vedro.Scenario):
+                pass
+
+            class Scenario(vedro.Scenario):
+                pass
+        '''
+
+    with when:
+        scenarios = parse(parser, source)
+
+    with then:
+        assert [x.name for x in scenarios] == ["Scenario"]
+
+
+@pytest.mark.parametrize("source", [
+    # non-literal subject or tags
+    "class Scenario(vedro.Scenario):\n    subject = make_subject()",
+    "class Scenario(vedro.Scenario):\n    tags = [Tag.API]",
+    # subject requires non-literal arguments
+    ("class Scenario(vedro.Scenario):\n    subject = 'get {status}'\n"
+     "    @vedro.params(HTTPStatus.OK)\n    def __init__(self, status): pass"),
+    # unknown decorators
+    "@vedro.skip_if(lambda: True)\nclass Scenario(vedro.Scenario):\n    pass",
+    "class Scenario(vedro.Scenario):\n    @vedro.params[vedro.skip](1)\n"
+    "    def __init__(self, x): pass",
+    "class Scenario(vedro.Scenario):\n    @decorator\n    def given(self): pass",
+    # public attribute that may be a step
+    "class Scenario(vedro.Scenario):\n    when = helpers.do_something",
+    # unresolved base
+    "class Scenario(BaseScenario):\n    pass",
+    # conditional declaration
+    "if True:\n    class Scenario(vedro.Scenario):\n        pass",
+    # rebound name
+    "class Scenario(vedro.Scenario):\n    pass\nScenario = wrap(Scenario)",
+    # invalid params
+    "class Scenario(vedro.Scenario):\n    @vedro.params(1, 2)\n    def __init__(self, x): pass",
+])
+def test_unsupported(source: str, *, parser: StaticScenarioParser):
+    with when:
+        scenarios = parse(parser, "import vedro\n" + source)
+
+    with then:
+        assert scenarios is None
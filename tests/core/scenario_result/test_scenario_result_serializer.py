@@ -0,0 +1,167 @@
+import json
+import sys
+from pathlib import Path
+from time import monotonic_ns
+from traceback import format_exception
+
+from baby_steps import given, then, when
+
+from vedro import Scenario
+from vedro.core import (
+    ExcInfo,
+    FileArtifact,
+    MemoryArtifact,
+    ScenarioResult,
+    StepResult,
+    StreamArtifact,
+    VirtualScenario,
+    VirtualStep,
+)
+from vedro.core.output_capturer import CapturedOutput
+from vedro.core.scenario_result import RemoteError, ScenarioResultSerializer
+
+
+def make_vscenario() -> VirtualScenario:
+    class _Scenario(Scenario):
+        __file__ = Path(f"scenario_{monotonic_ns()}.py").absolute()
+
+        def given(self):
+            pass
+
+        def then(self):
+            pass
+
+    return VirtualScenario(_Scenario, steps=[VirtualStep(_Scenario.given),
+                                             VirtualStep(_Scenario.then)])
+
+
+def make_exc_info() -> ExcInfo:
+    try:
+        raise AssertionError("banana")
+    except AssertionError:
+        return ExcInfo(*sys.exc_info())  # type: ignore
+
+
+def roundtrip(scenario_result: ScenarioResult) -> ScenarioResult:
+    serializer = ScenarioResultSerializer()
+    data = json.loads(json.dumps(serializer.serialize(scenario_result)))
+    return serializer.deserialize(data, scenario_result.scenario)
+
+
+def test_serialize_passed():
+    with given:
+        vscenario = make_vscenario()
+        scenario_result = ScenarioResult(vscenario).set_started_at(1.0).set_ended_at(3.0)
+        for step in vscenario.steps:
+            step_result = StepResult(step).set_started_at(1.0).set_ended_at(2.0).mark_passed()
+            scenario_result.add_step_result(step_result)
+        scenario_result.mark_passed()
+
+    with when:
+        res = roundtrip(scenario_result)
+
+    with then:
+        assert res.is_passed()
+        assert res.scenario is vscenario
+        assert (res.started_at, res.ended_at) == (1.0, 3.0)
+        assert [x.step for x in res.step_results] == vscenario.steps
+        assert all(x.is_passed() for x in res.step_results)
+        assert res.step_results[0].elapsed == 1.0
+
+
+def test_serialize_failed():
+    with given:
+        vscenario = make_vscenario()
+        step_result = StepResult(vscenario.steps[0]).mark_failed()
+        step_result.set_exc_info(make_exc_info())
+        scenario_result = ScenarioResult(vscenario).mark_failed()
+        scenario_result.add_step_result(step_result)
+
+    with when:
+        res = roundtrip(scenario_result)
+
+    with then:
+        assert res.is_failed()
+        exc_info = res.step_results[0].exc_info
+        assert issubclass(exc_info.type, RemoteError)
+        assert exc_info.type.__name__ == "AssertionError"
+        assert str(exc_info.value) == "banana"
+        assert "raise AssertionError" in exc_info.value.remote_traceback
+        assert exc_info.traceback is None
+
+
+def test_serialize_exc_info_snapshot():
+    with given:
+        exc_info = make_exc_info()
+        formatted = "".join(format_exception(exc_info.type, exc_info.value, exc_info.traceback))
+        exc_info.snapshot_traceback()
+
+    with when:
+        data = ScenarioResultSerializer().serialize_exc_info(exc_info)
+
+    with then:
+        assert data["traceback"] == formatted
+
+
+def test_serialize_skipped():
+    with given:
+        scenario_result = ScenarioResult(make_vscenario()).mark_skipped()
+
+    with when:
+        res = roundtrip(scenario_result)
+
+    with then:
+        assert res.is_skipped()
+        assert res.step_results == []
+
+
+def test_serialize_unknown_step():
+    with given:
+        vscenario = make_vscenario()
+        step_result = StepResult(VirtualStep(lambda self: None)).mark_passed()
+        scenario_result = ScenarioResult(vscenario).mark_passed()
+        scenario_result.add_step_result(step_result)
+
+    with when:
+        res = roundtrip(scenario_result)
+
+    with then:
+        assert res.step_results[0].step_name == "<lambda>"
+        assert res.step_results[0].step not in vscenario.steps
+
+
+def test_serialize_captured_output_and_artifacts(tmp_path: Path):
+    with given:
+        captured_output = CapturedOutput()
+        with captured_output:
+            print("banana")
+
+        memory_artifact = MemoryArtifact("log", "text/plain", b"\x00data")
+        file_artifact = FileArtifact("file", "text/plain", tmp_path / "file.txt")
+
+        scenario_result = ScenarioResult(make_vscenario()).mark_passed()
+        scenario_result.set_captured_output(captured_output)
+        scenario_result.attach(memory_artifact)
+        scenario_result.attach(file_artifact)
+
+    with when:
+        res = roundtrip(scenario_result)
+
+    with then:
+        assert res.captured_output.stdout.get_value() == "banana\n"
+        assert res.artifacts == [memory_artifact, file_artifact]
+
+
+def test_serialize_saved_stream_artifact(tmp_path: Path):
+    with given:
+        stream_artifact = StreamArtifact("log", "text/plain", [b"data"])
+        stream_artifact.mark_saved(tmp_path / "log")
+
+        scenario_result = ScenarioResult(make_vscenario()).mark_passed()
+        scenario_result.attach(stream_artifact)
+
+    with when:
+        res = roundtrip(scenario_result)
+
+    with then:
+        assert res.artifacts == [FileArtifact("log", "text/plain", tmp_path / "log")]
@@ -278,3 +278,30 @@ async def test_exception_outside_step_context(*, runner: ScenarioRunner,
         assert step_result3.is_failed()
         assert step_result3.step.name == "unexpected_error"
         assert step_result3.exc_info == exc_info
+
+
+async def test_recorded_step_wrappers_reused(*, runner: ScenarioRunner,
+                                             step_recorder: StepRecorder):
+    with given:
+        step_recorder.record("Given", "setup data", 1.0, 2.0)
+        step_recorder.record("Given", "setup data", 2.0, 3.0)
+        step_recorder.record("Then", "verify result", 3.0, 4.0)
+
+        def do(self):
+            pass
+
+        step_result = StepResult(VirtualStep(do))
+        step_result.set_started_at(1.0).set_ended_at(4.0).mark_passed()
+
+        scenario_result = ScenarioResult(make_vscenario())
+        scenario_result.set_started_at(1.0)
+
+    with when:
+        await runner._fire_fn_step_events(step_result, scenario_result)
+
+    with then:
+        step_result1, step_result2, step_result3 = scenario_result.step_results
+        assert step_result1 is not step_result2
+        assert step_result1.step is step_result2.step
+        assert step_result3.step is not step_result1.step
+        assert step_result3.step.name == "then verify result"
@@ -1,10 +1,11 @@
+import asyncio
 from typing import Type, cast
 from unittest.mock import Mock, call
 
 from baby_steps import given, then, when
 from pytest import raises
 
-from vedro.core import MonotonicScenarioRunner, VirtualScenario
+from vedro.core import MonotonicScenarioRunner, VirtualScenario, VirtualStep
 from vedro.core.scenario_runner import ScenarioInterrupted
 from vedro.events import (
     ScenarioFailedEvent,
@@ -13,6 +14,9 @@ from vedro.events import (
     StepPassedEvent,
     StepRunEvent,
 )
+from vedro.plugins.functioner import given as fn_given
+from vedro.plugins.functioner import then as fn_then
+from vedro.plugins.functioner._step_recorder import get_step_recorder
 
 from ._utils import (
     dispatcher_,
@@ -94,3 +98,32 @@ async def test_fn_scenario_interrupt(*, runner: MonotonicScenarioRunner,
             call.fire(ScenarioRunEvent(scenario_result)),
             call.fire(ScenarioFailedEvent(scenario_result)),
         ]
+
+
+async def test_concurrent_fn_scenarios(*, dispatcher_: Mock):
+    with given:
+        # given/when/then record steps to the global recorder
+        runner = MonotonicScenarioRunner(dispatcher_, step_recorder=get_step_recorder())
+
+        def make_scenario(name: str) -> VirtualScenario:
+            async def do(self):
+                async with fn_given(f"{name} given"):
+                    await asyncio.sleep(0)
+                async with fn_then(f"{name} then"):
+                    await asyncio.sleep(0)
+            vscenario = make_vscenario(steps=[VirtualStep(do)])
+            vscenario._orig_scenario.__vedro__fn__ = True
+            return vscenario
+
+        scenario1, scenario2 = make_scenario("first"), make_scenario("second")
+
+    with when:
+        result1, result2 = await asyncio.gather(runner.run_scenario(scenario1),
+                                                runner.run_scenario(scenario2))
+
+    with then:
+        assert result1.is_passed() and result2.is_passed()
+        assert [x.step.name for x in result1.step_results] == ["given first given",
+                                                               "then first then"]
+        assert [x.step.name for x in result2.step_results] == ["given second given",
+                                                               "then second then"]
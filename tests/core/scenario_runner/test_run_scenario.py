@@ -1,13 +1,17 @@
 from os import linesep
+from pathlib import Path
+from types import ModuleType
 from typing import Type, cast
-from unittest.mock import Mock, call
+from unittest.mock import AsyncMock, Mock, call
 
 import pytest
 from baby_steps import given, then, when
 from pytest import raises
 
+from vedro import Scenario
 from vedro.core import Event, MonotonicScenarioRunner, ScenarioResult
 from vedro.core.output_capturer import OutputCapturer
+from vedro.core.scenario_collector import LazyVirtualScenario, StaticScenario, StaticStep
 from vedro.core.scenario_runner import Interrupted, ScenarioInterrupted
 from vedro.events import (
     ExceptionRaisedEvent,
@@ -329,3 +333,47 @@ async def test_scenario_skipped_with_captured_output(*, runner: MonotonicScenari
 
         # Skipped scenarios don't initialize or run, so no output is captured
         assert scenario_result.captured_output is None
+
+
+async def test_lazy_scenario_materialized(*, runner: MonotonicScenarioRunner,
+                                          dispatcher_: Mock):
+    with given:
+        step_ = Mock()
+
+        class _Scenario(Scenario):
+            def given(self):
+                step_()
+
+        module = ModuleType("scenario")
+        module.__file__ = str(Path("scenario.py").absolute())
+        module._Scenario = _Scenario
+
+        static_scenario = StaticScenario("_Scenario", 1, steps=(StaticStep("given", None, False),))
+        vscenario = LazyVirtualScenario(static_scenario, AsyncMock(return_value=module),
+                                        path=Path(module.__file__), project_dir=Path.cwd())
+
+    with when:
+        scenario_result = await runner.run_scenario(vscenario)
+
+    with then:
+        assert vscenario.is_materialized() is True
+        assert scenario_result.is_passed() is True
+        assert step_.mock_calls == [call()]
+
+
+async def test_lazy_scenario_skipped_not_materialized(*, runner: MonotonicScenarioRunner,
+                                                      dispatcher_: Mock):
+    with given:
+        module_getter_ = AsyncMock()
+        vscenario = LazyVirtualScenario(StaticScenario("Scenario", 1), module_getter_,
+                                        path=Path("scenario.py").absolute(),
+                                        project_dir=Path.cwd())
+        vscenario.skip()
+
+    with when:
+        scenario_result = await runner.run_scenario(vscenario)
+
+    with then:
+        assert scenario_result.is_skipped() is True
+        assert vscenario.is_materialized() is False
+        assert module_getter_.mock_calls == []
@@ -157,3 +157,37 @@ async def test_scenario_interrupted(*, runner: MonotonicScenarioRunner,
         assert exc.type is RunInterrupted
         orig_exc = cast(RunInterrupted, exc.value)
         assert isinstance(orig_exc.exc_info.value, interrupt_exception)
+
+
+async def test_run_scenarios_pending(*, runner: MonotonicScenarioRunner, dispatcher_: Mock):
+    with given:
+        report = Report()
+        vscenario1, vscenario2 = make_vscenario(), make_vscenario()
+
+        class _Scheduler(Scheduler):
+            order = [vscenario1, vscenario2, vscenario1]
+
+            async def __anext__(self):
+                if len(self.order) == 0:
+                    raise StopAsyncIteration()
+                return self.order.pop(0)
+
+            def has_pending(self, scenario):
+                return scenario in self.order
+
+        scheduler = _Scheduler([vscenario1, vscenario2])
+        scheduler.aggregate_results = Mock(side_effect=(make_aggregated_result(),
+                                                        make_aggregated_result()))
+
+    with when:
+        await runner._run_scenarios(scheduler, report)
+
+    with then:
+        assert report.total == 2
+
+        # vscenario1 is reported after its pending execution
+        scenario2_results = scheduler.aggregate_results.mock_calls[0].args[0]
+        assert [x.scenario for x in scenario2_results] == [vscenario2]
+
+        scenario1_results = scheduler.aggregate_results.mock_calls[1].args[0]
+        assert [x.scenario for x in scenario1_results] == [vscenario1, vscenario1]
@@ -1,4 +1,5 @@
 from os import linesep
+from threading import current_thread
 from typing import Type, cast
 from unittest.mock import Mock, call
 
@@ -219,3 +220,48 @@ async def test_step_interrupted_with_captured_output(method_mock_factory: Mock,
 
         assert step_result.captured_output is not None
         assert step_result.captured_output.stdout.get_value() == f"{test_output}{linesep}"
+
+
+async def test_step_offloaded(*, runner: MonotonicScenarioRunner, dispatcher_: Mock):
+    with given:
+        threads = []
+
+        def step(scenario):
+            threads.append(current_thread())
+        setattr(step, "__vedro__offload__", True)
+
+        scenario_ = Mock(Scenario, step=step)
+        vstep = VirtualStep(step)
+
+    with when:
+        step_result = await runner.run_step(vstep, scenario_)
+
+    with then:
+        assert step_result.is_passed() is True
+        assert len(threads) == 1
+        assert threads[0] is not current_thread()
+
+
+async def test_step_failed_snapshot_traceback(*, dispatcher_: Mock):
+    with given:
+        runner = MonotonicScenarioRunner(dispatcher_, snapshot_tracebacks=True)
+
+        tracebacks = []
+        dispatcher_.fire.side_effect = lambda event: tracebacks.append(
+            event.exc_info.traceback if isinstance(event, ExceptionRaisedEvent) else None
+        )
+
+        step_ = Mock(side_effect=AssertionError(), __name__="step")
+        vstep = VirtualStep(step_)
+
+    with when:
+        step_result = await runner.run_step(vstep, Mock(Scenario, step=step_))
+
+    with then:
+        assert step_result.is_failed() is True
+        assert tracebacks[1] is not None  # ExceptionRaisedEvent handlers see the traceback
+
+        exc_info = step_result.exc_info
+        assert exc_info.traceback is None
+        assert exc_info.value.__traceback__ is None
+        assert len(exc_info.snapshot.frames) > 0
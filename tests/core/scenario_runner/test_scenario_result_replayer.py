@@ -0,0 +1,101 @@
+from unittest.mock import call
+
+from baby_steps import given, then, when
+
+from vedro.core import Dispatcher, ExcInfo, ScenarioResult, StepResult
+from vedro.core.scenario_result import ScenarioResultSerializer
+from vedro.core.scenario_runner import ScenarioResultReplayer
+from vedro.events import (
+    ExceptionRaisedEvent,
+    ScenarioFailedEvent,
+    ScenarioPassedEvent,
+    ScenarioRunEvent,
+    ScenarioSkippedEvent,
+    StepFailedEvent,
+    StepPassedEvent,
+    StepRunEvent,
+)
+
+from ._utils import dispatcher_, make_vscenario, make_vstep
+
+__all__ = ("dispatcher_",)  # fixtures
+
+
+async def test_replay_passed(*, dispatcher_: Dispatcher):
+    with given:
+        vscenario = make_vscenario([make_vstep(name="given"), make_vstep(name="then")])
+        scenario_result = ScenarioResult(vscenario).set_started_at(1.0).set_ended_at(2.0)
+        for step in vscenario.steps:
+            scenario_result.add_step_result(StepResult(step).mark_passed())
+        scenario_result.mark_passed()
+
+        data = ScenarioResultSerializer().serialize(scenario_result)
+        replayer = ScenarioResultReplayer(dispatcher_)
+
+    with when:
+        res = await replayer.replay(vscenario, data)
+
+    with then:
+        assert res.is_passed()
+        assert (res.started_at, res.ended_at) == (1.0, 2.0)
+        assert [x.step for x in res.step_results] == vscenario.steps
+
+        step_result1, step_result2 = res.step_results
+        assert dispatcher_.mock_calls == [
+            call.fire(ScenarioRunEvent(res)),
+            call.fire(StepRunEvent(step_result1)),
+            call.fire(StepPassedEvent(step_result1)),
+            call.fire(StepRunEvent(step_result2)),
+            call.fire(StepPassedEvent(step_result2)),
+            call.fire(ScenarioPassedEvent(res)),
+        ]
+
+
+async def test_replay_failed(*, dispatcher_: Dispatcher):
+    with given:
+        vscenario = make_vscenario([make_vstep(name="then")])
+        scenario_result = ScenarioResult(vscenario)
+        try:
+            raise AssertionError("banana")
+        except AssertionError as e:
+            exc_info = ExcInfo(type(e), e, e.__traceback__)
+        step_result = StepResult(vscenario.steps[0]).mark_failed().set_exc_info(exc_info)
+        scenario_result.add_step_result(step_result)
+        scenario_result.mark_failed()
+
+        data = ScenarioResultSerializer().serialize(scenario_result)
+        replayer = ScenarioResultReplayer(dispatcher_)
+
+    with when:
+        res = await replayer.replay(vscenario, data)
+
+    with then:
+        assert res.is_failed()
+
+        step_result, = res.step_results
+        assert str(step_result.exc_info.value) == "banana"
+        assert dispatcher_.mock_calls == [
+            call.fire(ScenarioRunEvent(res)),
+            call.fire(StepRunEvent(step_result)),
+            call.fire(ExceptionRaisedEvent(step_result.exc_info)),
+            call.fire(StepFailedEvent(step_result)),
+            call.fire(ScenarioFailedEvent(res)),
+        ]
+
+
+async def test_replay_skipped(*, dispatcher_: Dispatcher):
+    with given:
+        vscenario = make_vscenario(is_skipped=True)
+        scenario_result = ScenarioResult(vscenario).mark_skipped()
+
+        data = ScenarioResultSerializer().serialize(scenario_result)
+        replayer = ScenarioResultReplayer(dispatcher_)
+
+    with when:
+        res = await replayer.replay(vscenario, data)
+
+    with then:
+        assert res.is_skipped()
+        assert dispatcher_.mock_calls == [
+            call.fire(ScenarioSkippedEvent(res)),
+        ]
@@ -0,0 +1,197 @@
+import json
+from itertools import count
+from os import getpid
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from baby_steps import given, then, when
+from pytest import raises
+
+from vedro.core.startup_profiler import ProfileSpan, StartupProfiler, get_startup_profiler
+
+
+@pytest.fixture()
+def clock() -> Callable[[], float]:
+    ticks = count()
+    return lambda: float(next(ticks))
+
+
+@pytest.fixture()
+def profiler(clock: Callable[[], float]) -> StartupProfiler:
+    return StartupProfiler(clock=clock)
+
+
+def test_not_running_by_default(profiler: StartupProfiler):
+    with when:
+        is_running = profiler.is_running
+
+    with then:
+        assert is_running is False
+        assert profiler.elapsed == 0.0
+
+
+def test_span_not_recorded_before_start(profiler: StartupProfiler):
+    with when:
+        with profiler.span("phase", "phase"):
+            pass
+
+    with then:
+        assert profiler.spans == []
+
+
+def test_span_recorded(profiler: StartupProfiler):
+    with given:
+        profiler.start()  # t=0
+
+    with when:
+        with profiler.span("phase", "phase"):  # t=1..2
+            pass
+
+    with then:
+        assert profiler.is_running is True
+        assert profiler.spans == [ProfileSpan("phase", "phase", 1.0, 2.0, depth=0)]
+
+
+def test_nested_spans_recorded(profiler: StartupProfiler):
+    with given:
+        profiler.start()  # t=0
+
+    with when:
+        with profiler.span("phase", "phase"):  # t=1..4
+            with profiler.span("handler", "handler"):  # t=2..3
+                pass
+
+    with then:
+        assert profiler.spans == [
+            ProfileSpan("handler", "handler", 2.0, 3.0, depth=1),
+            ProfileSpan("phase", "phase", 1.0, 4.0, depth=0),
+        ]
+
+
+def test_span_recorded_on_exception(profiler: StartupProfiler):
+    with given:
+        profiler.start()  # t=0
+
+    with when, raises(BaseException) as exc:
+        with profiler.span("phase", "phase"):  # t=1..2
+            raise KeyError()
+
+    with then:
+        assert exc.type is KeyError
+        assert profiler.spans == [ProfileSpan("phase", "phase", 1.0, 2.0, depth=0)]
+
+
+def test_span_not_recorded_after_stop(profiler: StartupProfiler):
+    with given:
+        profiler.start()  # t=0
+        profiler.stop()  # t=1
+
+    with when:
+        with profiler.span("phase", "phase"):
+            pass
+
+    with then:
+        assert profiler.is_running is False
+        assert profiler.spans == []
+        assert profiler.elapsed == 1.0
+
+
+def test_start_once(profiler: StartupProfiler):
+    with given:
+        profiler.start()  # t=0
+
+    with when:
+        profiler.start()
+        profiler.stop()  # t=1
+
+    with then:
+        assert profiler.elapsed == 1.0
+
+
+def test_get_ranked_spans(profiler: StartupProfiler):
+    with given:
+        profiler.start()  # t=0
+        with profiler.span("fast", "phase"):  # t=1..2
+            pass
+        with profiler.span("slow", "phase"):  # t=3..6
+            with profiler.span("medium", "handler"):  # t=4..5
+                pass
+
+    with when:
+        ranked = profiler.get_ranked_spans()
+
+    with then:
+        assert [span.name for span in ranked] == ["slow", "fast", "medium"]
+
+
+def test_get_ranked_spans_with_limit(profiler: StartupProfiler):
+    with given:
+        profiler.start()  # t=0
+        with profiler.span("fast", "phase"):  # t=1..2
+            pass
+        with profiler.span("slow", "phase"):  # t=3..6
+            with profiler.span("medium", "handler"):  # t=4..5
+                pass
+
+    with when:
+        ranked = profiler.get_ranked_spans(limit=1)
+
+    with then:
+        assert [span.name for span in ranked] == ["slow"]
+
+
+def test_to_trace_events(profiler: StartupProfiler):
+    with given:
+        profiler.start()  # t=0
+        with profiler.span("phase", "phase"):  # t=1..4
+            with profiler.span("handler", "handler"):  # t=2..3
+                pass
+
+    with when:
+        trace = profiler.to_trace_events()
+
+    with then:
+        pid = getpid()
+        assert trace == {
+            "traceEvents": [
+                {"name": "phase", "cat": "phase", "ph": "X",
+                 "ts": 1_000_000, "dur": 3_000_000, "pid": pid, "tid": 0},
+                {"name": "handler", "cat": "handler", "ph": "X",
+                 "ts": 2_000_000, "dur": 1_000_000, "pid": pid, "tid": 0},
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+
+def test_write_trace(profiler: StartupProfiler, tmp_path: Path):
+    with given:
+        profiler.start()
+        with profiler.span("phase", "phase"):
+            pass
+        path = tmp_path / "trace.json"
+
+    with when:
+        profiler.write_trace(path)
+
+    with then:
+        assert json.loads(path.read_text()) == profiler.to_trace_events()
+
+
+def test_get_startup_profiler_not_activated():
+    with when:
+        profiler = get_startup_profiler()
+
+    with then:
+        assert profiler is None
+
+
+def test_activate(profiler: StartupProfiler):
+    with when:
+        with profiler.activate() as activated:
+            active_profiler = get_startup_profiler()
+
+    with then:
+        assert activated is profiler
+        assert active_profiler is profiler
+        assert get_startup_profiler() is None
@@ -1,10 +1,11 @@
+from io import BytesIO
 from pathlib import Path
 
 import pytest
 from baby_steps import given, then, when
 from pytest import raises
 
-from vedro.core import FileArtifact, MemoryArtifact
+from vedro.core import FileArtifact, MemoryArtifact, StreamArtifact
 
 
 def test_memory_artifact():
@@ -143,3 +144,111 @@ def test_file_artifact_not_eq(args):
 
     with then:
         assert not is_eq
+
+
+async def achunks(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+def test_stream_artifact():
+    with given:
+        name = "log"
+        mime_type = "text/plain"
+
+    with when:
+        artifact = StreamArtifact(name, mime_type, [b"chunk"], compression="gzip")
+
+    with then:
+        assert artifact.name == name
+        assert artifact.mime_type == mime_type
+        assert artifact.compression == "gzip"
+        assert artifact.is_async is False
+        assert artifact.consumed is False
+        assert artifact.saved_path is None
+
+
+def test_stream_artifact_repr():
+    with given:
+        artifact = StreamArtifact("log", "text/plain", [b"chunk"])
+
+    with when:
+        res = repr(artifact)
+
+    with then:
+        assert res == "StreamArtifact<'log', 'text/plain', compression=None>"
+
+
+@pytest.mark.parametrize("source", [b"data", 42])
+def test_stream_artifact_invalid_source(source):
+    with when, raises(BaseException) as exc:
+        StreamArtifact("log", "text/plain", source)
+
+    with then:
+        assert exc.type is TypeError
+
+
+def test_stream_artifact_invalid_compression():
+    with when, raises(BaseException) as exc:
+        StreamArtifact("log", "text/plain", [b"chunk"], compression="bz2")
+
+    with then:
+        assert exc.type is ValueError
+        assert str(exc.value) == ("Unknown compression 'bz2', "
+                                  "expected one of 'gzip', 'zstd' or None")
+
+
+@pytest.mark.parametrize("source", [
+    iter([b"ban", b"ana"]),
+    BytesIO(b"banana"),
+])
+def test_stream_artifact_iter_chunks(source):
+    with given:
+        artifact = StreamArtifact("log", "text/plain", source)
+
+    with when:
+        chunks = artifact.iter_chunks()
+
+    with then:
+        assert b"".join(chunks) == b"banana"
+        assert artifact.consumed is True
+
+
+def test_stream_artifact_iter_chunks_consumed():
+    with given:
+        artifact = StreamArtifact("log", "text/plain", [b"chunk"])
+        artifact.iter_chunks()
+
+    with when, raises(BaseException) as exc:
+        artifact.iter_chunks()
+
+    with then:
+        assert exc.type is RuntimeError
+
+
+def test_stream_artifact_iter_chunks_async_source():
+    with given:
+        artifact = StreamArtifact("log", "text/plain", achunks(b"chunk"))
+
+    with when, raises(BaseException) as exc:
+        artifact.iter_chunks()
+
+    with then:
+        assert exc.type is TypeError
+        assert artifact.consumed is False
+
+
+@pytest.mark.parametrize("source", [
+    [b"ban", b"ana"],
+    achunks(b"ban", b"ana"),
+])
+async def test_stream_artifact_aiter_chunks(source):
+    with given:
+        artifact = StreamArtifact("log", "text/plain", source)
+
+    with when:
+        chunks = [chunk async for chunk in artifact.aiter_chunks()]
+
+    with then:
+        assert b"".join(chunks) == b"banana"
+        assert artifact.consumed is True
@@ -4,9 +4,10 @@ from os import linesep
 from typing import Any, Dict, List, Type, cast
 
 import pytest
-from baby_steps import then, when
+from baby_steps import given, then, when
 
 from vedro import Scenario, params
+from vedro._scenario import build_template_case, lazy_template_expansion
 
 
 def get_scenarios(key: str, globals_: Dict[str, Any]) -> List[Type[Scenario]]:
@@ -103,6 +104,48 @@ def test_proxy_params():
         assert getattr(scenarios[1], "__label__") == "label2"
 
 
+def test_lazy_params():
+    with when, lazy_template_expansion():
+        class LazyParamsScenario(Scenario):
+            @params("Bob")
+            @params[label("label")]("Alice")
+            def __init__(self, user):
+                self.user = user
+
+    with then:
+        cases = getattr(LazyParamsScenario, "__vedro__template_cases__")
+        assert [(x.index, x.bound_args.arguments) for x in cases] == [
+            (1, {"self": None, "user": "Bob"}),
+            (2, {"self": None, "user": "Alice"}),
+        ]
+        # decorated cases are built eagerly
+        assert cases[0].scenario is None
+        assert getattr(cases[1].scenario, "__label__") == "label"
+        assert get_scenarios("LazyParamsScenario", globals()) == [cases[1].scenario]
+
+
+def test_build_lazy_params():
+    with given:
+        with lazy_template_expansion():
+            class BuildLazyParamsScenario(Scenario):
+                @params("Bob")
+                @params("Alice")
+                def __init__(self, user):
+                    self.user = user
+        case = getattr(BuildLazyParamsScenario, "__vedro__template_cases__")[1]
+
+    with when:
+        scenario = build_template_case(BuildLazyParamsScenario, case)
+
+    with then:
+        assert scenario.__name__ == "BuildLazyParamsScenario_2_VedroScenario"
+        assert getattr(scenario, "__vedro__template_index__") == 2
+        assert getattr(scenario, "__vedro__template_total__") == 2
+        assert scenario().user == "Alice"
+        assert build_template_case(BuildLazyParamsScenario, case) is scenario
+        assert get_scenarios("BuildLazyParamsScenario", globals()) == [scenario]
+
+
 def test_params_on_class():
     with when, pytest.raises(BaseException) as exc:
         @params(200)
@@ -121,6 +121,24 @@ def test_elapsed_min_max():
         assert isclose(report.elapsed, 3.0)
 
 
+def test_set_started_at_and_ended_at():
+    with given:
+        report = Report()
+        scenario_result = make_scenario_result()
+        scenario_result.set_started_at(1.0)
+        scenario_result.set_ended_at(5.0)
+        report.add_result(scenario_result)
+
+    with when:
+        report.set_started_at(2.0)
+        report.set_ended_at(3.0)
+
+    with then:
+        assert report.started_at == 2.0
+        assert report.ended_at == 3.0
+        assert isclose(report.elapsed, 1.0)
+
+
 def test_eq():
     with given:
         report1 = Report()
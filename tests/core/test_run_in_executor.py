@@ -0,0 +1,30 @@
+from contextvars import ContextVar
+from threading import get_ident
+
+from baby_steps import given, then, when
+
+from vedro.core._run_in_executor import run_in_executor
+
+_var: ContextVar[str] = ContextVar("_var", default="default")
+
+
+async def test_run_in_executor():
+    with when:
+        result = await run_in_executor(get_ident)
+
+    with then:
+        assert result != get_ident()
+
+
+async def test_run_in_executor_copies_context():
+    with given:
+        token = _var.set("value")
+
+    with when:
+        try:
+            result = await run_in_executor(_var.get)
+        finally:
+            _var.reset(token)
+
+    with then:
+        assert result == "value"
@@ -1,6 +1,7 @@
 from types import MethodType
 from unittest.mock import AsyncMock, Mock, call, sentinel
 
+import pytest
 from baby_steps import given, then, when
 
 from vedro.core import VirtualStep
@@ -149,3 +150,29 @@ def test_virtual_step_doc_when_absent():
 
     with then:
         assert doc is None
+
+
+def test_virtual_step_is_offloaded():
+    with given:
+        def method():
+            pass
+        setattr(method, "__vedro__offload__", True)
+        step = VirtualStep(method)
+
+    with when:
+        res = step.is_offloaded()
+
+    with then:
+        assert res is True
+
+
+@pytest.mark.parametrize("method_", [Mock(MethodType), AsyncMock(MethodType)])
+def test_virtual_step_is_not_offloaded(method_):
+    with given:
+        step = VirtualStep(method_)
+
+    with when:
+        res = step.is_offloaded()
+
+    with then:
+        assert res is False
@@ -1,8 +1,9 @@
 from argparse import ArgumentParser, Namespace
 from collections import deque
+from contextvars import ContextVar
 from pathlib import Path
 from time import monotonic_ns
-from typing import Optional
+from typing import Optional, Type
 from unittest.mock import patch
 
 import pytest
@@ -26,13 +27,13 @@ def global_artifacts() -> deque:
 
 
 @pytest.fixture()
-def scenario_artifacts() -> deque:
-    return deque()
+def scenario_artifacts() -> ContextVar:
+    return ContextVar("scenario_artifacts", default=deque())
 
 
 @pytest.fixture()
-def step_artifacts() -> deque:
-    return deque()
+def step_artifacts() -> ContextVar:
+    return ContextVar("step_artifacts", default=deque())
 
 
 @pytest.fixture()
@@ -55,8 +56,8 @@ def artifact_manager(artifacts_dir: Path, project_dir: Path):
 @pytest.fixture()
 def artifacted(dispatcher: Dispatcher,
                global_artifacts: deque,
-               scenario_artifacts: deque,
-               step_artifacts: deque) -> ArtifactedPlugin:
+               scenario_artifacts: ContextVar,
+               step_artifacts: ContextVar) -> ArtifactedPlugin:
     artifacted = ArtifactedPlugin(Artifacted,
                                   global_artifacts=global_artifacts,
                                   scenario_artifacts=scenario_artifacts,
@@ -122,6 +123,12 @@ def patch_mkdir(exception: Optional[Exception] = None):
     return patch("pathlib.Path.mkdir", side_effect=exception)
 
 
-def make_artifacted_plugin(artifact_manager: ArtifactManager) -> ArtifactedPlugin:
-    return ArtifactedPlugin(Artifacted,
+class BackgroundArtifacted(Artifacted):
+    save_workers = 2
+    show_artifacts_stats = True
+
+
+def make_artifacted_plugin(artifact_manager: ArtifactManager, *,
+                           config: Type[Artifacted] = Artifacted) -> ArtifactedPlugin:
+    return ArtifactedPlugin(config,
                             artifact_manager_factory=lambda *args: artifact_manager)
@@ -1,13 +1,14 @@
+import gzip
 from pathlib import Path
 from typing import Type
-from unittest.mock import call
+from unittest.mock import call, patch
 
 import pytest
 from baby_steps import given, then, when
 from pytest import raises
 
 from vedro.core import Artifact
-from vedro.plugins.artifacted import ArtifactManager
+from vedro.plugins.artifacted import ArtifactManager, StreamArtifact
 
 from ._utils import (
     artifact_manager,
@@ -185,3 +186,120 @@ def test_save_artifact_unknown_type(*, artifact_manager: ArtifactManager, artifa
         assert str(exc.value) == (
             f"Can't save artifact to '{artifacts_dir}': unknown type 'UnknownArtifact'"
         )
+
+
+def test_get_artifact_path(*, artifact_manager: ArtifactManager, artifacts_dir: Path):
+    with given:
+        artifact = create_memory_artifact()
+
+    with when:
+        artifact_path = artifact_manager.get_artifact_path(artifact, artifacts_dir)
+
+    with then:
+        assert artifact_path == (artifacts_dir / artifact.name).resolve()
+        assert not artifact_path.exists()
+
+
+def test_save_stream_artifact(*, artifact_manager: ArtifactManager, artifacts_dir: Path):
+    with given:
+        artifact = StreamArtifact("log.txt", "text/plain", iter([b"ban", b"ana"]))
+
+    with when:
+        artifact_path = artifact_manager.save_artifact(artifact, artifacts_dir)
+
+    with then:
+        assert artifact_path == (artifacts_dir / "log.txt").resolve()
+        assert artifact_path.read_bytes() == b"banana"
+        assert artifact.saved_path == artifact_path
+
+
+def test_save_stream_artifact_gzip(*, artifact_manager: ArtifactManager, artifacts_dir: Path):
+    with given:
+        artifact = StreamArtifact("log.txt.gz", "application/gzip", iter([b"ban", b"ana"]),
+                                  compression="gzip")
+
+    with when:
+        artifact_path = artifact_manager.save_artifact(artifact, artifacts_dir)
+
+    with then:
+        assert gzip.decompress(artifact_path.read_bytes()) == b"banana"
+
+
+def test_save_stream_artifact_zstd_not_installed(*, artifact_manager: ArtifactManager,
+                                                 artifacts_dir: Path):
+    with given:
+        artifact = StreamArtifact("log.txt.zst", "application/zstd", iter([b"banana"]),
+                                  compression="zstd")
+
+    with when, patch.dict("sys.modules", {"compression": None, "zstandard": None}), \
+            raises(BaseException) as exc:
+        artifact_manager.save_artifact(artifact, artifacts_dir)
+
+    with then:
+        assert exc.type is ModuleNotFoundError
+        assert str(exc.value) == (
+            "Package 'zstandard' is not found, install it via 'pip install zstandard'"
+        )
+
+
+def test_retire_artifacts(*, artifact_manager: ArtifactManager, artifacts_dir: Path):
+    with given:
+        (artifacts_dir / "log.txt").write_text("content")
+
+    with when:
+        retired_dir = artifact_manager.retire_artifacts()
+
+    with then:
+        assert not artifacts_dir.exists()
+        assert retired_dir.parent == artifacts_dir.parent
+        assert retired_dir.name.startswith(f"{artifacts_dir.name}.old-")
+        assert (retired_dir / "log.txt").read_text() == "content"
+        assert artifact_manager.get_retired_artifacts() == [retired_dir]
+
+
+def test_retire_artifacts_not_exists(*, artifact_manager: ArtifactManager, artifacts_dir: Path):
+    with given:
+        artifacts_dir.rmdir()
+
+    with when:
+        retired_dir = artifact_manager.retire_artifacts()
+
+    with then:
+        assert retired_dir is None
+        assert artifact_manager.get_retired_artifacts() == []
+
+
+def test_get_retired_artifacts(*, artifact_manager: ArtifactManager, artifacts_dir: Path):
+    with given:
+        parent_dir = artifacts_dir.parent
+        for name in ("artifacts.old-20", "artifacts.old-100", "artifacts.old-3",
+                     "artifacts.old-x", "artifacts.new-1", "other.old-1"):
+            (parent_dir / name).mkdir()
+
+    with when:
+        retired_dirs = artifact_manager.get_retired_artifacts()
+
+    with then:
+        assert retired_dirs == [parent_dir / "artifacts.old-3",
+                                parent_dir / "artifacts.old-20",
+                                parent_dir / "artifacts.old-100"]
+
+
+@pytest.mark.parametrize(("keep", "expected"), [
+    (0, []),
+    (2, ["artifacts.old-2", "artifacts.old-3"]),
+    (5, ["artifacts.old-1", "artifacts.old-2", "artifacts.old-3"]),
+])
+def test_cleanup_retired_artifacts(keep: int, expected, *, artifact_manager: ArtifactManager,
+                                   artifacts_dir: Path):
+    with given:
+        parent_dir = artifacts_dir.parent
+        for name in ("artifacts.old-1", "artifacts.old-2", "artifacts.old-3"):
+            (parent_dir / name / "scenario").mkdir(parents=True)
+
+    with when:
+        artifact_manager.cleanup_retired_artifacts(keep=keep)
+
+    with then:
+        assert [x.name for x in artifact_manager.get_retired_artifacts()] == expected
+        assert artifacts_dir.exists()
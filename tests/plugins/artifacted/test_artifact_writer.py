@@ -0,0 +1,193 @@
+import asyncio
+import gzip
+from os import linesep
+from pathlib import Path
+from threading import Event
+from unittest.mock import Mock
+
+import pytest
+from baby_steps import given, then, when
+from pytest import raises
+
+from vedro.plugins.artifacted import ArtifactManager, ArtifactWriter, StreamArtifact
+
+from ._utils import (
+    artifact_manager,
+    artifacts_dir,
+    create_file_artifact,
+    create_memory_artifact,
+    project_dir,
+)
+
+__all__ = ("project_dir", "artifacts_dir", "artifact_manager")  # fixtures
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+async def test_save_memory_artifact(workers: int, *, artifact_manager: ArtifactManager,
+                                    artifacts_dir: Path):
+    with given:
+        writer = ArtifactWriter(artifact_manager, workers=workers)
+        artifact = create_memory_artifact("content")
+
+    with when:
+        artifact_path = await writer.save(artifact, artifacts_dir)
+        await writer.flush()
+
+    with then:
+        assert artifact_path == (artifacts_dir / artifact.name).resolve()
+        assert artifact_path.read_text() == "content"
+
+        assert writer.stats.artifacts == 1
+        assert writer.stats.bytes_written == len("content")
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+async def test_save_file_artifact(workers: int, *, artifact_manager: ArtifactManager,
+                                  artifacts_dir: Path, project_dir: Path):
+    with given:
+        writer = ArtifactWriter(artifact_manager, workers=workers)
+        artifact = create_file_artifact(project_dir / "test.txt", "file content")
+
+    with when:
+        artifact_path = await writer.save(artifact, artifacts_dir / "nested")
+        await writer.flush()
+
+    with then:
+        assert artifact_path == (artifacts_dir / "nested" / artifact.name).resolve()
+        assert artifact_path.read_text() == "file content"
+
+        assert writer.stats.artifacts == 1
+        assert writer.stats.bytes_written == len("file content")
+
+
+async def test_save_in_background(*, artifacts_dir: Path):
+    with given:
+        released = Event()
+        artifact_manager_ = Mock(ArtifactManager,
+                                 save_artifact=Mock(side_effect=lambda *_: released.wait(5)))
+        writer = ArtifactWriter(artifact_manager_, workers=2)
+        artifact = create_memory_artifact()
+
+    with when:
+        await writer.save(artifact, artifacts_dir)
+
+    with then:
+        assert writer.stats.artifacts == 0
+
+        released.set()
+        await writer.flush()
+        assert writer.stats.artifacts == 1
+
+
+async def test_save_back_pressure(*, artifacts_dir: Path):
+    with given:
+        released = Event()
+        artifact_manager_ = Mock(ArtifactManager,
+                                 save_artifact=Mock(side_effect=lambda *_: released.wait(5)))
+        writer = ArtifactWriter(artifact_manager_, workers=2, max_pending=2)
+        await writer.save(create_memory_artifact(), artifacts_dir)
+        await writer.save(create_memory_artifact(), artifacts_dir)
+
+    with when:
+        task = asyncio.create_task(writer.save(create_memory_artifact(), artifacts_dir))
+        await asyncio.sleep(0.05)
+
+    with then:
+        assert not task.done()
+
+        released.set()
+        await task
+        await writer.flush()
+        assert writer.stats.artifacts == 3
+        assert writer.stats.wait_time > 0
+
+
+async def test_flush_raises_error(*, artifacts_dir: Path):
+    with given:
+        artifact_manager_ = Mock(ArtifactManager,
+                                 save_artifact=Mock(side_effect=OSError("No space left")),
+                                 get_artifact_path=Mock(return_value=artifacts_dir / "log.txt"))
+        writer = ArtifactWriter(artifact_manager_, workers=2)
+        await writer.save(create_memory_artifact(), artifacts_dir)
+
+    with when, raises(BaseException) as exc:
+        await writer.flush()
+
+    with then:
+        assert exc.type is RuntimeError
+        assert str(exc.value) == linesep.join([
+            "Failed to save 1 artifact(s):",
+            f"  - {artifacts_dir / 'log.txt'}: OSError: No space left",
+        ])
+        assert isinstance(exc.value.__cause__, OSError)
+
+
+async def test_save_records_failure_of_previous_write(*, artifacts_dir: Path):
+    with given:
+        error = OSError("No space left")
+        artifact_manager_ = Mock(ArtifactManager,
+                                 save_artifact=Mock(side_effect=[error, artifacts_dir]),
+                                 get_artifact_path=Mock(side_effect=lambda a, p: p / a.name))
+        writer = ArtifactWriter(artifact_manager_, workers=2)
+        artifact1 = create_memory_artifact()
+        await writer.save(artifact1, artifacts_dir)
+        await asyncio.sleep(0.05)
+
+    with when:
+        artifact2 = create_memory_artifact()
+        artifact_path = await writer.save(artifact2, artifacts_dir)
+
+    with then:
+        assert artifact_path == artifacts_dir / artifact2.name
+        assert writer.failures == [(artifacts_dir / artifact1.name, error)]
+
+
+async def test_save_raises_error_synchronously(*, artifacts_dir: Path):
+    with given:
+        artifact_manager_ = Mock(ArtifactManager,
+                                 save_artifact=Mock(side_effect=OSError("No space left")))
+        writer = ArtifactWriter(artifact_manager_)
+
+    with when, raises(BaseException) as exc:
+        await writer.save(create_memory_artifact(), artifacts_dir)
+
+    with then:
+        assert exc.type is OSError
+        assert writer.failures == []
+
+
+@pytest.mark.parametrize(("kwargs", "message"), [
+    ({"workers": -1}, "'workers' must be greater than or equal to 0"),
+    ({"max_pending": 0}, "'max_pending' must be greater than or equal to 1"),
+])
+def test_invalid_params(kwargs, message, *, artifact_manager: ArtifactManager):
+    with when, raises(BaseException) as exc:
+        ArtifactWriter(artifact_manager, **kwargs)
+
+    with then:
+        assert exc.type is ValueError
+        assert str(exc.value) == message
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+async def test_save_async_stream_artifact(workers: int, *, artifact_manager: ArtifactManager,
+                                          artifacts_dir: Path):
+    with given:
+        writer = ArtifactWriter(artifact_manager, workers=workers)
+
+        async def produce():
+            for chunk in (b"ban", b"ana"):
+                await asyncio.sleep(0)
+                yield chunk
+
+        artifact = StreamArtifact("log.txt", "text/plain", produce(), compression="gzip")
+
+    with when:
+        artifact_path = await writer.save(artifact, artifacts_dir)
+        await writer.flush()
+
+    with then:
+        assert gzip.decompress(artifact_path.read_bytes()) == b"banana"
+        assert artifact.consumed is True
+        assert artifact.saved_path == artifact_path
+        assert writer.stats.bytes_written == artifact_path.stat().st_size
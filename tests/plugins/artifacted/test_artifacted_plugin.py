@@ -1,7 +1,7 @@
-from collections import deque
+from contextvars import ContextVar
 from os import linesep
 from pathlib import Path
-from unittest.mock import Mock, call
+from unittest.mock import Mock, call, patch
 
 import pytest
 from baby_steps import given, then, when
@@ -17,9 +17,10 @@ from vedro.events import (
     StepFailedEvent,
     StepPassedEvent,
 )
-from vedro.plugins.artifacted import ArtifactManager
+from vedro.plugins.artifacted import Artifacted, ArtifactedPlugin, ArtifactManager, MemoryArtifact
 
 from ._utils import (
+    BackgroundArtifacted,
     artifacted,
     artifacts_dir,
     create_file_artifact,
@@ -92,35 +93,36 @@ async def test_arg_parsed_event_error_outside_artifacts_dir(*, dispatcher: Dispa
 
 
 @pytest.mark.usefixtures(artifacted.__name__)
-async def test_run_event_clears_artifacts(*, dispatcher: Dispatcher, scenario_artifacts: deque,
-                                          step_artifacts: deque):
+async def test_run_event_clears_artifacts(*, dispatcher: Dispatcher,
+                                          scenario_artifacts: ContextVar,
+                                          step_artifacts: ContextVar):
     with given:
         scenario_result = ScenarioResult(make_vscenario())
         event = ScenarioRunEvent(scenario_result)
 
-        scenario_artifacts.append(create_memory_artifact())
-        step_artifacts.append(create_memory_artifact())
+        scenario_artifacts.get().append(create_memory_artifact())
+        step_artifacts.get().append(create_memory_artifact())
 
     with when:
         await dispatcher.fire(event)
 
     with then:
-        assert len(scenario_artifacts) == 0
-        assert len(step_artifacts) == 0
+        assert len(scenario_artifacts.get()) == 0
+        assert len(step_artifacts.get()) == 0
 
 
 @pytest.mark.usefixtures(artifacted.__name__)
 @pytest.mark.parametrize("event_class", [ScenarioPassedEvent, ScenarioFailedEvent])
 async def test_scenario_end_event_attaches_artifacts(event_class, *, dispatcher: Dispatcher,
-                                                     scenario_artifacts: deque):
+                                                     scenario_artifacts: ContextVar):
     with given:
         scenario_result = ScenarioResult(make_vscenario())
 
         artifact1 = create_memory_artifact()
-        scenario_artifacts.append(artifact1)
+        scenario_artifacts.get().append(artifact1)
 
         artifact2 = create_memory_artifact()
-        scenario_artifacts.append(artifact2)
+        scenario_artifacts.get().append(artifact2)
 
         event = event_class(scenario_result)
 
@@ -134,15 +136,15 @@ async def test_scenario_end_event_attaches_artifacts(event_class, *, dispatcher:
 @pytest.mark.usefixtures(artifacted.__name__)
 @pytest.mark.parametrize("event_class", [StepPassedEvent, StepFailedEvent])
 async def test_step_end_event_attaches_artifacts(event_class, *, dispatcher: Dispatcher,
-                                                 step_artifacts: deque):
+                                                 step_artifacts: ContextVar):
     with given:
         step_result = StepResult(make_vstep())
 
         artifact1 = create_memory_artifact()
-        step_artifacts.append(artifact1)
+        step_artifacts.get().append(artifact1)
 
         artifact2 = create_memory_artifact()
-        step_artifacts.append(artifact2)
+        step_artifacts.get().append(artifact2)
 
         event = event_class(step_result)
 
@@ -270,3 +272,183 @@ async def test_cleanup_event_saves_global_artifacts(*, dispatcher: Dispatcher, p
                 f"#   - {artifact2.name}",
             ])
         ]
+
+
+async def test_scenario_reported_event_saves_artifacts_in_background(*, dispatcher: Dispatcher,
+                                                                     project_dir: Path):
+    with given:
+        artifacts_dir = project_dir / ".vedro/artifacts"
+        artifact_manager = ArtifactManager(artifacts_dir, project_dir)
+        make_artifacted_plugin(artifact_manager, config=BackgroundArtifacted).subscribe(dispatcher)
+
+        await fire_config_loaded_event(dispatcher, project_dir)
+        await fire_arg_parsed_event(dispatcher)
+
+        scenario_result = ScenarioResult(make_vscenario())
+        scenario_result.set_started_at(3.14)
+        scenario_result.attach(artifact := create_memory_artifact("content"))
+
+        aggregated_result = AggregatedResult.from_existing(scenario_result, [scenario_result])
+        report = Report()
+
+    with when:
+        await dispatcher.fire(ScenarioReportedEvent(aggregated_result))
+        await dispatcher.fire(CleanupEvent(report))
+
+    with then:
+        rel_path = Path(".vedro/artifacts/scenarios/scenario/3-14-Scenario-0") / artifact.name
+        assert scenario_result.extra_details == [f"artifact '{rel_path}'"]
+        assert (project_dir / rel_path).read_text() == "content"
+
+        stats_summary, = report.summary
+        assert stats_summary.startswith("artifacts: 1 saved (7 B), write time ")
+
+
+async def test_cleanup_event_flushes_on_global_artifact_error(*, dispatcher: Dispatcher,
+                                                              project_dir: Path):
+    with given:
+        artifact_manager = ArtifactManager(project_dir / ".vedro/artifacts", project_dir)
+        make_artifacted_plugin(artifact_manager, config=BackgroundArtifacted).subscribe(dispatcher)
+
+        await fire_config_loaded_event(dispatcher, project_dir)
+        await fire_arg_parsed_event(dispatcher)
+
+        scenario_result = ScenarioResult(make_vscenario())
+        scenario_result.set_started_at(3.14)
+        scenario_result.attach(artifact := create_memory_artifact("content"))
+        aggregated_result = AggregatedResult.from_existing(scenario_result, [scenario_result])
+        await dispatcher.fire(ScenarioReportedEvent(aggregated_result))
+
+        report = Report()
+        report.attach(global_artifact := create_memory_artifact())
+
+        get_artifact_path = artifact_manager.get_artifact_path
+
+        def get_artifact_path_(artifact, path):
+            if artifact is global_artifact:
+                raise OSError()
+            return get_artifact_path(artifact, path)
+
+    with when, raises(BaseException) as exc, \
+            patch.object(artifact_manager, "get_artifact_path", side_effect=get_artifact_path_):
+        await dispatcher.fire(CleanupEvent(report))
+
+    with then:
+        assert exc.type is OSError
+
+        rel_path = Path(".vedro/artifacts/scenarios/scenario/3-14-Scenario-0") / artifact.name
+        assert (project_dir / rel_path).read_text() == "content"
+
+
+async def test_cleanup_event_reports_failed_background_writes(*, dispatcher: Dispatcher,
+                                                              project_dir: Path):
+    with given:
+        artifact_manager = ArtifactManager(project_dir / ".vedro/artifacts", project_dir)
+        make_artifacted_plugin(artifact_manager, config=BackgroundArtifacted).subscribe(dispatcher)
+
+        await fire_config_loaded_event(dispatcher, project_dir)
+        await fire_arg_parsed_event(dispatcher)
+
+        scenario_result = ScenarioResult(make_vscenario())
+        scenario_result.set_started_at(3.14)
+        scenario_result.attach(artifact := create_memory_artifact("content"))
+        aggregated_result = AggregatedResult.from_existing(scenario_result, [scenario_result])
+
+    with when, raises(BaseException) as exc:
+        with patch.object(artifact_manager, "save_artifact", side_effect=OSError("No space")):
+            await dispatcher.fire(ScenarioReportedEvent(aggregated_result))
+        await dispatcher.fire(CleanupEvent(Report()))
+
+    with then:
+        assert exc.type is RuntimeError
+
+        artifact_path = (project_dir / ".vedro/artifacts/scenarios/scenario/3-14-Scenario-0"
+                         / artifact.name)
+        assert str(exc.value) == linesep.join([
+            "Failed to save 1 artifact(s):",
+            f"  - {artifact_path}: OSError: No space",
+        ])
+
+
+async def test_cleanup_event_no_artifacts_stats(*, dispatcher: Dispatcher, project_dir: Path):
+    with given:
+        artifact_manager = ArtifactManager(project_dir / ".vedro/artifacts", project_dir)
+        make_artifacted_plugin(artifact_manager, config=BackgroundArtifacted).subscribe(dispatcher)
+
+        await fire_config_loaded_event(dispatcher, project_dir)
+        await fire_arg_parsed_event(dispatcher)
+
+        report = Report()
+
+    with when:
+        await dispatcher.fire(CleanupEvent(report))
+
+    with then:
+        assert report.summary == []
+
+
+async def test_scenario_reported_event_deduplicates_artifacts(*, dispatcher: Dispatcher,
+                                                              project_dir: Path):
+    with given:
+        class DedupArtifacted(Artifacted):
+            deduplicate_artifacts = True
+
+        ArtifactedPlugin(DedupArtifacted).subscribe(dispatcher)
+
+        await fire_config_loaded_event(dispatcher, project_dir)
+        await fire_arg_parsed_event(dispatcher)
+
+        scenario_results = []
+        for started_at in (1.0, 2.0):
+            scenario_result = ScenarioResult(make_vscenario())
+            scenario_result.set_started_at(started_at)
+            scenario_result.attach(MemoryArtifact("log.txt", "text/plain", b"content"))
+            scenario_results.append(scenario_result)
+
+    with when:
+        for scenario_result in scenario_results:
+            aggregated_result = AggregatedResult.from_existing(scenario_result, [scenario_result])
+            await dispatcher.fire(ScenarioReportedEvent(aggregated_result))
+        await dispatcher.fire(CleanupEvent(Report()))
+
+    with then:
+        artifacts_dir = project_dir / ".vedro/artifacts"
+        blob, = (artifacts_dir / ".blobs").iterdir()
+
+        scenario_dir = artifacts_dir / "scenarios/scenario"
+        assert (scenario_dir / "1-0-Scenario-0/log.txt").samefile(blob)
+        assert (scenario_dir / "2-0-Scenario-0/log.txt").samefile(blob)
+
+
+@pytest.mark.parametrize("background_cleanup", [False, True])
+async def test_arg_parsed_event_cleans_up_artifacts(background_cleanup: bool, *,
+                                                    dispatcher: Dispatcher, project_dir: Path):
+    with given:
+        background_cleanup_ = background_cleanup
+
+        class CleanupArtifacted(Artifacted):
+            keep_artifacts_runs = 1
+            background_cleanup = background_cleanup_
+
+        plugin = ArtifactedPlugin(CleanupArtifacted)
+        plugin.subscribe(dispatcher)
+
+        artifacts_dir = project_dir / ".vedro/artifacts"
+        (crashed_run_dir := project_dir / ".vedro/artifacts.old-1").mkdir(parents=True)
+        artifacts_dir.mkdir(parents=True)
+        (artifacts_dir / "log.txt").write_text("previous run")
+
+        await fire_config_loaded_event(dispatcher, project_dir)
+
+    with when:
+        await fire_arg_parsed_event(dispatcher)
+
+    with then:
+        if plugin._cleanup_thread is not None:
+            plugin._cleanup_thread.join(timeout=5)
+
+        assert not artifacts_dir.exists()
+        assert not crashed_run_dir.exists()
+
+        previous_run_dir, = (project_dir / ".vedro").glob("artifacts.old-*")
+        assert (previous_run_dir / "log.txt").read_text() == "previous run"
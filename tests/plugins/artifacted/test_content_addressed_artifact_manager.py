@@ -0,0 +1,194 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from baby_steps import given, then, when
+from pytest import raises
+
+from vedro.plugins.artifacted import (
+    ContentAddressedArtifactManager,
+    FileArtifact,
+    MemoryArtifact,
+    StreamArtifact,
+)
+
+from ._utils import artifacts_dir, create_file_artifact, project_dir
+
+__all__ = ("project_dir", "artifacts_dir",)  # fixtures
+
+
+@pytest.fixture()
+def artifact_manager(artifacts_dir: Path, project_dir: Path) -> ContentAddressedArtifactManager:
+    return ContentAddressedArtifactManager(artifacts_dir, project_dir)
+
+
+def get_blobs(artifacts_dir: Path):
+    return sorted((artifacts_dir / ".blobs").iterdir())
+
+
+def test_save_same_memory_artifacts(*, artifact_manager: ContentAddressedArtifactManager,
+                                    artifacts_dir: Path):
+    with given:
+        artifact = MemoryArtifact("log.txt", "text/plain", b"content")
+
+    with when:
+        path1 = artifact_manager.save_artifact(artifact, artifacts_dir / "scenario1")
+        path2 = artifact_manager.save_artifact(artifact, artifacts_dir / "scenario2")
+
+    with then:
+        assert path1 == (artifacts_dir / "scenario1" / "log.txt").resolve()
+        assert path1.read_bytes() == path2.read_bytes() == b"content"
+
+        blob, = get_blobs(artifacts_dir)
+        assert path1.samefile(blob) and path2.samefile(blob)
+
+
+def test_save_different_memory_artifacts(*, artifact_manager: ContentAddressedArtifactManager,
+                                         artifacts_dir: Path):
+    with given:
+        artifact1 = MemoryArtifact("log.txt", "text/plain", b"content1")
+        artifact2 = MemoryArtifact("log.txt", "text/plain", b"content2")
+
+    with when:
+        path1 = artifact_manager.save_artifact(artifact1, artifacts_dir / "scenario1")
+        path2 = artifact_manager.save_artifact(artifact2, artifacts_dir / "scenario2")
+
+    with then:
+        assert path1.read_bytes() == b"content1"
+        assert path2.read_bytes() == b"content2"
+        assert len(get_blobs(artifacts_dir)) == 2
+
+
+def test_overwrite_memory_artifact(*, artifact_manager: ContentAddressedArtifactManager,
+                                   artifacts_dir: Path):
+    with given:
+        artifact1 = MemoryArtifact("log.txt", "text/plain", b"content1")
+        artifact2 = MemoryArtifact("log.txt", "text/plain", b"content2")
+        artifact_manager.save_artifact(artifact1, artifacts_dir)
+
+    with when:
+        artifact_path = artifact_manager.save_artifact(artifact2, artifacts_dir)
+
+    with then:
+        assert artifact_path.read_bytes() == b"content2"
+        assert sorted(x.read_bytes() for x in get_blobs(artifacts_dir)) == [
+            b"content1", b"content2"
+        ]
+
+
+def test_save_file_artifact_copy(*, artifact_manager: ContentAddressedArtifactManager,
+                                 artifacts_dir: Path, project_dir: Path):
+    with given:
+        artifact = create_file_artifact(source := project_dir / "source.txt", "content")
+
+    with when:
+        artifact_path = artifact_manager.save_artifact(artifact, artifacts_dir)
+
+    with then:
+        assert artifact_path.read_text() == "content"
+        assert source.read_text() == "content"
+        assert not artifact_path.samefile(source)
+
+
+def test_save_file_artifact_link(*, artifacts_dir: Path, project_dir: Path):
+    with given:
+        artifact_manager = ContentAddressedArtifactManager(artifacts_dir, project_dir,
+                                                           file_artifact_mode="link")
+        artifact = create_file_artifact(source := project_dir / "source.txt", "content")
+
+    with when:
+        artifact_path = artifact_manager.save_artifact(artifact, artifacts_dir)
+
+    with then:
+        assert artifact_path.read_text() == "content"
+        assert artifact_path.samefile(source)
+
+
+@pytest.mark.parametrize("saved_before", [False, True])
+def test_save_file_artifact_move(saved_before: bool, *, artifacts_dir: Path, project_dir: Path):
+    with given:
+        artifact_manager = ContentAddressedArtifactManager(artifacts_dir, project_dir,
+                                                           file_artifact_mode="move")
+        if saved_before:
+            memory_artifact = MemoryArtifact("log.txt", "text/plain", b"content")
+            artifact_manager.save_artifact(memory_artifact, artifacts_dir / "scenario1")
+        artifact = create_file_artifact(source := project_dir / "source.txt", "content")
+
+    with when:
+        artifact_path = artifact_manager.save_artifact(artifact, artifacts_dir / "scenario2")
+
+    with then:
+        assert artifact_path.read_text() == "content"
+        assert not source.exists()
+        assert len(get_blobs(artifacts_dir)) == 1
+
+
+def test_save_relative_file_artifact(*, artifact_manager: ContentAddressedArtifactManager,
+                                     artifacts_dir: Path, project_dir: Path):
+    with given:
+        (project_dir / "source.txt").write_text("content")
+        artifact = FileArtifact("source.txt", "text/plain", Path("source.txt"))
+
+    with when:
+        artifact_path = artifact_manager.save_artifact(artifact, artifacts_dir)
+
+    with then:
+        assert artifact_path.read_text() == "content"
+
+
+def test_save_file_artifact_not_found(*, artifact_manager: ContentAddressedArtifactManager,
+                                      artifacts_dir: Path, project_dir: Path):
+    with given:
+        source = project_dir / "source.txt"
+        artifact = FileArtifact("source.txt", "text/plain", source)
+
+    with when, raises(BaseException) as exc:
+        artifact_manager.save_artifact(artifact, artifacts_dir)
+
+    with then:
+        assert exc.type is FileNotFoundError
+        assert str(exc.value).startswith(f"Source file '{source}' not found: ")
+
+
+def test_invalid_file_artifact_mode(*, artifacts_dir: Path, project_dir: Path):
+    with when, raises(BaseException) as exc:
+        ContentAddressedArtifactManager(artifacts_dir, project_dir, file_artifact_mode="symlink")
+
+    with then:
+        assert exc.type is ValueError
+        assert str(exc.value) == ("Unknown file artifact mode 'symlink', "
+                                  "expected one of 'copy', 'link', 'move'")
+
+
+def test_save_same_stream_artifacts(*, artifact_manager: ContentAddressedArtifactManager,
+                                    artifacts_dir: Path):
+    with given:
+        artifact1 = StreamArtifact("log.txt", "text/plain", iter([b"ban", b"ana"]))
+        artifact2 = StreamArtifact("log.txt", "text/plain", iter([b"banana"]))
+
+    with when:
+        path1 = artifact_manager.save_artifact(artifact1, artifacts_dir / "scenario1")
+        path2 = artifact_manager.save_artifact(artifact2, artifacts_dir / "scenario2")
+
+    with then:
+        assert path1.read_bytes() == path2.read_bytes() == b"banana"
+
+        blob, = get_blobs(artifacts_dir)
+        assert path1.samefile(blob) and path2.samefile(blob)
+
+
+def test_save_same_artifacts_concurrently(*, artifact_manager: ContentAddressedArtifactManager,
+                                          artifacts_dir: Path):
+    with given:
+        artifact = MemoryArtifact("log.txt", "text/plain", b"content" * 100_000)
+
+    with when:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            paths = list(executor.map(
+                lambda index: artifact_manager.save_artifact(artifact, artifacts_dir / str(index)),
+                range(16)
+            ))
+
+    with then:
+        blob, = get_blobs(artifacts_dir)
+        assert all(path.samefile(blob) for path in paths)
@@ -1,4 +1,5 @@
 import importlib
+import os
 import sys
 from pathlib import Path
 from textwrap import dedent
@@ -74,3 +75,115 @@ def test_import_rewrites_assertions(module_search_path: Path):
         assert assert_.get_right(exc.value) == 2
         assert assert_.get_operator(exc.value) == CompareOperator.EQUAL
         assert assert_.get_message(exc.value) == Nil
+
+
+def test_finder_skips_modules_outside_rewrite_paths(tmp_path: Path):
+    with given:
+        (tmp_path / "effects").mkdir()
+        (tmp_path / "effects_old").mkdir()
+        (tmp_path / "effects_old" / "fn.py").write_text("")
+
+        finder = AssertRewriterFinder(rewrite_paths=[(tmp_path / "effects").resolve()],
+                                      skip_paths=[])
+        sys_path = [str(tmp_path / "effects_old")]
+
+    with when, patch("sys.path", sys_path):
+        spec = finder.find_spec("fn")
+
+    with then:
+        assert spec is not None
+        assert not isinstance(spec.loader, AssertRewriterAdapter)
+
+
+def test_finder_skips_library_paths(tmp_path: Path):
+    with given:
+        lib_dir = tmp_path / "site-packages"
+        lib_dir.mkdir()
+        (lib_dir / "fn.py").write_text("")
+
+        finder = AssertRewriterFinder(rewrite_paths=[tmp_path.resolve()],
+                                      skip_paths=[str(lib_dir)])
+        sys_path = [str(lib_dir)]
+
+    with when, patch("sys.path", sys_path), \
+         patch("os.path.realpath", wraps=os.path.realpath) as realpath_:
+        spec = finder.find_spec("fn")
+
+    with then:
+        assert spec is not None
+        assert not isinstance(spec.loader, AssertRewriterAdapter)
+        assert realpath_.call_count == 0
+
+
+def test_finder_skips_library_subpackages(tmp_path: Path):
+    with given:
+        pkg_dir = tmp_path / "site-packages" / "pkg"
+        pkg_dir.mkdir(parents=True)
+        (pkg_dir / "fn.py").write_text("")
+
+        finder = AssertRewriterFinder(rewrite_paths=[tmp_path.resolve()],
+                                      skip_paths=[str(tmp_path / "site-packages")])
+
+    with when:
+        spec = finder.find_spec("pkg.fn", [str(pkg_dir)])
+
+    with then:
+        assert spec is None
+
+
+def test_finder_skips_library_paths_case_insensitive(tmp_path: Path):
+    with given:
+        lib_dir = tmp_path / "Site-Packages"
+        (lib_dir / "pkg").mkdir(parents=True)
+        (lib_dir / "fn.py").write_text("")
+        (lib_dir / "pkg" / "fn.py").write_text("")
+        sys_path = [str(lib_dir)]
+
+    with when, patch("os.path.normcase", str.lower), patch("sys.path", sys_path):
+        # Paths differ only in case, as they may on Windows
+        finder = AssertRewriterFinder(rewrite_paths=[tmp_path.resolve()],
+                                      skip_paths=[str(tmp_path / "site-packages")])
+        spec = finder.find_spec("fn")
+        sub_spec = finder.find_spec("pkg.fn", [str(lib_dir / "pkg")])
+
+    with then:
+        assert spec is not None
+        assert not isinstance(spec.loader, AssertRewriterAdapter)
+        assert sub_spec is None
+
+
+def test_finder_rewrites_rewrite_paths_inside_library_paths(tmp_path: Path):
+    with given:
+        lib_dir = tmp_path / "site-packages"
+        (lib_dir / "effects").mkdir(parents=True)
+        (lib_dir / "effects" / "fn.py").write_text("")
+
+        finder = AssertRewriterFinder(rewrite_paths=[(lib_dir / "effects").resolve()],
+                                      skip_paths=[str(lib_dir)])
+        sys_path = [str(lib_dir / "effects")]
+
+    with when, patch("sys.path", sys_path):
+        spec = finder.find_spec("fn")
+
+    with then:
+        assert spec is not None
+        assert isinstance(spec.loader, AssertRewriterAdapter)
+
+
+def test_finder_caches_directory_verdicts(tmp_path: Path):
+    with given:
+        pkg_dir = tmp_path / "helpers"
+        pkg_dir.mkdir()
+        (pkg_dir / "fn1.py").write_text("")
+        (pkg_dir / "fn2.py").write_text("")
+
+        finder = AssertRewriterFinder(rewrite_paths=[pkg_dir.resolve()], skip_paths=[])
+        sys_path = [str(pkg_dir)]
+
+    with when, patch("sys.path", sys_path), \
+         patch("os.path.realpath", wraps=os.path.realpath) as realpath_:
+        specs = [finder.find_spec("fn1"), finder.find_spec("fn2")]
+
+    with then:
+        assert all(isinstance(spec.loader, AssertRewriterAdapter) for spec in specs)
+        assert realpath_.call_count == 1
@@ -66,6 +66,62 @@ async def test_load_assertion_failure_with_message(tmp_scn_dir: Path):
         assert assert_.get_message(exc.value) == "assertion failed"
 
 
+async def test_load_assertion_operands_evaluated_once(tmp_scn_dir: Path):
+    with given:
+        path = tmp_scn_dir / "scenario.py"
+        path.write_text(dedent('''
+            import vedro
+            class Scenario(vedro.Scenario):
+                def __init__(self):
+                    self.calls = []
+
+                def value(self, val):
+                    self.calls.append(val)
+                    return val
+
+                def step(self):
+                    assert self.value(1) < self.value(2) < self.value(2), self.value("msg")
+        '''))
+
+        loader = AssertRewriterLoader()
+        module = await loader.load(path)
+        scenario = module.Scenario()
+
+    with when, raises(BaseException) as exc:
+        scenario.step()
+
+    with then:
+        assert exc.type is AssertionError
+        assert str(exc.value) == "msg"
+
+        assert assert_.get_left(exc.value) == 2
+        assert assert_.get_right(exc.value) == 2
+        assert assert_.get_operator(exc.value) == CompareOperator.LESS
+        assert scenario.calls == [1, 2, 2, "msg"]
+
+
+async def test_load_assertion_success_message_not_evaluated(tmp_scn_dir: Path):
+    with given:
+        path = tmp_scn_dir / "scenario.py"
+        path.write_text(dedent('''
+            import vedro
+            class Scenario(vedro.Scenario):
+                def step(self):
+                    for row in [{"id": 1}, {"id": 2}]:
+                        assert row["id"] in (1, 2), 1 / 0
+        '''))
+
+        loader = AssertRewriterLoader()
+        module = await loader.load(path)
+        scenario = module.Scenario()
+
+    with when:
+        res = scenario.step()
+
+    with then:
+        assert res is None
+
+
 async def test_load_empty_scenario_file(tmp_scn_dir: Path):
     with given:
         path = tmp_scn_dir / "scenario.py"
@@ -143,6 +143,52 @@ def test_compare_fail_with_message(method, actual, expected, operator, *, assert
         assert assert_.get_message(exc.value) == message
 
 
+@pytest.mark.parametrize(("method", "operator"), [
+    (AssertionTool.fail_equal, Op.EQUAL),
+    (AssertionTool.fail_not_equal, Op.NOT_EQUAL),
+
+    (AssertionTool.fail_less, Op.LESS),
+    (AssertionTool.fail_less_equal, Op.LESS_EQUAL),
+    (AssertionTool.fail_greater, Op.GREATER),
+    (AssertionTool.fail_greater_equal, Op.GREATER_EQUAL),
+
+    (AssertionTool.fail_is, Op.IS),
+    (AssertionTool.fail_is_not, Op.IS_NOT),
+
+    (AssertionTool.fail_in, Op.IN),
+    (AssertionTool.fail_not_in, Op.NOT_IN),
+])
+def test_compare_fail_method(method, operator, *, assert_: AssertionTool):
+    with given:
+        message = "<message>"
+
+    with when, raises(BaseException) as exc:
+        getattr(assert_, method.__name__)(1, 2, message)
+
+    with then:
+        assert exc.type == AssertionError
+        assert str(exc.value) == message
+
+        assert assert_.get_left(exc.value) == 1
+        assert assert_.get_right(exc.value) == 2
+        assert assert_.get_operator(exc.value) == operator
+        assert assert_.get_message(exc.value) == message
+
+
+def test_truthy_fail_method(*, assert_: AssertionTool):
+    with when, raises(BaseException) as exc:
+        assert_.fail_truthy(0)
+
+    with then:
+        assert exc.type == AssertionError
+        assert str(exc.value) == ""
+
+        assert assert_.get_left(exc.value) == 0
+        assert assert_.get_right(exc.value) == Nil
+        assert assert_.get_operator(exc.value) == Nil
+        assert assert_.get_message(exc.value) == Nil
+
+
 @pytest.mark.parametrize("op", CompareOperator)
 def test_compare_operator(op):
     with when:
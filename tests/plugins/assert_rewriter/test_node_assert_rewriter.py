@@ -9,7 +9,7 @@ from vedro.plugins.assert_rewriter import NodeAssertRewriter
 
 def test_rewrite_assert():
     with given:
-        rewriter = NodeAssertRewriter("assert_tool", {ast.Eq: "assert_equal"})
+        rewriter = NodeAssertRewriter("assert_tool", {ast.Eq: "fail_equal"})
         tree = ast.parse("assert x == y")
 
     with when:
@@ -17,13 +17,13 @@ def test_rewrite_assert():
 
     with then:
         assert dump(rewritten_tree) == dump(ast.parse(
-            "assert_tool.assert_equal(x, y)"
+            "if not x == y: assert_tool.fail_equal(x, y)"
         ))
 
 
 def test_rewrite_assert_with_message():
     with given:
-        rewriter = NodeAssertRewriter("assert_tool", {ast.Eq: "assert_equal"})
+        rewriter = NodeAssertRewriter("assert_tool", {ast.Eq: "fail_equal"})
         tree = ast.parse("assert x == y, 'x should be equal to y'")
 
     with when:
@@ -31,15 +31,31 @@ def test_rewrite_assert_with_message():
 
     with then:
         assert dump(rewritten_tree) == dump(ast.parse(
-            "assert_tool.assert_equal(x, y, message='x should be equal to y')"
+            "if not x == y: assert_tool.fail_equal(x, y, message='x should be equal to y')"
+        ))
+
+
+def test_rewrite_assert_with_expressions():
+    with given:
+        rewriter = NodeAssertRewriter("assert_tool", {ast.Eq: "fail_equal"})
+        tree = ast.parse("assert f(x) == y['key']")
+
+    with when:
+        rewritten_tree = rewriter.visit(tree)
+
+    with then:
+        assert dump(rewritten_tree) == dump(ast.parse(
+            "if not (__vedro_operand_0__ := f(x)) == (__vedro_operand_1__ := y['key']):\n"
+            "    assert_tool.fail_equal(__vedro_operand_0__, __vedro_operand_1__)\n"
+            "del __vedro_operand_0__, __vedro_operand_1__"
         ))
 
 
 def test_rewrite_assert_multiple_comparisons():
     with given:
         rewriter = NodeAssertRewriter("assert_tool", {
-            ast.Lt: "assert_less",
-            ast.LtE: "assert_less_equal",
+            ast.Lt: "fail_less",
+            ast.LtE: "fail_less_equal",
         })
         tree = ast.parse("assert x < y <= z")
 
@@ -48,13 +64,35 @@ def test_rewrite_assert_multiple_comparisons():
 
     with then:
         assert dump(rewritten_tree) == dump(ast.parse(
-            "assert_tool.assert_less(x, y) and assert_tool.assert_less_equal(y, z)"
+            "if not x < y: assert_tool.fail_less(x, y)\n"
+            "if not y <= z: assert_tool.fail_less_equal(y, z)"
+        ))
+
+
+def test_rewrite_assert_multiple_comparisons_with_expressions():
+    with given:
+        rewriter = NodeAssertRewriter("assert_tool", {
+            ast.Lt: "fail_less",
+            ast.LtE: "fail_less_equal",
+        })
+        tree = ast.parse("assert x < f(y) <= z")
+
+    with when:
+        rewritten_tree = rewriter.visit(tree)
+
+    with then:
+        assert dump(rewritten_tree) == dump(ast.parse(
+            "if not x < (__vedro_operand_1__ := f(y)):\n"
+            "    assert_tool.fail_less(x, __vedro_operand_1__)\n"
+            "if not __vedro_operand_1__ <= z:\n"
+            "    assert_tool.fail_less_equal(__vedro_operand_1__, z)\n"
+            "del __vedro_operand_1__"
         ))
 
 
 def test_rewrite_assert_truthy():
     with given:
-        rewriter = NodeAssertRewriter("assert_tool", {type(None): "assert_truthy"})
+        rewriter = NodeAssertRewriter("assert_tool", {type(None): "fail_truthy"})
         tree = ast.parse("assert x")
 
     with when:
@@ -62,10 +100,38 @@ def test_rewrite_assert_truthy():
 
     with then:
         assert dump(rewritten_tree) == dump(ast.parse(
-            "assert_tool.assert_truthy(x)"
+            "if not x: assert_tool.fail_truthy(x)"
         ))
 
 
+def test_rewrite_assert_truthy_with_expression():
+    with given:
+        rewriter = NodeAssertRewriter("assert_tool", {type(None): "fail_truthy"})
+        tree = ast.parse("assert f(x)")
+
+    with when:
+        rewritten_tree = rewriter.visit(tree)
+
+    with then:
+        assert dump(rewritten_tree) == dump(ast.parse(
+            "if not (__vedro_operand_0__ := f(x)): assert_tool.fail_truthy(__vedro_operand_0__)\n"
+            "del __vedro_operand_0__"
+        ))
+
+
+def test_rewrite_assert_does_not_leak_operands():
+    with given:
+        rewriter = NodeAssertRewriter("assert_tool", {ast.Eq: "fail_equal"})
+        tree = ast.parse("assert len(items) == sum([1, 1])")
+        namespace = {"items": [1, 2], "assert_tool": None}
+
+    with when:
+        exec(compile(rewriter.visit(tree), "<test>", "exec"), namespace)
+
+    with then:
+        assert sorted(namespace) == ["__builtins__", "assert_tool", "items"]
+
+
 def test_rewrite_assert_unsupported_operator():
     with given:
         rewriter = NodeAssertRewriter("assert_tool", {})
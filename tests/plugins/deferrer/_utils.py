@@ -1,4 +1,5 @@
 from collections import deque
+from contextvars import ContextVar
 from pathlib import Path
 from time import monotonic_ns
 
@@ -7,6 +8,8 @@ import pytest
 from vedro import Scenario
 from vedro.core import Dispatcher, VirtualScenario
 from vedro.plugins.deferrer import Deferrer, DeferrerPlugin
+from vedro.plugins.deferrer._deferrer import _global_queue
+from vedro.plugins.deferrer._session_resources import _resources
 
 
 @pytest.fixture()
@@ -15,8 +18,8 @@ def dispatcher() -> Dispatcher:
 
 
 @pytest.fixture()
-def queue() -> deque:
-    return deque()
+def queue() -> ContextVar:
+    return ContextVar("queue", default=deque())
 
 
 @pytest.fixture()
@@ -25,7 +28,7 @@ def global_queue() -> deque:
 
 
 @pytest.fixture()
-def deferrer(dispatcher: Dispatcher, queue: deque, global_queue: queue) -> DeferrerPlugin:
+def deferrer(dispatcher: Dispatcher, queue: ContextVar, global_queue: deque) -> DeferrerPlugin:
     deferrer = DeferrerPlugin(Deferrer, queue=queue, global_queue=global_queue)
     deferrer.subscribe(dispatcher)
     return deferrer
@@ -36,3 +39,13 @@ def make_vscenario() -> VirtualScenario:
         __file__ = Path(f"scenario_{monotonic_ns()}.py").absolute()
 
     return VirtualScenario(_Scenario, steps=[])
+
+
+@pytest.fixture()
+def session_deferrer(dispatcher: Dispatcher) -> DeferrerPlugin:
+    # session_context() works with the module-level queue and resources
+    deferrer = DeferrerPlugin(Deferrer)
+    deferrer.subscribe(dispatcher)
+    yield deferrer
+    _global_queue.clear()
+    _resources.clear()
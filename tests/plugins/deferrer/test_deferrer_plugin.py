@@ -1,4 +1,5 @@
 from collections import deque
+from contextvars import ContextVar
 from unittest.mock import AsyncMock, Mock, call
 
 import pytest
@@ -36,9 +37,9 @@ async def test_scenario_startup_event(*, dispatcher: Dispatcher, global_queue: d
 
 
 @pytest.mark.usefixtures(deferrer.__name__)
-async def test_scenario_run_event(*, dispatcher: Dispatcher, queue: deque):
+async def test_scenario_run_event(*, dispatcher: Dispatcher, queue: ContextVar):
     with given:
-        queue.append((Mock(), (), {}))
+        queue.get().append((Mock(), (), {}))
 
         scenario_result = ScenarioResult(make_vscenario())
         event = ScenarioRunEvent(scenario_result)
@@ -47,12 +48,12 @@ async def test_scenario_run_event(*, dispatcher: Dispatcher, queue: deque):
         await dispatcher.fire(event)
 
     with then:
-        assert len(queue) == 0
+        assert len(queue.get()) == 0
 
 
 @pytest.mark.usefixtures(deferrer.__name__)
 @pytest.mark.parametrize("event_class", [ScenarioPassedEvent, ScenarioFailedEvent])
-async def test_scenario_end_event(event_class, *, dispatcher: Dispatcher, queue: deque):
+async def test_scenario_end_event(event_class, *, dispatcher: Dispatcher, queue: ContextVar):
     with given:
         manager = Mock()
         deferred1 = Mock()
@@ -61,9 +62,9 @@ async def test_scenario_end_event(event_class, *, dispatcher: Dispatcher, queue:
         manager.attach_mock(deferred2, "deferred2")
 
         args1, kwargs1 = ("arg1", "arg2"), {"key1": "val1"}
-        queue.append((deferred1, args1, kwargs1))
+        queue.get().append((deferred1, args1, kwargs1))
         args2, kwargs2 = ("arg3", "arg4"), {"key2": "val2"}
-        queue.append((deferred2, args2, kwargs2))
+        queue.get().append((deferred2, args2, kwargs2))
 
         scenario_result = ScenarioResult(make_vscenario())
         event = event_class(scenario_result)
@@ -76,12 +77,12 @@ async def test_scenario_end_event(event_class, *, dispatcher: Dispatcher, queue:
             call.deferred2(*args2, **kwargs2),
             call.deferred1(*args1, **kwargs1),
         ]
-        assert len(queue) == 0
+        assert len(queue.get()) == 0
 
 
 @pytest.mark.usefixtures(deferrer.__name__)
 @pytest.mark.parametrize("event_class", [ScenarioPassedEvent, ScenarioFailedEvent])
-async def test_scenario_end_event_async(event_class, *, dispatcher: Dispatcher, queue: deque):
+async def test_scenario_end_event_async(event_class, *, dispatcher: Dispatcher, queue: ContextVar):
     with given:
         manager = Mock()
         deferred1 = AsyncMock()
@@ -90,9 +91,9 @@ async def test_scenario_end_event_async(event_class, *, dispatcher: Dispatcher,
         manager.attach_mock(deferred2, "deferred2")
 
         args1, kwargs1 = ("arg1", "arg2"), {"key1": "val1"}
-        queue.append((deferred1, args1, kwargs1))
+        queue.get().append((deferred1, args1, kwargs1))
         args2, kwargs2 = ("arg3", "arg4"), {"key2": "val2"}
-        queue.append((deferred2, args2, kwargs2))
+        queue.get().append((deferred2, args2, kwargs2))
 
         scenario_result = ScenarioResult(make_vscenario())
         event = event_class(scenario_result)
@@ -107,7 +108,7 @@ async def test_scenario_end_event_async(event_class, *, dispatcher: Dispatcher,
         ]
         deferred1.assert_awaited_once()
         deferred2.assert_awaited_once()
-        assert len(queue) == 0
+        assert len(queue.get()) == 0
 
 
 @pytest.mark.parametrize("event_class", [ScenarioPassedEvent, ScenarioFailedEvent])
@@ -0,0 +1,202 @@
+from asyncio import gather
+from unittest.mock import Mock, call
+
+import pytest
+from baby_steps import given, then, when
+from pytest import raises
+
+from vedro import session_context
+from vedro.core import Dispatcher, Report
+from vedro.core.scenario_scheduler import MonotonicScenarioScheduler as ScenarioScheduler
+from vedro.events import CleanupEvent, StartupEvent
+
+from ._utils import dispatcher, session_deferrer
+
+__all__ = ("dispatcher", "session_deferrer",)  # fixtures
+
+
+async def fire_startup_event(dispatcher: Dispatcher) -> None:
+    await dispatcher.fire(StartupEvent(ScenarioScheduler(scenarios=[])))
+
+
+@pytest.mark.usefixtures(session_deferrer.__name__)
+async def test_session_context_cached(*, dispatcher: Dispatcher):
+    with given:
+        await fire_startup_event(dispatcher)
+        setup = Mock(side_effect=lambda: object())
+
+        @session_context
+        def resource():
+            return setup()
+
+    with when:
+        values = [resource(), resource(), resource()]
+
+    with then:
+        assert values[0] is values[1] is values[2]
+        assert setup.call_count == 1
+        assert getattr(resource, "__vedro__context__") is True
+
+
+@pytest.mark.usefixtures(session_deferrer.__name__)
+async def test_session_context_args(*, dispatcher: Dispatcher):
+    with given:
+        await fire_startup_event(dispatcher)
+
+        @session_context
+        def resource(name, *, size=1):
+            return object()
+
+    with when:
+        first, second = resource("a"), resource("b")
+        third = resource("a", size=2)
+
+    with then:
+        assert resource("a") is first
+        assert len({id(first), id(second), id(third)}) == 3
+
+
+@pytest.mark.usefixtures(session_deferrer.__name__)
+async def test_session_context_unhashable_args(*, dispatcher: Dispatcher):
+    with given:
+        await fire_startup_event(dispatcher)
+
+        @session_context
+        def resource(names):
+            return names
+
+    with when, raises(BaseException) as exc:
+        resource(["a"])
+
+    with then:
+        assert exc.type is TypeError
+        assert str(exc.value) == ("Arguments of session context "
+                                  "test_session_context_unhashable_args.<locals>.resource() "
+                                  "must be hashable")
+
+
+@pytest.mark.usefixtures(session_deferrer.__name__)
+async def test_session_context_async_concurrent(*, dispatcher: Dispatcher):
+    with given:
+        await fire_startup_event(dispatcher)
+        setup = Mock(side_effect=lambda: object())
+
+        @session_context
+        async def resource():
+            return setup()
+
+    with when:
+        values = await gather(resource(), resource(), resource())
+
+    with then:
+        assert values[0] is values[1] is values[2]
+        assert setup.call_count == 1
+
+
+@pytest.mark.usefixtures(session_deferrer.__name__)
+async def test_session_context_teardown(*, dispatcher: Dispatcher):
+    with given:
+        await fire_startup_event(dispatcher)
+        manager = Mock()
+
+        @session_context
+        def first():
+            manager.setup_first()
+            yield "first"
+            manager.teardown_first()
+
+        @session_context
+        async def second():
+            manager.setup_second()
+            yield "second"
+            manager.teardown_second()
+
+        first()
+        await second()
+        first()
+
+    with when:
+        await dispatcher.fire(CleanupEvent(Report()))
+
+    with then:
+        assert manager.mock_calls == [
+            call.setup_first(),
+            call.setup_second(),
+            call.teardown_second(),
+            call.teardown_first(),
+        ]
+
+
+@pytest.mark.usefixtures(session_deferrer.__name__)
+async def test_session_context_yields_twice(*, dispatcher: Dispatcher):
+    with given:
+        await fire_startup_event(dispatcher)
+
+        @session_context
+        def resource():
+            yield 1
+            yield 2
+
+        resource()
+
+    with when, raises(BaseException) as exc:
+        await dispatcher.fire(CleanupEvent(Report()))
+
+    with then:
+        assert exc.type is RuntimeError
+        assert str(exc.value) == ("Session context "
+                                  "test_session_context_yields_twice.<locals>.resource() "
+                                  "must yield only once")
+
+
+@pytest.mark.usefixtures(session_deferrer.__name__)
+async def test_session_context_summary(*, dispatcher: Dispatcher):
+    with given:
+        await fire_startup_event(dispatcher)
+
+        @session_context
+        def resource(name):
+            return name
+
+        resource("a"), resource("a"), resource("b")
+        report = Report()
+
+    with when:
+        await dispatcher.fire(CleanupEvent(report))
+
+    with then:
+        summary, = report.summary
+        assert summary.startswith("session resources: "
+                                  "test_session_context_summary.<locals>.resource (setup 2x in ")
+        assert summary.endswith("s, used 3x)")
+
+
+@pytest.mark.usefixtures(session_deferrer.__name__)
+async def test_session_context_no_summary(*, dispatcher: Dispatcher):
+    with given:
+        await fire_startup_event(dispatcher)
+        report = Report()
+
+    with when:
+        await dispatcher.fire(CleanupEvent(report))
+
+    with then:
+        assert report.summary == []
+
+
+@pytest.mark.usefixtures(session_deferrer.__name__)
+async def test_session_context_cleared_on_cleanup(*, dispatcher: Dispatcher):
+    with given:
+        await fire_startup_event(dispatcher)
+
+        @session_context
+        def resource():
+            return object()
+
+        value = resource()
+
+    with when:
+        await dispatcher.fire(CleanupEvent(Report()))
+
+    with then:
+        assert resource() is not value
@@ -1,6 +1,7 @@
 from traceback import extract_tb
 
 from vedro import given, scenario, then, when
+from vedro.core import ExcInfo
 
 from ._helpers import make_json_formatter
 from ._tb_helpers import execute_and_capture_exception, generate_call_chain_modules
@@ -25,3 +26,44 @@ def format_exc_info():
             "file": last_frame.filename,
             "lineno": last_frame.lineno,
         }
+
+
+@scenario
+def format_exc_info_without_traceback():
+    with given:
+        formatter = make_json_formatter()
+
+        exc_info = ExcInfo(AssertionError, AssertionError("banana"), None)
+
+    with when:
+        formatted_exc_info = formatter.format_exc_info(exc_info)
+
+    with then:
+        assert formatted_exc_info == {
+            "type": "AssertionError",
+            "message": "banana",
+            "file": None,
+            "lineno": None,
+        }
+
+
+@scenario
+def format_exc_info_from_snapshot():
+    with given:
+        formatter = make_json_formatter()
+
+        tmp_dir = generate_call_chain_modules([("main.py", "main")])
+        exc_info = execute_and_capture_exception(tmp_dir / "main.py", "main")
+        last_frame = extract_tb(exc_info.traceback)[-1]
+        exc_info.snapshot_traceback()
+
+    with when:
+        formatted_exc_info = formatter.format_exc_info(exc_info)
+
+    with then:
+        assert formatted_exc_info == {
+            "type": "ZeroDivisionError",
+            "message": "division by zero",
+            "file": last_frame.filename,
+            "lineno": last_frame.lineno,
+        }
@@ -123,3 +123,31 @@ def format_scenario_reported_event_with_rich_output():
             "steps": [],
             "rich_output": rich_output
         }
+
+
+@scenario
+def format_scenario_reported_event_with_extra_details():
+    with given:
+        formatter = make_json_formatter()
+        aggregated_result = make_aggregated_result(make_failed_scenario_result())
+        aggregated_result.add_extra_details("latency x2: min 0.100s")
+
+    with when:
+        event = formatter.format_scenario_reported_event(aggregated_result)
+
+    with then:
+        assert event == {
+            "event": "scenario_reported",
+            "timestamp": format_ts(formatter.time_fn()),
+            "scenario": {
+                "id": aggregated_result.scenario.unique_id,
+                "subject": aggregated_result.scenario.subject,
+                "path": str(aggregated_result.scenario.path),
+                "lineno": aggregated_result.scenario.lineno,
+                "status": ScenarioStatus.FAILED.value,
+                "elapsed": format_ts(aggregated_result.elapsed),
+                "skip_reason": None,
+            },
+            "steps": [],
+            "extra_details": ["latency x2: min 0.100s"],
+        }
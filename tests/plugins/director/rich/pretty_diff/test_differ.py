@@ -0,0 +1,100 @@
+from difflib import Differ
+
+from baby_steps import given, then, when
+
+from vedro.plugins.director.rich._differ import AdvancedDiffer
+
+
+def test_compare():
+    with given:
+        differ = AdvancedDiffer()
+        a = ["one", "two", "three", "four"]
+        b = ["one", "tree", "four", "five"]
+
+    with when:
+        diff = list(differ.compare(a, b))
+
+    with then:
+        assert diff == list(Differ().compare(a, b))
+
+
+def test_compare_unified():
+    with given:
+        differ = AdvancedDiffer()
+        a = [str(i) for i in range(10)]
+        b = a[:2] + ["x"] + a[3:8] + ["y"] + a[9:]
+
+    with when:
+        diff = list(differ.compare_unified(a, b, 1))
+
+    with then:
+        assert diff == [
+            "  1",
+            "- 2",
+            "+ x",
+            "  3",
+            "...",
+            "  7",
+            "- 8",
+            "+ y",
+            "  9",
+        ]
+
+
+def test_compare_max_differences():
+    with given:
+        differ = AdvancedDiffer(max_differences=3)
+        a = ["a", "b", "c", "d"]
+        b = ["a", "x", "c", "y"]
+
+    with when:
+        diff = list(differ.compare(a, b))
+
+    with then:
+        assert diff == [
+            "  a",
+            "- b",
+            "+ x",
+            "  c",
+            "- d",
+            "... 1 more differences",
+        ]
+
+
+def test_compare_unified_max_differences():
+    with given:
+        differ = AdvancedDiffer(max_differences=2)
+        a = [str(i) for i in range(10)]
+        b = a[:2] + ["x"] + a[3:8] + ["y"] + a[9:]
+
+    with when:
+        diff = list(differ.compare_unified(a, b, 1))
+
+    with then:
+        assert diff == [
+            "  1",
+            "- 2",
+            "+ x",
+            "  3",
+            "...",
+            "  7",
+            "... 2 more differences",
+        ]
+
+
+def test_compare_large_replace_block():
+    with given:
+        differ = AdvancedDiffer(max_fancy_pairs=1)
+        a = ["line 1", "line 2"]
+        b = ["line 3", "line 4"]
+
+    with when:
+        diff = list(differ.compare(a, b))
+
+    with then:
+        assert diff == [
+            "- line 1",
+            "- line 2",
+            "+ line 3",
+            "+ line 4",
+        ]
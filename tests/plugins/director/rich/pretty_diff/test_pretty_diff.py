@@ -0,0 +1,74 @@
+from io import StringIO
+
+from baby_steps import given, then, when
+from rich.console import Console
+
+from vedro.plugins.director.rich._pretty_diff import PrettyDiff
+
+
+def render(pretty_diff: PrettyDiff) -> str:
+    console = Console(file=StringIO(), width=80, color_system=None)
+    console.print(pretty_diff)
+    lines = console.file.getvalue().splitlines()  # type: ignore
+    return "\n".join(line.rstrip() for line in lines)
+
+
+def test_small_operands():
+    with given:
+        pretty_diff = PrettyDiff([1, 2, 3], [1, 4, 3], "==")
+
+    with when:
+        output = render(pretty_diff)
+
+    with then:
+        assert output.splitlines() == [
+            ">>> assert actual == expected",
+            "      [",
+            "          1,",
+            "    -     4,",
+            "    +     2,",
+            "          3",
+            "      ]",
+        ]
+
+
+def test_large_operands():
+    with given:
+        left = list(range(50_000))
+        right = left[:100] + [-1] + left[100:40_000] + left[40_001:]
+        pretty_diff = PrettyDiff(left, right, "==", max_context_lines=1)
+
+    with when:
+        output = render(pretty_diff)
+
+    with then:
+        assert output.splitlines() == [
+            ">>> assert actual == expected",
+            "          99,",
+            "    -     -1,",
+            "          100,",
+            "    ...",
+            "          39999,",
+            "    +     40000,",
+            "          40001,",
+        ]
+
+
+def test_max_differences():
+    with given:
+        left, right = list(range(5_000)), list(range(-5_000, 0))
+        pretty_diff = PrettyDiff(left, right, "==", max_differences=4)
+
+    with when:
+        output = render(pretty_diff)
+
+    with then:
+        assert output.splitlines() == [
+            ">>> assert actual == expected",
+            "      [",
+            "    -     -5000,",
+            "    +     0,",
+            "    -     -4999,",
+            "    -     -4998,",
+            "    ... 4 more differences",
+        ]
@@ -0,0 +1,126 @@
+from difflib import SequenceMatcher
+
+import pytest
+from baby_steps import given, then, when
+
+from vedro.plugins.director.rich._sequence_matcher import BoundedSequenceMatcher
+
+
+def assert_valid_blocks(a, b, blocks):
+    prev_i = prev_j = 0
+    for i, j, size in blocks[:-1]:
+        assert i >= prev_i and j >= prev_j
+        assert a[i:i + size] == b[j:j + size]
+        prev_i, prev_j = i + size, j + size
+    assert blocks[-1] == (len(a), len(b), 0)
+
+
+@pytest.mark.parametrize(("a", "b"), [
+    ("abcdef", "abXdef"),
+    ("abcabba", "cbabac"),
+    ("", "abc"),
+    ("abc", ""),
+])
+def test_small_sequences(a: str, b: str):
+    with given:
+        matcher = BoundedSequenceMatcher(a, b)
+
+    with when:
+        opcodes = matcher.get_opcodes()
+
+    with then:
+        assert opcodes == SequenceMatcher(None, a, b).get_opcodes()
+        assert matcher.completed is True
+
+
+@pytest.mark.parametrize(("a", "b"), [
+    ("abcabba", "cbabac"),
+    ("xaxbxcx", "yaybycy"),
+    ("abcdefgh", "hgfedcba"),
+    ("", "abc"),
+])
+def test_large_sequences(a: str, b: str):
+    with given:
+        matcher = BoundedSequenceMatcher(a, b, max_difflib_size=0)
+
+    with when:
+        blocks = matcher.get_matching_blocks()
+
+    with then:
+        assert_valid_blocks(a, b, blocks)
+        assert matcher.completed is True
+
+
+def test_large_sequences_shortest_edit():
+    with given:
+        # No unique items, so the sequences are matched by the Myers algorithm
+        a, b = "abcabba", "cbabac"
+        matcher = BoundedSequenceMatcher(a, b, max_difflib_size=0)
+
+    with when:
+        blocks = matcher.get_matching_blocks()
+
+    with then:
+        assert sum(size for *_, size in blocks) == 4  # the longest common subsequence
+
+
+def test_large_sequences_anchors():
+    with given:
+        a = [f"line {i}" for i in range(10_000)]
+        b = a[:100] + ["inserted"] + a[100:5000] + a[5001:]
+        matcher = BoundedSequenceMatcher(a, b, max_difflib_size=0)
+
+    with when:
+        opcodes = matcher.get_opcodes()
+
+    with then:
+        assert [op for op in opcodes if op[0] != "equal"] == [
+            ("insert", 100, 100, 100, 101),
+            ("delete", 5000, 5001, 5001, 5001),
+        ]
+        assert matcher.completed is True
+
+
+def test_max_edit_distance_exceeded():
+    with given:
+        a, b = "x" + "aab" * 30, "x" + "bba" * 30
+        matcher = BoundedSequenceMatcher(a, b, max_edit_distance=10, max_difflib_size=0)
+
+    with when:
+        opcodes = matcher.get_opcodes()
+
+    with then:
+        assert opcodes == [
+            ("equal", 0, 1, 0, 1),
+            ("replace", 1, 91, 1, 91),
+        ]
+        assert matcher.completed is False
+
+
+def test_time_limit_exceeded():
+    with given:
+        a, b = "x" + "aab" * 30, "x" + "bba" * 30
+        matcher = BoundedSequenceMatcher(a, b, time_limit=0, max_difflib_size=0)
+
+    with when:
+        opcodes = matcher.get_opcodes()
+
+    with then:
+        assert opcodes == [
+            ("equal", 0, 1, 0, 1),
+            ("replace", 1, 91, 1, 91),
+        ]
+        assert matcher.completed is False
+
+
+def test_grouped_opcodes():
+    with given:
+        a = [str(i) for i in range(20)]
+        b = a[:5] + ["x"] + a[6:15] + ["y"] + a[16:]
+        matcher = BoundedSequenceMatcher(a, b, max_difflib_size=0)
+
+    with when:
+        groups = list(matcher.get_grouped_opcodes(1))
+
+    with then:
+        assert groups == list(SequenceMatcher(None, a, b).get_grouped_opcodes(1))
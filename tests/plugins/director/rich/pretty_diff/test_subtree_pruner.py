@@ -0,0 +1,99 @@
+from baby_steps import given, then, when
+
+from vedro.plugins.director.rich._subtree_pruner import SubtreePruner
+
+
+def test_prune_small_values():
+    with given:
+        pruner = SubtreePruner(min_size=100)
+        left, right = {"id": 1, "tags": ["a", "b"]}, {"id": 2, "tags": ["a", "b"]}
+
+    with when:
+        result = pruner.prune(left, right)
+
+    with then:
+        assert result == (left, right)
+        assert result[0] is left and result[1] is right
+
+
+def test_prune_dicts():
+    with given:
+        pruner = SubtreePruner(min_size=1)
+        left = {"id": 1, "tags": ["a", "b"], "meta": {"x": 1}}
+        right = {"id": 2, "tags": ["a", "b"], "meta": {"x": 2}}
+
+    with when:
+        pruned_left, pruned_right = pruner.prune(left, right)
+
+    with then:
+        assert repr(pruned_left) == "{'id': 1, 'tags': [...], 'meta': {'x': 1}}"
+        assert repr(pruned_right) == "{'id': 2, 'tags': [...], 'meta': {'x': 2}}"
+
+
+def test_prune_dict_items_run():
+    with given:
+        pruner = SubtreePruner(min_size=1)
+        left = {f"k{i}": i for i in range(6)}
+        right = {**left, "k5": -1}
+
+    with when:
+        pruned_left, pruned_right = pruner.prune(left, right)
+
+    with then:
+        assert repr(pruned_left) == "{'k0': 0, ... 3 equal items: ..., 'k4': 4, 'k5': 5}"
+        assert repr(pruned_right) == "{'k0': 0, ... 3 equal items: ..., 'k4': 4, 'k5': -1}"
+
+
+def test_prune_lists():
+    with given:
+        pruner = SubtreePruner(min_size=1)
+        left = [[i] for i in range(10)]
+        right = left[:2] + [[-1]] + left[2:8] + [[8, 8]] + left[9:]
+
+    with when:
+        pruned_left, pruned_right = pruner.prune(left, right)
+
+    with then:
+        assert repr(pruned_left) == "[[...], [...], [...], ... 4 equal items, [...], [8], [...]]"
+        assert repr(pruned_right) == (
+            "[[...], [...], [-1], [...], ... 4 equal items, [...], [8, 8], [...]]"
+        )
+
+
+def test_prune_distinguishes_types():
+    with given:
+        pruner = SubtreePruner(min_size=1)
+        left, right = [[1], [True]], [[1.0], [True]]
+
+    with when:
+        pruned_left, pruned_right = pruner.prune(left, right)
+
+    with then:
+        assert repr(pruned_left) == "[[1], [...]]"
+        assert repr(pruned_right) == "[[1.0], [...]]"
+
+
+def test_prune_recursive_values():
+    with given:
+        pruner = SubtreePruner(min_size=1)
+        left, right = [1], [2]
+        left.append(left)
+        right.append(right)
+
+    with when:
+        result = pruner.prune(left, right)
+
+    with then:
+        assert result[0] is left and result[1] is right
+
+
+def test_prune_time_limit_exceeded():
+    with given:
+        pruner = SubtreePruner(min_size=1, time_limit=0)
+        left, right = {"a": [1, 2]}, {"a": [1, 3]}
+
+    with when:
+        result = pruner.prune(left, right)
+
+    with then:
+        assert result[0] is left and result[1] is right
@@ -1,3 +1,5 @@
+import sys
+from io import StringIO
 from os import linesep
 from traceback import format_exception
 from typing import Dict, Union
@@ -6,10 +8,12 @@ from unittest.mock import Mock, call
 import pytest
 from baby_steps import given, then, when
 from niltype import Nil
+from rich.console import Console
 from rich.style import Style
 from rich.traceback import Traceback
 
 from vedro.core import ExcInfo, ScenarioStatus, StepStatus
+from vedro.core.scenario_result import RemoteError
 from vedro.plugins.director.rich import RichPrinter
 
 from ._utils import TestPretty, TestPrettyDiff, TestTraceback, console_, exc_info, printer
@@ -290,6 +294,23 @@ def test_print_exception(*, printer: RichPrinter, exc_info: ExcInfo, console_: M
         ]
 
 
+def test_print_remote_exception(*, printer: RichPrinter, console_: Mock):
+    with given:
+        error = RemoteError("banana",
+                            "Traceback (most recent call last):\nAssertionError: banana\n")
+        exc_info = ExcInfo(RemoteError, error, None)
+
+    with when:
+        printer.print_remote_exception(exc_info)
+
+    with then:
+        assert console_.mock_calls == [
+            call.out("Traceback (most recent call last):\nAssertionError: banana",
+                     style=Style(color="yellow")),
+            call.out(" "),
+        ]
+
+
 def test_print_pretty_exception(*, printer: RichPrinter, exc_info: ExcInfo, console_: Mock):
     with given:
         trace = Traceback.extract(exc_info.type, exc_info.value, exc_info.traceback)
@@ -306,6 +327,118 @@ def test_print_pretty_exception(*, printer: RichPrinter, exc_info: ExcInfo, cons
         ]
 
 
+def make_exc_info_without_caller() -> ExcInfo:
+    def fail():
+        value = "banana"  # noqa: F841
+        raise KeyError("key")
+
+    try:
+        fail()
+    except KeyError:
+        exc_type, value, traceback = sys.exc_info()
+    # The frame that caught the exception keeps running, so it is left out
+    return ExcInfo(exc_type, value, traceback.tb_next)
+
+
+def test_print_exception_snapshot(*, printer: RichPrinter, console_: Mock):
+    with given:
+        exc_info = make_exc_info_without_caller()
+        formatted = format_exception(exc_info.type, exc_info.value, exc_info.traceback)
+        exc_info.snapshot_traceback()
+
+    with when:
+        printer.print_exception(exc_info, show_internal_calls=True)
+
+    with then:
+        assert console_.mock_calls == [
+            call.out("".join(formatted), style=Style(color="yellow")),
+        ]
+
+
+@pytest.mark.parametrize("show_locals", [False, True])
+def test_print_pretty_exception_snapshot(show_locals: bool, *,
+                                         printer: RichPrinter, console_: Mock):
+    with given:
+        exc_info = make_exc_info_without_caller()
+        trace = Traceback.extract(exc_info.type, exc_info.value, exc_info.traceback,
+                                  show_locals=show_locals)
+        if show_locals:
+            printer._filter_locals(trace)
+        tb = TestTraceback(trace, max_frames=8, word_wrap=False, width=console_.size.width,
+                           indent_guides=False)
+        exc_info.snapshot_traceback()
+
+    with when:
+        printer.print_pretty_exception(exc_info, show_locals=show_locals,
+                                       show_internal_calls=True)
+
+    with then:
+        assert console_.mock_calls == [
+            call.print(tb),
+            call.out(" "),
+        ]
+
+
+def make_exc_info_with_long_locals() -> ExcInfo:
+    def fail():
+        text = "x" * 1000  # noqa: F841
+        data = b"y" * 1000  # noqa: F841
+        items = [f"item-{i}-" + "z" * 20 for i in range(100)]  # noqa: F841
+        nested = {"users": [{"id": i, "tags": list(range(50))} for i in range(20)]}  # noqa: F841
+        raise KeyError("key")
+
+    try:
+        fail()
+    except KeyError:
+        exc_type, value, traceback = sys.exc_info()
+    return ExcInfo(exc_type, value, traceback.tb_next)
+
+
+def render_pretty_exception(exc_info: ExcInfo) -> str:
+    console = Console(file=StringIO(), width=100, color_system=None, force_terminal=False)
+    printer = RichPrinter(lambda: console)
+    printer.print_pretty_exception(exc_info, show_locals=True, show_internal_calls=True)
+    return console.file.getvalue()
+
+
+def test_print_pretty_exception_snapshot_renders_same_locals():
+    with given:
+        exc_info = make_exc_info_with_long_locals()
+        rendered = render_pretty_exception(exc_info)
+        exc_info.snapshot_traceback()
+
+    with when:
+        rendered_snapshot = render_pretty_exception(exc_info)
+
+    with then:
+        assert rendered_snapshot == rendered
+        assert "... +90" in rendered  # containers are abbreviated, as rich does
+        assert "... +40" in rendered
+
+
+def test_filter_locals_hides_dunder_names(*, printer: RichPrinter):
+    with given:
+        def fail():
+            __vedro_operand_0__ = "banana"  # noqa: F841
+            value = "banana"  # noqa: F841
+            raise KeyError("key")
+
+        try:
+            fail()
+        except KeyError:
+            exc_type, exc_value, traceback = sys.exc_info()
+        # Older versions of rich don't hide dunder names
+        trace = Traceback.extract(exc_type, exc_value, traceback.tb_next,
+                                  show_locals=True, locals_hide_dunder=False)
+
+    with when:
+        printer._filter_locals(trace)
+
+    with then:
+        frame, = trace.stacks[0].frames
+        assert list(frame.locals) == ["value"]
+
+
 def test_print_pretty_exception_diff_left(*, printer: RichPrinter,
                                           exc_info: ExcInfo, console_: Mock):
     with given:
@@ -4,8 +4,9 @@ from unittest.mock import Mock, call
 import pytest
 from baby_steps import given, then, when
 
-from vedro.core import Dispatcher, ScenarioStatus, StepStatus
+from vedro.core import Dispatcher, ExcInfo, ScenarioStatus, StepStatus
 from vedro.core.output_capturer import CapturedOutput
+from vedro.core.scenario_result import RemoteError
 from vedro.events import ScenarioFailedEvent, ScenarioReportedEvent
 from vedro.plugins.director import RichReporterPlugin
 
@@ -72,6 +73,32 @@ async def test_scenario_failed(show_locals: bool, show_full_diff: bool, *,
         ]
 
 
+@pytest.mark.usefixtures(rich_reporter.__name__)
+async def test_scenario_failed_remote_error(dispatcher: Dispatcher, printer_: Mock):
+    with given:
+        await fire_arg_parsed_event(dispatcher)
+
+        scenario_result = make_scenario_result().mark_failed()
+        exc_info = ExcInfo(RemoteError, RemoteError("banana", "<traceback>"), None)
+        step_result = make_step_result().mark_failed().set_exc_info(exc_info)
+        scenario_result.add_step_result(step_result)
+
+        aggregated_result = make_aggregated_result(scenario_result)
+        event = ScenarioReportedEvent(aggregated_result)
+
+    with when:
+        await dispatcher.fire(event)
+
+    with then:
+        assert printer_.mock_calls == [
+            call.print_scenario_subject(aggregated_result.scenario.subject,
+                                        ScenarioStatus.FAILED, elapsed=None, prefix=" "),
+            call.print_step_name(step_result.step_name,
+                                 StepStatus.FAILED, elapsed=None, prefix=" " * 3),
+            call.print_remote_exception(exc_info),
+        ]
+
+
 @pytest.mark.usefixtures(rich_reporter.__name__)
 async def test_scenario_failed_show_paths(dispatcher: Dispatcher, printer_: Mock):
     with given:
@@ -196,6 +196,33 @@ async def test_scenario_passed_aggregated_result(*, dispatcher: Dispatcher, prin
         ]
 
 
+@pytest.mark.usefixtures(rich_reporter.__name__)
+async def test_scenario_passed_aggregated_result_extra_details(*, dispatcher: Dispatcher,
+                                                               printer_: Mock):
+    with given:
+        await fire_arg_parsed_event(dispatcher)
+
+        scenario_results = [
+            make_scenario_result().mark_passed(),
+            make_scenario_result().mark_passed(),
+        ]
+        scenario_results[0].add_extra_details("id: scenario")
+
+        aggregated_result = AggregatedResult.from_existing(scenario_results[0], scenario_results)
+        aggregated_result.add_extra_details("latency x2: min 0.100s")
+        event = ScenarioReportedEvent(aggregated_result)
+
+    with when:
+        await dispatcher.fire(event)
+
+    with then:
+        assert printer_.mock_calls[:2] == [
+            call.print_scenario_subject(aggregated_result.scenario.subject,
+                                        ScenarioStatus.PASSED, elapsed=None, prefix=" "),
+            call.print_scenario_extra_details(["latency x2: min 0.100s"], prefix="   "),
+        ]
+
+
 @pytest.mark.usefixtures(rich_reporter.__name__)
 async def test_scenario_passed_with_captured_output(*, dispatcher: Dispatcher,
                                                     rich_reporter: RichReporterPlugin,
@@ -0,0 +1,85 @@
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+from time import monotonic_ns
+from typing import Any, Callable, List, Optional, Union
+from unittest.mock import AsyncMock
+
+import pytest
+
+from vedro import Scenario
+from vedro.core import (
+    Config,
+    ConfigType,
+    Dispatcher,
+    Factory,
+    ScenarioRunner,
+    VirtualScenario,
+    VirtualStep,
+)
+from vedro.events import ArgParsedEvent, ArgParseEvent, ConfigLoadedEvent
+from vedro.plugins.distributor import Distributor, DistributorPlugin
+
+__all__ = ("dispatcher_", "dispatcher", "distributor_plugin", "make_vstep", "make_vscenario",
+           "make_config", "fire_config_loaded_event", "fire_arg_parsed_event",)
+
+
+@pytest.fixture()
+def dispatcher_():
+    return AsyncMock(Dispatcher())
+
+
+@pytest.fixture()
+def dispatcher():
+    return Dispatcher()
+
+
+@pytest.fixture()
+def distributor_plugin(dispatcher: Dispatcher) -> DistributorPlugin:
+    plugin = DistributorPlugin(Distributor)
+    plugin.subscribe(dispatcher)
+    return plugin
+
+
+def make_vstep(callable: Callable[..., Any] = None, *, name: Optional[str] = None) -> VirtualStep:
+    def step(self):
+        if callable:
+            callable(self)
+    step.__name__ = name or f"step_{monotonic_ns()}"
+    return VirtualStep(step)
+
+
+def make_vscenario(steps: Optional[List[VirtualStep]] = None, *,
+                   is_skipped: bool = False) -> VirtualScenario:
+    class _Scenario(Scenario):
+        __file__ = Path(f"scenario_{monotonic_ns()}.py").absolute()
+
+    vsenario = VirtualScenario(_Scenario, steps=steps or [])
+    if is_skipped:
+        vsenario.skip()
+    return vsenario
+
+
+def make_config(dispatcher: Dispatcher, scenario_runner: ScenarioRunner) -> ConfigType:
+    class TestConfig(Config):
+        class Registry(Config.Registry):
+            Dispatcher = Factory[Dispatcher](lambda: dispatcher)
+            ScenarioRunner = Factory[ScenarioRunner](lambda: scenario_runner)
+
+    return TestConfig
+
+
+async def fire_config_loaded_event(dispatcher: Dispatcher, config: ConfigType) -> None:
+    config_loaded_event = ConfigLoadedEvent(Path(), config)
+    await dispatcher.fire(config_loaded_event)
+
+
+async def fire_arg_parsed_event(dispatcher: Dispatcher, *,
+                                coordinator: Union[str, None] = None,
+                                worker: Union[str, None] = None,
+                                workers: int = 0) -> None:
+    arg_parse_event = ArgParseEvent(ArgumentParser())
+    await dispatcher.fire(arg_parse_event)
+
+    namespace = Namespace(coordinator=coordinator, worker=worker, workers=workers)
+    arg_parsed_event = ArgParsedEvent(namespace)
+    await dispatcher.fire(arg_parsed_event)
@@ -0,0 +1,214 @@
+import asyncio
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock
+
+from baby_steps import given, then, when
+
+from vedro.core import Dispatcher, Report, VirtualScenario
+from vedro.core.scenario_result import RemoteError
+from vedro.core.scenario_scheduler import MonotonicScenarioScheduler
+from vedro.events import ScenarioFailedEvent, ScenarioPassedEvent, ScenarioReportedEvent
+from vedro.plugins.distributor import CoordinatorRunner, WorkerRunner
+from vedro.plugins.distributor._protocol import open_connection, read_message, write_message
+from vedro.plugins.rerunner import RerunnerScenarioScheduler
+
+from ._utils import make_vscenario, make_vstep
+
+
+async def run_worker(address: str, scenarios: List[VirtualScenario]) -> Report:
+    worker = WorkerRunner(AsyncMock(Dispatcher()), address=address, connect_timeout=5.0)
+    return await worker.run(MonotonicScenarioScheduler(scenarios))
+
+
+async def crash_worker(address: str) -> str:
+    reader, writer = await open_connection(address, timeout=5.0)
+    await write_message(writer, {"type": "next"})
+    message = await read_message(reader)
+    writer.close()  # Disconnect without sending the result
+    assert message is not None
+    return message["unique_id"]
+
+
+async def send_malformed_result(address: str) -> str:
+    reader, writer = await open_connection(address, timeout=5.0)
+    await write_message(writer, {"type": "next"})
+    message = await read_message(reader)
+    payload = b"{not json"
+    writer.write(len(payload).to_bytes(4, "big") + payload)
+    await writer.drain()
+    await reader.read()  # Wait until the coordinator closes the connection
+    writer.close()
+    assert message is not None
+    return message["unique_id"]
+
+
+def get_fired(dispatcher_: AsyncMock, event_type: type) -> list:
+    return [call.args[0] for call in dispatcher_.fire.mock_calls
+            if isinstance(call.args[0], event_type)]
+
+
+async def test_run_scenarios(tmp_path: Path):
+    with given:
+        address = str(tmp_path / "coordinator.sock")
+        scenarios = [make_vscenario([make_vstep(), make_vstep()]) for _ in range(5)]
+
+        dispatcher_ = AsyncMock(Dispatcher())
+        coordinator = CoordinatorRunner(dispatcher_, address=address)
+
+    with when:
+        report, *_ = await asyncio.gather(
+            coordinator.run(MonotonicScenarioScheduler(scenarios)),
+            run_worker(address, scenarios),
+            run_worker(address, scenarios),
+        )
+
+    with then:
+        assert report.total == 5
+        assert report.passed == 5
+
+        passed = get_fired(dispatcher_, ScenarioPassedEvent)
+        assert {x.scenario_result.scenario.unique_id for x in passed} == {
+            x.unique_id for x in scenarios
+        }
+        assert all(len(x.scenario_result.step_results) == 2 for x in passed)
+        assert len(get_fired(dispatcher_, ScenarioReportedEvent)) == 5
+
+
+async def test_run_failed_and_skipped_scenarios(tmp_path: Path):
+    with given:
+        address = str(tmp_path / "coordinator.sock")
+
+        def fail(scope):
+            raise AssertionError("banana")
+
+        scenarios = [
+            make_vscenario([make_vstep(fail)]),
+            make_vscenario([make_vstep()], is_skipped=True),
+        ]
+        dispatcher_ = AsyncMock(Dispatcher())
+        coordinator = CoordinatorRunner(dispatcher_, address=address)
+
+    with when:
+        report, _ = await asyncio.gather(
+            coordinator.run(MonotonicScenarioScheduler(scenarios)),
+            run_worker(address, scenarios),
+        )
+
+    with then:
+        assert (report.total, report.failed, report.skipped) == (2, 1, 1)
+
+        failed, = get_fired(dispatcher_, ScenarioFailedEvent)
+        exc_info = failed.scenario_result.step_results[0].exc_info
+        assert isinstance(exc_info.value, RemoteError)
+        assert str(exc_info.value) == "banana"
+
+
+async def test_requeue_on_worker_crash(tmp_path: Path):
+    with given:
+        address = str(tmp_path / "coordinator.sock")
+        scenarios = [make_vscenario([make_vstep()]) for _ in range(3)]
+
+        dispatcher_ = AsyncMock(Dispatcher())
+        coordinator = CoordinatorRunner(dispatcher_, address=address)
+        run = asyncio.ensure_future(coordinator.run(MonotonicScenarioScheduler(scenarios)))
+
+    with when:
+        crashed_id = await crash_worker(address)
+        report = await run_worker(address, scenarios)
+        coordinator_report = await run
+
+    with then:
+        assert coordinator_report.passed == 3
+        assert report.passed == 3
+        passed = get_fired(dispatcher_, ScenarioPassedEvent)
+        assert crashed_id in {x.scenario_result.scenario.unique_id for x in passed}
+
+
+async def test_requeue_on_malformed_message(tmp_path: Path):
+    with given:
+        address = str(tmp_path / "coordinator.sock")
+        scenarios = [make_vscenario([make_vstep()]) for _ in range(3)]
+
+        dispatcher_ = AsyncMock(Dispatcher())
+        coordinator = CoordinatorRunner(dispatcher_, address=address)
+        run = asyncio.ensure_future(coordinator.run(MonotonicScenarioScheduler(scenarios)))
+
+        loop_errors: List[Dict[str, Any]] = []
+        asyncio.get_running_loop().set_exception_handler(lambda _, ctx: loop_errors.append(ctx))
+
+    with when:
+        malformed_id = await send_malformed_result(address)
+        report = await run_worker(address, scenarios)
+        coordinator_report = await run
+
+    with then:
+        assert coordinator_report.passed == 3
+        assert report.passed == 3
+        passed = get_fired(dispatcher_, ScenarioPassedEvent)
+        assert malformed_id in {x.scenario_result.scenario.unique_id for x in passed}
+        assert loop_errors == []
+
+
+async def test_fail_after_max_requeues(tmp_path: Path):
+    with given:
+        address = str(tmp_path / "coordinator.sock")
+        scenarios = [make_vscenario([make_vstep()]) for _ in range(2)]
+
+        dispatcher_ = AsyncMock(Dispatcher())
+        coordinator = CoordinatorRunner(dispatcher_, address=address, max_requeues=0)
+        run = asyncio.ensure_future(coordinator.run(MonotonicScenarioScheduler(scenarios)))
+
+    with when:
+        crashed_id = await crash_worker(address)
+        await run_worker(address, scenarios)
+        report = await run
+
+    with then:
+        assert (report.passed, report.failed) == (1, 1)
+
+        failed, = get_fired(dispatcher_, ScenarioFailedEvent)
+        assert failed.scenario_result.scenario.unique_id == crashed_id
+        assert failed.scenario_result.extra_details == [
+            "worker exited while running the scenario (1 attempts)"
+        ]
+
+
+async def test_deferred_reruns(tmp_path: Path):
+    with given:
+        address = str(tmp_path / "coordinator.sock")
+
+        calls = []
+
+        def fail_once(scope):
+            calls.append(scope)
+            if len(calls) == 1:
+                raise AssertionError("banana")
+
+        scenarios = [make_vscenario([make_vstep(fail_once)]), make_vscenario([make_vstep()])]
+        scheduler = RerunnerScenarioScheduler(scenarios)
+
+        dispatcher = Dispatcher()
+        dispatcher.listen(ScenarioFailedEvent,
+                          lambda e: scheduler.defer(e.scenario_result.scenario, 2))
+        reported = []
+        dispatcher.listen(ScenarioReportedEvent, lambda e: reported.append(e.aggregated_result))
+
+        coordinator = CoordinatorRunner(dispatcher, address=address)
+
+    with when:
+        report, *_ = await asyncio.gather(
+            coordinator.run(scheduler),
+            run_worker(address, scenarios),
+            run_worker(address, scenarios),
+        )
+
+    with then:
+        assert (report.total, report.passed, report.failed) == (2, 2, 0)
+        assert len(calls) == 3
+
+        # The rerun scenario is reported once, with all its executions
+        assert [x.scenario for x in reported] == [scenarios[1], scenarios[0]]
+        assert [x.status.value for x in reported[1].scenario_results] == [
+            "FAILED", "PASSED", "PASSED"
+        ]
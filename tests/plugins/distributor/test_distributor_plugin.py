@@ -0,0 +1,113 @@
+from unittest.mock import Mock
+
+import pytest
+from baby_steps import given, then, when
+from pytest import raises
+
+from vedro.core import Dispatcher, ScenarioRunner
+from vedro.plugins.distributor import CoordinatorRunner, DistributorPlugin, WorkerRunner
+
+from ._utils import (
+    dispatcher,
+    distributor_plugin,
+    fire_arg_parsed_event,
+    fire_config_loaded_event,
+    make_config,
+)
+
+__all__ = ("dispatcher", "distributor_plugin",)  # fixtures
+
+
+@pytest.mark.usefixtures(distributor_plugin.__name__)
+async def test_no_distribution(*, dispatcher: Dispatcher):
+    with given:
+        scenario_runner_ = Mock(ScenarioRunner)
+        config = make_config(dispatcher, scenario_runner_)
+        await fire_config_loaded_event(dispatcher, config)
+
+    with when:
+        await fire_arg_parsed_event(dispatcher)
+
+    with then:
+        assert config.Registry.ScenarioRunner() == scenario_runner_
+
+
+@pytest.mark.usefixtures(distributor_plugin.__name__)
+async def test_coordinator(*, dispatcher: Dispatcher):
+    with given:
+        config = make_config(dispatcher, Mock(ScenarioRunner))
+        await fire_config_loaded_event(dispatcher, config)
+
+    with when:
+        await fire_arg_parsed_event(dispatcher, coordinator="127.0.0.1:0", workers=2)
+
+    with then:
+        assert isinstance(config.Registry.ScenarioRunner(), CoordinatorRunner)
+
+
+@pytest.mark.usefixtures(distributor_plugin.__name__)
+async def test_worker(*, dispatcher: Dispatcher):
+    with given:
+        config = make_config(dispatcher, Mock(ScenarioRunner))
+        await fire_config_loaded_event(dispatcher, config)
+
+    with when:
+        await fire_arg_parsed_event(dispatcher, worker="unix:/tmp/vedro.sock")
+
+    with then:
+        assert isinstance(config.Registry.ScenarioRunner(), WorkerRunner)
+
+
+@pytest.mark.usefixtures(distributor_plugin.__name__)
+async def test_coordinator_and_worker(*, dispatcher: Dispatcher):
+    with given:
+        config = make_config(dispatcher, Mock(ScenarioRunner))
+        await fire_config_loaded_event(dispatcher, config)
+
+    with when, raises(BaseException) as exc:
+        await fire_arg_parsed_event(dispatcher, coordinator="127.0.0.1:0",
+                                    worker="127.0.0.1:8765")
+
+    with then:
+        assert exc.type is ValueError
+        assert str(exc.value) == "`--coordinator` and `--worker` can't be used together"
+
+
+@pytest.mark.usefixtures(distributor_plugin.__name__)
+async def test_workers_without_coordinator(*, dispatcher: Dispatcher):
+    with given:
+        config = make_config(dispatcher, Mock(ScenarioRunner))
+        await fire_config_loaded_event(dispatcher, config)
+
+    with when, raises(BaseException) as exc:
+        await fire_arg_parsed_event(dispatcher, workers=2)
+
+    with then:
+        assert exc.type is ValueError
+        assert str(exc.value) == "`--workers` can only be used with `--coordinator`"
+
+
+@pytest.mark.usefixtures(distributor_plugin.__name__)
+async def test_negative_workers(*, dispatcher: Dispatcher):
+    with given:
+        config = make_config(dispatcher, Mock(ScenarioRunner))
+        await fire_config_loaded_event(dispatcher, config)
+
+    with when, raises(BaseException) as exc:
+        await fire_arg_parsed_event(dispatcher, coordinator="127.0.0.1:0", workers=-1)
+
+    with then:
+        assert exc.type is ValueError
+        assert str(exc.value) == "`--workers` must be greater than or equal to 0, -1 given"
+
+
+@pytest.mark.parametrize("argv", [
+    ["run", "scenarios/", "--coordinator", "127.0.0.1:0", "--workers", "4", "-vv"],
+    ["run", "scenarios/", "--coordinator=127.0.0.1:0", "--workers=4", "-vv"],
+])
+def test_get_worker_args(argv, distributor_plugin: DistributorPlugin):
+    with when:
+        res = distributor_plugin._get_worker_args(argv)
+
+    with then:
+        assert res == ["run", "scenarios/", "-vv"]
@@ -0,0 +1,98 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from baby_steps import given, then, when
+from pytest import raises
+
+from vedro.plugins.distributor import format_address, parse_address
+from vedro.plugins.distributor._protocol import (
+    ProtocolError,
+    open_connection,
+    read_message,
+    start_server,
+    write_message,
+)
+
+
+@pytest.mark.parametrize(("raw", "expected"), [
+    ("127.0.0.1:8765", ("127.0.0.1", 8765)),
+    (":8765", ("127.0.0.1", 8765)),
+    ("localhost:0", ("localhost", 0)),
+    ("unix:/tmp/vedro.sock", "/tmp/vedro.sock"),
+])
+def test_parse_address(raw, expected):
+    with when:
+        res = parse_address(raw)
+
+    with then:
+        assert res == expected
+
+
+@pytest.mark.parametrize("raw", ["127.0.0.1", "127.0.0.1:port", "unix:"])
+def test_parse_invalid_address(raw):
+    with when, raises(BaseException) as exc:
+        parse_address(raw)
+
+    with then:
+        assert exc.type is ValueError
+
+
+@pytest.mark.parametrize("raw", ["127.0.0.1:8765", "unix:/tmp/vedro.sock"])
+def test_format_address(raw):
+    with when:
+        res = format_address(parse_address(raw))
+
+    with then:
+        assert res == raw
+
+
+async def test_send_messages(tmp_path: Path):
+    with given:
+        received = []
+
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            while (message := await read_message(reader)) is not None:
+                received.append(message)
+            writer.close()
+
+        server, address = await start_server(handle, str(tmp_path / "test.sock"))
+        _, writer = await open_connection(address, timeout=1.0)
+
+    with when:
+        await write_message(writer, {"type": "next"})
+        await write_message(writer, {"type": "result", "result": {"data": "x" * 100_000}})
+        writer.close()
+        await writer.wait_closed()
+        await asyncio.sleep(0.05)
+        server.close()
+
+    with then:
+        assert received == [
+            {"type": "next"},
+            {"type": "result", "result": {"data": "x" * 100_000}},
+        ]
+
+
+@pytest.mark.parametrize("payload", [b"{", b"\xff\xfe", b"[]", b"null"])
+async def test_read_malformed_message(payload: bytes):
+    with given:
+        reader = asyncio.StreamReader()
+        reader.feed_data(len(payload).to_bytes(4, "big") + payload)
+        reader.feed_eof()
+
+    with when, raises(BaseException) as exc:
+        await read_message(reader)
+
+    with then:
+        assert exc.type is ProtocolError
+        assert isinstance(exc.value, ValueError)
+        assert str(exc.value).startswith("Malformed message: ")
+
+
+async def test_open_connection_timeout(tmp_path: Path):
+    with when, raises(BaseException) as exc:
+        await open_connection(str(tmp_path / "missing.sock"), timeout=0.1, interval=0.05)
+
+    with then:
+        assert exc.type is ConnectionError
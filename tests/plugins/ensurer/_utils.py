@@ -23,13 +23,17 @@ def make_ensurer_plugin(dispatcher: Dispatcher, *,
                         show_attempts: bool = Ensurer.show_attempts,
                         default_attempts: int = Ensurer.default_attempts,
                         default_delay: float = Ensurer.default_delay,
-                        default_swallow: Type[Exception] = Ensurer.default_swallow
+                        default_swallow: Type[Exception] = Ensurer.default_swallow,
+                        show_metrics: bool = Ensurer.show_metrics,
+                        offload_sync_steps: bool = Ensurer.offload_sync_steps,
                         ) -> EnsurerPlugin:
     config = type("Ensurer", (Ensurer,), {
         "show_attempts": show_attempts,
         "default_attempts": default_attempts,
         "default_delay": default_delay,
         "default_swallow": default_swallow,
+        "show_metrics": show_metrics,
+        "offload_sync_steps": offload_sync_steps,
     })
     plugin = EnsurerPlugin(config)
     plugin.subscribe(dispatcher)
@@ -0,0 +1,63 @@
+from unittest.mock import patch
+
+import pytest
+from baby_steps import given, then, when
+from pytest import raises
+
+from vedro.plugins.ensurer import Backoff
+
+
+@pytest.mark.parametrize(("attempt", "expected"), [(1, 0.1), (2, 0.2), (3, 0.4), (4, 0.5)])
+def test_backoff(attempt: int, expected: float):
+    with given:
+        backoff = Backoff(0.1, factor=2.0, max_delay=0.5, jitter=False)
+
+    with when:
+        res = backoff(attempt)
+
+    with then:
+        assert res == pytest.approx(expected)
+
+
+def test_backoff_overflow():
+    with given:
+        backoff = Backoff(0.1, max_delay=5.0, jitter=False)
+
+    with when:
+        res = backoff(10_000)
+
+    with then:
+        assert res == 5.0
+
+
+def test_backoff_jitter():
+    with given:
+        backoff = Backoff(0.1, factor=2.0)
+
+    with when, patch("random.uniform", return_value=0.05) as uniform_:
+        res = backoff(3)
+
+    with then:
+        assert res == 0.05
+        assert uniform_.call_args.args[0] == 0
+        assert uniform_.call_args.args[1] == pytest.approx(0.4)
+
+
+@pytest.mark.parametrize("kwargs", [{"base": -1.0}, {"max_delay": -1.0}, {"factor": 0.5}])
+def test_backoff_invalid(kwargs):
+    with when, raises(BaseException) as exc:
+        Backoff(**kwargs)
+
+    with then:
+        assert exc.type is ValueError
+
+
+def test_backoff_repr():
+    with given:
+        backoff = Backoff(0.5)
+
+    with when:
+        res = repr(backoff)
+
+    with then:
+        assert res == "Backoff(0.5, factor=2.0, max_delay=10.0, jitter=True)"
@@ -3,7 +3,7 @@ from unittest.mock import AsyncMock, Mock, call, patch, sentinel
 from baby_steps import given, then, when
 from pytest import raises
 
-from vedro.plugins.ensurer import Ensure
+from vedro.plugins.ensurer import Ensure, EnsureMetrics
 
 
 async def test_attempts_without_error():
@@ -222,3 +222,56 @@ async def test_logger_with_errors():
             call(mock_, 2, exception),
             call(mock_, 3, exception)
         ]
+
+
+async def test_retry_on_result():
+    with given:
+        ensure = Ensure(attempts=3, retry_on=lambda res: res is None)
+        mock_ = AsyncMock(side_effect=[None, sentinel.result])
+
+    with when:
+        res = await ensure(mock_)(sentinel.arg)
+
+    with then:
+        assert res is sentinel.result
+        assert mock_.mock_calls == [call(sentinel.arg)] * 2
+
+
+async def test_deadline():
+    with given:
+        ensure = Ensure(attempts=5, delay=0.5, deadline=1.0)
+        mock_ = AsyncMock(side_effect=[Exception(), Exception(), sentinel.result])
+
+    with when, patch("time.monotonic", side_effect=[0.0, 0.4, 1.2]), \
+            patch("asyncio.sleep") as sleep_, raises(BaseException) as exc:
+        await ensure(mock_)()
+
+    with then:
+        assert exc.type is Exception
+        assert len(mock_.mock_calls) == 2
+        assert sleep_.mock_calls == [call(0.5)]
+
+
+async def test_metrics():
+    with given:
+        metrics = EnsureMetrics()
+        ensure = Ensure(attempts=2, metrics=metrics)
+        mock_ = AsyncMock(side_effect=[Exception(), Exception()], __qualname__="fn")
+
+    with when, raises(BaseException):
+        await ensure(mock_)()
+
+    with then:
+        stats, = metrics.stats
+        assert (stats.name, stats.calls, stats.attempts, stats.failures) == ("fn", 1, 2, 1)
+
+
+async def test_offload_ignored():
+    with given:
+        ensure = Ensure(offload=True)
+
+    with when:
+        wrapper = ensure(AsyncMock())
+
+    with then:
+        assert getattr(wrapper, "__vedro__offload__", False) is False
@@ -1,9 +1,10 @@
 from unittest.mock import Mock, call, patch, sentinel
 
+import pytest
 from baby_steps import given, then, when
 from pytest import raises
 
-from vedro.plugins.ensurer import Ensure
+from vedro.plugins.ensurer import Ensure, EnsureMetrics, RejectedResult
 
 
 def test_attempts_without_error():
@@ -233,3 +234,107 @@ def test_repr():
 
     with then:
         assert res == "Ensure(attempts=3, delay=0.1, swallow=<class 'ValueError'>)"
+
+
+def test_repr_with_deadline_and_retry_on():
+    with given:
+        ensure = Ensure(attempts=3, delay=0.1, swallow=ValueError, deadline=1.0, retry_on=bool)
+
+    with when:
+        res = repr(ensure)
+
+    with then:
+        assert res == ("Ensure(attempts=3, delay=0.1, swallow=<class 'ValueError'>, "
+                       "deadline=1.0, retry_on=<class 'bool'>)")
+
+
+def test_retry_on_result():
+    with given:
+        ensure = Ensure(attempts=3, retry_on=lambda res: res >= 500)
+        mock_ = Mock(side_effect=[503, 502, 200])
+
+    with when:
+        res = ensure(mock_)(sentinel.arg)
+
+    with then:
+        assert res == 200
+        assert mock_.mock_calls == [call(sentinel.arg)] * 3
+
+
+def test_retry_on_result_exhausted():
+    with given:
+        logger_ = Mock()
+        ensure = Ensure(attempts=2, retry_on=lambda res: res >= 500, logger=logger_)
+        mock_ = Mock(side_effect=[503, 502])
+
+    with when:
+        res = ensure(mock_)()
+
+    with then:
+        assert res == 502
+        assert [(c.args[1], repr(c.args[2])) for c in logger_.mock_calls] == [
+            (1, "RejectedResult(503)"),
+            (2, "RejectedResult(502)"),
+        ]
+        assert isinstance(logger_.mock_calls[0].args[2], RejectedResult)
+
+
+def test_deadline():
+    with given:
+        ensure = Ensure(attempts=5, delay=0.5, deadline=1.0)
+        mock_ = Mock(side_effect=[Exception(), Exception(), sentinel.result])
+
+    with when, patch("time.monotonic", side_effect=[0.0, 0.4, 1.2]), \
+            patch("time.sleep") as sleep_, raises(BaseException) as exc:
+        ensure(mock_)()
+
+    with then:
+        assert exc.type is Exception
+        assert len(mock_.mock_calls) == 2
+        assert sleep_.mock_calls == [call(0.5)]
+
+
+def test_metrics():
+    with given:
+        metrics = EnsureMetrics()
+        ensure = Ensure(attempts=3, metrics=metrics)
+
+        def fn(res):
+            return res
+        mock_ = Mock(side_effect=[Exception(), sentinel.result])
+
+    with when:
+        ensure(fn)(sentinel.result)
+        ensure(lambda: mock_())()
+
+    with then:
+        stats = metrics.stats
+        assert [(x.calls, x.attempts, x.failures) for x in stats] == [(1, 1, 0), (1, 2, 0)]
+        assert stats[0].name == "test_metrics.<locals>.fn"
+
+
+def test_metrics_not_swallowed():
+    with given:
+        metrics = EnsureMetrics()
+        ensure = Ensure(attempts=3, swallow=KeyError, metrics=metrics)
+        mock_ = Mock(side_effect=IndexError(), __qualname__="fn")
+
+    with when, raises(BaseException) as exc:
+        ensure(mock_)()
+
+    with then:
+        assert exc.type is IndexError
+        stats, = metrics.stats
+        assert (stats.calls, stats.attempts, stats.failures) == (1, 1, 1)
+
+
+@pytest.mark.parametrize("offload", [True, False])
+def test_offload(offload: bool):
+    with given:
+        ensure = Ensure(offload=offload)
+
+    with when:
+        wrapper = ensure(Mock())
+
+    with then:
+        assert getattr(wrapper, "__vedro__offload__", False) is offload
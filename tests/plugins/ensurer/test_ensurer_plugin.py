@@ -4,8 +4,8 @@ import pytest
 from baby_steps import given, then, when
 from pytest import raises
 
-from vedro.core import Dispatcher
-from vedro.events import StepPassedEvent
+from vedro.core import Dispatcher, Report
+from vedro.events import CleanupEvent, StepPassedEvent
 from vedro.plugins.ensurer import ensure
 
 from ._utils import dispatcher, ensurer, make_ensurer_plugin, make_step_result, run_step
@@ -115,3 +115,58 @@ async def test_custom_swallow(*, dispatcher: Dispatcher):
     with then:
         assert exc.type is Exception
         assert len(mock_.mock_calls) == 1
+
+
+async def test_metrics_summary(*, dispatcher: Dispatcher):
+    with given:
+        make_ensurer_plugin(dispatcher, show_metrics=True)
+
+        mock_ = Mock(side_effect=[Exception(), None], __qualname__="fn")
+        step_result = make_step_result(ensure()(mock_))
+        await run_step(dispatcher, StepPassedEvent, step_result)
+
+        report = Report()
+
+    with when:
+        await dispatcher.fire(CleanupEvent(report))
+
+    with then:
+        summary, = report.summary
+        assert summary.startswith("ensure: fn (calls 1, attempts 2, failed 0, avg ")
+
+
+@pytest.mark.usefixtures(ensurer.__name__)
+async def test_show_metrics_disabled_by_default(*, dispatcher: Dispatcher):
+    with given:
+        mock_ = Mock(side_effect=[Exception(), None], __qualname__="fn")
+        step_result = make_step_result(ensure()(mock_))
+        await run_step(dispatcher, StepPassedEvent, step_result)
+
+        report = Report()
+
+    with when:
+        await dispatcher.fire(CleanupEvent(report))
+
+    with then:
+        assert report.summary == []
+
+
+@pytest.mark.parametrize("offload_sync_steps", [True, False])
+async def test_offload_sync_steps(offload_sync_steps: bool, *, dispatcher: Dispatcher):
+    with given:
+        make_ensurer_plugin(dispatcher, offload_sync_steps=offload_sync_steps)
+
+    with when:
+        step = make_step_result(ensure()(Mock())).step
+
+    with then:
+        assert step.is_offloaded() is offload_sync_steps
+
+
+@pytest.mark.usefixtures(ensurer.__name__)
+async def test_offload_sync_steps_disabled_by_default(*, dispatcher: Dispatcher):
+    with when:
+        step = make_step_result(ensure()(Mock())).step
+
+    with then:
+        assert step.is_offloaded() is False
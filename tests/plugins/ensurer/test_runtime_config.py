@@ -1,6 +1,7 @@
 from baby_steps import given, then, when
 from pytest import raises
 
+from vedro.plugins.ensurer import EnsureMetrics
 from vedro.plugins.ensurer._runtime_config import RuntimeConfig
 
 
@@ -98,3 +99,51 @@ def test_logger_not_set():
     with then:
         assert exc.type is ValueError
         assert str(exc.value) == "'logger' is not set"
+
+
+def test_metrics():
+    with given:
+        runtime_config = RuntimeConfig()
+        runtime_config.set_metrics(metrics := EnsureMetrics())
+
+    with when:
+        res = runtime_config.get_metrics()
+
+    with then:
+        assert res is metrics
+
+
+def test_metrics_not_set():
+    with given:
+        runtime_config = RuntimeConfig()
+
+    with when, raises(BaseException) as exc:
+        runtime_config.get_metrics()
+
+    with then:
+        assert exc.type is ValueError
+        assert str(exc.value) == "'metrics' is not set"
+
+
+def test_offload():
+    with given:
+        runtime_config = RuntimeConfig()
+        runtime_config.set_offload(offload := True)
+
+    with when:
+        res = runtime_config.get_offload()
+
+    with then:
+        assert res == offload
+
+
+def test_offload_not_set():
+    with given:
+        runtime_config = RuntimeConfig()
+
+    with when, raises(BaseException) as exc:
+        runtime_config.get_offload()
+
+    with then:
+        assert exc.type is ValueError
+        assert str(exc.value) == "'offload' is not set"
@@ -1,12 +1,13 @@
 from pathlib import Path
 from textwrap import dedent
+from unittest.mock import AsyncMock
 
 import pytest
 from baby_steps import given, then, when
 
 from vedro import Scenario
 from vedro.core import ModuleLoader
-from vedro.core.scenario_collector import ScenarioSource
+from vedro.core.scenario_collector import LazyTemplateScenario, ScenarioSource
 from vedro.plugins.functioner import FuncBasedScenarioProvider as ScenarioProvider
 from vedro.plugins.functioner import FunctionerPlugin
 
@@ -292,3 +293,47 @@ async def test_custom_meta_on_parametrized_scenario(provider: ScenarioProvider,
         for scenario in scenarios:
             assert scenario.get_meta("decorated1", plugin=FunctionerPlugin) == 1
             assert scenario.get_meta("decorated2", plugin=FunctionerPlugin) == 2
+
+
+@pytest.mark.parametrize(("source", "expected"), [
+    ("import vedro\nclass Scenario(vedro.Scenario):\n    pass", 0),
+    ("from vedro import scenario\n@scenario\ndef create_user():\n    pass", 1),
+    ("import vedro as v\n@v.scenario()\ndef create_user():\n    pass", 1),
+])
+async def test_static_precheck(source: str, expected: int, *, module_loader: ModuleLoader,
+                               scenario_source: ScenarioSource):
+    with given:
+        provider = ScenarioProvider(static_precheck=True)
+        scenario_source.path.write_text(source)
+        module_loader.load = AsyncMock(wraps=module_loader.load)
+
+    with when:
+        scenarios = await provider.provide(scenario_source)
+
+    with then:
+        assert len(scenarios) == expected
+        assert len(module_loader.load.mock_calls) == expected
+
+
+async def test_parametrized_func_scenario_built_on_demand(provider: ScenarioProvider,
+                                                          scenario_source: ScenarioSource):
+    with given:
+        scenario_source.path.write_text(dedent('''
+            from vedro import scenario, params
+            @scenario([
+                params(1),
+                params(2),
+            ])
+            def create_user(user_id):
+                pass
+        '''))
+        scenarios = await provider.provide(scenario_source)
+
+    with when:
+        await scenarios[1].materialize()
+
+    with then:
+        assert [isinstance(x, LazyTemplateScenario) for x in scenarios] == [True, True]
+        assert [x.is_materialized() for x in scenarios] == [False, True]
+        assert scenarios[1]().user_id == 2
+        assert scenarios[1].unique_id == "scenarios/scenario.py::create_user#2"
@@ -1,6 +1,14 @@
+import asyncio
+from typing import List
+
 from baby_steps import given, then, when
 
-from vedro.plugins.functioner._step_recorder import StepRecorder, get_step_recorder
+from vedro.plugins.functioner._step_recorder import (
+    ContextStepRecorder,
+    RecordType,
+    StepRecorder,
+    get_step_recorder,
+)
 
 
 def test_initial_state():
@@ -119,3 +127,48 @@ def test_returns_step_recorder_instance():
 
     with then:
         assert isinstance(recorder, StepRecorder)
+
+
+def test_returns_context_step_recorder_instance():
+    with when:
+        recorder = get_step_recorder()
+
+    with then:
+        assert isinstance(recorder, ContextStepRecorder)
+
+
+async def test_context_recorder_records_per_task():
+    with given:
+        recorder = ContextStepRecorder()
+
+        async def record(name: str) -> List[RecordType]:
+            recorder.clear()
+            recorder.record("Given", name, 1.0, 2.0)
+            await asyncio.sleep(0)
+            recorder.record("Then", name, 2.0, 3.0)
+            return list(recorder)
+
+    with when:
+        records1, records2 = await asyncio.gather(record("first"), record("second"))
+
+    with then:
+        assert records1 == [("Given", "first", 1.0, 2.0, None),
+                            ("Then", "first", 2.0, 3.0, None)]
+        assert records2 == [("Given", "second", 1.0, 2.0, None),
+                            ("Then", "second", 2.0, 3.0, None)]
+        assert len(recorder) == 0
+
+
+async def test_context_recorder_clear_in_child_task():
+    with given:
+        recorder = ContextStepRecorder()
+        recorder.record("Given", "parent", 1.0, 2.0)
+
+        async def clear() -> None:
+            recorder.clear()
+
+    with when:
+        await asyncio.create_task(clear())
+
+    with then:
+        assert list(recorder) == [("Given", "parent", 1.0, 2.0, None)]
@@ -16,8 +16,10 @@ from vedro.core import (
     Dispatcher,
     ExcInfo,
     Factory,
+    MonotonicScenarioRunner,
     MonotonicScenarioScheduler,
     ScenarioResult,
+    ScenarioRunner,
     ScenarioScheduler,
     VirtualScenario,
 )
@@ -77,7 +79,11 @@ def make_scenario_result(scenario: Optional[VirtualScenario] = None) -> Scenario
 def make_config() -> ConfigType:
     class TestConfig(Config):
         class Registry(Config.Registry):
+            Dispatcher = Factory[Dispatcher](Dispatcher)
             ScenarioScheduler = Factory[ScenarioScheduler](MonotonicScenarioScheduler)
+            ScenarioRunner = Factory[ScenarioRunner](
+                lambda: MonotonicScenarioRunner(Dispatcher())
+            )
 
     return TestConfig
 
@@ -85,8 +91,10 @@ def make_config() -> ConfigType:
 async def fire_arg_parsed_event(dispatcher: Dispatcher, *,
                                 repeats: int,
                                 repeats_delay: float = 0.0,
-                                fail_fast_on_repeat: bool = False) -> None:
-    config_loaded_event = ConfigLoadedEvent(Path(), make_config())
+                                fail_fast_on_repeat: bool = False,
+                                repeats_parallel: int = 1) -> ConfigType:
+    config = make_config()
+    config_loaded_event = ConfigLoadedEvent(Path(), config)
     await dispatcher.fire(config_loaded_event)
 
     arg_parse_event = ArgParseEvent(ArgumentParser())
@@ -96,9 +104,12 @@ async def fire_arg_parsed_event(dispatcher: Dispatcher, *,
         repeats=repeats,
         repeats_delay=repeats_delay,
         fail_fast_on_repeat=fail_fast_on_repeat,
+        repeats_parallel=repeats_parallel,
     ))
     await dispatcher.fire(arg_parsed_event)
 
+    return config
+
 
 async def fire_startup_event(dispatcher: Dispatcher, scheduler: Scheduler) -> None:
     startup_event = StartupEvent(scheduler)
@@ -5,15 +5,16 @@ import pytest
 from baby_steps import given, then, when
 from pytest import raises
 
-from vedro.core import Dispatcher, Event, Report, ScenarioResult
+from vedro.core import AggregatedResult, Dispatcher, Event, Report, ScenarioResult
 from vedro.events import (
     CleanupEvent,
     ScenarioFailedEvent,
     ScenarioPassedEvent,
+    ScenarioReportedEvent,
     ScenarioRunEvent,
     ScenarioSkippedEvent,
 )
-from vedro.plugins.repeater import RepeaterExecutionInterrupted
+from vedro.plugins.repeater import RepeaterExecutionInterrupted, RepeaterScenarioRunner
 
 from ._utils import (
     dispatcher,
@@ -273,3 +274,105 @@ async def test_dont_add_summary_interrupted(dispatcher: Dispatcher, scheduler_:
 
     with then:
         assert report.summary == []
+
+
+@pytest.mark.usefixtures(repeater.__name__)
+async def test_repeats_parallel_validation(dispatcher: Dispatcher):
+    with when, raises(BaseException) as exc:
+        await fire_arg_parsed_event(dispatcher, repeats=2, repeats_parallel=0)
+
+    with then:
+        assert exc.type is ValueError
+        assert str(exc.value) == "--repeats-parallel must be >= 1"
+
+
+@pytest.mark.usefixtures(repeater.__name__)
+async def test_repeats_parallel_without_repeats_validation(dispatcher: Dispatcher):
+    with when, raises(BaseException) as exc:
+        await fire_arg_parsed_event(dispatcher, repeats=1, repeats_parallel=2)
+
+    with then:
+        assert exc.type is ValueError
+        assert str(exc.value) == "--repeats-parallel must be used with --repeats > 1"
+
+
+@pytest.mark.usefixtures(repeater.__name__)
+async def test_repeats_parallel_with_delay_validation(dispatcher: Dispatcher):
+    with when, raises(BaseException) as exc:
+        await fire_arg_parsed_event(dispatcher, repeats=2, repeats_parallel=2, repeats_delay=0.1)
+
+    with then:
+        assert exc.type is ValueError
+        assert str(exc.value) == "--repeats-parallel can't be used with --repeats-delay"
+
+
+@pytest.mark.usefixtures(repeater.__name__)
+async def test_repeats_parallel_registers_runner(dispatcher: Dispatcher):
+    with when:
+        config = await fire_arg_parsed_event(dispatcher, repeats=3, repeats_parallel=2)
+
+    with then:
+        runner = config.Registry.ScenarioRunner()
+        assert isinstance(runner, RepeaterScenarioRunner)
+        assert runner._concurrency == 2
+
+
+@pytest.mark.usefixtures(repeater.__name__)
+async def test_repeats_sequential_keeps_runner(dispatcher: Dispatcher):
+    with when:
+        config = await fire_arg_parsed_event(dispatcher, repeats=3)
+
+    with then:
+        assert not isinstance(config.Registry.ScenarioRunner(), RepeaterScenarioRunner)
+
+
+@pytest.mark.usefixtures(repeater.__name__)
+async def test_repeats_parallel_latency(dispatcher: Dispatcher):
+    with given:
+        await fire_arg_parsed_event(dispatcher, repeats=4, repeats_parallel=2)
+
+        scenario_results = []
+        for elapsed in [0.4, 0.1, 0.3, 0.2]:
+            scenario_result = make_scenario_result().mark_passed()
+            scenario_result.set_started_at(1.0).set_ended_at(1.0 + elapsed)
+            scenario_results.append(scenario_result)
+        aggregated_result = AggregatedResult.from_existing(scenario_results[0], scenario_results)
+
+    with when:
+        await dispatcher.fire(ScenarioReportedEvent(aggregated_result))
+
+    with then:
+        assert aggregated_result.extra_details == [
+            "latency x4: min 0.100s, p50 0.200s, p95 0.400s, max 0.400s"
+        ]
+
+
+@pytest.mark.usefixtures(repeater.__name__)
+async def test_repeats_sequential_no_latency(dispatcher: Dispatcher):
+    with given:
+        await fire_arg_parsed_event(dispatcher, repeats=2)
+
+        scenario_results = [make_scenario_result().mark_passed() for _ in range(2)]
+        aggregated_result = AggregatedResult.from_existing(scenario_results[0], scenario_results)
+
+    with when:
+        await dispatcher.fire(ScenarioReportedEvent(aggregated_result))
+
+    with then:
+        assert aggregated_result.extra_details == []
+
+
+@pytest.mark.usefixtures(repeater.__name__)
+async def test_add_summary_with_concurrency(dispatcher: Dispatcher, scheduler_: Mock):
+    with given:
+        await fire_arg_parsed_event(dispatcher, repeats=5, repeats_parallel=3)
+        await fire_startup_event(dispatcher, scheduler_)
+
+        report = Report()
+        cleanup_event = CleanupEvent(report)
+
+    with when:
+        await dispatcher.fire(cleanup_event)
+
+    with then:
+        assert report.summary == ["repeated x5 with concurrency 3"]
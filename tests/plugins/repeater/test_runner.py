@@ -0,0 +1,255 @@
+import asyncio
+from contextvars import ContextVar
+from pathlib import Path
+from time import monotonic_ns
+from typing import Any, Callable, List, Tuple
+from unittest.mock import Mock
+
+import pytest
+from baby_steps import given, then, when
+
+from vedro import MemoryArtifact, Scenario
+from vedro.core import AggregatedResult, Dispatcher, Report, VirtualScenario, VirtualStep
+from vedro.core.output_capturer import OutputCapturer
+from vedro.core.scenario_runner import RunInterrupted
+from vedro.events import (
+    ScenarioPassedEvent,
+    ScenarioReportedEvent,
+    ScenarioRunEvent,
+    StartupEvent,
+    StepPassedEvent,
+)
+from vedro.plugins.artifacted import (
+    Artifacted,
+    ArtifactedPlugin,
+    attach_scenario_artifact,
+    attach_step_artifact,
+)
+from vedro.plugins.deferrer import Deferrer, DeferrerPlugin, defer
+from vedro.plugins.repeater import RepeaterScenarioRunner
+from vedro.plugins.repeater import RepeaterScenarioScheduler as Scheduler
+
+from ._utils import dispatcher, fire_arg_parsed_event, repeater, sleep_
+
+__all__ = ("dispatcher", "repeater", "sleep_")  # fixtures
+
+
+class ConcurrencyTracker:
+    def __init__(self) -> None:
+        self.active = 0
+        self.max_active = 0
+
+    async def step(self, scenario: Scenario) -> None:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+
+
+def make_vscenario(fn: Callable[..., Any]) -> VirtualScenario:
+    class _Scenario(Scenario):
+        __file__ = Path(f"scenario_{monotonic_ns()}.py").absolute()
+
+    return VirtualScenario(_Scenario, steps=[VirtualStep(fn)])
+
+
+async def run(dispatcher: Dispatcher, scenarios: List[VirtualScenario], *,
+              concurrency: int, **kwargs: Any) -> Tuple[Report, List[AggregatedResult]]:
+    reported: List[AggregatedResult] = []
+    dispatcher.listen(ScenarioReportedEvent, lambda e: reported.append(e.aggregated_result))
+
+    scheduler = Scheduler(scenarios)
+    await dispatcher.fire(StartupEvent(scheduler))
+
+    runner = RepeaterScenarioRunner(dispatcher, concurrency=concurrency,
+                                    interrupt_exceptions=(KeyboardInterrupt,))
+    report = await runner.run(scheduler, **kwargs)
+    return report, reported
+
+
+@pytest.mark.usefixtures(repeater.__name__)
+async def test_run_repeats_concurrently(*, dispatcher: Dispatcher):
+    with given:
+        await fire_arg_parsed_event(dispatcher, repeats=7, repeats_parallel=3)
+        tracker = ConcurrencyTracker()
+
+    with when:
+        report, reported = await run(dispatcher, [make_vscenario(tracker.step)], concurrency=3)
+
+    with then:
+        assert tracker.max_active == 3
+        assert report.passed == 1
+
+        aggregated_result, = reported
+        assert len(aggregated_result.scenario_results) == 7
+
+
+@pytest.mark.usefixtures(repeater.__name__)
+async def test_run_different_scenarios_sequentially(*, dispatcher: Dispatcher):
+    with given:
+        await fire_arg_parsed_event(dispatcher, repeats=2, repeats_parallel=4)
+        tracker = ConcurrencyTracker()
+        scenarios = [make_vscenario(tracker.step), make_vscenario(tracker.step)]
+
+    with when:
+        report, reported = await run(dispatcher, scenarios, concurrency=4)
+
+    with then:
+        assert tracker.max_active == 1
+        assert report.passed == 2
+        assert [x.scenario for x in reported] == scenarios
+
+
+@pytest.mark.usefixtures(repeater.__name__)
+async def test_run_sync_repeats_sequentially(*, dispatcher: Dispatcher):
+    with given:
+        await fire_arg_parsed_event(dispatcher, repeats=3, repeats_parallel=3)
+        step = Mock(__name__="step")
+
+    with when:
+        report, reported = await run(dispatcher, [make_vscenario(step)], concurrency=3)
+
+    with then:
+        assert step.call_count == 3
+        assert report.passed == 1
+
+
+@pytest.mark.parametrize(("mode", "expected"), [
+    ("redirect", 1),
+    ("context", 3),
+])
+@pytest.mark.usefixtures(repeater.__name__)
+async def test_run_repeats_with_output_capturer(mode: str, expected: int, *,
+                                                dispatcher: Dispatcher):
+    with given:
+        await fire_arg_parsed_event(dispatcher, repeats=4, repeats_parallel=3)
+        tracker = ConcurrencyTracker()
+        output_capturer = OutputCapturer(enabled=True, mode=mode)
+
+    with when:
+        await run(dispatcher, [make_vscenario(tracker.step)], concurrency=3,
+                  output_capturer=output_capturer)
+
+    with then:
+        assert tracker.max_active == expected
+
+
+@pytest.mark.usefixtures(repeater.__name__)
+async def test_run_repeats_concurrently_with_artifacts(*, dispatcher: Dispatcher):
+    with given:
+        artifacted = ArtifactedPlugin(Artifacted)
+        dispatcher.listen(ScenarioRunEvent, artifacted.on_scenario_run) \
+                  .listen(StepPassedEvent, artifacted.on_step_end) \
+                  .listen(ScenarioPassedEvent, artifacted.on_scenario_end)
+        await fire_arg_parsed_event(dispatcher, repeats=4, repeats_parallel=3)
+        calls = 0
+
+        async def step(scenario: Scenario) -> None:
+            nonlocal calls
+            calls += 1
+            call_number = calls
+            attach_scenario_artifact(MemoryArtifact(f"scenario-{call_number}", "text/plain", b""))
+            await asyncio.sleep(0.01)
+            attach_step_artifact(MemoryArtifact(f"step-{call_number}", "text/plain", b""))
+
+    with when:
+        report, reported = await run(dispatcher, [make_vscenario(step)], concurrency=3)
+
+    with then:
+        aggregated_result, = reported
+        artifacts = [
+            ([x.name for x in res.artifacts], [x.name for x in res.step_results[0].artifacts])
+            for res in aggregated_result.scenario_results
+        ]
+        assert artifacts == [([f"scenario-{n}"], [f"step-{n}"]) for n in range(1, 5)]
+
+
+@pytest.mark.usefixtures(repeater.__name__)
+async def test_run_repeats_concurrently_with_defer(*, dispatcher: Dispatcher):
+    with given:
+        DeferrerPlugin(Deferrer).subscribe(dispatcher)
+        await fire_arg_parsed_event(dispatcher, repeats=4, repeats_parallel=3)
+        calls, deferred = 0, []
+        current_call: ContextVar[int] = ContextVar("current_call")
+
+        async def step(scenario: Scenario) -> None:
+            nonlocal calls
+            calls += 1
+            current_call.set(calls)
+            defer(lambda call_number: deferred.append((call_number, current_call.get())), calls)
+            await asyncio.sleep(0.01)
+
+    with when:
+        await run(dispatcher, [make_vscenario(step)], concurrency=3)
+
+    with then:
+        # Each repeat runs only the functions it has deferred
+        assert sorted(deferred) == [(1, 1), (2, 2), (3, 3), (4, 4)]
+
+
+@pytest.mark.usefixtures(repeater.__name__)
+async def test_run_repeats_failed(*, dispatcher: Dispatcher):
+    with given:
+        await fire_arg_parsed_event(dispatcher, repeats=4, repeats_parallel=2)
+        calls = 0
+
+        async def step(scenario: Scenario) -> None:
+            nonlocal calls
+            calls += 1
+            call_number = calls
+            await asyncio.sleep(0)
+            assert call_number % 2 == 1
+
+    with when:
+        report, reported = await run(dispatcher, [make_vscenario(step)], concurrency=2)
+
+    with then:
+        assert report.failed == 1
+
+        aggregated_result, = reported
+        assert [x.is_passed() for x in aggregated_result.scenario_results] == [
+            True, False, True, False
+        ]
+
+
+@pytest.mark.usefixtures(repeater.__name__)
+async def test_run_repeats_interrupted(*, dispatcher: Dispatcher):
+    with given:
+        await fire_arg_parsed_event(dispatcher, repeats=4, repeats_parallel=2)
+        calls = 0
+
+        async def step(scenario: Scenario) -> None:
+            nonlocal calls
+            calls += 1
+            if calls == 3:
+                raise KeyboardInterrupt()
+            await asyncio.sleep(0.01)
+
+        report = Report()
+
+    with when:
+        _, reported = await run(dispatcher, [make_vscenario(step)], concurrency=2,
+                                report=report)
+
+    with then:
+        assert report.interrupted is not None
+        assert report.interrupted.type is KeyboardInterrupt
+
+        aggregated_result, = reported
+        assert len(aggregated_result.scenario_results) == 4
+
+
+async def test_run_scenarios_interrupted(*, dispatcher: Dispatcher):
+    with given:
+        async def step(scenario: Scenario) -> None:
+            raise KeyboardInterrupt()
+
+        scheduler = Scheduler([make_vscenario(step)])
+        runner = RepeaterScenarioRunner(dispatcher, concurrency=2,
+                                        interrupt_exceptions=(KeyboardInterrupt,))
+
+    with when, pytest.raises(BaseException) as exc:
+        await runner._run_scenarios(scheduler, Report())
+
+    with then:
+        assert exc.type is RunInterrupted
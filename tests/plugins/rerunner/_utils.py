@@ -2,6 +2,7 @@ import asyncio
 from argparse import ArgumentParser, Namespace
 from pathlib import Path
 from time import monotonic_ns
+from typing import Optional
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -17,6 +18,7 @@ from vedro.core import (
     ScenarioScheduler,
     VirtualScenario,
 )
+from vedro.core.exp.local_storage import create_local_storage
 from vedro.events import (
     ArgParsedEvent,
     ArgParseEvent,
@@ -46,6 +48,25 @@ def rerunner(dispatcher: Dispatcher, sleep_: SleepType) -> RerunnerPlugin:
     return plugin
 
 
+@pytest.fixture()
+def tracking_rerunner(dispatcher: Dispatcher, sleep_: SleepType,
+                      tmp_path: Path) -> RerunnerPlugin:
+    return make_tracking_rerunner(dispatcher, sleep_, tmp_path)
+
+
+def make_tracking_rerunner(dispatcher: Dispatcher, sleep: SleepType,
+                           project_dir: Path) -> RerunnerPlugin:
+    class TrackingRerunner(Rerunner):
+        track_flakiness = True
+
+    plugin = RerunnerPlugin(
+        TrackingRerunner, sleep=sleep,
+        local_storage_factory=lambda p, _: create_local_storage(p, project_dir),
+    )
+    plugin.subscribe(dispatcher)
+    return plugin
+
+
 @pytest.fixture()
 def scheduler() -> Scheduler:
     return Scheduler([])
@@ -63,8 +84,8 @@ def make_vscenario() -> VirtualScenario:
     return VirtualScenario(_Scenario, steps=[])
 
 
-def make_scenario_result() -> ScenarioResult:
-    return ScenarioResult(make_vscenario())
+def make_scenario_result(scenario: Optional[VirtualScenario] = None) -> ScenarioResult:
+    return ScenarioResult(scenario or make_vscenario())
 
 
 def make_config() -> ConfigType:
@@ -76,14 +97,18 @@ def make_config() -> ConfigType:
 
 
 async def fire_arg_parsed_event(dispatcher: Dispatcher, *,
-                                reruns: int, reruns_delay: float = 0.0) -> None:
+                                reruns: int, reruns_delay: float = 0.0,
+                                reruns_deferred: bool = False,
+                                reruns_flaky_only: bool = False) -> None:
     config_loaded_event = ConfigLoadedEvent(Path(), make_config())
     await dispatcher.fire(config_loaded_event)
 
     arg_parse_event = ArgParseEvent(ArgumentParser())
     await dispatcher.fire(arg_parse_event)
 
-    arg_parsed_event = ArgParsedEvent(Namespace(reruns=reruns, reruns_delay=reruns_delay))
+    arg_parsed_event = ArgParsedEvent(Namespace(reruns=reruns, reruns_delay=reruns_delay,
+                                                reruns_deferred=reruns_deferred,
+                                                reruns_flaky_only=reruns_flaky_only))
     await dispatcher.fire(arg_parsed_event)
 
 
@@ -0,0 +1,148 @@
+import pytest
+from baby_steps import given, then, when
+from pytest import raises
+
+from vedro.plugins.rerunner import FlakinessHistory, FlakinessTracker
+
+
+def test_history_empty():
+    with when:
+        history = FlakinessHistory()
+
+    with then:
+        assert history.size == 0
+        assert history.failures == 0
+        assert history.flip_rate == 0.0
+
+
+@pytest.mark.parametrize(("outcomes", "expected"), [
+    ([False], 0.0),
+    ([False, False, False], 0.0),
+    ([True, True, True], 0.0),
+    ([False, True], 1.0),
+    ([False, True, False, True], 1.0),
+    ([False, False, True, True, False], 0.5),
+])
+def test_history_flip_rate(outcomes, expected):
+    with given:
+        history = FlakinessHistory()
+
+    with when:
+        for failed in outcomes:
+            history.record(failed)
+
+    with then:
+        assert history.flip_rate == expected
+        assert history.failures == sum(outcomes)
+
+
+def test_history_capacity():
+    with given:
+        history = FlakinessHistory(capacity=3)
+
+    with when:
+        for failed in [True, False, True, False, False]:
+            history.record(failed)
+
+    with then:
+        assert history.size == 3
+        assert history.bits == 0b100
+        assert history.flip_rate == 0.5
+
+
+def test_history_restore_truncated():
+    with when:
+        history = FlakinessHistory(0b10110, 5, capacity=3)
+
+    with then:
+        assert history.size == 3
+        assert history.bits == 0b110
+
+
+def test_history_capacity_validation():
+    with when, raises(BaseException) as exc:
+        FlakinessHistory(capacity=1)
+
+    with then:
+        assert exc.type is ValueError
+        assert str(exc.value) == "'capacity' must be greater than or equal to 2"
+
+
+def test_history_repr():
+    with given:
+        history = FlakinessHistory()
+        for failed in [True, False, False]:
+            history.record(failed)
+
+    with when:
+        res = repr(history)
+
+    with then:
+        assert res == "<FlakinessHistory '100' flip_rate=0.50>"
+
+
+def test_tracker_dump_load():
+    with given:
+        tracker = FlakinessTracker()
+        for failed in [False, True, False]:
+            tracker.record("scenario_1", failed)
+        tracker.record("scenario_2", True)
+
+    with when:
+        restored = FlakinessTracker()
+        restored.load(tracker.dump())
+
+    with then:
+        assert restored.dump() == {"scenario_1": [0b010, 3], "scenario_2": [0b1, 1]}
+
+
+@pytest.mark.parametrize("data", [
+    None,
+    [],
+    {"scenario_1": "0b10"},
+    {"scenario_1": [1, 2, 3]},
+    {"scenario_1": ["1", 2]},
+])
+def test_tracker_load_malformed(data):
+    with given:
+        tracker = FlakinessTracker()
+
+    with when:
+        tracker.load(data)
+
+    with then:
+        assert tracker.dump() == {}
+
+
+@pytest.mark.parametrize(("outcomes", "threshold", "expected"), [
+    ([], 0.1, False),
+    ([True, True, True], 0.0, False),
+    ([False, False, False, True], 0.4, False),
+    ([False, False, False, True], 0.3, True),
+    ([False, True, False], 1.0, True),
+])
+def test_tracker_is_flaky(outcomes, threshold, expected):
+    with given:
+        tracker = FlakinessTracker()
+        for failed in outcomes:
+            tracker.record("scenario", failed)
+
+    with when:
+        res = tracker.is_flaky("scenario", threshold)
+
+    with then:
+        assert res is expected
+
+
+def test_tracker_get():
+    with given:
+        tracker = FlakinessTracker(history_size=4)
+        tracker.record("scenario", True)
+
+    with when:
+        history = tracker.get("scenario")
+
+    with then:
+        assert history is not None
+        assert history.size == 1
+        assert tracker.get("unknown") is None
@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import Type, Union
 from unittest.mock import AsyncMock, Mock, call
 
@@ -5,7 +6,8 @@ import pytest
 from baby_steps import given, then, when
 from pytest import raises
 
-from vedro.core import Dispatcher, Report
+from vedro.core import Dispatcher, MonotonicScenarioScheduler, Report
+from vedro.core.exp.local_storage import create_local_storage
 from vedro.events import (
     CleanupEvent,
     ScenarioFailedEvent,
@@ -13,6 +15,7 @@ from vedro.events import (
     ScenarioRunEvent,
     ScenarioSkippedEvent,
 )
+from vedro.plugins.rerunner import RerunnerPlugin
 
 from ._utils import (
     dispatcher,
@@ -20,12 +23,15 @@ from ._utils import (
     fire_failed_event,
     fire_startup_event,
     make_scenario_result,
+    make_tracking_rerunner,
+    make_vscenario,
     rerunner,
     scheduler_,
     sleep_,
+    tracking_rerunner,
 )
 
-__all__ = ("rerunner", "scheduler_", "dispatcher", "sleep_")  # fixtures
+__all__ = ("rerunner", "tracking_rerunner", "scheduler_", "dispatcher", "sleep_")  # fixtures
 
 
 @pytest.mark.usefixtures(rerunner.__name__)
@@ -235,3 +241,181 @@ async def test_dont_add_summary(dispatcher: Dispatcher, scheduler_: Mock):
 
     with then:
         assert report.summary == []
+
+
+@pytest.mark.usefixtures(rerunner.__name__)
+async def test_reruns_deferred_validation(dispatcher: Dispatcher):
+    with when, raises(BaseException) as exc:
+        await fire_arg_parsed_event(dispatcher, reruns=0, reruns_deferred=True)
+
+    with then:
+        assert exc.type is ValueError
+        assert str(exc.value) == "--reruns-deferred must be used with --reruns > 0"
+
+
+@pytest.mark.usefixtures(rerunner.__name__)
+async def test_reruns_deferred_unsupported_scheduler(dispatcher: Dispatcher):
+    with given:
+        await fire_arg_parsed_event(dispatcher, reruns=1, reruns_deferred=True)
+
+    with when, raises(BaseException) as exc:
+        await fire_startup_event(dispatcher, MonotonicScenarioScheduler([]))
+
+    with then:
+        assert exc.type is TypeError
+        assert str(exc.value) == ("--reruns-deferred requires the scenario scheduler to be "
+                                  "a subclass of RerunnerScenarioScheduler, "
+                                  "got MonotonicScenarioScheduler")
+
+
+@pytest.mark.usefixtures(rerunner.__name__)
+async def test_rerun_failed_deferred(*, dispatcher: Dispatcher, scheduler_: Mock,
+                                     sleep_: AsyncMock):
+    with given:
+        await fire_arg_parsed_event(dispatcher, reruns=2, reruns_delay=0.5,
+                                    reruns_deferred=True)
+        await fire_startup_event(dispatcher, scheduler_)
+
+        scenario_result = make_scenario_result().mark_failed()
+
+    with when:
+        await dispatcher.fire(ScenarioRunEvent(scenario_result))
+        await dispatcher.fire(ScenarioFailedEvent(scenario_result))
+
+    with then:
+        assert scheduler_.mock_calls == [
+            call.set_batch_delay(0.5, sleep=sleep_),
+            call.defer(scenario_result.scenario, 2),
+        ]
+        assert sleep_.mock_calls == []
+
+
+@pytest.mark.usefixtures(rerunner.__name__)
+async def test_no_additional_reruns_deferred(*, dispatcher: Dispatcher, scheduler_: Mock):
+    with given:
+        await fire_arg_parsed_event(dispatcher, reruns=2, reruns_deferred=True)
+        await fire_startup_event(dispatcher, scheduler_)
+
+        scenario_failed_event = await fire_failed_event(dispatcher)
+        scheduler_.reset_mock()
+
+    with when:
+        # The scenario fails again in the deferred batch
+        await dispatcher.fire(scenario_failed_event)
+
+    with then:
+        assert scheduler_.mock_calls == []
+
+
+@pytest.mark.usefixtures(rerunner.__name__)
+async def test_add_summary_deferred(dispatcher: Dispatcher, scheduler_: Mock):
+    with given:
+        await fire_arg_parsed_event(dispatcher, reruns=2, reruns_deferred=True)
+        await fire_startup_event(dispatcher, scheduler_)
+        await fire_failed_event(dispatcher)
+
+        report = Report()
+
+    with when:
+        await dispatcher.fire(CleanupEvent(report))
+
+    with then:
+        assert report.summary == ["rerun 1 scenario, 2 times, deferred"]
+
+
+@pytest.mark.usefixtures(rerunner.__name__)
+async def test_reruns_flaky_only_validation(dispatcher: Dispatcher):
+    with when, raises(BaseException) as exc:
+        await fire_arg_parsed_event(dispatcher, reruns=0, reruns_flaky_only=True)
+
+    with then:
+        assert exc.type is ValueError
+        assert str(exc.value) == "--reruns-flaky-only must be used with --reruns > 0"
+
+
+async def test_rerun_flaky_only(*, tracking_rerunner: RerunnerPlugin, dispatcher: Dispatcher,
+                                scheduler_: Mock, tmp_path: Path):
+    with given:
+        flaky, stable = make_vscenario(), make_vscenario()
+
+        local_storage = create_local_storage(tracking_rerunner, tmp_path)
+        await local_storage.put("flakiness", {
+            flaky.unique_id: [0b0101, 4],
+            stable.unique_id: [0b0000, 4],
+        })
+        await local_storage.flush()
+
+        await fire_arg_parsed_event(dispatcher, reruns=2, reruns_flaky_only=True)
+        await fire_startup_event(dispatcher, scheduler_)
+
+    with when:
+        await dispatcher.fire(ScenarioFailedEvent(make_scenario_result(stable).mark_failed()))
+        await dispatcher.fire(ScenarioFailedEvent(make_scenario_result(flaky).mark_failed()))
+
+    with then:
+        assert scheduler_.mock_calls == [call.schedule(flaky), call.schedule(flaky)]
+
+
+async def test_track_flakiness(*, tracking_rerunner: RerunnerPlugin, dispatcher: Dispatcher,
+                               scheduler_: Mock, tmp_path: Path):
+    with given:
+        scenario = make_vscenario()
+        await fire_arg_parsed_event(dispatcher, reruns=0)
+        await fire_startup_event(dispatcher, scheduler_)
+
+        await dispatcher.fire(ScenarioPassedEvent(make_scenario_result(scenario).mark_passed()))
+        await dispatcher.fire(ScenarioFailedEvent(make_scenario_result(scenario).mark_failed()))
+
+    with when:
+        await dispatcher.fire(CleanupEvent(Report()))
+
+    with then:
+        local_storage = create_local_storage(tracking_rerunner, tmp_path)
+        assert await local_storage.get("flakiness") == {scenario.unique_id: [0b0, 1]}
+        assert scheduler_.mock_calls == []
+
+
+async def test_track_flakiness_once_per_run(*, sleep_: AsyncMock, scheduler_: Mock,
+                                            tmp_path: Path):
+    with given:
+        scenario = make_vscenario()
+        outcomes_per_run = [
+            ["failed", "failed", "passed", "passed"],  # failed, then 3 reruns
+            ["passed"],
+            ["failed", "passed", "passed", "passed"],
+        ]
+
+    with when:
+        for outcomes in outcomes_per_run:
+            dispatcher = Dispatcher()
+            tracking_rerunner = make_tracking_rerunner(dispatcher, sleep_, tmp_path)
+            await fire_arg_parsed_event(dispatcher, reruns=3)
+            await fire_startup_event(dispatcher, scheduler_)
+
+            for outcome in outcomes:
+                scenario_result = make_scenario_result(scenario)
+                if outcome == "failed":
+                    event = ScenarioFailedEvent(scenario_result.mark_failed())
+                else:
+                    event = ScenarioPassedEvent(scenario_result.mark_passed())
+                await dispatcher.fire(event)
+            await dispatcher.fire(CleanupEvent(Report()))
+
+    with then:
+        local_storage = create_local_storage(tracking_rerunner, tmp_path)
+        assert await local_storage.get("flakiness") == {scenario.unique_id: [0b101, 3]}
+
+
+@pytest.mark.usefixtures(tracking_rerunner.__name__)
+async def test_add_summary_flaky_only(dispatcher: Dispatcher, scheduler_: Mock):
+    with given:
+        await fire_arg_parsed_event(dispatcher, reruns=1, reruns_flaky_only=True)
+        await fire_startup_event(dispatcher, scheduler_)
+
+        report = Report()
+
+    with when:
+        await dispatcher.fire(CleanupEvent(report))
+
+    with then:
+        assert report.summary == ["rerun 0 scenarios, 0 times, flaky only"]
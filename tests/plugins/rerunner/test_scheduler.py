@@ -1,4 +1,5 @@
 from typing import Callable, List
+from unittest.mock import AsyncMock, call
 
 import pytest
 from baby_steps import given, then, when
@@ -7,7 +8,7 @@ from pytest import raises
 from vedro.core import AggregatedResult, MonotonicScenarioScheduler, ScenarioResult
 from vedro.plugins.rerunner import RerunnerScenarioScheduler as Scheduler
 
-from ._utils import make_scenario_result, scheduler
+from ._utils import make_scenario_result, make_vscenario, scheduler
 
 __all__ = ("scheduler",)  # fixtures
 
@@ -74,3 +75,53 @@ def test_aggregate_2failed_1passed(scheduler: Scheduler):
     with then:
         expected = AggregatedResult.from_existing(failed_last, scenario_results)
         assert aggregated_result == expected
+
+
+async def test_deferred_batch():
+    with given:
+        scn1, scn2, scn3 = [make_vscenario() for _ in range(3)]
+        scheduler = Scheduler([scn1, scn2, scn3])
+        sleep_ = AsyncMock()
+        scheduler.set_batch_delay(0.5, sleep=sleep_)
+
+    with when:
+        executed = []
+        async for scenario in scheduler:
+            executed.append(scenario)
+            if scenario in (scn1, scn2) and executed.count(scenario) == 1:
+                scheduler.defer(scenario, 2)
+
+    with then:
+        assert executed == [scn1, scn2, scn3, scn1, scn1, scn2, scn2]
+        assert sleep_.mock_calls == [call(0.5)]
+        assert list(scheduler.scheduled) == [scn1, scn1, scn1, scn2, scn2, scn2, scn3]
+
+
+async def test_deferred_has_pending():
+    with given:
+        scn1, scn2 = make_vscenario(), make_vscenario()
+        scheduler = Scheduler([scn1, scn2])
+
+    with when:
+        pending = []
+        async for scenario in scheduler:
+            if scenario is scn1 and not pending:
+                scheduler.defer(scenario)
+            pending.append((scheduler.has_pending(scn1), scheduler.has_pending(scn2)))
+
+    with then:
+        assert pending == [(True, True), (True, False), (False, False)]
+
+
+async def test_deferred_ignore():
+    with given:
+        scn1, scn2 = make_vscenario(), make_vscenario()
+        scheduler = Scheduler([scn1, scn2])
+        scheduler.defer(scn1)
+
+    with when:
+        scheduler.ignore(scn1)
+
+    with then:
+        assert [x async for x in scheduler] == [scn2]
+        assert scheduler.has_pending(scn1) is False
@@ -0,0 +1,49 @@
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+from time import monotonic_ns
+from typing import List, Optional
+
+import pytest
+
+from vedro import Scenario
+from vedro.core import AggregatedResult, Dispatcher, ScenarioResult, VirtualScenario
+from vedro.events import ArgParsedEvent, ArgParseEvent
+from vedro.plugins.result_writer import ResultWriter, ResultWriterPlugin
+
+__all__ = ("dispatcher", "result_writer", "make_vscenario", "make_aggregated_result",
+           "fire_arg_parsed_event",)
+
+
+@pytest.fixture()
+def dispatcher() -> Dispatcher:
+    return Dispatcher()
+
+
+@pytest.fixture()
+def result_writer(dispatcher: Dispatcher) -> ResultWriterPlugin:
+    plugin = ResultWriterPlugin(ResultWriter)
+    plugin.subscribe(dispatcher)
+    return plugin
+
+
+def make_vscenario(project_dir: Path, *, subject: Optional[str] = None) -> VirtualScenario:
+    class _Scenario(Scenario):
+        __file__ = project_dir / "scenarios" / f"scenario_{monotonic_ns()}.py"
+
+    if subject is not None:
+        _Scenario.subject = subject
+
+    return VirtualScenario(_Scenario, steps=[], project_dir=project_dir)
+
+
+def make_aggregated_result(scenario_results: List[ScenarioResult]) -> AggregatedResult:
+    main = next((x for x in scenario_results if x.is_failed()), scenario_results[0])
+    return AggregatedResult.from_existing(main, scenario_results)
+
+
+async def fire_arg_parsed_event(dispatcher: Dispatcher, *,
+                                save_results: Optional[Path] = None) -> None:
+    await dispatcher.fire(ArgParseEvent(ArgumentParser()))
+
+    namespace = Namespace(save_results=save_results)
+    await dispatcher.fire(ArgParsedEvent(namespace))
@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import pytest
+from baby_steps import given, then, when
+
+from vedro.core import MonotonicScenarioScheduler, Report, ScenarioResult
+from vedro.events import CleanupEvent, ScenarioReportedEvent, StartupEvent
+from vedro.plugins.result_writer import ResultsFileReader
+
+from ._utils import (
+    dispatcher,
+    fire_arg_parsed_event,
+    make_aggregated_result,
+    make_vscenario,
+    result_writer,
+)
+
+__all__ = ("dispatcher", "result_writer",)  # fixtures
+
+
+@pytest.mark.usefixtures(result_writer.__name__)
+async def test_save_results(tmp_path: Path, *, dispatcher):
+    with given:
+        path = tmp_path / "results.jsonl"
+        await fire_arg_parsed_event(dispatcher, save_results=path)
+
+        scenarios = [make_vscenario(tmp_path), make_vscenario(tmp_path)]
+        scheduler = MonotonicScenarioScheduler(scenarios)
+        report = Report()
+        await dispatcher.fire(StartupEvent(scheduler, report=report))
+
+        for scenario in scenarios:
+            aggregated_result = make_aggregated_result([ScenarioResult(scenario).mark_passed()])
+            report.add_result(aggregated_result)
+            await dispatcher.fire(ScenarioReportedEvent(aggregated_result))
+
+    with when:
+        await dispatcher.fire(CleanupEvent(report))
+
+    with then:
+        reader = ResultsFileReader(path, project_dir=tmp_path)
+        assert [x.scenario.unique_id for x in reader] == [x.unique_id for x in scenarios]
+        assert reader.report["total"] == 2
+
+
+@pytest.mark.usefixtures(result_writer.__name__)
+async def test_save_results_file_appears_on_cleanup(tmp_path: Path, *, dispatcher):
+    with given:
+        path = tmp_path / "results.jsonl"
+        await fire_arg_parsed_event(dispatcher, save_results=path)
+
+        report = Report()
+        await dispatcher.fire(StartupEvent(MonotonicScenarioScheduler([]), report=report))
+
+    with when:
+        exists_before = path.exists()
+        await dispatcher.fire(CleanupEvent(report))
+
+    with then:
+        assert exists_before is False
+        assert path.exists()
+
+
+@pytest.mark.usefixtures(result_writer.__name__)
+async def test_no_save_results(tmp_path: Path, *, dispatcher):
+    with given:
+        await fire_arg_parsed_event(dispatcher, save_results=None)
+
+        report = Report()
+        await dispatcher.fire(StartupEvent(MonotonicScenarioScheduler([]), report=report))
+
+    with when:
+        await dispatcher.fire(CleanupEvent(report))
+
+    with then:
+        assert list(tmp_path.iterdir()) == []
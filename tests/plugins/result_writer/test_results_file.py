@@ -0,0 +1,159 @@
+import json
+from pathlib import Path
+
+from baby_steps import given, then, when
+from pytest import raises
+
+from vedro.core import Report, ScenarioResult
+from vedro.plugins.result_writer import RecordedScenario, ResultsFileReader, ResultsFileWriter
+
+from ._utils import make_aggregated_result, make_vscenario
+
+
+def test_write_and_read(tmp_path: Path):
+    with given:
+        path = tmp_path / "results" / "1.jsonl"
+        writer = ResultsFileWriter(path)
+
+        vscenario = make_vscenario(tmp_path, subject="subject")
+        scenario_result = ScenarioResult(vscenario).set_started_at(1.0).set_ended_at(2.0)
+        aggregated_result = make_aggregated_result([scenario_result.mark_passed()])
+
+        report = Report()
+        report.add_result(aggregated_result)
+
+    with when:
+        writer.open()
+        writer.write_result(aggregated_result)
+        writer.close(report)
+
+        reader = ResultsFileReader(path, project_dir=tmp_path)
+        records = list(reader)
+
+    with then:
+        assert len(records) == 1
+        record = records[0]
+        assert isinstance(record.scenario, RecordedScenario)
+        assert record.scenario.unique_id == vscenario.unique_id
+        assert record.scenario.subject == "subject"
+        assert record.scenario.rel_path == vscenario.rel_path
+        assert record.scenario.namespace == vscenario.namespace
+        assert record.scenario_results[0]["status"] == "PASSED"
+        assert record.main_index == 0
+
+        assert reader.report["total"] == 1
+        assert reader.report["passed"] == 1
+        assert (reader.report["started_at"], reader.report["ended_at"]) == (1.0, 2.0)
+        assert reader.report["interrupted"] is None
+
+
+def test_write_main_index(tmp_path: Path):
+    with given:
+        path = tmp_path / "results.jsonl"
+        writer = ResultsFileWriter(path)
+
+        vscenario = make_vscenario(tmp_path)
+        aggregated_result = make_aggregated_result([
+            ScenarioResult(vscenario).mark_passed(),
+            ScenarioResult(vscenario).mark_failed(),
+        ])
+
+    with when:
+        writer.open()
+        writer.write_result(aggregated_result)
+        writer.close(Report())
+
+    with then:
+        record, = ResultsFileReader(path, project_dir=tmp_path)
+        assert record.main_index == 1
+        assert [x["status"] for x in record.scenario_results] == ["PASSED", "FAILED"]
+
+
+def test_write_is_atomic(tmp_path: Path):
+    with given:
+        path = tmp_path / "results.jsonl"
+        writer = ResultsFileWriter(path)
+
+    with when:
+        writer.open()
+
+    with then:
+        assert not path.exists()
+        assert list(tmp_path.iterdir()) == [tmp_path / ".results.jsonl.tmp"]
+
+
+def test_recorded_scenario_skipped(tmp_path: Path):
+    with given:
+        vscenario = make_vscenario(tmp_path)
+        vscenario.skip("reason")
+        data = json.loads(json.dumps(RecordedScenario.serialize(vscenario)))
+
+    with when:
+        scenario = RecordedScenario(data, project_dir=tmp_path)
+
+    with then:
+        assert scenario.is_skipped()
+        assert scenario.skip_reason == "reason"
+        assert scenario.path == vscenario.path
+        assert scenario.unique_hash == vscenario.unique_hash
+
+
+def test_read_not_results_file(tmp_path: Path):
+    with given:
+        path = tmp_path / "results.jsonl"
+        path.write_text(json.dumps({"type": "scenario"}) + "\n")
+        reader = ResultsFileReader(path, project_dir=tmp_path)
+
+    with when, raises(BaseException) as exc:
+        list(reader)
+
+    with then:
+        assert exc.type is ValueError
+        assert str(exc.value) == f"'{path}' is not a results file"
+
+
+def test_read_unsupported_version(tmp_path: Path):
+    with given:
+        path = tmp_path / "results.jsonl"
+        path.write_text(json.dumps({"type": "header", "format": "vedro-results", "version": 0}))
+        reader = ResultsFileReader(path, project_dir=tmp_path)
+
+    with when, raises(BaseException) as exc:
+        list(reader)
+
+    with then:
+        assert exc.type is ValueError
+        assert str(exc.value) == (f"Unsupported results file version 0 in '{path}' "
+                                  "(expected 1)")
+
+
+def test_read_incomplete_file(tmp_path: Path):
+    with given:
+        path = tmp_path / "results.jsonl"
+        writer = ResultsFileWriter(path)
+        writer.open()
+        writer.close(Report())
+        # Drop the report record
+        path.write_text(path.read_text().splitlines()[0] + "\n")
+        reader = ResultsFileReader(path, project_dir=tmp_path)
+
+    with when, raises(BaseException) as exc:
+        list(reader)
+
+    with then:
+        assert exc.type is ValueError
+        assert str(exc.value) == f"Results file '{path}' is incomplete (no report record)"
+
+
+def test_read_malformed_record(tmp_path: Path):
+    with given:
+        path = tmp_path / "results.jsonl"
+        path.write_text("not json\n")
+        reader = ResultsFileReader(path, project_dir=tmp_path)
+
+    with when, raises(BaseException) as exc:
+        list(reader)
+
+    with then:
+        assert exc.type is ValueError
+        assert str(exc.value) == f"Malformed record in results file '{path}': 'not json\\n'"
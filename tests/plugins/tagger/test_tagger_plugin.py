@@ -5,6 +5,8 @@ from pytest import raises
 from vedro.core import Dispatcher
 from vedro.core import MonotonicScenarioScheduler as Scheduler
 from vedro.events import StartupEvent
+from vedro.plugins.tagger._tagger import create_logic_tag_matcher
+from vedro.plugins.tagger.logic_tag_matcher import LogicTagMatcher
 
 from ._utils import dispatcher, fire_arg_parsed_event, make_vscenario, tagger
 
@@ -278,3 +280,12 @@ async def test_tags_tag_type_validation(*, dispatcher: Dispatcher):
         assert str(exc.value).startswith(
             f"Scenario '{scenario.unique_id}' tag 'None' is not valid"
         )
+
+
+def test_create_logic_tag_matcher():
+    with when:
+        matcher = create_logic_tag_matcher("SMOKE")
+
+    with then:
+        assert isinstance(matcher, LogicTagMatcher)
+        assert matcher.match({"SMOKE"}) is True
@@ -0,0 +1,46 @@
+import subprocess
+import sys
+from inspect import isclass
+
+import pytest
+from baby_steps import given, then, when
+
+import vedro
+from vedro.core import Plugin, PluginConfig
+
+
+@pytest.mark.parametrize("plugin_config", list(vedro.Config.Plugins.values()))
+def test_plugin_config_is_class(plugin_config: type):
+    with when:
+        res = isclass(plugin_config) and issubclass(plugin_config, PluginConfig)
+
+    with then:
+        assert res is True
+        assert issubclass(plugin_config.plugin, Plugin)
+
+
+def test_plugin_config_override_enabled():
+    with when:
+        class Config(vedro.Config):
+            class Plugins(vedro.Config.Plugins):
+                class Tagger(vedro.Config.Plugins.Tagger):
+                    enabled = False
+
+    with then:
+        assert Config.Plugins.Tagger.enabled is False
+        assert issubclass(Config.Plugins.Tagger, vedro.Config.Plugins.Tagger)
+        assert vedro.Config.Plugins.Tagger.enabled is True
+
+
+def test_heavy_deps_not_imported():
+    with given:
+        code = ("import sys, vedro, vedro.plugins.last_failed, vedro.plugins.rerunner, "
+                "vedro.plugins.system_upgrade, vedro.plugins.tagger; "
+                "print(sorted({'pyparsing', 'filelock'} & set(sys.modules)))")
+
+    with when:
+        res = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                             check=True)
+
+    with then:
+        assert res.stdout == "[]\n"
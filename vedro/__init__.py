@@ -14,13 +14,14 @@ from .plugins.artifacted import (
     Artifact,
     FileArtifact,
     MemoryArtifact,
+    StreamArtifact,
     attach_artifact,
     attach_global_artifact,
     attach_scenario_artifact,
     attach_step_artifact,
 )
 from .plugins.assert_rewriter import assert_ as asserts
-from .plugins.deferrer import defer, defer_global
+from .plugins.deferrer import defer, defer_global, session_context
 from .plugins.ensurer import ensure
 from .plugins.functioner import given, scenario, then, when
 from .plugins.seeder import seed
@@ -30,9 +31,10 @@ from .plugins.temp_keeper import create_tmp_dir, create_tmp_file
 __version__ = version
 __all__ = ("Scenario", "Interface", "run", "only", "skip", "skip_if", "params", "effect",
            "catched", "scenario", "given", "when", "then", "ensure", "context", "asserts",
-           "defer", "defer_global", "create_tmp_dir", "create_tmp_file", "attach_artifact",
-           "attach_scenario_artifact", "attach_step_artifact", "attach_global_artifact",
-           "seed", "Config", "computed", "MemoryArtifact", "FileArtifact", "Artifact",)
+           "defer", "defer_global", "session_context", "create_tmp_dir", "create_tmp_file",
+           "attach_artifact", "attach_scenario_artifact", "attach_step_artifact",
+           "attach_global_artifact", "seed", "Config", "computed", "MemoryArtifact",
+           "FileArtifact", "Artifact", "StreamArtifact",)
 
 
 def run(argv: Optional[List[str]] = None, *, plugins: Any = None) -> None:
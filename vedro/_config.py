@@ -7,6 +7,7 @@ import vedro.plugins.artifacted as artifacted
 import vedro.plugins.assert_rewriter as assert_rewriter
 import vedro.plugins.deferrer as deferrer
 import vedro.plugins.director as director
+import vedro.plugins.distributor as distributor
 import vedro.plugins.dry_runner as dry_runner
 import vedro.plugins.ensurer as ensurer
 import vedro.plugins.functioner as functioner
@@ -15,6 +16,7 @@ import vedro.plugins.last_failed as last_failed
 import vedro.plugins.orderer as orderer
 import vedro.plugins.repeater as repeater
 import vedro.plugins.rerunner as rerunner
+import vedro.plugins.result_writer as result_writer
 import vedro.plugins.seeder as seeder
 import vedro.plugins.skipper as skipper
 import vedro.plugins.slicer as slicer
@@ -218,6 +220,12 @@ class Config(core.Config):
         class DryRunner(dry_runner.DryRunner):
             enabled = True
 
+        class Distributor(distributor.Distributor):
+            enabled = True
+
+        class ResultWriter(result_writer.ResultWriter):
+            enabled = True
+
         class Ensurer(ensurer.Ensurer):
             enabled = True
 
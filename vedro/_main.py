@@ -9,10 +9,12 @@ from ._config import Config
 from .commands import CommandArgumentParser
 from .commands.config_command import ConfigCommand
 from .commands.plugin_command import PluginCommand
+from .commands.report_command import ReportCommand
 from .commands.run_command import RunCommand
 from .commands.version_command import VersionCommand
 from .commands.version_command._version_command import make_console
 from .core import ConfigFileLoader
+from .core.startup_profiler import StartupProfiler
 
 
 async def main(argv: Optional[List[str]] = None) -> None:
@@ -26,7 +28,7 @@ async def main(argv: Optional[List[str]] = None) -> None:
     - Parsing the project directory argument.
     - Validating the existence and type of the specified project directory.
     - Dynamically loading the configuration file.
-    - Parsing the main command (run, version, plugin, etc.).
+    - Parsing the main command (run, version, plugin, report, etc.).
     - Executing the corresponding command logic.
 
     :param argv: Optional list of command-line arguments without the program name.
@@ -39,8 +41,17 @@ async def main(argv: Optional[List[str]] = None) -> None:
 
     shadow_parser = ArgumentParser(add_help=False, allow_abbrev=False)
     shadow_parser.add_argument("--project-dir", type=Path, default=Path.cwd())
+    shadow_parser.add_argument("--profile-startup", action="store_true", default=False)
+    shadow_parser.add_argument("--profile-startup-trace", type=Path, default=None)
     shadow_args, _ = shadow_parser.parse_known_args(argv)
 
+    # The profiler is started before the config is loaded to include it in the profile,
+    # RunCommand reports the profile (other commands ignore the flags)
+    startup_profiler: Optional[StartupProfiler] = None
+    if shadow_args.profile_startup or (shadow_args.profile_startup_trace is not None):
+        startup_profiler = StartupProfiler()
+        startup_profiler.start()
+
     project_dir = shadow_args.project_dir.absolute()
     if not project_dir.exists():
         raise FileNotFoundError(f"Specified project directory '{project_dir}' does not exist")
@@ -52,7 +63,11 @@ async def main(argv: Optional[List[str]] = None) -> None:
 
     config_loader = ConfigFileLoader(Config)
     config_path = Path("vedro.cfg.py")
-    config = cast(Type[Config], await config_loader.load(config_path))
+    if startup_profiler is None:
+        config = cast(Type[Config], await config_loader.load(config_path))
+    else:
+        with startup_profiler.span("load config", "phase"):
+            config = cast(Type[Config], await config_loader.load(config_path))
 
     formatter = partial(HelpFormatter, max_help_position=30)
     arg_parser = ArgumentParser("vedro", formatter_class=formatter, add_help=False,
@@ -60,7 +75,7 @@ async def main(argv: Optional[List[str]] = None) -> None:
 
     arg_parser.add_argument("--version", action="store_true", help="Show vedro version")
 
-    commands = {"run", "version", "plugin", "config"}
+    commands = {"run", "version", "plugin", "config", "report"}
     arg_parser.add_argument("command", nargs="?", help=f"Command to run {{{', '.join(commands)}}}")
     args, unknown_args = arg_parser.parse_known_args(argv)
 
@@ -83,7 +98,7 @@ async def main(argv: Optional[List[str]] = None) -> None:
 
     if args.command == "run":
         parser = arg_parser_factory("vedro run")
-        await RunCommand(config, parser).run()
+        await RunCommand(config, parser, startup_profiler=startup_profiler).run()
 
     elif args.command == "version":
         parser = arg_parser_factory("vedro version")
@@ -98,6 +113,10 @@ async def main(argv: Optional[List[str]] = None) -> None:
         parser = arg_parser_factory("vedro config")
         await ConfigCommand(config, parser).run()
 
+    elif args.command == "report":
+        parser = arg_parser_factory("vedro report")
+        await ReportCommand(config, parser).run()
+
     else:
         arg_parser.print_help()
         arg_parser.exit()
@@ -1,6 +1,8 @@
 import inspect
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import partialmethod
-from typing import Any, Dict, Tuple
+from typing import Any, Callable, Dict, Iterator, Tuple, Type, Union
 
 from ._tags import TagsType, TagType
 from .core._meta_data import MetaData
@@ -44,10 +46,10 @@ class _Meta(type):
         updated_namespace = {**namespace, "__qualname__": updated_name}
         created = super().__new__(mcs, updated_name, bases, updated_namespace)
 
-        cls_globals = getattr(cls_constructor, "__globals__")
+        # The signature is the same for every case, so it is computed only once
+        signature = inspect.signature(cls_constructor)  # type: ignore
+        cases = []
         for idx, (args, kwargs, decorators) in enumerate(reversed(cls_params), start=1):
-            signature = inspect.signature(cls_constructor)  # type: ignore
-
             try:
                 bound_args = signature.bind(None, *args, **kwargs)
             except BaseException as e:
@@ -55,28 +57,120 @@ class _Meta(type):
                 raise TypeError(f"{e} <{module}.{name}>") from None
 
             bound_args.apply_defaults()
-
-            cls_name = f"{name}_{idx}_VedroScenario"
-            cls_namespace = {
-                **namespace,
-                "__qualname__": cls_name,
-                "__init__": partialmethod(cls_constructor, *args, **kwargs),
-                "__vedro__template_name__": name,
-                "__vedro__template__": created,
-                "__vedro__template_index__": idx,
-                "__vedro__template_total__": len(cls_params),
-                "__vedro__template_args__": bound_args,
-            }
-            cls = type(cls_name, bases, cls_namespace)
-            setattr(cls, "__vedro__lineno__", lineno)
-
-            for decorator in decorators:
-                cls = decorator(cls)
-            cls_globals[cls_name] = cls
+            cases.append(TemplateCase(idx, args, kwargs, decorators, bound_args))
+
+        setattr(created, "__vedro__template_name__", name)
+        setattr(created, "__vedro__template_namespace__", namespace)
+        setattr(created, "__vedro__template_bases__", bases)
+
+        if _lazy_expansion.get():
+            setattr(created, "__vedro__template_cases__", tuple(cases))
+            for case in cases:
+                # Decorators may change anything about the scenario (e.g. skip it),
+                # so decorated cases can't be deferred
+                if len(case.decorators) > 0:
+                    build_template_case(created, case)
+        else:
+            for case in cases:
+                build_template_case(created, case)
 
         return created
 
 
+class TemplateCase:
+    """
+    Represents a single `@params` case of a templated scenario.
+
+    Cases are lightweight records created at import time. The concrete scenario class
+    is built from a case by `build_template_case`.
+    """
+
+    __slots__ = ("index", "args", "kwargs", "decorators", "bound_args", "scenario",)
+
+    def __init__(self, index: int, args: Tuple[Any, ...], kwargs: Dict[str, Any],
+                 decorators: Tuple[Callable[..., Any], ...],
+                 bound_args: inspect.BoundArguments) -> None:
+        """
+        Initialize the TemplateCase instance.
+
+        :param index: The 1-based index of the case in the template.
+        :param args: The positional arguments passed to `@params`.
+        :param kwargs: The keyword arguments passed to `@params`.
+        :param decorators: The decorators passed via `@params[...]`.
+        :param bound_args: The arguments bound to the constructor signature.
+        """
+        self.index = index
+        self.args = args
+        self.kwargs = kwargs
+        self.decorators = decorators
+        self.bound_args = bound_args
+        self.scenario: Union[Type["Scenario"], None] = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(index={self.index}, args={self.bound_args.args!r})"
+
+
+_lazy_expansion: ContextVar[bool] = ContextVar("_lazy_expansion", default=False)
+
+
+@contextmanager
+def lazy_template_expansion() -> Iterator[None]:
+    """
+    Defer building `@params` scenario classes while the context is active.
+
+    Templates declared within the context keep their cases as `TemplateCase` records
+    in `__vedro__template_cases__` instead of creating a class per case. Cases without
+    decorators are built on demand by `build_template_case`.
+    """
+    token = _lazy_expansion.set(True)
+    try:
+        yield
+    finally:
+        _lazy_expansion.reset(token)
+
+
+def build_template_case(template: Type[Any], case: TemplateCase) -> Type["Scenario"]:
+    """
+    Build the concrete scenario class for a case of a templated scenario.
+
+    The class is created once, cached in the case record and published in the
+    module globals under the `{name}_{index}_VedroScenario` name.
+
+    :param template: The template class created by the `@params` decorated scenario.
+    :param case: The case to build the scenario class for.
+    :return: The scenario class for the given case.
+    """
+    if case.scenario is not None:
+        return case.scenario
+
+    namespace = getattr(template, "__vedro__template_namespace__")
+    bases = getattr(template, "__vedro__template_bases__")
+    name = getattr(template, "__vedro__template_name__")
+    cls_constructor = namespace["__init__"]
+
+    cls_name = f"{name}_{case.index}_VedroScenario"
+    cls_namespace = {
+        **namespace,
+        "__qualname__": cls_name,
+        "__init__": partialmethod(cls_constructor, *case.args, **case.kwargs),
+        "__vedro__template_name__": name,
+        "__vedro__template__": template,
+        "__vedro__template_index__": case.index,
+        "__vedro__template_total__": len(getattr(cls_constructor, "__vedro__params__")),
+        "__vedro__template_args__": case.bound_args,
+    }
+    cls = type(cls_name, bases, cls_namespace)
+    setattr(cls, "__vedro__lineno__", namespace["__vedro__lineno__"])
+
+    for decorator in case.decorators:
+        cls = decorator(cls)
+
+    cls_globals = getattr(cls_constructor, "__globals__")
+    cls_globals[cls_name] = cls
+    case.scenario = cls
+    return cls
+
+
 # In v2, consider moving this class to `vedro.core.scenario_provider`
 class Scenario(metaclass=_Meta):
     subject: str
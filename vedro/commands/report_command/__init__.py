@@ -0,0 +1,3 @@
+from ._report_command import ReportCommand
+
+__all__ = ("ReportCommand",)
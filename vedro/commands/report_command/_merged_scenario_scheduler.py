@@ -0,0 +1,87 @@
+from typing import Iterator, List
+
+from vedro.core import VirtualScenario
+from vedro.core.scenario_result import AggregatedResult, ScenarioResult
+from vedro.core.scenario_scheduler import ScenarioScheduler
+from vedro.plugins.result_writer import ResultsFileReader
+
+__all__ = ("MergedScenarioScheduler",)
+
+
+class MergedScenarioScheduler(ScenarioScheduler):
+    """
+    Exposes the scenarios recorded in results files as a scheduler.
+
+    Reporters inspect the scheduler on startup (e.g. to show discovery stats), so the
+    scenarios are streamed from the files each time they are iterated instead of being
+    kept in memory. Recorded scenarios have already been run, nothing can be scheduled.
+    """
+
+    def __init__(self, readers: List[ResultsFileReader]) -> None:
+        """
+        Initialize the MergedScenarioScheduler.
+
+        :param readers: The readers of the results files to merge.
+        """
+        super().__init__([])
+        self._readers = readers
+
+    @property
+    def discovered(self) -> Iterator[VirtualScenario]:
+        """
+        Get an iterator over the recorded scenarios of all results files.
+
+        :return: An iterator over the recorded scenarios.
+        """
+        return self.scheduled
+
+    @property
+    def scheduled(self) -> Iterator[VirtualScenario]:
+        """
+        Get an iterator over the recorded scenarios of all results files.
+
+        :return: An iterator over the recorded scenarios.
+        """
+        for reader in self._readers:
+            for record in reader:
+                yield record.scenario
+
+    def schedule(self, scenario: VirtualScenario) -> None:
+        """
+        Refuse to schedule a scenario, merged results can't be extended.
+
+        :param scenario: The virtual scenario to be scheduled.
+        :raises NotImplementedError: Always.
+        """
+        raise NotImplementedError("Scenarios can't be scheduled when merging results")
+
+    def ignore(self, scenario: VirtualScenario) -> None:
+        """
+        Refuse to ignore a scenario, merged results can't be filtered.
+
+        :param scenario: The virtual scenario to be ignored.
+        :raises NotImplementedError: Always.
+        """
+        raise NotImplementedError("Scenarios can't be ignored when merging results")
+
+    def aggregate_results(self, scenario_results: List[ScenarioResult]) -> AggregatedResult:
+        """
+        Aggregate the results of a scenario's executions.
+
+        The first failed result is used as the base, otherwise the first result.
+
+        :param scenario_results: A list of scenario results to be aggregated.
+        :return: An aggregated result representing the combined outcome of the executions.
+        :raises AssertionError: If the list of scenario results is empty.
+        """
+        assert len(scenario_results) > 0
+        result = next((x for x in scenario_results if x.is_failed()), scenario_results[0])
+        return AggregatedResult.from_existing(result, scenario_results)
+
+    async def __anext__(self) -> VirtualScenario:
+        """
+        Retrieve the next scenario to be executed, there are none.
+
+        :raises StopAsyncIteration: Always, recorded scenarios have already been run.
+        """
+        raise StopAsyncIteration()
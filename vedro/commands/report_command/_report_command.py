@@ -0,0 +1,172 @@
+from argparse import Namespace
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple, Type, Union
+
+from vedro import Config
+from vedro.core import Dispatcher, PluginConfig, Report
+from vedro.core.scenario_result import AggregatedResult, ScenarioResultSerializer
+from vedro.core.scenario_runner import ScenarioResultReplayer
+from vedro.events import (
+    ArgParsedEvent,
+    ArgParseEvent,
+    CleanupEvent,
+    ConfigLoadedEvent,
+    ScenarioReportedEvent,
+    StartupEvent,
+)
+from vedro.plugins.director import DirectorPlugin, Reporter
+from vedro.plugins.result_writer import ResultsFileReader
+from vedro.plugins.terminator import TerminatorPlugin
+
+from .._cmd_arg_parser import CommandArgumentParser
+from .._command import Command
+from ..run_command._plugin_config_validator import PluginConfigValidator
+from ..run_command._plugin_registrar import PluginRegistrar
+from ._merged_scenario_scheduler import MergedScenarioScheduler
+
+__all__ = ("ReportCommand",)
+
+PluginRegistrarFactory = Union[
+    Type[PluginRegistrar],
+    Callable[[], PluginRegistrar]
+]
+
+
+class ReportCommand(Command):
+    """
+    Implements the 'report' command for the Vedro testing framework.
+
+    `vedro report merge <files>` merges results files saved with `--save-results`
+    (e.g. by CI jobs running `--slice 1/N` … `N/N`) into a single report. Recorded
+    results are replayed through the configured reporters, so the merged report looks
+    like the report of a single run. Files are streamed one record at a time, so memory
+    use doesn't depend on the number of files.
+    """
+
+    # Only plugins that present the results take part in merging,
+    # plugins that select or run scenarios have nothing to do with recorded results
+    REPORT_PLUGINS: Tuple[type, ...] = (DirectorPlugin, Reporter, TerminatorPlugin)
+
+    def __init__(self, config: Type[Config], arg_parser: CommandArgumentParser, *,
+                 plugin_registrar_factory: PluginRegistrarFactory = PluginRegistrar,
+                 serializer: Optional[ScenarioResultSerializer] = None) -> None:
+        """
+        Initialize the ReportCommand.
+
+        :param config: The Vedro configuration class.
+        :param arg_parser: Command-line argument parser.
+        :param plugin_registrar_factory: Factory for creating a PluginRegistrar instance.
+        :param serializer: The serializer used to restore recorded results.
+        """
+        super().__init__(config, arg_parser)
+        self._plugin_registrar = plugin_registrar_factory(
+            plugin_config_validator_factory=lambda: PluginConfigValidator(
+                validate_plugins_attrs=config.validate_plugins_configs  # type: ignore
+            )
+        )
+        self._serializer = serializer or ScenarioResultSerializer()
+
+    async def run(self) -> None:
+        """
+        Execute the 'report' command.
+
+        Registers the reporting plugins, parses command-line arguments and merges
+        the given results files into a single report.
+
+        :raises FileNotFoundError: If a results file does not exist.
+        :raises ValueError: If a file is not a valid results file.
+        """
+        dispatcher = self._config.Registry.Dispatcher()
+        self._plugin_registrar.register(self._get_report_plugins(), dispatcher)
+
+        await dispatcher.fire(ConfigLoadedEvent(self._config.path, self._config))
+
+        args = await self._parse_args(dispatcher)
+        for path in args.files:
+            if not path.is_file():
+                raise FileNotFoundError(f"Results file '{path}' does not exist")
+
+        readers = [ResultsFileReader(path, project_dir=self._config.project_dir)
+                   for path in args.files]
+
+        report = Report()
+        await dispatcher.fire(StartupEvent(MergedScenarioScheduler(readers), report=report))
+        await self._merge(readers, report, dispatcher)
+        await dispatcher.fire(CleanupEvent(report))
+
+    def _get_report_plugins(self) -> List[Type[PluginConfig]]:
+        """
+        Get the configurations of plugins that take part in merging.
+
+        :return: A list of plugin configuration classes.
+        """
+        return [plugin_config for plugin_config in self._config.Plugins.values()
+                if issubclass(plugin_config.plugin, self.REPORT_PLUGINS)]
+
+    async def _merge(self, readers: List[ResultsFileReader], report: Report,
+                     dispatcher: Dispatcher) -> None:
+        """
+        Replay the recorded results of all files and merge them into the report.
+
+        Totals are summed, the elapsed time is the one of the longest run
+        (runs are expected to run in parallel) and the first interruption is kept.
+
+        :param readers: The readers of the results files.
+        :param report: The report to add results to.
+        :param dispatcher: The dispatcher to fire events with.
+        """
+        replayer = ScenarioResultReplayer(dispatcher, serializer=self._serializer)
+        longest: Union[Tuple[float, float], None] = None
+
+        for reader in readers:
+            for record in reader:
+                scenario_results = [await replayer.replay(record.scenario, x)
+                                    for x in record.scenario_results]
+                aggregated_result = AggregatedResult.from_existing(
+                    scenario_results[record.main_index], scenario_results
+                )
+                report.add_result(aggregated_result)
+                await dispatcher.fire(ScenarioReportedEvent(aggregated_result))
+
+            recorded = reader.report
+            assert recorded is not None  # for type checking
+
+            interrupted = self._serializer.deserialize_exc_info(recorded["interrupted"])
+            if (interrupted is not None) and (report.interrupted is None):
+                report.set_interrupted(interrupted)
+
+            started_at, ended_at = recorded["started_at"], recorded["ended_at"]
+            if (started_at is not None) and (ended_at is not None):
+                if (longest is None) or (ended_at - started_at > longest[1] - longest[0]):
+                    longest = (started_at, ended_at)
+
+        if longest is not None:
+            report.set_started_at(longest[0])
+            report.set_ended_at(longest[1])
+
+    async def _parse_args(self, dispatcher: Dispatcher) -> Namespace:
+        """
+        Parse command-line arguments and fire corresponding events.
+
+        :param dispatcher: Event dispatcher for firing ArgParseEvent and ArgParsedEvent.
+        :return: Parsed arguments as a Namespace object.
+        """
+        self._arg_parser.add_argument("action", choices=("merge",),
+                                      help="Action to perform")
+        self._arg_parser.add_argument("files", nargs="+", type=Path, metavar="FILE",
+                                      help="Results files saved with `--save-results`")
+        # Avoid unrecognized arguments error
+        self._arg_parser.add_argument("--project-dir", type=Path,
+                                      default=self._config.project_dir,
+                                      help="Specify the root directory of the project")
+
+        # Temporarily remove help action to avoid issues with plugin argument registration
+        # See: https://github.com/python/cpython/issues/95073
+        self._arg_parser.remove_help_action()
+        await dispatcher.fire(ArgParseEvent(self._arg_parser))
+        self._arg_parser.add_help_action()
+
+        args = self._arg_parser.parse_args()
+        await dispatcher.fire(ArgParsedEvent(args))
+
+        return args
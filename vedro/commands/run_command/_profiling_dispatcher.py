@@ -0,0 +1,79 @@
+from asyncio import iscoroutinefunction
+from typing import Type
+
+from vedro.core import Dispatcher, Event, HandlerType, Subscriber
+from vedro.core.startup_profiler import StartupProfiler
+
+__all__ = ("ProfilingDispatcher",)
+
+
+class ProfilingDispatcher(Dispatcher):
+    """
+    Wraps a dispatcher to time the event handlers of plugins during startup.
+
+    Plugins are registered through this dispatcher, so every handler they listen with
+    is wrapped before it is passed on to the original dispatcher. While the profiler
+    is running, each call of a handler is recorded as a "handler" span, named after
+    the event and the handler (e.g., "ArgParsedEvent: TaggerPlugin.on_arg_parsed").
+    Once the profiler is stopped, the handlers are called as is.
+    """
+
+    def __init__(self, dispatcher: Dispatcher, profiler: StartupProfiler) -> None:
+        """
+        Initialize the ProfilingDispatcher.
+
+        :param dispatcher: The dispatcher that actually stores and fires the handlers.
+        :param profiler: The profiler to record the handler spans with.
+        """
+        super().__init__()
+        self._dispatcher = dispatcher
+        self._profiler = profiler
+
+    def register(self, subscriber: Subscriber) -> None:
+        """
+        Register a subscriber, letting it listen through this dispatcher.
+
+        :param subscriber: The subscriber to be registered.
+        """
+        subscriber.subscribe(self)
+
+    def listen(self, event: Type[Event], handler: HandlerType,
+               priority: int = 0) -> "ProfilingDispatcher":
+        """
+        Register a timed version of the handler with the original dispatcher.
+
+        :param event: The event type to listen for.
+        :param handler: The handler function to be called when the event is fired.
+        :param priority: The priority of the handler. Lower values indicate higher priority.
+        :return: The ProfilingDispatcher instance to allow for method chaining.
+        """
+        self._dispatcher.listen(event, self._wrap_handler(event, handler), priority)
+        return self
+
+    async def fire(self, event: Event) -> None:
+        """
+        Dispatch the given event with the original dispatcher.
+
+        :param event: The event to be dispatched.
+        """
+        await self._dispatcher.fire(event)
+
+    def _wrap_handler(self, event: Type[Event], handler: HandlerType) -> HandlerType:
+        """
+        Wrap a handler to record its calls while the profiler is running.
+
+        :param event: The event type the handler listens for.
+        :param handler: The handler function.
+        :return: An asynchronous handler function.
+        """
+        name = f"{event.__name__}: {getattr(handler, '__qualname__', repr(handler))}"
+        is_coroutine = iscoroutinefunction(handler)
+
+        async def timed_handler(evt: Event) -> None:
+            with self._profiler.span(name, "handler"):
+                if is_coroutine:
+                    await handler(evt)
+                else:
+                    handler(evt)
+
+        return timed_handler
@@ -1,15 +1,18 @@
 import inspect
 import os
+import sys
 import warnings
-from argparse import Namespace
+from argparse import ArgumentParser, Namespace
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Callable, Type, Union
+from typing import Callable, ContextManager, Optional, Type, Union
 
 from vedro import Config
 from vedro.core import Config as BaseConfig
 from vedro.core import Dispatcher, MonotonicScenarioRunner, Plugin, PluginConfig, Report
 from vedro.core.exc_info import NoOpTracebackFilter
-from vedro.core.output_capturer import OutputCapturer
+from vedro.core.output_capturer import CAPTURE_MODES, OutputCapturer
+from vedro.core.startup_profiler import StartupProfiler
 from vedro.events import (
     ArgParsedEvent,
     ArgParseEvent,
@@ -24,6 +27,8 @@ from .._command import Command
 from ._config_validator import ConfigValidator
 from ._plugin_config_validator import PluginConfigValidator
 from ._plugin_registrar import PluginRegistrar
+from ._profiling_dispatcher import ProfilingDispatcher
+from ._startup_profile_printer import StartupProfilePrinter
 
 __all__ = ("RunCommand",)
 
@@ -64,7 +69,8 @@ class RunCommand(Command):
 
     def __init__(self, config: Type[Config], arg_parser: CommandArgumentParser, *,
                  config_validator_factory: ConfigValidatorFactory = ConfigValidator,
-                 plugin_registrar_factory: PluginRegistrarFactory = PluginRegistrar) -> None:
+                 plugin_registrar_factory: PluginRegistrarFactory = PluginRegistrar,
+                 startup_profiler: Optional[StartupProfiler] = None) -> None:
         """
         Initialize the RunCommand.
 
@@ -72,8 +78,11 @@ class RunCommand(Command):
         :param arg_parser: Command-line argument parser.
         :param config_validator_factory: Factory for creating a ConfigValidator instance.
         :param plugin_registrar_factory: Factory for creating a PluginRegistrar instance.
+        :param startup_profiler: The profiler to time the startup with (created by the entry
+                                 point for --profile-startup), or None to skip profiling.
         """
         super().__init__(config, arg_parser)
+        self._startup_profiler = startup_profiler
         self._config_validator = config_validator_factory(config)
         self._plugin_registrar = plugin_registrar_factory(
             plugin_config_validator_factory=lambda: PluginConfigValidator(
@@ -94,49 +103,82 @@ class RunCommand(Command):
         6. Executes scenarios with output capturing
         7. Generates and processes the test report
 
+        If a startup profiler is given, steps 1-5 and the StartupEvent are timed,
+        along with each plugin handler and each scenario module import. The profile
+        is reported once the StartupEvent is handled, or when the startup fails.
+
         :raises Exception: If a SystemExit is raised during scenario discovery.
         """
-        # TODO: move config validation to somewhere else in v2
-        # (e.g. to the ConfigLoader)
-        self._config_validator.validate()  # Must be before ConfigLoadedEvent
-
-        dispatcher = self._config.Registry.Dispatcher()
-        self._plugin_registrar.register(self._config.Plugins.values(), dispatcher)
-
-        await dispatcher.fire(ConfigLoadedEvent(self._config.path, self._config))
-
-        args = await self._parse_args(dispatcher)
-        start_dir = self._get_start_dir(args)
-
-        discoverer = self._config.Registry.ScenarioDiscoverer()
-
-        kwargs = {}
-        # Backward compatibility (to be removed in v2):
-        signature = inspect.signature(discoverer.discover)
-        if "project_dir" in signature.parameters:
-            kwargs["project_dir"] = self._config.project_dir
+        if self._startup_profiler is not None:
+            self._startup_profiler.start()
 
+        args: Optional[Namespace] = None
         try:
-            scenarios = await discoverer.discover(start_dir, **kwargs)
-        except SystemExit as e:
-            raise Exception(f"SystemExit({e.code}) ⬆")
-
-        output_capturer = OutputCapturer(args.capture_output, args.capture_limit)
-        with output_capturer.capture() as _:
-            report = Report()
-
-            scheduler = self._config.Registry.ScenarioScheduler(scenarios)
-            await dispatcher.fire(StartupEvent(scheduler, report=report))
-
-            runner = self._config.Registry.ScenarioRunner()
-            if not isinstance(runner, (MonotonicScenarioRunner, DryRunner)):
-                # TODO: In v2 add --dry-run argument to RunCommand
-                warnings.warn("Deprecated: custom runners will be removed in v2.0",
-                              DeprecationWarning)
-            # TODO: In v2 return nothing from runner.run()
-            report = await runner.run(scheduler, output_capturer=output_capturer)
-
-            await dispatcher.fire(CleanupEvent(report))
+            # TODO: move config validation to somewhere else in v2
+            # (e.g. to the ConfigLoader)
+            with self._profile("validate config"):
+                self._config_validator.validate()  # Must be before ConfigLoadedEvent
+
+            dispatcher = self._config.Registry.Dispatcher()
+            with self._profile("register plugins"):
+                registrar_dispatcher = dispatcher
+                if self._startup_profiler is not None:
+                    registrar_dispatcher = ProfilingDispatcher(dispatcher, self._startup_profiler)
+                self._plugin_registrar.register(self._config.Plugins.values(),
+                                                registrar_dispatcher)
+
+            with self._profile("fire ConfigLoadedEvent"):
+                await dispatcher.fire(ConfigLoadedEvent(self._config.path, self._config))
+
+            with self._profile("parse args"):
+                args = await self._parse_args(dispatcher)
+            start_dir = self._get_start_dir(args)
+
+            discoverer = self._config.Registry.ScenarioDiscoverer()
+
+            kwargs = {}
+            # Backward compatibility (to be removed in v2):
+            signature = inspect.signature(discoverer.discover)
+            if "project_dir" in signature.parameters:
+                kwargs["project_dir"] = self._config.project_dir
+
+            try:
+                with self._profile("discover scenarios"), self._activate_profiler():
+                    scenarios = await discoverer.discover(start_dir, **kwargs)
+            except SystemExit as e:
+                raise Exception(f"SystemExit({e.code}) ⬆")
+
+            output_capturer = OutputCapturer(args.capture_output, args.capture_limit,
+                                             args.capture_mode)
+            # Redirecting file descriptors for the whole run would also swallow reporters' output,
+            # so fd-level capturing is applied to scenarios and steps only
+            run_capture_mode = "context" if (args.capture_mode == "fd") else args.capture_mode
+            run_capturer = OutputCapturer(args.capture_output, args.capture_limit,
+                                          run_capture_mode)
+            with run_capturer.capture() as _:
+                report = Report()
+
+                scheduler = self._config.Registry.ScenarioScheduler(scenarios)
+                with self._profile("fire StartupEvent"):
+                    await dispatcher.fire(StartupEvent(scheduler, report=report))
+                self._report_startup_profile(args)
+
+                runner = self._config.Registry.ScenarioRunner()
+                if not isinstance(runner, (MonotonicScenarioRunner, DryRunner)):
+                    # TODO: In v2 add --dry-run argument to RunCommand
+                    warnings.warn("Deprecated: custom runners will be removed in v2.0",
+                                  DeprecationWarning)
+                run_kwargs = {}
+                if args.snapshot_tracebacks:
+                    run_kwargs["snapshot_tracebacks"] = True
+                # TODO: In v2 return nothing from runner.run()
+                report = await runner.run(scheduler, output_capturer=output_capturer, **run_kwargs)
+
+                await dispatcher.fire(CleanupEvent(report))
+        finally:
+            # Reports the profile if the startup fails (e.g., discovery or
+            # a StartupEvent handler raises), does nothing if it is already reported
+            self._report_startup_profile(args)
         # In v2 RunCommand will handle report.interrupted and exit codes itself.
         # At that point, captured output should also be added to the Report.
 
@@ -148,7 +190,11 @@ class RunCommand(Command):
         - --project-dir: Root directory of the project
         - --capture-output/-C: Enable output capturing
         - --capture-limit: Maximum characters to capture
+        - --capture-mode: How output is captured (redirect, context or fd)
+        - --snapshot-tracebacks: Release tracebacks of failed steps early
         - --vedro-debug: Enable debug mode
+        - --profile-startup: Show the slowest parts of the startup
+        - --profile-startup-trace: Write the startup profile in the Chrome trace-event format
 
         :param dispatcher: Event dispatcher for firing ArgParseEvent and ArgParsedEvent.
         :return: Parsed arguments as a Namespace object.
@@ -166,9 +212,26 @@ class RunCommand(Command):
         self._arg_parser.add_argument("--capture-limit", type=int, default=1 * 1024,
                                       help="Max characters to capture per stream "
                                            "(default: 1KB, 0 for unlimited)")
+        self._arg_parser.add_argument("--capture-mode", choices=tuple(CAPTURE_MODES),
+                                      default="redirect",
+                                      help="How output is captured: 'redirect' swaps sys.stdout "
+                                           "and sys.stderr, 'context' captures per task/thread, "
+                                           "'fd' also captures subprocess output "
+                                           "(default: redirect)")
+        self._arg_parser.add_argument("--snapshot-tracebacks", action="store_true", default=False,
+                                      help="Replace tracebacks of failed steps with lightweight "
+                                           "snapshots, releasing frames and their locals early")
         self._arg_parser.add_argument("--vedro-debug", action="store_true", default=False,
                                       help="Enable debug mode (shows full tracebacks "
                                            "without filtering)")
+        self._arg_parser.add_argument("--profile-startup", action="store_true", default=False,
+                                      help="Time config loading, plugin registration "
+                                           "(each event handler) and scenario discovery "
+                                           "(each module import), and show the slowest parts")
+        self._arg_parser.add_argument("--profile-startup-trace", type=Path, default=None,
+                                      metavar="PATH",
+                                      help="Write the startup profile to a file in the Chrome "
+                                           "trace-event format (chrome://tracing, Perfetto)")
 
         # Temporarily remove help action to avoid issues with plugin argument registration
         # See: https://github.com/python/cpython/issues/95073
@@ -188,6 +251,63 @@ class RunCommand(Command):
 
         return args
 
+    def _profile(self, phase: str) -> ContextManager[None]:
+        """
+        Time a phase of the startup, if it is being profiled.
+
+        :param phase: The name of the phase.
+        :return: A context manager recording the phase span (or doing nothing).
+        """
+        if self._startup_profiler is None:
+            return nullcontext()
+        return self._startup_profiler.span(phase, "phase")
+
+    def _activate_profiler(self) -> ContextManager[object]:
+        """
+        Make the startup profiler available to components that load scenario modules.
+
+        :return: A context manager activating the profiler (or doing nothing).
+        """
+        if self._startup_profiler is None:
+            return nullcontext()
+        return self._startup_profiler.activate()
+
+    def _report_startup_profile(self, args: Optional[Namespace]) -> None:
+        """
+        Stop the startup profiler, print the slowest spans and write the trace file,
+        as requested by the command-line arguments. The profile is reported once.
+
+        The table is written to the original stderr, bypassing output capturing
+        and keeping stdout clean for reporters.
+
+        :param args: Parsed command-line arguments, or None if the startup failed
+                     before they were parsed (the profiling flags are parsed then).
+        """
+        profiler = self._startup_profiler
+        if (profiler is None) or (not profiler.is_running):
+            return
+        profiler.stop()
+
+        if args is None:
+            args = self._parse_profile_args()
+
+        if args.profile_startup:
+            StartupProfilePrinter(sys.__stderr__ or sys.stderr).print(profiler)
+        if args.profile_startup_trace is not None:
+            profiler.write_trace(args.profile_startup_trace)
+
+    def _parse_profile_args(self) -> Namespace:
+        """
+        Parse the profiling flags only, the same way the entry point does.
+
+        :return: Parsed arguments with `profile_startup` and `profile_startup_trace`.
+        """
+        parser = ArgumentParser(add_help=False, allow_abbrev=False)
+        parser.add_argument("--profile-startup", action="store_true", default=False)
+        parser.add_argument("--profile-startup-trace", type=Path, default=None)
+        args, _ = parser.parse_known_args()
+        return args
+
     def _get_start_dir(self, args: Namespace) -> Path:
         """
         Determine the starting directory for scenario discovery.
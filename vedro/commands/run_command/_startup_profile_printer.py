@@ -0,0 +1,51 @@
+from typing import TextIO
+
+from rich.console import Console
+from rich.table import Table
+
+from vedro.core.startup_profiler import StartupProfiler
+
+__all__ = ("StartupProfilePrinter",)
+
+
+class StartupProfilePrinter:
+    """
+    Prints the slowest spans of a startup profile as a ranked table.
+
+    Spans are nested (a phase includes the handlers and the imports within it),
+    so the shares of the total startup time are not meant to add up to 100%.
+    """
+
+    def __init__(self, file: TextIO, *, limit: int = 20) -> None:
+        """
+        Initialize the StartupProfilePrinter.
+
+        :param file: The stream to print the table to.
+        :param limit: The maximum number of spans to show.
+        """
+        self._console = Console(file=file, highlight=False, markup=False, soft_wrap=True)
+        self._limit = limit
+
+    def print(self, profiler: StartupProfiler) -> None:
+        """
+        Print the slowest spans recorded by the profiler.
+
+        :param profiler: The (stopped) startup profiler.
+        """
+        total = profiler.elapsed
+        spans = profiler.get_ranked_spans(self._limit)
+
+        table = Table(title=f"Startup profile ({total * 1000:.1f} ms total)",
+                      border_style="grey50")
+        table.add_column("#", justify="right")
+        table.add_column("Duration", justify="right")
+        table.add_column("Share", justify="right")
+        table.add_column("Category")
+        table.add_column("Name", overflow="fold")
+
+        for rank, span in enumerate(spans, start=1):
+            share = (span.elapsed / total * 100) if total > 0 else 0.0
+            table.add_row(str(rank), f"{span.elapsed * 1000:.1f} ms", f"{share:.1f}%",
+                          span.category, span.name)
+
+        self._console.print(table)
@@ -1,5 +1,5 @@
-from ._artifacts import Artifact, FileArtifact, MemoryArtifact
-from ._dispatcher import Dispatcher, Subscriber
+from ._artifacts import Artifact, FileArtifact, MemoryArtifact, StreamArtifact
+from ._dispatcher import Dispatcher, HandlerType, Subscriber
 from ._event import Event
 from ._exc_info import ExcInfo
 from ._plugin import Plugin, PluginConfig
@@ -35,4 +35,5 @@ __all__ = ("Dispatcher", "Subscriber", "Event", "ExcInfo", "Plugin", "PluginConf
            "ScenarioScheduler", "MonotonicScenarioScheduler", "FactoryType",
            "Container", "Factory", "Singleton", "ScenarioOrderer", "get_scenario_meta",
            "ScenarioCollector", "ScenarioProvider", "ScenarioSource",
-           "MultiProviderScenarioCollector", "set_scenario_meta",)
+           "MultiProviderScenarioCollector", "set_scenario_meta", "StreamArtifact",
+           "HandlerType",)
@@ -1,8 +1,13 @@
 from abc import ABC
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterable, AsyncIterator, BinaryIO, Iterable, Iterator, Union
 
-__all__ = ("Artifact", "MemoryArtifact", "FileArtifact",)
+__all__ = ("Artifact", "MemoryArtifact", "FileArtifact", "StreamArtifact", "StreamSource",
+           "STREAM_COMPRESSIONS",)
+
+StreamSource = Union[Iterable[bytes], AsyncIterable[bytes], BinaryIO]
+
+STREAM_COMPRESSIONS = ("gzip", "zstd")
 
 
 class Artifact(ABC):
@@ -153,3 +158,188 @@ class FileArtifact(Artifact):
         :return: True if the other artifact is equal to this one, False otherwise.
         """
         return isinstance(other, self.__class__) and (self.__dict__ == other.__dict__)
+
+
+class StreamArtifact(Artifact):
+    """
+    Represents an artifact whose data is produced in chunks.
+
+    This class is used for large artifacts, such as captured video, big logs or HAR dumps,
+    that shouldn't be held in memory all at once. The data comes from an iterator, an async
+    iterator or a binary file-like object, and is written to disk chunk by chunk, optionally
+    compressed on the fly. The source can be consumed only once.
+
+    The source is not read when the artifact is attached, but when it is saved, i.e.,
+    when the ScenarioReportedEvent fires (or the CleanupEvent, for global artifacts),
+    after the scenario has finished. By then the source must still be readable:
+    a file closed by a `with` block in the step, or a generator that has already
+    been exhausted, fails to save.
+
+        # Wrong: the file is closed before the artifact is saved
+        with open("video.webm", "rb") as f:
+            attach_scenario_artifact(StreamArtifact("video.webm", "video/webm", f))
+
+        # Right: the generator opens (and closes) the file when the artifact is saved
+        def read_video():
+            with open("video.webm", "rb") as f:
+                yield from iter(lambda: f.read(64 * 1024), b"")
+
+        attach_scenario_artifact(StreamArtifact("video.webm", "video/webm", read_video()))
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, name: str, mime_type: str, source: StreamSource, *,
+                 compression: Union[str, None] = None) -> None:
+        """
+        Initialize a StreamArtifact with a name, MIME type, and data source.
+
+        :param name: The name of the artifact, used as is (e.g., "network.har.gz").
+        :param mime_type: The MIME type of the data (e.g., "text/plain", "video/webm").
+        :param source: An iterable or async iterable of byte chunks, or a binary file-like
+                       object (it is read to the end, but not closed).
+        :param compression: The compression applied while writing, one of
+                            STREAM_COMPRESSIONS ("gzip" or "zstd"), or None.
+        :raises TypeError: If `source` is not a supported source of bytes.
+        :raises ValueError: If the compression is unknown.
+        """
+        if isinstance(source, (bytes, bytearray, str)):
+            raise TypeError("'source' must be an iterable of bytes or a file-like object, "
+                            "use MemoryArtifact for bytes")
+        if not (hasattr(source, "read") or hasattr(source, "__aiter__")
+                or hasattr(source, "__iter__")):
+            raise TypeError("'source' must be an iterable of bytes or a file-like object")
+        if (compression is not None) and (compression not in STREAM_COMPRESSIONS):
+            compressions = ", ".join(repr(x) for x in STREAM_COMPRESSIONS)
+            raise ValueError(
+                f"Unknown compression {compression!r}, expected one of {compressions} or None"
+            )
+        self._name = name
+        self._mime_type = mime_type
+        self._source: Union[StreamSource, None] = source
+        self._compression = compression
+        self._is_async = (not hasattr(source, "read")) and hasattr(source, "__aiter__")
+        self._saved_path: Union[Path, None] = None
+
+    @property
+    def name(self) -> str:
+        """
+        Get the name of the artifact.
+
+        :return: The name of the artifact as a string.
+        """
+        return self._name
+
+    @property
+    def mime_type(self) -> str:
+        """
+        Get the MIME type of the artifact data.
+
+        :return: The MIME type as a string.
+        """
+        return self._mime_type
+
+    @property
+    def compression(self) -> Union[str, None]:
+        """
+        Get the compression applied while writing the artifact.
+
+        :return: The compression name, or None if the data is written as is.
+        """
+        return self._compression
+
+    @property
+    def is_async(self) -> bool:
+        """
+        Check whether the data is produced by an async iterator.
+
+        :return: True if the source is an async iterable, False otherwise.
+        """
+        return self._is_async
+
+    @property
+    def consumed(self) -> bool:
+        """
+        Check whether the source has already been consumed.
+
+        :return: True if the chunks have been taken, False otherwise.
+        """
+        return self._source is None
+
+    @property
+    def saved_path(self) -> Union[Path, None]:
+        """
+        Get the path the artifact was saved to.
+
+        :return: The path to the saved artifact, or None if it is not saved yet.
+        """
+        return self._saved_path
+
+    def mark_saved(self, path: Path) -> None:
+        """
+        Record the path the artifact was saved to.
+
+        :param path: The path to the saved artifact.
+        """
+        self._saved_path = path
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        """
+        Take the chunks of a synchronous source. The source is released once taken.
+
+        :return: An iterator of byte chunks.
+        :raises TypeError: If the source is an async iterable.
+        :raises RuntimeError: If the source has already been consumed.
+        """
+        if self._is_async:
+            raise TypeError(f"{self!r} has an async source, use 'aiter_chunks()'")
+        return self._iter_source(self._take_source())
+
+    def aiter_chunks(self) -> AsyncIterator[bytes]:
+        """
+        Take the chunks of the source asynchronously. The source is released once taken.
+
+        :return: An async iterator of byte chunks.
+        :raises RuntimeError: If the source has already been consumed.
+        """
+        source = self._take_source()
+        if self._is_async:
+            return source.__aiter__()  # type: ignore
+
+        async def aiter_chunks() -> AsyncIterator[bytes]:
+            for chunk in self._iter_source(source):
+                yield chunk
+        return aiter_chunks()
+
+    def _take_source(self) -> StreamSource:
+        """
+        Take the source, so it can't be consumed twice and isn't referenced afterwards.
+
+        :return: The source.
+        :raises RuntimeError: If the source has already been consumed.
+        """
+        if self._source is None:
+            raise RuntimeError(f"{self!r} has already been consumed")
+        source, self._source = self._source, None
+        return source
+
+    def _iter_source(self, source: StreamSource) -> Iterator[bytes]:
+        """
+        Iterate over the chunks of a synchronous source.
+
+        :param source: An iterable of byte chunks or a binary file-like object.
+        :return: An iterator of byte chunks.
+        """
+        if hasattr(source, "read"):
+            return iter(lambda: source.read(self.CHUNK_SIZE), b"")
+        return iter(source)  # type: ignore
+
+    def __repr__(self) -> str:
+        """
+        Represent the StreamArtifact as a string.
+
+        :return: A string representation of the StreamArtifact, including its name,
+                 MIME type, and compression.
+        """
+        return (f"{self.__class__.__name__}<{self._name!r}, {self._mime_type!r}, "
+                f"compression={self._compression!r}>")
@@ -151,6 +151,22 @@ class Report:
                 self._ended_at = result.ended_at
             self._ended_at = max(cast(float, self._ended_at), result.ended_at)
 
+    def set_started_at(self, started_at: Union[float, None]) -> None:
+        """
+        Set the start time of the report, overriding the one computed from results.
+
+        :param started_at: The start time, or None to reset it.
+        """
+        self._started_at = started_at
+
+    def set_ended_at(self, ended_at: Union[float, None]) -> None:
+        """
+        Set the end time of the report, overriding the one computed from results.
+
+        :param ended_at: The end time, or None to reset it.
+        """
+        self._ended_at = ended_at
+
     def add_preamble(self, line: str) -> None:
         """
         Add a line to the report preamble.
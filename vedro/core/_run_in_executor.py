@@ -0,0 +1,22 @@
+from asyncio import get_running_loop
+from contextvars import copy_context
+from functools import partial
+from typing import Callable, TypeVar
+
+__all__ = ("run_in_executor",)
+
+T = TypeVar("T")
+
+
+async def run_in_executor(fn: Callable[[], T]) -> T:
+    """
+    Run a blocking function in a worker thread of the default executor.
+
+    The function runs in a copy of the current context, so context variables
+    (e.g., of the output capturer) are visible to it.
+
+    :param fn: The function to run (use `functools.partial` to pass arguments).
+    :return: The result of the function.
+    """
+    context = copy_context()
+    return await get_running_loop().run_in_executor(None, partial(context.run, fn))
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from hashlib import blake2b
 from inspect import BoundArguments, getdoc
 from pathlib import Path
@@ -47,7 +48,7 @@ class VirtualScenario:
         self._orig_scenario = orig_scenario
         self._steps = steps
         # TODO: Make project_dir required in v2.0
-        self._project_dir = project_dir.resolve()
+        self._project_dir = _resolve_dir(project_dir)
         # TODO: Move path to constructor in v2.0
         self._path = Path(getattr(orig_scenario, "__file__", "."))
         self._is_skipped = False
@@ -311,3 +312,24 @@ class VirtualScenario:
         :return: A boolean indicating if the other object is equal to this instance.
         """
         return isinstance(other, self.__class__) and (self.__dict__ == other.__dict__)
+
+
+@lru_cache(maxsize=16)
+def _resolve_absolute_dir(path: Path) -> Path:
+    return path.resolve()
+
+
+def _resolve_dir(path: Path) -> Path:
+    """
+    Resolve a directory path, caching the result for absolute paths.
+
+    All scenarios of a project share the same project directory, so resolving it
+    (which requires system calls) once is enough.
+
+    :param path: The directory path to resolve.
+    :return: The resolved path.
+    """
+    if path.is_absolute():
+        return _resolve_absolute_dir(path)
+    # Relative paths depend on the current working directory
+    return path.resolve()
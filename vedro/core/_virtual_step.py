@@ -48,6 +48,18 @@ class VirtualStep:
         """
         return iscoroutinefunction(self._orig_step)
 
+    def is_offloaded(self) -> bool:
+        """
+        Check if the original step should run in a worker thread.
+
+        Synchronous steps that may block for a long time (e.g. retried with delays by
+        `ensure`) are marked with the `__vedro__offload__` attribute, so the runner
+        doesn't block the event loop while executing them.
+
+        :return: A boolean indicating if the step should run in a worker thread.
+        """
+        return not self.is_coro() and bool(getattr(self._orig_step, "__vedro__offload__", False))
+
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         """
         Execute the original step with the provided arguments and keyword arguments.
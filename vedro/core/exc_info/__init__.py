@@ -1,4 +1,6 @@
 from ._exc_info import ExcInfo
 from ._traceback_filter import NoOpTracebackFilter, TracebackFilter, TracebackFilterType
+from ._traceback_snapshot import FrameSnapshot, TracebackSnapshot
 
-__all__ = ("ExcInfo", "TracebackFilter", "NoOpTracebackFilter", "TracebackFilterType",)
+__all__ = ("ExcInfo", "TracebackFilter", "NoOpTracebackFilter", "TracebackFilterType",
+           "TracebackSnapshot", "FrameSnapshot",)
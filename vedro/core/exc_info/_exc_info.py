@@ -1,5 +1,8 @@
+import sys
 from types import TracebackType
-from typing import Type
+from typing import List, Optional, Set, Type
+
+from ._traceback_snapshot import TracebackSnapshot
 
 __all__ = ("ExcInfo",)
 
@@ -11,24 +14,68 @@ class ExcInfo:
     This class encapsulates the details of an exception, including its type, the exception
     instance itself, and the traceback associated with the exception. It provides a structured
     way to store and access exception details.
+
+    The traceback keeps every frame of the call stack (and all their locals) alive.
+    `snapshot_traceback` replaces it with a lightweight `TracebackSnapshot`, so the frames
+    can be freed while the exception can still be rendered.
     """
 
     # TODO: In v2, make type, value, and traceback read-only
     def __init__(self,
                  type_: Type[BaseException],
                  value: BaseException,
-                 traceback: TracebackType) -> None:
+                 traceback: Optional[TracebackType],
+                 snapshot: Optional[TracebackSnapshot] = None) -> None:
         """
         Initialize an instance of ExcInfo with exception details.
 
         :param type_: The type of the exception (e.g., `ValueError`, `TypeError`).
         :param value: The exception instance (i.e., the exception object raised).
         :param traceback: The traceback object associated with the exception, representing
-                          the call stack at the point where the exception occurred.
+                          the call stack at the point where the exception occurred,
+                          or None if it is released (see `snapshot`).
+        :param snapshot: The snapshot of the traceback, if the traceback is already released.
         """
         self.type = type_
         self.value = value
-        self.traceback = traceback
+        self.traceback: Optional[TracebackType] = traceback
+        self.snapshot = snapshot
+
+    def snapshot_traceback(self, *, capture_locals: bool = True) -> TracebackSnapshot:
+        """
+        Replace the traceback with its snapshot, releasing the frames.
+
+        The tracebacks of the exception and of its chained exceptions are dropped,
+        so `traceback` becomes None afterwards and `snapshot` should be used instead.
+        Calling this method again returns the existing snapshot.
+
+        :param capture_locals: Whether to capture the size-bounded reprs of the frame locals.
+        :return: The snapshot of the traceback.
+        """
+        if self.snapshot is None:
+            self.snapshot = TracebackSnapshot.capture(self.type, self.value, self.traceback,
+                                                      capture_locals=capture_locals)
+        self.traceback = None
+        self._release_tracebacks(self.value)
+        return self.snapshot
+
+    def _release_tracebacks(self, exception: BaseException) -> None:
+        """
+        Drop the tracebacks of an exception and of all exceptions chained to it.
+
+        :param exception: The exception to release the tracebacks of.
+        """
+        exceptions: List[Optional[BaseException]] = [exception]
+        seen: Set[int] = set()
+        while exceptions:
+            exc = exceptions.pop()
+            if (exc is None) or (id(exc) in seen):
+                continue
+            seen.add(id(exc))
+            exc.__traceback__ = None
+            exceptions += [exc.__cause__, exc.__context__]
+            if sys.version_info >= (3, 11) and isinstance(exc, BaseExceptionGroup):  # noqa: F821
+                exceptions += exc.exceptions
 
     def __repr__(self) -> str:
         """
@@ -1,8 +1,41 @@
+import os
+from functools import lru_cache
+from inspect import CO_OPTIMIZED
 from pathlib import Path
 from types import FrameType, ModuleType, TracebackType
-from typing import Callable, Sequence, Union
+from typing import TYPE_CHECKING, Callable, Sequence, Tuple, Union
 
-__all__ = ("TracebackFilter", "NoOpTracebackFilter", "TracebackFilterType",)
+if TYPE_CHECKING:
+    from ._traceback_snapshot import FrameSnapshot, TracebackSnapshot
+
+__all__ = ("TracebackFilter", "NoOpTracebackFilter", "TracebackFilterType", "HIDE_FLAGS",
+           "has_hide_flag",)
+
+HIDE_FLAGS = ("__traceback_hide__", "__tracebackhide__")
+
+
+def has_hide_flag(frame: FrameType, flags: Sequence[str] = HIDE_FLAGS) -> bool:
+    """
+    Check if a frame is marked for hiding with one of the hide flags in its locals.
+
+    The locals of a function are known from its code object, so building them
+    (which is relatively expensive) is skipped when no flag is declared.
+    Module and class bodies can define any name, so they are always checked.
+
+    :param frame: The frame object to check.
+    :param flags: The names of the hide flags.
+    :return: True if a hide flag is set, False otherwise.
+    """
+    code = frame.f_code
+    if code.co_flags & CO_OPTIMIZED:
+        names = code.co_varnames + code.co_cellvars + code.co_freevars
+        if not any(flag in names for flag in flags):
+            return False
+
+    for flag in flags:
+        if frame.f_locals.get(flag, False):
+            return True
+    return False
 
 
 # NOTE FOR PLUGIN DEVELOPERS:
@@ -26,19 +59,29 @@ class TracebackFilter:
     This class provides methods to filter out frames from traceback objects
     that belong to specified modules or are marked for hiding, making it
     easier to focus on relevant parts of the traceback.
+
+    Whether a file belongs to the specified modules is decided once per filename
+    (and cached), using string prefix matching on normalized paths.
     """
 
+    HIDE_FLAGS = HIDE_FLAGS
+
     def __init__(self, modules: Sequence[Union[str, ModuleType]], *,
-                 skip_hidden_frames: bool = True) -> None:
+                 skip_hidden_frames: bool = True, cache_size: int = 4096) -> None:
         """
         Initialize the TracebackFilter with a list of modules to filter out.
 
         :param modules: List of modules or module paths to be filtered out from tracebacks.
         :param skip_hidden_frames: Whether to skip frames marked with __tracebackhide__ or
                                    __traceback_hide__.
+        :param cache_size: The maximum number of filenames to remember decisions for.
         """
         self._module_paths = [self.resolve_module_path(m) for m in modules]
         self._skip_hidden_frames = skip_hidden_frames
+        self._module_dirs, self._module_prefixes = self._make_prefixes(self._module_paths)
+        self._is_module_file: Callable[[str], bool] = lru_cache(maxsize=cache_size)(
+            self._match_module_file
+        )
 
     def filter_tb(self, tb: TracebackType) -> TracebackType:
         """
@@ -48,29 +91,23 @@ class TracebackFilter:
         :param tb: The original traceback object to be filtered.
         :return: A new traceback object with hidden frames removed.
         """
-        filtered_tb = None
-        last_tb = None
-
+        visible_tbs = []
         while tb is not None:
             if not self.should_hide_frame(tb.tb_frame):
-                # Create a new traceback object if it is not a filtered file
-                if last_tb is None:
-                    # Create a new 'root' traceback
-                    filtered_tb = tb
-                    last_tb = tb
-                else:
-                    # Append the current traceback to the last valid traceback
-                    last_tb.tb_next = tb
-                    last_tb = tb
-
+                visible_tbs.append(tb)
             # Move to the next traceback object
             tb = tb.tb_next  # type: ignore
 
-        # Ensure the last traceback in the chain doesn't link to excluded frames
-        if last_tb is not None:
-            last_tb.tb_next = None
+        # Link the visible tracebacks from the end, so each assignment (which walks
+        # the new chain to prevent cycles) only walks the already filtered tail.
+        # Links that are already in place are not reassigned.
+        next_tb = None
+        for visible_tb in reversed(visible_tbs):
+            if visible_tb.tb_next is not next_tb:
+                visible_tb.tb_next = next_tb
+            next_tb = visible_tb
 
-        return filtered_tb
+        return next_tb
 
     def resolve_module_path(self, module: Union[str, ModuleType]) -> Path:
         """
@@ -99,34 +136,57 @@ class TracebackFilter:
         :param frame: The frame object to check.
         :return: True if the frame should be hidden, False otherwise.
         """
-        filename = Path(frame.f_code.co_filename)
-        if any(self._is_relative_to(filename, m) for m in self._module_paths):
+        if self._is_module_file(frame.f_code.co_filename):
             return True
+        return self._skip_hidden_frames and has_hide_flag(frame, self.HIDE_FLAGS)
 
-        if not self._skip_hidden_frames:
-            return False
+    def filter_snapshot(self, snapshot: "TracebackSnapshot") -> "TracebackSnapshot":
+        """
+        Filter the given traceback snapshot the same way as `filter_tb` filters
+        a traceback. Snapshots of chained exceptions are kept as is.
 
-        for flag in ("__traceback_hide__", "__tracebackhide__"):
-            if frame.f_locals.get(flag, False):
-                return True
+        :param snapshot: The traceback snapshot to be filtered.
+        :return: A new snapshot with hidden frames removed.
+        """
+        return snapshot.with_frames([
+            frame for frame in snapshot.frames if not self.should_hide_frame_snapshot(frame)
+        ])
 
-        return False
+    def should_hide_frame_snapshot(self, frame: "FrameSnapshot") -> bool:
+        """
+        Determine if a frame of a traceback snapshot should be hidden.
 
-    def _is_relative_to(self, path: Path, other: Path) -> bool:
+        :param frame: The frame snapshot to check.
+        :return: True if the frame should be hidden, False otherwise.
         """
-        Check if the path is relative to another path.
+        if self._is_module_file(frame.filename):
+            return True
+        return self._skip_hidden_frames and frame.hidden
 
-        (Path.is_relative_to() is available since Python 3.9)
+    def _make_prefixes(self,
+                       module_paths: Sequence[Path]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Build the normalized module directories and their prefixes for matching.
 
-        :param path: The path to be checked.
-        :param other: The reference path.
-        :return: True if 'path' is relative to 'other', False otherwise.
+        :param module_paths: The module paths to be filtered out.
+        :return: A tuple of the normalized paths and the same paths ending with a separator.
         """
-        try:
-            path.relative_to(other)
-        except ValueError:
-            return False
-        return True
+        module_dirs = tuple(os.path.normcase(str(path)) for path in module_paths)
+        prefixes = tuple(path if path.endswith(os.sep) else path + os.sep for path in module_dirs)
+        return module_dirs, prefixes
+
+    def _match_module_file(self, filename: str) -> bool:
+        """
+        Check if a file belongs to one of the module paths.
+
+        The filename is normalized the same way as `Path` does it (without resolving),
+        so the result matches `Path(filename).relative_to(module_path)` checks.
+
+        :param filename: The filename of a code object.
+        :return: True if the file is within one of the module paths, False otherwise.
+        """
+        path = os.path.normcase(str(Path(filename)))
+        return (path in self._module_dirs) or path.startswith(self._module_prefixes)
 
 
 class NoOpTracebackFilter(TracebackFilter):
@@ -146,6 +206,15 @@ class NoOpTracebackFilter(TracebackFilter):
         """
         return tb
 
+    def filter_snapshot(self, snapshot: "TracebackSnapshot") -> "TracebackSnapshot":
+        """
+        Return the traceback snapshot unfiltered.
+
+        :param snapshot: The original traceback snapshot.
+        :return: The same snapshot without any filtering.
+        """
+        return snapshot
+
 
 TracebackFilterType = Union[
     TracebackFilter,
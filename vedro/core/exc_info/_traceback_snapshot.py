@@ -0,0 +1,365 @@
+import sys
+from functools import partial
+from inspect import isclass, isfunction
+from traceback import FrameSummary, StackSummary, TracebackException, walk_tb
+from types import FrameType, TracebackType
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Type
+
+from rich.pretty import Node, traverse
+
+from ._traceback_filter import has_hide_flag
+
+__all__ = ("TracebackSnapshot", "FrameSnapshot",)
+
+InstructionPosition = Tuple[Tuple[int, int], Tuple[int, int]]
+
+LocalsReprType = Callable[[Any], Node]
+
+
+class FrameSnapshot:
+    """
+    Represents a frame of a traceback snapshot.
+
+    A frame snapshot keeps what is needed to render the frame: the standard library
+    frame summary (filename, line number, function name and source line) and the
+    size-bounded reprs of the frame locals, but not the frame itself.
+
+    The reprs of the locals are the trees `rich` builds to render locals in tracebacks
+    (`rich.pretty.Node`), truncated with the same limits, so a traceback rendered from
+    a snapshot looks the same as one rendered from the live frames. Nodes hold only strings.
+    """
+
+    __slots__ = ("_summary", "_lineno", "_locals", "_hidden",)
+
+    def __init__(self, summary: FrameSummary, *,
+                 lineno: Optional[int] = None,
+                 locals_: Optional[Dict[str, Node]] = None,
+                 hidden: bool = False) -> None:
+        """
+        Initialize the FrameSnapshot.
+
+        :param summary: The frame summary, with the source line already looked up.
+        :param lineno: The line number of the traceback entry, defaults to the line number
+                       of the summary (they differ only for instructions spanning lines).
+        :param locals_: The reprs of the frame locals, or None if they weren't captured.
+        :param hidden: Whether the frame is marked with __tracebackhide__
+                       or __traceback_hide__.
+        """
+        self._summary = summary
+        self._lineno = summary.lineno if (lineno is None) else lineno
+        self._locals = locals_
+        self._hidden = hidden
+
+    @property
+    def summary(self) -> FrameSummary:
+        """
+        Get the standard library summary of the frame.
+
+        :return: The frame summary, used to format the traceback as text.
+        """
+        return self._summary
+
+    @property
+    def filename(self) -> str:
+        """
+        Get the filename of the frame's code.
+
+        :return: The filename.
+        """
+        return self._summary.filename
+
+    @property
+    def lineno(self) -> Optional[int]:
+        """
+        Get the line number of the traceback entry.
+
+        :return: The line number.
+        """
+        return self._lineno
+
+    @property
+    def name(self) -> str:
+        """
+        Get the name of the frame's function.
+
+        :return: The function name.
+        """
+        return self._summary.name
+
+    @property
+    def line(self) -> str:
+        """
+        Get the source line of the traceback entry.
+
+        :return: The stripped source line, or an empty string if it is not available.
+        """
+        return self._summary.line or ""
+
+    @property
+    def locals(self) -> Optional[Dict[str, Node]]:
+        """
+        Get the size-bounded reprs of the frame locals.
+
+        :return: A dictionary of the repr trees by name (use `str()` to get a one-line repr),
+                 or None if locals weren't captured.
+        """
+        return self._locals
+
+    @property
+    def hidden(self) -> bool:
+        """
+        Check if the frame is marked with __tracebackhide__ or __traceback_hide__.
+
+        :return: True if the frame is marked for hiding, False otherwise.
+        """
+        return self._hidden
+
+    @property
+    def last_instruction(self) -> Optional[InstructionPosition]:
+        """
+        Get the position of the instruction that raised (Python 3.11+).
+
+        :return: The start and end positions as (line, column) pairs,
+                 or None if the position is not available.
+        """
+        positions = (self._summary.lineno, getattr(self._summary, "colno", None),
+                     getattr(self._summary, "end_lineno", None),
+                     getattr(self._summary, "end_colno", None))
+        start_line, start_column, end_line, end_column = positions
+        if (start_line is None) or (start_column is None) or \
+           (end_line is None) or (end_column is None):
+            return None
+        return (start_line, start_column), (end_line, end_column)
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the FrameSnapshot.
+
+        :return: A string containing the filename, line number and function name.
+        """
+        return f"<{self.__class__.__name__} {self.filename}:{self.lineno} in {self.name}>"
+
+
+class TracebackSnapshot:
+    """
+    Represents a lightweight copy of an exception's traceback that holds no frames.
+
+    A traceback keeps every frame of the call stack alive, and each frame keeps all its
+    local variables. A snapshot keeps only what reporters render: the frame snapshots and
+    the snapshots of chained exceptions (the cause or the context, and the exceptions
+    of an exception group), so the traceback itself can be released early.
+
+    The exception (type and value) is not a part of the snapshot, it is passed
+    to `format` the same way it is passed to `traceback.format_exception`.
+    """
+
+    def __init__(self, frames: Sequence[FrameSnapshot], *,
+                 cause: Optional["TracebackSnapshot"] = None,
+                 context: Optional["TracebackSnapshot"] = None,
+                 exceptions: Sequence["TracebackSnapshot"] = ()) -> None:
+        """
+        Initialize the TracebackSnapshot.
+
+        :param frames: The frame snapshots, from the outermost to the innermost frame.
+        :param cause: The snapshot of the exception's __cause__, if any.
+        :param context: The snapshot of the exception's __context__, if it is displayed.
+        :param exceptions: The snapshots of the exceptions of an exception group.
+        """
+        self._frames = tuple(frames)
+        self._cause = cause
+        self._context = context
+        self._exceptions = tuple(exceptions)
+
+    @classmethod
+    def capture(cls, exc_type: Type[BaseException], exc_value: BaseException,
+                traceback: Optional[TracebackType], *,
+                capture_locals: bool = True,
+                locals_max_length: int = 10,
+                locals_max_string: int = 80) -> "TracebackSnapshot":
+        """
+        Take a snapshot of the traceback of an exception and of its chained exceptions.
+
+        Source lines are looked up right away. If locals are captured, they are truncated
+        the same way rich tracebacks truncate them (with the same defaults), and the reprs
+        of function and class objects and of names starting with a double underscore
+        are skipped.
+
+        :param exc_type: The type of the exception.
+        :param exc_value: The exception instance.
+        :param traceback: The traceback of the exception.
+        :param capture_locals: Whether to capture the reprs of the frame locals.
+        :param locals_max_length: The maximum number of items of a container shown.
+        :param locals_max_string: The maximum length of a string or bytes value shown.
+        :return: The traceback snapshot.
+        """
+        exception = TracebackException(exc_type, exc_value, traceback)
+        locals_repr: Optional[LocalsReprType] = None
+        if capture_locals:
+            locals_repr = partial(traverse, max_length=locals_max_length,
+                                  max_string=locals_max_string)
+        return cls._from_exception(exception, exc_value, traceback, locals_repr)
+
+    @classmethod
+    def _from_exception(cls, exception: TracebackException, exc_value: BaseException,
+                        traceback: Optional[TracebackType],
+                        locals_repr: Optional[LocalsReprType]) -> "TracebackSnapshot":
+        """
+        Build a snapshot from the stacks extracted by the standard library.
+
+        :param exception: The TracebackException of the exception.
+        :param exc_value: The exception instance.
+        :param traceback: The traceback of the exception.
+        :param locals_repr: The repr builder for locals, or None to skip them.
+        :return: The traceback snapshot.
+        """
+        frames = []
+        for summary, (frame, lineno) in zip(exception.stack, walk_tb(traceback)):
+            locals_ = cls._capture_locals(frame, locals_repr) if locals_repr else None
+            frames.append(FrameSnapshot(summary, lineno=lineno, locals_=locals_,
+                                        hidden=has_hide_flag(frame)))
+
+        cause = context = None
+        if (exception.__cause__ is not None) and (exc_value.__cause__ is not None):
+            cause = cls._from_exception(exception.__cause__, exc_value.__cause__,
+                                        exc_value.__cause__.__traceback__, locals_repr)
+        elif (exception.__context__ is not None) and (exc_value.__context__ is not None) \
+                and not exc_value.__suppress_context__:
+            context = cls._from_exception(exception.__context__, exc_value.__context__,
+                                          exc_value.__context__.__traceback__, locals_repr)
+
+        exceptions = []
+        group = getattr(exception, "exceptions", None) or []
+        for group_exception, group_value in zip(group, getattr(exc_value, "exceptions", [])):
+            exceptions.append(cls._from_exception(group_exception, group_value,
+                                                  group_value.__traceback__, locals_repr))
+
+        return cls(frames, cause=cause, context=context, exceptions=exceptions)
+
+    @staticmethod
+    def _capture_locals(frame: FrameType, locals_repr: LocalsReprType) -> Dict[str, Node]:
+        """
+        Capture the size-bounded reprs of the frame locals.
+
+        :param frame: The frame object.
+        :param locals_repr: The repr builder.
+        :return: A dictionary of the repr trees by name.
+        """
+        return {
+            name: locals_repr(value)
+            for name, value in frame.f_locals.items()
+            if not (name.startswith("__") or isfunction(value) or isclass(value))
+        }
+
+    @property
+    def frames(self) -> Tuple[FrameSnapshot, ...]:
+        """
+        Get the frame snapshots.
+
+        :return: A tuple of frame snapshots, from the outermost to the innermost frame.
+        """
+        return self._frames
+
+    @property
+    def cause(self) -> Optional["TracebackSnapshot"]:
+        """
+        Get the snapshot of the exception's __cause__.
+
+        :return: The snapshot, or None if the exception has no cause.
+        """
+        return self._cause
+
+    @property
+    def context(self) -> Optional["TracebackSnapshot"]:
+        """
+        Get the snapshot of the exception's __context__.
+
+        :return: The snapshot, or None if there is no context or it is suppressed.
+        """
+        return self._context
+
+    @property
+    def exceptions(self) -> Tuple["TracebackSnapshot", ...]:
+        """
+        Get the snapshots of the exceptions of an exception group.
+
+        :return: A tuple of snapshots, empty if the exception is not a group.
+        """
+        return self._exceptions
+
+    def with_frames(self, frames: Sequence[FrameSnapshot]) -> "TracebackSnapshot":
+        """
+        Create a copy of the snapshot with other frames (e.g., filtered ones).
+
+        :param frames: The frame snapshots of the new snapshot.
+        :return: The new snapshot, sharing the snapshots of chained exceptions.
+        """
+        return self.__class__(frames, cause=self._cause, context=self._context,
+                              exceptions=self._exceptions)
+
+    def format(self, exc_type: Type[BaseException], exc_value: BaseException, *,
+               limit: Optional[int] = None) -> List[str]:
+        """
+        Format the exception with the snapshot in place of its traceback.
+
+        The result is the same as of `traceback.format_exception` called
+        with the traceback the snapshot was taken of.
+
+        :param exc_type: The type of the exception.
+        :param exc_value: The exception instance.
+        :param limit: The maximum number of frames per exception (negative to take
+                      the last frames), the same as for `traceback.format_exception`.
+        :return: A list of strings, each ending in a newline.
+        """
+        exception = TracebackException(exc_type, exc_value, None)
+        self._restore_stacks(exception, limit, set())
+        return list(exception.format())
+
+    def _restore_stacks(self, exception: TracebackException, limit: Optional[int],
+                        seen: Set[int]) -> None:
+        """
+        Put the frames of the snapshot (and of chained snapshots) into a TracebackException
+        built without a traceback.
+
+        :param exception: The TracebackException to fill.
+        :param limit: The maximum number of frames per exception.
+        :param seen: The ids of already filled TracebackExceptions.
+        """
+        if id(exception) in seen:
+            return
+        seen.add(id(exception))
+
+        frames = [frame.summary for frame in self._limit_frames(limit)]
+        exception.stack = StackSummary.from_list(frames)
+
+        if (self._cause is not None) and (exception.__cause__ is not None):
+            self._cause._restore_stacks(exception.__cause__, limit, seen)
+        if (self._context is not None) and (exception.__context__ is not None):
+            self._context._restore_stacks(exception.__context__, limit, seen)
+
+        group = getattr(exception, "exceptions", None) or []
+        for group_exception, snapshot in zip(group, self._exceptions):
+            snapshot._restore_stacks(group_exception, limit, seen)
+
+    def _limit_frames(self, limit: Optional[int]) -> Tuple[FrameSnapshot, ...]:
+        """
+        Limit the frames the same way `traceback.StackSummary.extract` does.
+
+        :param limit: The maximum number of frames (negative to take the last frames),
+                      or None to use sys.tracebacklimit.
+        :return: The limited frames.
+        """
+        if limit is None:
+            limit = getattr(sys, "tracebacklimit", None)
+            if (limit is not None) and (limit < 0):
+                limit = 0
+        if limit is None:
+            return self._frames
+        return self._frames[:limit] if (limit >= 0) else self._frames[limit:]
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the TracebackSnapshot.
+
+        :return: A string containing the number of frames.
+        """
+        return f"<{self.__class__.__name__} frames={len(self._frames)}>"
@@ -2,9 +2,11 @@ from pathlib import Path
 from typing import Callable
 
 from ..._plugin import Plugin
+from ._base_local_storage import BaseLocalStorage
 from ._local_storage import LocalStorage
+from ._sqlite_local_storage import SQLiteLocalStorage
 
-LocalStorageFactory = Callable[[Plugin, Path], LocalStorage]
+LocalStorageFactory = Callable[[Plugin, Path], BaseLocalStorage]
 
 
 def create_local_storage(plugin: Plugin, project_dir: Path) -> LocalStorage:
@@ -21,4 +23,23 @@ def create_local_storage(plugin: Plugin, project_dir: Path) -> LocalStorage:
     return LocalStorage(plugin, project_dir)
 
 
-__all__ = ("create_local_storage", "LocalStorageFactory", "LocalStorage",)
+def create_sqlite_local_storage(plugin: Plugin, project_dir: Path) -> SQLiteLocalStorage:
+    """
+    Create and return a new SQLiteLocalStorage instance for a given plugin.
+
+    This factory can be passed as `local_storage_factory` to plugins that store large
+    amounts of data (e.g., per-scenario history), which SQLiteLocalStorage reads
+    and writes partially instead of rewriting the whole file.
+
+    :param plugin: The Plugin instance for which the SQLiteLocalStorage is to be created.
+    :param project_dir: The root directory of the project.
+    :return: A SQLiteLocalStorage instance associated with the given plugin.
+    :raises TypeError: If the provided plugin is not an instance of Plugin.
+    """
+    if not isinstance(plugin, Plugin):
+        raise TypeError(f"Expected Plugin instance, but got {type(plugin)}")
+    return SQLiteLocalStorage(plugin, project_dir)
+
+
+__all__ = ("create_local_storage", "create_sqlite_local_storage", "LocalStorageFactory",
+           "BaseLocalStorage", "LocalStorage", "SQLiteLocalStorage",)
@@ -0,0 +1,59 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Mapping
+
+__all__ = ("BaseLocalStorage",)
+
+
+class BaseLocalStorage(ABC):
+    """
+    Defines an abstract base class for a plugin key-value storage. This class is experimental
+    and may be subject to changes in future versions.
+
+    Values must be JSON-serializable. Changes made with `put` are not persisted until
+    `flush` is called.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Any:
+        """
+        Get the value associated with the key from the storage.
+
+        :param key: Key of the item to get from the storage.
+        :return: The value associated with the key. If key does not exist, Nil is returned.
+        """
+        pass
+
+    @abstractmethod
+    async def put(self, key: str, value: Any) -> None:
+        """
+        Store the key-value pair in the storage. The changes are written on `flush`.
+
+        :param key: Key of the item to store.
+        :param value: Value of the item to store.
+        """
+        pass
+
+    @abstractmethod
+    async def flush(self) -> None:
+        """
+        Write the pending changes of the storage.
+        """
+        pass
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Get the values associated with the keys from the storage.
+
+        :param keys: Keys of the items to get from the storage.
+        :return: A dictionary of keys and their values. Nil is used for keys that do not exist.
+        """
+        return {key: await self.get(key) for key in keys}
+
+    async def put_many(self, items: Mapping[str, Any]) -> None:
+        """
+        Store the key-value pairs in the storage. The changes are written on `flush`.
+
+        :param items: A mapping of keys and values to store.
+        """
+        for key, value in items.items():
+            await self.put(key, value)
@@ -1,23 +1,37 @@
+import asyncio
 import json
 import os
 from functools import partial
 from pathlib import Path
 from tempfile import NamedTemporaryFile as TemporaryFile
-from typing import Any, Callable, Dict, Union, cast
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Callable, Dict, TypeVar, Union, cast
 
-from filelock import FileLock
 from niltype import Nil
 
 from vedro.core import Plugin
 
+from ..._run_in_executor import run_in_executor
+from ._base_local_storage import BaseLocalStorage
+
+if TYPE_CHECKING:  # pragma: no cover
+    from filelock import FileLock
+
 __all__ = ("LocalStorage",)
 
+T = TypeVar("T")
+
+LockFactory = Callable[[Path], "FileLock"]
+
 
-LockFactory = Callable[[Path], FileLock]
-_lock_factory: LockFactory = partial(FileLock, timeout=0.1)
+def _lock_factory(lock_path: Path) -> "FileLock":
+    # filelock is imported on first use, so that plugins keeping local storage
+    # don't slow down the startup of every vedro command
+    from filelock import FileLock
+    return FileLock(lock_path, timeout=0.1)
 
 
-class LocalStorage:
+class LocalStorage(BaseLocalStorage):
     """
     A class that represents local storage using a JSON file. This class is experimental and
     may be subject to changes in future versions.
@@ -26,23 +40,34 @@ class LocalStorage:
     content from the file only on the first access, and all subsequent operations are performed
     in memory for performance reasons. Therefore, to write changes to the file, you need to call
     the 'flush' method explicitly.
+
+    File I/O and lock waits run in a thread executor, so they don't block the event loop.
+    If the lock is held by another process, acquisition is retried with exponential backoff
+    until `lock_timeout` expires.
     """
 
+    _LOCK_RETRY_DELAY = 0.05
+    _LOCK_MAX_RETRY_DELAY = 1.0
+
     def __init__(self, plugin: Plugin, project_dir: Path, *,
-                 lock_factory: LockFactory = _lock_factory) -> None:
+                 lock_factory: LockFactory = _lock_factory,
+                 lock_timeout: float = 30.0) -> None:
         """
         Initialize a new instance of LocalStorage.
 
         :param plugin: Plugin instance that provides namespace for the storage file.
         :param project_dir: The root directory of the project.
-        :param lock_factory: Factory function to create a file lock.
+        :param lock_factory: Factory function to create a file lock. The timeout of
+                             the created lock limits a single acquisition attempt.
+        :param lock_timeout: Total time to wait for the file lock, in seconds.
         """
         namespace = f"{plugin.__class__.__name__}"
         self._dir_path = (project_dir / ".vedro" / "local_storage/").resolve()
         self._file_path = self._dir_path / f"{namespace}.json"
         self._lock_path = self._dir_path / f"{namespace}.lock"
         self._lock_factory = lock_factory
-        self._lock: Union[FileLock, None] = None
+        self._lock_timeout = lock_timeout
+        self._lock: Union["FileLock", None] = None
         self._storage: Union[Dict[str, Any], None] = None
 
     async def get(self, key: str) -> Any:
@@ -76,7 +101,7 @@ class LocalStorage:
         await self._ensure_storage_loaded()
         await self._save_storage()
 
-    def _acquire_lock(self) -> FileLock:
+    def _acquire_lock(self) -> "FileLock":
         """
         Acquire a file lock to prevent concurrent access to the storage file.
 
@@ -87,6 +112,41 @@ class LocalStorage:
             self._lock = self._lock_factory(self._lock_path)
         return self._lock
 
+    async def _run_locked(self, fn: Callable[[], T]) -> T:
+        """
+        Run a function holding the file lock, in a thread executor.
+
+        The lock is acquired and released in the same worker thread. If it is held
+        by another process, the attempt is retried with exponential backoff.
+
+        :param fn: The function to run.
+        :return: The result of the function.
+        :raises Timeout: If the lock could not be acquired within `lock_timeout`.
+        """
+        from filelock import Timeout
+
+        started_at = monotonic()
+        delay = self._LOCK_RETRY_DELAY
+        while True:
+            try:
+                return await run_in_executor(partial(self._call_locked, fn))
+            except Timeout:
+                if monotonic() - started_at + delay > self._lock_timeout:
+                    raise
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self._LOCK_MAX_RETRY_DELAY)
+
+    def _call_locked(self, fn: Callable[[], T]) -> T:
+        """
+        Call a function holding the file lock.
+
+        :param fn: The function to call.
+        :return: The result of the function.
+        :raises Timeout: If the lock could not be acquired in a single attempt.
+        """
+        with self._acquire_lock():
+            return fn()
+
     async def _ensure_storage_loaded(self) -> None:
         """
         Ensure that the storage data is loaded from the file. If the storage is not loaded,
@@ -102,25 +162,43 @@ class LocalStorage:
 
         :return: Dictionary that represents the storage.
         """
-        with self._acquire_lock():
-            try:
-                with open(self._file_path, "r") as f:
-                    return cast(Dict[str, Any], json.load(f))
-            except FileNotFoundError:
-                return {}
-            except json.JSONDecodeError:
-                print(f"Failed to load local storage from {self._file_path}")
-                return {}
+        return await self._run_locked(self._read_file)
 
     async def _save_storage(self) -> None:
         """
         Save the current state of the storage to the file.
         """
-        with self._acquire_lock():
-            with TemporaryFile("w", dir=str(self._dir_path), suffix=".tmp", delete=False) as f:
-                tmp_file_name = f.name
-                json.dump(self._storage, f, indent=4, ensure_ascii=False)
-            try:
-                os.replace(tmp_file_name, self._file_path)
-            except Exception:
-                os.unlink(tmp_file_name)
+        assert self._storage is not None  # for type checker
+        # The file is written in another thread, a shallow copy protects it
+        # from keys added or removed by `put` meanwhile
+        storage = dict(self._storage)
+        await self._run_locked(partial(self._write_file, storage))
+
+    def _read_file(self) -> Dict[str, Any]:
+        """
+        Read the storage file. Must be called holding the file lock.
+
+        :return: Dictionary that represents the storage.
+        """
+        try:
+            with open(self._file_path, "r") as f:
+                return cast(Dict[str, Any], json.load(f))
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError:
+            print(f"Failed to load local storage from {self._file_path}")
+            return {}
+
+    def _write_file(self, storage: Dict[str, Any]) -> None:
+        """
+        Atomically replace the storage file. Must be called holding the file lock.
+
+        :param storage: Dictionary that represents the storage.
+        """
+        with TemporaryFile("w", dir=str(self._dir_path), suffix=".tmp", delete=False) as f:
+            tmp_file_name = f.name
+            json.dump(storage, f, indent=4, ensure_ascii=False)
+        try:
+            os.replace(tmp_file_name, self._file_path)
+        except Exception:
+            os.unlink(tmp_file_name)
@@ -0,0 +1,181 @@
+import json
+import sqlite3
+from functools import partial
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Mapping, Tuple, Union
+
+from niltype import Nil
+
+from vedro.core import Plugin
+
+from ..._run_in_executor import run_in_executor
+from ._base_local_storage import BaseLocalStorage
+
+__all__ = ("SQLiteLocalStorage",)
+
+
+class SQLiteLocalStorage(BaseLocalStorage):
+    """
+    A class that represents local storage using an SQLite database. This class is experimental
+    and may be subject to changes in future versions.
+
+    Unlike `LocalStorage`, this storage reads only the requested keys and writes only
+    the changed ones, so its cost doesn't grow with the total amount of stored data.
+    Values are stored as JSON, one row per key. The database uses write-ahead logging (WAL),
+    so parallel workers can read while another one writes, and writes from different
+    processes are serialized by SQLite (waiting up to `timeout` seconds for a lock).
+
+    Read values are cached in memory, and `put` only buffers the changes, so to write them
+    to the database, you need to call the 'flush' method explicitly. Database queries
+    (and lock waits) run in a thread executor, so they don't block the event loop.
+    """
+
+    # Stay below SQLITE_MAX_VARIABLE_NUMBER of older SQLite versions (999)
+    _SELECT_CHUNK_SIZE = 500
+
+    def __init__(self, plugin: Plugin, project_dir: Path, *, timeout: float = 5.0) -> None:
+        """
+        Initialize a new instance of SQLiteLocalStorage.
+
+        :param plugin: Plugin instance that provides namespace for the storage file.
+        :param project_dir: The root directory of the project.
+        :param timeout: Time to wait for a lock held by another process, in seconds.
+        """
+        namespace = f"{plugin.__class__.__name__}"
+        self._dir_path = (project_dir / ".vedro" / "local_storage/").resolve()
+        self._file_path = self._dir_path / f"{namespace}.db"
+        self._timeout = timeout
+        self._connection: Union[sqlite3.Connection, None] = None
+        # The connection is shared by executor threads, queries are serialized
+        self._connection_lock = Lock()
+        self._cache: Dict[str, Any] = {}
+        self._pending: Dict[str, Any] = {}
+
+    async def get(self, key: str) -> Any:
+        """
+        Get the value associated with the key from the storage. The value is read
+        from the database only on the first access.
+
+        :param key: Key of the item to get from the storage.
+        :return: The value associated with the key. If key does not exist, Nil is returned.
+        """
+        values = await self.get_many([key])
+        return values[key]
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Get the values associated with the keys from the storage. Keys that are not
+        cached yet are read from the database with a single query per chunk of keys.
+
+        :param keys: Keys of the items to get from the storage.
+        :return: A dictionary of keys and their values. Nil is used for keys that do not exist.
+        """
+        requested = list(keys)
+        missing = [key for key in requested
+                   if (key not in self._pending) and (key not in self._cache)]
+        if missing:
+            rows = await run_in_executor(partial(self._select, missing))
+            for key in missing:
+                # A concurrent flush may have cached a newer value meanwhile
+                self._cache.setdefault(key, json.loads(rows[key]) if (key in rows) else Nil)
+
+        return {key: self._pending[key] if (key in self._pending) else self._cache[key]
+                for key in requested}
+
+    async def put(self, key: str, value: Any) -> None:
+        """
+        Store the key-value pair in the storage. This method does not write the changes to the
+        database. To save changes, you need to call the 'flush' method explicitly.
+
+        :param key: Key of the item to store.
+        :param value: Value of the item to store.
+        """
+        self._pending[key] = value
+
+    async def put_many(self, items: Mapping[str, Any]) -> None:
+        """
+        Store the key-value pairs in the storage. This method does not write the changes to the
+        database. To save changes, you need to call the 'flush' method explicitly.
+
+        :param items: A mapping of keys and values to store.
+        """
+        self._pending.update(items)
+
+    async def flush(self) -> None:
+        """
+        Write the changed keys to the database in a single transaction.
+        """
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, {}
+        rows = [(key, json.dumps(value, ensure_ascii=False)) for key, value in pending.items()]
+        try:
+            await run_in_executor(partial(self._insert, rows))
+        except BaseException:
+            # Keep the changes, unless they were overwritten meanwhile
+            self._pending = {**pending, **self._pending}
+            raise
+        self._cache.update(pending)
+
+    def close(self) -> None:
+        """
+        Close the database connection. Pending changes that were not flushed are kept
+        in memory, and the connection is reopened on the next access.
+        """
+        with self._connection_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open the database connection and create the storage table, if needed.
+        Must be called holding the connection lock.
+
+        :return: The database connection.
+        """
+        if self._connection is None:
+            self._dir_path.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self._file_path), timeout=self._timeout,
+                                         check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            with connection:
+                connection.execute("CREATE TABLE IF NOT EXISTS storage "
+                                   "(key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            self._connection = connection
+        return self._connection
+
+    def _select(self, keys: List[str]) -> Dict[str, str]:
+        """
+        Read the raw values of the keys from the database.
+
+        :param keys: Keys to read.
+        :return: A dictionary of the found keys and their JSON-encoded values.
+        """
+        rows: Dict[str, str] = {}
+        with self._connection_lock:
+            connection = self._connect()
+            for index in range(0, len(keys), self._SELECT_CHUNK_SIZE):
+                chunk = keys[index:index + self._SELECT_CHUNK_SIZE]
+                placeholders = ", ".join("?" for _ in chunk)
+                cursor = connection.execute(
+                    f"SELECT key, value FROM storage WHERE key IN ({placeholders})", chunk
+                )
+                rows.update(cursor.fetchall())
+        return rows
+
+    def _insert(self, rows: List[Tuple[str, str]]) -> None:
+        """
+        Write the raw values of the keys to the database in a single transaction.
+
+        :param rows: Pairs of keys and their JSON-encoded values.
+        """
+        with self._connection_lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO storage (key, value) VALUES (?, ?)", rows
+                )
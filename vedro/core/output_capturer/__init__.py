@@ -1,7 +1,11 @@
 from ._captured_output import CapturedOutput, NoOpCapturedOutput
-from ._output_capturer import OutputCapturer
+from ._context_captured_output import ContextCapturedOutput
+from ._demux_stream import DemuxStream, install_demux_stream
+from ._fd_captured_output import FdCapturedOutput, FdRedirect
+from ._output_capturer import CAPTURE_MODES, OutputCapturer
 from ._stream_buffer import StreamBuffer
 from ._stream_view import StreamView
 
 __all__ = ("CapturedOutput", "StreamBuffer", "StreamView", "OutputCapturer",
-           "NoOpCapturedOutput",)
+           "NoOpCapturedOutput", "ContextCapturedOutput", "FdCapturedOutput", "FdRedirect",
+           "DemuxStream", "install_demux_stream", "CAPTURE_MODES",)
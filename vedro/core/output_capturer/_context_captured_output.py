@@ -0,0 +1,56 @@
+from contextvars import Token
+from typing import Any, Optional, TextIO
+
+from ._captured_output import CapturedOutput
+from ._demux_stream import install_demux_stream
+
+__all__ = ("ContextCapturedOutput",)
+
+
+class ContextCapturedOutput(CapturedOutput):
+    """
+    Captures stdout and stderr written in the current context only.
+
+    Unlike `CapturedOutput`, which swaps `sys.stdout` and `sys.stderr` for the whole
+    process, this context manager routes the writes of the current asyncio task or thread
+    to its buffers through a `DemuxStream`. Output of scenarios running concurrently
+    is captured separately, and output of other contexts is left untouched.
+    """
+
+    def __init__(self, capture_limit: Optional[int] = None) -> None:
+        """
+        Initialize a ContextCapturedOutput context manager.
+
+        :param capture_limit: Maximum number of characters to capture per stream
+                              (stdout and stderr are limited independently).
+                              If None, no limit is applied.
+        """
+        super().__init__(capture_limit)
+        self._stdout_token: Optional["Token[Optional[TextIO]]"] = None
+        self._stderr_token: Optional["Token[Optional[TextIO]]"] = None
+
+    def __enter__(self) -> "ContextCapturedOutput":
+        """
+        Enter the context manager and start capturing the output of the current context.
+
+        :return: The ContextCapturedOutput instance.
+        """
+        self._stdout_token = install_demux_stream("stdout").redirect(self._stdout_buffer)
+        self._stderr_token = install_demux_stream("stderr").redirect(self._stderr_buffer)
+        return self
+
+    def __exit__(self, exc_type: Optional[type], exc_val: Optional[Exception],
+                 exc_tb: Optional[Any]) -> None:
+        """
+        Exit the context manager and stop capturing output.
+
+        :param exc_type: Exception type if raised inside the context.
+        :param exc_val: Exception instance if raised inside the context.
+        :param exc_tb: Traceback object if raised inside the context.
+        """
+        if self._stdout_token:  # pragma: no branch
+            install_demux_stream("stdout").restore(self._stdout_token)
+            self._stdout_token = None
+        if self._stderr_token:  # pragma: no branch
+            install_demux_stream("stderr").restore(self._stderr_token)
+            self._stderr_token = None
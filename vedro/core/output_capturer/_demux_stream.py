@@ -0,0 +1,114 @@
+import sys
+from contextvars import ContextVar, Token
+from threading import Lock
+from typing import Any, Iterable, Optional, TextIO, cast
+
+__all__ = ("DemuxStream", "install_demux_stream",)
+
+
+class DemuxStream:
+    """
+    A stream proxy that routes writes to the target of the current context.
+
+    The proxy replaces `sys.stdout` or `sys.stderr` once per process. Each execution
+    context (asyncio task or thread) may redirect the proxy to its own target, while
+    writes from contexts without a target go to the original stream. Routing is a single
+    context variable lookup, so no locking is involved when writing.
+    """
+
+    def __init__(self, stream: TextIO, name: str) -> None:
+        """
+        Initialize the DemuxStream.
+
+        :param stream: The original stream to write to when no target is set.
+        :param name: The name of the stream (e.g. "stdout"), used to name the context variable.
+        """
+        self._stream = stream
+        self._target: ContextVar[Optional[TextIO]] = ContextVar(f"vedro_{name}_target",
+                                                                default=None)
+
+    @property
+    def stream(self) -> TextIO:
+        """
+        Get the original stream.
+
+        :return: The stream the proxy was installed over.
+        """
+        return self._stream
+
+    def redirect(self, target: TextIO) -> "Token[Optional[TextIO]]":
+        """
+        Route writes made in the current context to the given target.
+
+        :param target: The stream to write to.
+        :return: A token to pass to `restore` when the redirection is no longer needed.
+        """
+        return self._target.set(target)
+
+    def restore(self, token: "Token[Optional[TextIO]]") -> None:
+        """
+        Restore the routing that was in effect before the corresponding `redirect` call.
+
+        :param token: The token returned by `redirect`.
+        """
+        self._target.reset(token)
+
+    def _get_stream(self) -> TextIO:
+        target = self._target.get()
+        return self._stream if (target is None) else target
+
+    def write(self, s: str) -> int:
+        """
+        Write a string to the target of the current context.
+
+        :param s: The string to write.
+        :return: The number of characters written.
+        """
+        return self._get_stream().write(s)
+
+    def writelines(self, lines: Iterable[str]) -> None:
+        """
+        Write lines to the target of the current context.
+
+        :param lines: The lines to write.
+        """
+        self._get_stream().writelines(lines)
+
+    def flush(self) -> None:
+        """
+        Flush the target of the current context.
+        """
+        self._get_stream().flush()
+
+    def __getattr__(self, name: str) -> Any:
+        # Everything else (fileno, isatty, encoding, buffer, ...) refers to the original stream
+        return getattr(self._stream, name)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self._stream!r}>"
+
+
+_install_lock = Lock()
+
+
+def install_demux_stream(name: str) -> DemuxStream:
+    """
+    Install a DemuxStream over `sys.<name>` unless it is already installed.
+
+    The proxy is installed once and reused afterwards. If the stream has been replaced
+    since (e.g. by another tool), a new proxy is installed over the current stream.
+
+    :param name: The name of the stream in the `sys` module ("stdout" or "stderr").
+    :return: The installed DemuxStream.
+    """
+    current = getattr(sys, name)
+    if isinstance(current, DemuxStream):
+        return current
+
+    with _install_lock:
+        current = getattr(sys, name)
+        if isinstance(current, DemuxStream):
+            return current
+        demux = DemuxStream(current, name)
+        setattr(sys, name, cast(TextIO, demux))
+        return demux
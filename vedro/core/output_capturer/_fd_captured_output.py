@@ -0,0 +1,176 @@
+import os
+from tempfile import TemporaryFile
+from threading import Lock
+from typing import IO, Any, Optional
+
+from ._context_captured_output import ContextCapturedOutput
+from ._demux_stream import install_demux_stream
+
+__all__ = ("FdCapturedOutput", "FdRedirect",)
+
+
+class FdRedirect:
+    """
+    Redirects a file descriptor to a temporary file for as long as it is in use.
+
+    Redirecting a file descriptor with `os.dup2` affects the whole process, so a single
+    redirect is shared by all captures of the descriptor. The first `start` call performs
+    the redirection and the last `stop` call restores the descriptor. Each user
+    remembers the file offset at which it started and reads everything written
+    after that offset when it stops.
+    """
+
+    def __init__(self, fd: int) -> None:
+        """
+        Initialize the FdRedirect.
+
+        :param fd: The file descriptor to redirect (e.g. 1 for stdout).
+        """
+        self._fd = fd
+        self._lock = Lock()
+        self._users = 0
+        self._saved_fd: Optional[int] = None
+        self._file: Optional[IO[bytes]] = None
+
+    @property
+    def active(self) -> bool:
+        """
+        Check whether the descriptor is currently redirected.
+
+        :return: True if there is at least one user of the redirect, False otherwise.
+        """
+        return self._users > 0
+
+    def start(self) -> int:
+        """
+        Start using the redirect, redirecting the descriptor if it is the first user.
+
+        :return: The offset of the temporary file at which the caller's output starts.
+        """
+        with self._lock:
+            if self._file is None:
+                self._file = TemporaryFile(mode="w+b")
+                self._saved_fd = os.dup(self._fd)
+                os.dup2(self._file.fileno(), self._fd)
+            self._users += 1
+            return os.fstat(self._file.fileno()).st_size
+
+    def stop(self, offset: int) -> bytes:
+        """
+        Stop using the redirect, restoring the descriptor if it is the last user.
+
+        :param offset: The offset returned by the corresponding `start` call.
+        :return: The bytes written to the descriptor since the offset.
+        """
+        with self._lock:
+            assert self._file is not None and self._saved_fd is not None
+            data = self._read(self._file.fileno(), offset)
+            self._users -= 1
+            if self._users == 0:
+                os.dup2(self._saved_fd, self._fd)
+                os.close(self._saved_fd)
+                self._file.close()
+                self._file, self._saved_fd = None, None
+            return data
+
+    def _read(self, fileno: int, offset: int) -> bytes:
+        """
+        Read the temporary file from the offset to its end.
+
+        The redirected descriptor shares the file position with the temporary file,
+        so the data is read without moving the position whenever possible.
+
+        :param fileno: The file descriptor of the temporary file.
+        :param offset: The offset to read from.
+        :return: The bytes read.
+        """
+        size = os.fstat(fileno).st_size - offset
+        if size <= 0:
+            return b""
+        if hasattr(os, "pread"):
+            return os.pread(fileno, size, offset)
+        position = os.lseek(fileno, 0, os.SEEK_CUR)
+        try:
+            os.lseek(fileno, offset, os.SEEK_SET)
+            return os.read(fileno, size)
+        finally:
+            os.lseek(fileno, position, os.SEEK_SET)
+
+
+_stdout_redirect = FdRedirect(1)
+_stderr_redirect = FdRedirect(2)
+
+
+class FdCapturedOutput(ContextCapturedOutput):
+    """
+    Captures stdout and stderr at the file descriptor level.
+
+    Python-level writes are captured per context as in `ContextCapturedOutput`, while
+    file descriptors 1 and 2 are redirected to temporary files to catch the output of
+    subprocesses and C extensions. Descriptors are shared by the whole process, so output
+    written to them while several captures are active is attributed to each of them.
+    Descriptor-level output is appended after the Python-level output of the capture.
+    """
+
+    def __init__(self, capture_limit: Optional[int] = None) -> None:
+        """
+        Initialize a FdCapturedOutput context manager.
+
+        :param capture_limit: Maximum number of characters to capture per stream
+                              (stdout and stderr are limited independently).
+                              If None, no limit is applied.
+        """
+        super().__init__(capture_limit)
+        self._stdout_offset: Optional[int] = None
+        self._stderr_offset: Optional[int] = None
+
+    def __enter__(self) -> "FdCapturedOutput":
+        """
+        Enter the context manager and start capturing Python-level and fd-level output.
+
+        :return: The FdCapturedOutput instance.
+        """
+        # Pending Python-level output belongs to the original destination
+        self._flush_streams()
+        self._stdout_offset = _stdout_redirect.start()
+        self._stderr_offset = _stderr_redirect.start()
+        super().__enter__()
+        return self
+
+    def __exit__(self, exc_type: Optional[type], exc_val: Optional[Exception],
+                 exc_tb: Optional[Any]) -> None:
+        """
+        Exit the context manager, stop capturing and collect fd-level output.
+
+        :param exc_type: Exception type if raised inside the context.
+        :param exc_val: Exception instance if raised inside the context.
+        :param exc_tb: Traceback object if raised inside the context.
+        """
+        super().__exit__(exc_type, exc_val, exc_tb)
+        self._flush_streams()
+        if self._stdout_offset is not None:  # pragma: no branch
+            self._write_fd_output(self._stdout_buffer, _stdout_redirect.stop(self._stdout_offset))
+            self._stdout_offset = None
+        if self._stderr_offset is not None:  # pragma: no branch
+            self._write_fd_output(self._stderr_buffer, _stderr_redirect.stop(self._stderr_offset))
+            self._stderr_offset = None
+
+    def _flush_streams(self) -> None:
+        """
+        Flush the original Python streams so their buffered output reaches the descriptors.
+        """
+        for name in ("stdout", "stderr"):
+            try:
+                install_demux_stream(name).stream.flush()
+            except (OSError, ValueError):  # pragma: no cover
+                pass
+
+    def _write_fd_output(self, buffer: IO[str], data: bytes) -> None:
+        """
+        Append fd-level output to a capture buffer.
+
+        :param buffer: The buffer to write to.
+        :param data: The raw bytes written to the descriptor.
+        """
+        if data:
+            buffer.write(data.decode(errors="replace"))
@@ -1,8 +1,19 @@
-from typing import Optional
+from typing import Dict, Optional, Type
 
 from ._captured_output import CapturedOutput, NoOpCapturedOutput
+from ._context_captured_output import ContextCapturedOutput
+from ._fd_captured_output import FdCapturedOutput
 
-__all__ = ("OutputCapturer",)
+__all__ = ("OutputCapturer", "CAPTURE_MODES",)
+
+CAPTURE_MODES: Dict[str, Type[CapturedOutput]] = {
+    # Swaps sys.stdout and sys.stderr for the whole process
+    "redirect": CapturedOutput,
+    # Routes writes of the current task or thread through a process-wide stream proxy
+    "context": ContextCapturedOutput,
+    # Same as "context", plus output of subprocesses and C extensions (fds 1 and 2)
+    "fd": FdCapturedOutput,
+}
 
 
 class OutputCapturer:
@@ -13,16 +24,24 @@ class OutputCapturer:
     capture, and for applying a capture size limit.
     """
 
-    def __init__(self, enabled: bool = False, capture_limit: Optional[int] = None) -> None:
+    def __init__(self, enabled: bool = False, capture_limit: Optional[int] = None,
+                 mode: str = "redirect") -> None:
         """
         Initialize an OutputCapturer.
 
         :param enabled: Whether output capturing is enabled.
         :param capture_limit: Maximum number of characters to capture.
                               If None, no limit is applied.
+        :param mode: The capture mode, one of CAPTURE_MODES
+                     ("redirect", "context" or "fd").
+        :raises ValueError: If the capture mode is unknown.
         """
+        if mode not in CAPTURE_MODES:
+            modes = ", ".join(repr(x) for x in CAPTURE_MODES)
+            raise ValueError(f"Unknown capture mode {mode!r}, expected one of {modes}")
         self._enabled = enabled
         self._capture_limit = capture_limit
+        self._mode = mode
 
     @property
     def enabled(self) -> bool:
@@ -42,15 +61,24 @@ class OutputCapturer:
         """
         return self._capture_limit
 
+    @property
+    def mode(self) -> str:
+        """
+        Get the capture mode.
+
+        :return: The name of the capture mode.
+        """
+        return self._mode
+
     def capture(self) -> CapturedOutput:
         """
         Create a context manager for capturing output.
 
-        If capturing is enabled, returns a CapturedOutput instance.
+        If capturing is enabled, returns a CapturedOutput instance of the configured mode.
         Otherwise, returns a NoCapturedOutput.
 
         :return: A CapturedOutput instance.
         """
         if self._enabled:
-            return CapturedOutput(self._capture_limit)
+            return CAPTURE_MODES[self._mode](self._capture_limit)
         return NoOpCapturedOutput()
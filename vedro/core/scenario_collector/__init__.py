@@ -1,9 +1,15 @@
 from ._class_based_scenario_provider import ClassBasedScenarioProvider
+from ._lazy_scenario_provider import LazyScenarioProvider
+from ._lazy_template_scenario import LazyTemplateScenario, create_template_vscenarios
+from ._lazy_virtual_scenario import LazyVirtualScenario
 from ._multi_provider_scenario_collector import MultiProviderScenarioCollector
 from ._scenario_collector import ScenarioCollector
 from ._scenario_provider import ScenarioProvider
 from ._scenario_source import ScenarioSource
+from ._static_scenario_parser import StaticScenario, StaticScenarioParser, StaticStep
 
 __all__ = ("ScenarioCollector", "MultiProviderScenarioCollector",
            "ScenarioProvider", "ClassBasedScenarioProvider",
-           "ScenarioSource",)
+           "ScenarioSource", "LazyScenarioProvider", "LazyVirtualScenario",
+           "LazyTemplateScenario", "create_template_vscenarios",
+           "StaticScenarioParser", "StaticScenario", "StaticStep",)
@@ -3,9 +3,10 @@ from inspect import isclass
 from types import ModuleType
 from typing import Any, List, Type
 
-from ..._scenario import Scenario
+from ..._scenario import Scenario, lazy_template_expansion
 from .._virtual_scenario import VirtualScenario
 from ..scenario_discoverer._create_vscenario import create_vscenario
+from ._lazy_template_scenario import create_template_vscenarios
 from ._scenario_provider import ScenarioProvider
 from ._scenario_source import ScenarioSource
 
@@ -20,6 +21,17 @@ class ClassBasedScenarioProvider(ScenarioProvider):
     Vedro's `Scenario` base class within a given Python module.
     """
 
+    def __init__(self, *, lazy_templates: bool = False) -> None:
+        """
+        Initialize the ClassBasedScenarioProvider.
+
+        :param lazy_templates: If True, the module is imported within `lazy_template_expansion`
+                               and `@params` cases are provided as `LazyTemplateScenario`
+                               objects, so a scenario class is built only for the cases
+                               that actually run.
+        """
+        self._lazy_templates = lazy_templates
+
     async def provide(self, source: ScenarioSource) -> List[VirtualScenario]:
         """
         Provide scenarios discovered from the given source module.
@@ -29,10 +41,60 @@ class ClassBasedScenarioProvider(ScenarioProvider):
         """
         if source.path.suffix != ".py":
             return []
-        module = await source.get_module()
+
+        module = await self._load_module(source)
+        if self._lazy_templates:
+            return self._collect_vscenarios(module, source)
+
         scenarios = self._collect_scenarios(module)
         return [create_vscenario(scn, project_dir=source.project_dir) for scn in scenarios]
 
+    async def _load_module(self, source: ScenarioSource) -> ModuleType:
+        """
+        Load the source module, deferring template expansion if enabled.
+
+        :param source: The scenario source to load.
+        :return: The loaded module.
+        """
+        if not self._lazy_templates:
+            return await source.get_module()
+        with lazy_template_expansion():
+            return await source.get_module()
+
+    def _collect_vscenarios(self, module: ModuleType,
+                            source: ScenarioSource) -> List[VirtualScenario]:
+        """
+        Collect virtual scenarios from a module imported with lazy template expansion.
+
+        Cases of lazily expanded templates are provided at the position of the template,
+        in template order, which matches the order of eagerly created scenario classes.
+
+        :param module: The module from which to collect scenarios.
+        :param source: The source the module was loaded from.
+        :return: A list of VirtualScenario objects.
+        """
+        vscenarios: List[VirtualScenario] = []
+        for name, val in module.__dict__.items():
+            if name.startswith("_") or getattr(val, "__module__", None) != module.__name__:
+                continue
+
+            is_template = getattr(val, "__vedro__template_cases__", None) is not None
+            if isclass(val) and issubclass(val, Scenario) and is_template:
+                vscenarios.extend(create_template_vscenarios(val, path=source.path,
+                                                             project_dir=source.project_dir))
+                continue
+
+            template = getattr(val, "__vedro__template__", None)
+            if getattr(template, "__vedro__template_cases__", None) is not None:
+                # Already provided with its template
+                continue
+
+            if self._is_vedro_scenario(val):
+                val.__file__ = os.path.abspath(module.__file__)  # type: ignore
+                vscenarios.append(create_vscenario(val, project_dir=source.project_dir))
+
+        return vscenarios
+
     def _collect_scenarios(self, module: ModuleType) -> List[Type[Scenario]]:
         """
         Collect scenario classes from the specified module.
@@ -0,0 +1,94 @@
+import ast
+from types import ModuleType
+from typing import List, Union
+
+from .._virtual_scenario import VirtualScenario
+from ._class_based_scenario_provider import ClassBasedScenarioProvider
+from ._lazy_virtual_scenario import LazyVirtualScenario
+from ._scenario_source import ScenarioSource
+from ._static_scenario_parser import StaticScenario, StaticScenarioParser
+
+__all__ = ("LazyScenarioProvider",)
+
+
+class LazyScenarioProvider(ClassBasedScenarioProvider):
+    """
+    Provides class-based scenarios without importing their modules during collection.
+
+    Scenario classes, subjects, tags, `@params` cases, `@skip`/`@only` markers and
+    line numbers are extracted from the module syntax tree. The returned scenarios are
+    `LazyVirtualScenario` instances which import the module right before they run,
+    so scenarios filtered out at startup are never imported.
+
+    Modules that can't be analysed statically (e.g. dynamic tags, custom decorators
+    or conditionally declared classes) are imported and collected the same way as
+    `ClassBasedScenarioProvider` does.
+    """
+
+    def __init__(self, *, parser: Union[StaticScenarioParser, None] = None,
+                 lazy_templates: bool = False) -> None:
+        """
+        Initialize the LazyScenarioProvider.
+
+        :param parser: The parser used to extract scenarios from the module syntax tree.
+        :param lazy_templates: If True, `@params` scenario classes are built only
+                               for the cases that actually run.
+        """
+        super().__init__(lazy_templates=lazy_templates)
+        self._parser = parser if (parser is not None) else StaticScenarioParser()
+
+    async def provide(self, source: ScenarioSource) -> List[VirtualScenario]:
+        """
+        Provide scenarios declared in the given source module.
+
+        :param source: The ScenarioSource containing the path and project directory.
+        :return: A list of VirtualScenario objects, lazy whenever possible.
+        """
+        if source.path.suffix != ".py":
+            return []
+
+        static_scenarios = await self._parse(source)
+        if static_scenarios is None:
+            return await super().provide(source)
+
+        scenarios: List[VirtualScenario] = []
+        for static_scenario in static_scenarios:
+            scenarios.extend(self._create_lazy_vscenarios(static_scenario, source))
+        return scenarios
+
+    async def _parse(self, source: ScenarioSource) -> Union[List[StaticScenario], None]:
+        """
+        Extract scenarios from the source without importing it.
+
+        :param source: The scenario source to parse.
+        :return: A list of static scenarios, or None if the module must be imported.
+        """
+        content = await source.get_content()
+        try:
+            tree = ast.parse(content, filename=str(source.path))
+        except SyntaxError:
+            # Importing the module reports the error the usual way
+            return None
+        return self._parser.parse(tree)
+
+    def _create_lazy_vscenarios(self, static_scenario: StaticScenario,
+                                source: ScenarioSource) -> List[LazyVirtualScenario]:
+        """
+        Create lazy virtual scenarios for a static scenario, one per `@params` case.
+
+        :param static_scenario: The statically extracted scenario declaration.
+        :param source: The source the scenario is declared in.
+        :return: A list of LazyVirtualScenario objects.
+        """
+        async def get_module() -> ModuleType:
+            return await self._load_module(source)
+
+        if len(static_scenario.cases) == 0:
+            return [LazyVirtualScenario(static_scenario, get_module,
+                                        path=source.path, project_dir=source.project_dir)]
+
+        return [
+            LazyVirtualScenario(static_scenario, get_module, template_index=idx,
+                                path=source.path, project_dir=source.project_dir)
+            for idx in range(1, len(static_scenario.cases) + 1)
+        ]
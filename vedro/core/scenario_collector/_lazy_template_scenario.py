@@ -0,0 +1,176 @@
+import os
+import sys
+from asyncio import iscoroutinefunction
+from inspect import getdoc
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Type, Union
+
+from niltype import Nil
+
+from ..._scenario import Scenario, TemplateCase, build_template_case
+from .._virtual_scenario import VirtualScenario
+from .._virtual_step import VirtualStep
+from ..scenario_discoverer._create_vscenario import create_vscenario
+from ._lazy_virtual_scenario import LazyVirtualScenario
+from ._static_scenario_parser import StaticScenario, StaticStep
+
+__all__ = ("LazyTemplateScenario", "create_template_vscenarios", "make_static_scenario",)
+
+
+class LazyTemplateScenario(LazyVirtualScenario):
+    """
+    Represents a `@params` case whose scenario class has not been built yet.
+
+    The template was created within `lazy_template_expansion`, so its cases are kept
+    as `TemplateCase` records. The scenario answers from the template class and the case
+    record until `materialize` builds the concrete class right before the case runs.
+    """
+
+    def __init__(self, template: Type[Scenario], case: TemplateCase, *,
+                 path: Path, project_dir: Path,
+                 static_scenario: Optional[StaticScenario] = None,
+                 steps: Optional[List[VirtualStep]] = None) -> None:
+        """
+        Initialize the LazyTemplateScenario instance.
+
+        :param template: The template class created by the `@params` decorated scenario.
+        :param case: The case record of this scenario.
+        :param path: The absolute path to the scenario file.
+        :param project_dir: The project directory path.
+        :param static_scenario: The template description shared by all its cases.
+                                Created from the template if not provided.
+        :param steps: The step methods of the template, which are shared by the cases.
+                      Collected from the template if not provided.
+        """
+        if static_scenario is None:
+            static_scenario = make_static_scenario(template)
+        if steps is None:
+            steps = create_vscenario(template).steps
+        super().__init__(static_scenario, self._get_module, template_index=case.index,
+                         path=path, project_dir=project_dir, steps=steps)
+        self._template = template
+        self._case = case
+        self._template_namespace: Dict[str, Any] = getattr(template,
+                                                           "__vedro__template_namespace__")
+
+    @property
+    def _orig_scenario(self) -> Type[Scenario]:
+        """
+        Get the original scenario class, building it if necessary.
+
+        Building a case doesn't require an import, so the scenario is materialized
+        on first access.
+
+        :return: The scenario class of the case.
+        """
+        if self._materialized is None:
+            return self._bind_scenario(self._build_scenario())
+        return self._materialized
+
+    @_orig_scenario.setter
+    def _orig_scenario(self, value: Union[Type[Scenario], None]) -> None:
+        self._materialized = value
+
+    async def _get_module(self) -> ModuleType:
+        """
+        Get the module in which the template is declared.
+
+        :return: The already imported module.
+        """
+        return sys.modules[self._template.__module__]
+
+    async def _load_scenario(self) -> Type[Scenario]:
+        """
+        Build the scenario class for the case.
+
+        :return: The scenario class of the case.
+        """
+        return self._build_scenario()
+
+    def _build_scenario(self) -> Type[Scenario]:
+        """
+        Build the scenario class for the case.
+
+        :return: The scenario class of the case.
+        """
+        scenario = build_template_case(self._template, self._case)
+        scenario.__file__ = os.path.abspath(self._path)  # type: ignore
+        return scenario
+
+    def _get_static_meta(self, meta_key: str) -> Any:
+        """
+        Get metadata set on the template class (e.g. by class decorators).
+
+        :param meta_key: The plugin-scoped metadata key.
+        :return: The metadata value, or Nil if not set.
+        """
+        return self._template.__vedro__meta__.get(meta_key)  # type: ignore
+
+    def _get_static_attr(self, attr: str, default: Any) -> Any:
+        """
+        Get a legacy attribute declared in the template class body.
+
+        :param attr: The attribute name.
+        :param default: The value to return if the attribute is not declared.
+        :return: The attribute value or the default.
+        """
+        return self._template_namespace.get(attr, default)
+
+
+def make_static_scenario(template: Type[Scenario]) -> StaticScenario:
+    """
+    Describe a lazily expanded template as a static scenario.
+
+    :param template: The template class created within `lazy_template_expansion`.
+    :return: The static scenario shared by all cases of the template.
+    """
+    steps = create_vscenario(template).steps
+    return StaticScenario(
+        getattr(template, "__vedro__template_name__"),
+        getattr(template, "__vedro__lineno__"),
+        doc=getdoc(template),
+        subject=getattr(template, "subject", None),
+        tags=getattr(template, "tags", Nil),
+        steps=tuple(_make_static_step(x._orig_step) for x in steps),
+        cases=tuple(x.bound_args for x in getattr(template, "__vedro__template_cases__")),
+    )
+
+
+def create_template_vscenarios(template: Type[Scenario], *, path: Path,
+                               project_dir: Path) -> List[VirtualScenario]:
+    """
+    Create virtual scenarios for the cases of a lazily expanded template.
+
+    Cases that have already been built (e.g. decorated ones) are wrapped as usual,
+    the rest are provided as `LazyTemplateScenario` objects.
+
+    :param template: The template class created within `lazy_template_expansion`.
+    :param path: The absolute path to the scenario file.
+    :param project_dir: The project directory path.
+    :return: A list of virtual scenarios in template order.
+    """
+    static_scenario = make_static_scenario(template)
+    steps = create_vscenario(template).steps
+
+    vscenarios: List[VirtualScenario] = []
+    for case in getattr(template, "__vedro__template_cases__"):
+        if case.scenario is not None:
+            case.scenario.__file__ = os.path.abspath(path)
+            vscenarios.append(create_vscenario(case.scenario, project_dir=project_dir))
+        else:
+            vscenarios.append(LazyTemplateScenario(template, case, path=path,
+                                                   project_dir=project_dir,
+                                                   static_scenario=static_scenario,
+                                                   steps=list(steps)))
+    return vscenarios
+
+
+def _make_static_step(step: Any) -> StaticStep:
+    """
+    Describe a step method of a template.
+
+    :param step: The step method.
+    :return: The static step.
+    """
+    return StaticStep(step.__name__, getdoc(step), iscoroutinefunction(step))
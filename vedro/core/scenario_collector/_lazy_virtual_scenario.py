@@ -0,0 +1,372 @@
+import os
+from inspect import BoundArguments, isclass
+from pathlib import Path
+from types import ModuleType
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
+
+from niltype import Nil, Nilable, NilType
+
+from ..._scenario import Scenario, build_template_case
+from ..._tags import TagsType
+from .._meta_data import MetaData
+from .._plugin import Plugin
+from .._scenario_meta import _get_meta_key, _validate_key, _validate_plugin
+from .._virtual_scenario import ScenarioInitError, VirtualScenario
+from .._virtual_step import VirtualStep
+from ..scenario_discoverer._create_vscenario import create_vscenario
+from ._static_scenario_parser import StaticScenario, StaticStep
+
+__all__ = ("LazyVirtualScenario", "ModuleGetterType",)
+
+T = TypeVar("T")
+
+ModuleGetterType = Callable[[], Awaitable[ModuleType]]
+
+
+class LazyVirtualScenario(VirtualScenario):
+    """
+    Represents a virtual scenario whose module is imported only when it is about to run.
+
+    Until `materialize` is called, the scenario answers from the statically extracted
+    `StaticScenario` record: name, subject, tags, line number, template index and the
+    `@skip`/`@only` markers. Metadata set by plugins in the meantime is kept aside and
+    transferred to the scenario class once it is imported.
+    """
+
+    def __init__(self, static_scenario: StaticScenario, module_getter: ModuleGetterType, *,
+                 path: Path, project_dir: Path,
+                 template_index: Optional[int] = None,
+                 steps: Optional[List[VirtualStep]] = None) -> None:
+        """
+        Initialize the LazyVirtualScenario instance.
+
+        :param static_scenario: The statically extracted scenario declaration.
+        :param module_getter: A coroutine function returning the imported scenario module.
+        :param path: The absolute path to the scenario file.
+        :param project_dir: The project directory path.
+        :param template_index: The 1-based index of the `@params` case, if any.
+        :param steps: The steps to expose until materialization.
+                      Defaults to placeholders created from the static steps.
+        """
+        self._materialized: Union[Type[Scenario], None] = None
+        if steps is None:
+            steps = [VirtualStep(_make_placeholder_step(x)) for x in static_scenario.steps]
+        super().__init__(cast(Type[Scenario], None), steps, project_dir=project_dir)
+        self._path = path
+        self._static_scenario = static_scenario
+        self._module_getter = module_getter
+        self._template_index = template_index
+        self._pending_meta = MetaData()
+        self._pending_attrs: Dict[str, Any] = {}
+
+    @property
+    def _orig_scenario(self) -> Type[Scenario]:
+        """
+        Get the original scenario class.
+
+        :return: The imported scenario class.
+        :raises RuntimeError: If the scenario has not been materialized yet.
+        """
+        if self._materialized is None:
+            raise RuntimeError(f"Scenario '{self.unique_id}' is not materialized yet, "
+                               "call `await scenario.materialize()` first")
+        return self._materialized
+
+    @_orig_scenario.setter
+    def _orig_scenario(self, value: Union[Type[Scenario], None]) -> None:
+        self._materialized = value
+
+    def is_materialized(self) -> bool:
+        """
+        Check if the scenario module has been imported.
+
+        :return: True if the original scenario class is available, False otherwise.
+        """
+        return self._materialized is not None
+
+    async def materialize(self) -> Type[Scenario]:
+        """
+        Import the scenario module and bind the original scenario class.
+
+        Steps are replaced with the real methods and any metadata set before
+        the import is transferred to the scenario class. Repeated calls are no-ops.
+
+        :return: The original scenario class.
+        :raises ScenarioInitError: If the module does not define the expected scenario.
+        """
+        if self._materialized is not None:
+            return self._materialized
+
+        scenario = await self._load_scenario()
+        return self._bind_scenario(scenario)
+
+    def _bind_scenario(self, scenario: Type[Scenario]) -> Type[Scenario]:
+        """
+        Bind the original scenario class and transfer the pending metadata to it.
+
+        :param scenario: The original scenario class.
+        :return: The original scenario class.
+        """
+        for key, value in self._pending_meta.items():
+            scenario.__vedro__meta__._set(key, value)  # type: ignore
+        for attr, value in self._pending_attrs.items():
+            setattr(scenario, attr, value)
+
+        self._steps[:] = create_vscenario(scenario).steps
+        self._materialized = scenario
+        return scenario
+
+    async def _load_scenario(self) -> Type[Scenario]:
+        """
+        Import the scenario module and look up the original scenario class.
+
+        :return: The original scenario class.
+        :raises ScenarioInitError: If the module does not define the expected scenario.
+        """
+        module = await self._module_getter()
+
+        name = self._static_scenario.name
+        scenario = module.__dict__.get(name)
+        if self._template_index is not None:
+            cases = getattr(scenario, "__vedro__template_cases__", None)
+            if cases is not None:
+                # The template was expanded lazily (see `lazy_template_expansion`)
+                scenario = build_template_case(cast(Type[Scenario], scenario),
+                                               cases[self._template_index - 1])
+            else:
+                # Logic adapted from the `_Meta` class in vedro/_scenario.py
+                name = f"{name}_{self._template_index}_VedroScenario"
+                scenario = module.__dict__.get(name)
+
+        if not (isclass(scenario) and issubclass(scenario, Scenario)):
+            message = f'Can\'t materialize scenario "{name}" at "{self.rel_path}"'
+            raise ScenarioInitError(message)
+        scenario.__file__ = os.path.abspath(module.__file__ or self._path)  # type: ignore
+        return scenario
+
+    @property
+    def doc(self) -> Optional[str]:
+        """
+        Get the docstring of the original scenario.
+
+        :return: The docstring of the original scenario or None if not available.
+        """
+        if self._materialized is not None:
+            return super().doc
+        return self._static_scenario.doc
+
+    @property
+    def template_index(self) -> Union[int, None]:
+        """
+        Get the template index of the current scenario in the templated scenario.
+
+        :return: An integer representing the template index, or None if not applicable.
+        """
+        return self._template_index
+
+    @property
+    def template_total(self) -> Union[int, None]:
+        """
+        Get the total number of scenarios in the templated scenario.
+
+        :return: An integer representing the total number of scenarios, or None if not applicable.
+        """
+        if self._template_index is None:
+            return None
+        return len(self._static_scenario.cases)
+
+    @property
+    def template_args(self) -> Union[BoundArguments, None]:
+        """
+        Get the bound arguments for the templated scenario.
+
+        Before materialization, only literal arguments are known statically;
+        None is returned otherwise.
+
+        :return: A BoundArguments object representing the template arguments,
+                 or None if not applicable.
+        """
+        if self._materialized is not None:
+            return super().template_args
+        if self._template_index is None:
+            return None
+        return self._static_scenario.cases[self._template_index - 1]
+
+    @property
+    def name(self) -> str:
+        """
+        Get the name of the scenario.
+
+        :return: A string representing the name of the scenario.
+        """
+        return self._static_scenario.name
+
+    @property
+    def subject(self) -> str:
+        """
+        Get the subject of the scenario.
+
+        :return: A string representing the subject of the scenario.
+        """
+        if self._materialized is not None:
+            return super().subject
+
+        subject: Any = self._static_scenario.subject
+        if not isinstance(subject, str) or subject.strip() == "":
+            subject = self._path.stem.replace("_", " ")
+
+        template_args = self.template_args
+        if not template_args:
+            return cast(str, subject)
+
+        try:
+            return cast(str, subject.format(**template_args.arguments))
+        except Exception as exc:
+            message = f'Can\'t format subject "{subject}" at "{self.rel_path}" ({exc})'
+            raise ValueError(message) from None
+
+    @property
+    def lineno(self) -> Union[int, None]:
+        """
+        Get the line number where the scenario class is defined.
+
+        :return: An integer representing the line number.
+        """
+        return self._static_scenario.lineno
+
+    @property
+    def tags(self) -> TagsType:
+        """
+        Get the tags associated with the scenario.
+
+        :return: A collection of tags associated with the scenario.
+        """
+        if self._materialized is not None:
+            return super().tags
+        tags = self._static_scenario.tags
+        return cast(TagsType, () if tags is Nil else tags)
+
+    def set_meta(self, key: str, value: Any, *, plugin: Plugin,
+                 fallback_key: Optional[str] = None) -> None:
+        """
+        Set metadata for the associated scenario.
+
+        Metadata set before materialization is kept aside and transferred
+        to the scenario class by `materialize`.
+
+        :param key: The metadata key to set. Must be a valid Python identifier.
+        :param value: The metadata value to set.
+        :param plugin: The plugin instance to scope the metadata under.
+        :param fallback_key: Optional. A fallback attribute name for backward compatibility.
+        """
+        if self._materialized is not None:
+            return super().set_meta(key, value, plugin=plugin, fallback_key=fallback_key)
+
+        _validate_key(key) and _validate_plugin(plugin)
+        self._pending_meta._set(_get_meta_key(plugin, key), value)
+        if fallback_key is not None:
+            self._pending_attrs[fallback_key] = value
+
+    @overload
+    def get_meta(self, key: str, *, plugin: Plugin, default: T,
+                 fallback_key: Optional[str] = None) -> T:  # pragma: no cover
+        ...  # When default is provided, return T
+
+    @overload
+    def get_meta(self, key: str, *, plugin: Plugin, default: NilType = Nil,
+                 fallback_key: Optional[str] = None) -> NilType:  # pragma: no cover
+        ...  # When default is not provided, return NilType
+
+    def get_meta(self, key: str, *, plugin: Plugin, default: Nilable[T] = Nil,
+                 fallback_key: Optional[str] = None) -> Union[T, NilType]:
+        """
+        Retrieve metadata for the associated scenario.
+
+        Before materialization, the `@skip` and `@only` markers extracted statically
+        are available through their fallback keys.
+
+        :param key: The metadata key to retrieve. Must be a valid Python identifier.
+        :param plugin: The plugin instance the metadata is scoped under.
+        :param default: The default value to return if the metadata is not found.
+        :param fallback_key: Optional. A fallback attribute name for backward compatibility.
+        :return: The metadata value if found, or the default if not found.
+        """
+        if self._materialized is not None:
+            return super().get_meta(key, plugin=plugin, default=default,
+                                    fallback_key=fallback_key)
+
+        _validate_key(key) and _validate_plugin(plugin)
+        meta_key = _get_meta_key(plugin, key)
+        meta_val = self._pending_meta.get(meta_key)
+        if meta_val is Nil:
+            meta_val = self._get_static_meta(meta_key)
+        if meta_val is not Nil:
+            return cast(T, meta_val)
+
+        if fallback_key is not None:
+            if fallback_key in self._pending_attrs:
+                return cast(T, self._pending_attrs[fallback_key])
+            return cast(Union[T, NilType], self._get_static_attr(fallback_key, default))
+
+        return default
+
+    def _get_static_meta(self, meta_key: str) -> Any:
+        """
+        Get metadata known before materialization.
+
+        :param meta_key: The plugin-scoped metadata key.
+        :return: The metadata value, or Nil if not known.
+        """
+        return Nil
+
+    def _get_static_attr(self, attr: str, default: Any) -> Any:
+        """
+        Get a legacy scenario attribute known before materialization.
+
+        :param attr: The attribute name.
+        :param default: The value to return if the attribute is not known.
+        :return: The attribute value or the default.
+        """
+        # Legacy attributes set by the @skip and @only decorators
+        attrs: Dict[str, Any] = {}
+        if self._static_scenario.skipped:
+            attrs["__vedro__skipped__"] = True
+        if self._static_scenario.skip_reason is not None:
+            attrs["__vedro__skip_reason__"] = self._static_scenario.skip_reason
+        if self._static_scenario.only:
+            attrs["__vedro__only__"] = True
+        return attrs.get(attr, default)
+
+
+def _make_placeholder_step(static_step: StaticStep) -> Callable[..., Any]:
+    """
+    Create a stand-in for a step method that has not been imported yet.
+
+    :param static_step: The statically extracted step.
+    :return: A function with the same name, docstring and coroutine flag.
+    """
+    def _raise(*args: Any, **kwargs: Any) -> None:
+        raise RuntimeError(f"Step '{static_step.name}' is not materialized yet")
+
+    if static_step.is_coro:
+        async def step(*args: Any, **kwargs: Any) -> None:
+            _raise()
+    else:
+        def step(*args: Any, **kwargs: Any) -> None:  # type: ignore
+            _raise()
+
+    step.__name__ = step.__qualname__ = static_step.name
+    step.__doc__ = static_step.doc
+    return step
@@ -4,6 +4,7 @@ from types import ModuleType
 from typing import Any, Union
 
 from ..module_loader import ModuleLoader
+from ..startup_profiler import get_startup_profiler
 
 __all__ = ("ScenarioSource",)
 
@@ -64,13 +65,19 @@ class ScenarioSource:
         Load and return the module corresponding to the scenario file.
 
         The module is cached after the first load and protected by an asynchronous lock.
+        If startup is being profiled, the load is recorded as an "import" span.
 
         :return: The loaded module object.
         :raises ModuleNotFoundError: If the module cannot be found or loaded.
         """
         async with self._lock:
             if self._module is None:
-                self._module = await self._module_loader.load(self.rel_path)
+                profiler = get_startup_profiler()
+                if profiler is None:
+                    self._module = await self._module_loader.load(self.rel_path)
+                else:
+                    with profiler.span(str(self.rel_path), "import"):
+                        self._module = await self._module_loader.load(self.rel_path)
         return self._module
 
     async def get_content(self) -> str:
@@ -0,0 +1,311 @@
+import ast
+from inspect import BoundArguments, Parameter, Signature
+from typing import Any, Dict, List, Tuple, Union
+
+from niltype import Nil, Nilable
+
+__all__ = ("StaticScenarioParser", "StaticScenario", "StaticStep",)
+
+
+class StaticStep:
+    """
+    Represents a scenario step discovered by static analysis.
+    """
+
+    def __init__(self, name: str, doc: Union[str, None], is_coro: bool) -> None:
+        """
+        Initialize the StaticStep instance.
+
+        :param name: The name of the step method.
+        :param doc: The cleaned docstring of the step method, if any.
+        :param is_coro: Whether the step method is declared with `async def`.
+        """
+        self.name = name
+        self.doc = doc
+        self.is_coro = is_coro
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name!r})"
+
+
+class StaticScenario:
+    """
+    Represents a scenario class discovered by static analysis of a module.
+
+    Contains everything needed to select, order and report the scenario
+    without importing the module in which it is defined.
+    """
+
+    def __init__(self, name: str, lineno: int, *,
+                 doc: Union[str, None] = None,
+                 subject: Any = None,
+                 tags: Nilable[Any] = Nil,
+                 steps: Tuple[StaticStep, ...] = (),
+                 cases: Tuple[Union[BoundArguments, None], ...] = (),
+                 skipped: bool = False,
+                 skip_reason: Union[str, None] = None,
+                 only: bool = False) -> None:
+        """
+        Initialize the StaticScenario instance.
+
+        :param name: The name of the scenario class.
+        :param lineno: The line number of the class definition.
+        :param doc: The cleaned class docstring, if any.
+        :param subject: The literal value assigned to `subject`, or None if absent.
+        :param tags: The literal value assigned to `tags`, or Nil if absent.
+        :param steps: The steps of the scenario in definition order.
+        :param cases: The bound arguments of each `@params` case in template order.
+                      An item is None if the case arguments are not literals.
+        :param skipped: Whether the class is decorated with `@skip`.
+        :param skip_reason: The reason passed to `@skip`, if any.
+        :param only: Whether the class is decorated with `@only`.
+        """
+        self.name = name
+        self.lineno = lineno
+        self.doc = doc
+        self.subject = subject
+        self.tags = tags
+        self.steps = steps
+        self.cases = cases
+        self.skipped = skipped
+        self.skip_reason = skip_reason
+        self.only = only
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name!r}, lineno={self.lineno})"
+
+
+class _Unsupported(Exception):
+    pass
+
+
+class StaticScenarioParser:
+    """
+    Extracts class-based scenarios from a module syntax tree without executing it.
+
+    The parser understands the declarative subset of scenario modules: scenario classes
+    inheriting directly from `vedro.Scenario`, literal `subject` and `tags`, `@params`
+    on `__init__` and `@skip`/`@only` on the class. Whenever a module uses a construct
+    whose outcome is only known at runtime, `parse` returns None and the caller is
+    expected to import the module instead.
+    """
+
+    def parse(self, tree: ast.Module) -> Union[List[StaticScenario], None]:
+        """
+        Parse the module syntax tree into a list of static scenarios.
+
+        :param tree: The parsed module.
+        :return: The scenarios in definition order, or None if the module can't be
+                 analysed statically.
+        """
+        try:
+            return self._parse_module(tree)
+        except _Unsupported:
+            return None
+
+    def _parse_module(self, tree: ast.Module) -> List[StaticScenario]:
+        aliases = self._collect_aliases(tree)
+
+        scenarios: Dict[str, StaticScenario] = {}
+        bound_names = set()
+        for stmt in tree.body:
+            if isinstance(stmt, ast.ClassDef):
+                if stmt.name in scenarios:
+                    raise _Unsupported()
+                scenario = self._parse_class(stmt, aliases)
+                if scenario is not None:
+                    scenarios[stmt.name] = scenario
+                else:
+                    bound_names.add(stmt.name)
+            elif isinstance(stmt, (ast.Import, ast.ImportFrom)):
+                bound_names.update((x.asname or x.name).split(".")[0] for x in stmt.names)
+            elif isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                bound_names.add(stmt.name)
+            elif isinstance(stmt, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+                targets = stmt.targets if isinstance(stmt, ast.Assign) else [stmt.target]
+                for target in targets:
+                    bound_names.update(x.id for x in ast.walk(target) if isinstance(x, ast.Name))
+            elif isinstance(stmt, ast.Expr):
+                continue
+            elif any(isinstance(x, ast.ClassDef) for x in ast.walk(stmt)):
+                # Classes declared conditionally or in loops
+                raise _Unsupported()
+
+        if bound_names.intersection(scenarios):
+            raise _Unsupported()
+
+        return [scn for name, scn in scenarios.items() if not name.startswith("_")]
+
+    def _collect_aliases(self, tree: ast.Module) -> Dict[str, str]:
+        aliases = {}
+        for stmt in tree.body:
+            if isinstance(stmt, ast.Import):
+                for alias in stmt.names:
+                    if alias.name == "vedro":
+                        aliases[alias.asname or alias.name] = "vedro"
+            elif isinstance(stmt, ast.ImportFrom) and (stmt.level == 0) and stmt.module:
+                if stmt.module == "vedro" or stmt.module.startswith("vedro."):
+                    for alias in stmt.names:
+                        aliases[alias.asname or alias.name] = f"vedro.{alias.name}"
+        return aliases
+
+    def _resolve(self, node: ast.expr, aliases: Dict[str, str]) -> Union[str, None]:
+        if isinstance(node, ast.Name):
+            return aliases.get(node.id)
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+            if aliases.get(node.value.id) == "vedro":
+                return f"vedro.{node.attr}"
+        return None
+
+    def _is_scenario_like_name(self, name: str) -> bool:
+        return name.startswith("Scenario") or name.endswith("Scenario")
+
+    def _parse_class(self, node: ast.ClassDef,
+                     aliases: Dict[str, str]) -> Union[StaticScenario, None]:
+        bases = [self._resolve(base, aliases) for base in node.bases]
+        is_scenario = (bases == ["vedro.Scenario"]) and (len(node.keywords) == 0)
+        if not is_scenario:
+            if ("vedro.Scenario" in bases) or self._is_scenario_like_name(node.name):
+                # Either an invalid declaration or a base class we can't resolve;
+                # importing the module reports the former and handles the latter
+                raise _Unsupported()
+            return None
+
+        scenario = StaticScenario(node.name, node.lineno, doc=ast.get_docstring(node))
+        self._parse_class_decorators(node, scenario, aliases)
+
+        steps: Dict[str, StaticStep] = {}
+        init: Union[ast.FunctionDef, ast.AsyncFunctionDef, None] = None
+        for stmt in node.body:
+            if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                if stmt.name == "__init__":
+                    init = stmt
+                elif not stmt.name.startswith("_"):
+                    if len(stmt.decorator_list) > 0:
+                        raise _Unsupported()
+                    is_coro = isinstance(stmt, ast.AsyncFunctionDef)
+                    steps[stmt.name] = StaticStep(stmt.name, ast.get_docstring(stmt), is_coro)
+            elif isinstance(stmt, (ast.Assign, ast.AnnAssign)):
+                self._parse_class_attr(stmt, scenario)
+            elif not isinstance(stmt, (ast.Expr, ast.Pass, ast.ClassDef)):
+                raise _Unsupported()
+
+        scenario.steps = tuple(steps.values())
+        if init is not None:
+            scenario.cases = self._parse_cases(init, aliases)
+
+        if len(scenario.cases) > 0 and isinstance(scenario.subject, str):
+            if ("{" in scenario.subject) or ("}" in scenario.subject):
+                # Subject must be formatted with arguments
+                for case in scenario.cases:
+                    if case is None:
+                        raise _Unsupported()
+                    try:
+                        scenario.subject.format(**case.arguments)
+                    except Exception:
+                        raise _Unsupported()
+
+        return scenario
+
+    def _parse_class_decorators(self, node: ast.ClassDef, scenario: StaticScenario,
+                                aliases: Dict[str, str]) -> None:
+        for decorator in node.decorator_list:
+            args: List[ast.expr] = []
+            if isinstance(decorator, ast.Call):
+                if len(decorator.keywords) > 0:
+                    raise _Unsupported()
+                args = decorator.args
+                decorator = decorator.func
+
+            name = self._resolve(decorator, aliases)
+            if name == "vedro.skip" and len(args) <= 1:
+                scenario.skipped = True
+                if len(args) == 1:
+                    reason = args[0]
+                    if not (isinstance(reason, ast.Constant) and isinstance(reason.value, str)):
+                        raise _Unsupported()
+                    scenario.skip_reason = reason.value
+            elif name == "vedro.only" and len(args) == 0:
+                scenario.only = True
+            else:
+                raise _Unsupported()
+
+    def _parse_class_attr(self, stmt: Union[ast.Assign, ast.AnnAssign],
+                          scenario: StaticScenario) -> None:
+        targets = stmt.targets if isinstance(stmt, ast.Assign) else [stmt.target]
+        if len(targets) != 1 or not isinstance(targets[0], ast.Name):
+            raise _Unsupported()
+        name = targets[0].id
+        if stmt.value is None:
+            return
+
+        try:
+            value = ast.literal_eval(stmt.value)
+        except Exception:
+            if name.startswith("_"):
+                return
+            # A non-literal public attribute may turn out to be a step
+            raise _Unsupported()
+
+        if name == "subject":
+            scenario.subject = value
+        elif name == "tags":
+            scenario.tags = value
+
+    def _parse_cases(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+                     aliases: Dict[str, str]) -> Tuple[Union[BoundArguments, None], ...]:
+        calls = []
+        for decorator in node.decorator_list:
+            if not isinstance(decorator, ast.Call):
+                raise _Unsupported()
+            if self._resolve(decorator.func, aliases) != "vedro.params":
+                raise _Unsupported()
+            calls.append(decorator)
+
+        signature = self._build_signature(node.args)
+        # Decorators are applied bottom-up, the metaclass enumerates them top-down
+        return tuple(self._bind_case(call, signature) for call in calls)
+
+    def _build_signature(self, arguments: ast.arguments) -> Union[Signature, None]:
+        params: List[Parameter] = []
+        positional = [*arguments.posonlyargs, *arguments.args]
+        defaults: List[Any] = [Parameter.empty] * (len(positional) - len(arguments.defaults))
+        try:
+            defaults += [ast.literal_eval(x) for x in arguments.defaults]
+            kw_defaults = [Parameter.empty if x is None else ast.literal_eval(x)
+                           for x in arguments.kw_defaults]
+        except Exception:
+            return None
+
+        for idx, (arg, default) in enumerate(zip(positional, defaults)):
+            kind = Parameter.POSITIONAL_ONLY if idx < len(arguments.posonlyargs) \
+                else Parameter.POSITIONAL_OR_KEYWORD
+            params.append(Parameter(arg.arg, kind, default=default))
+        if arguments.vararg:
+            params.append(Parameter(arguments.vararg.arg, Parameter.VAR_POSITIONAL))
+        for arg, default in zip(arguments.kwonlyargs, kw_defaults):
+            params.append(Parameter(arg.arg, Parameter.KEYWORD_ONLY, default=default))
+        if arguments.kwarg:
+            params.append(Parameter(arguments.kwarg.arg, Parameter.VAR_KEYWORD))
+        return Signature(params)
+
+    def _bind_case(self, call: ast.Call,
+                   signature: Union[Signature, None]) -> Union[BoundArguments, None]:
+        if signature is None:
+            return None
+        if any(isinstance(x, ast.Starred) for x in call.args) or \
+           any(x.arg is None for x in call.keywords):
+            return None
+        try:
+            args = [ast.literal_eval(x) for x in call.args]
+            kwargs = {str(x.arg): ast.literal_eval(x.value) for x in call.keywords}
+        except Exception:
+            return None
+
+        try:
+            bound_args = signature.bind(None, *args, **kwargs)
+        except TypeError:
+            # Let the import report the error
+            raise _Unsupported()
+        bound_args.apply_defaults()
+        return bound_args
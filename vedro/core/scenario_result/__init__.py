@@ -1,5 +1,7 @@
 from ._aggregated_result import AggregatedResult
 from ._scenario_result import ScenarioResult
+from ._scenario_result_serializer import RemoteError, ScenarioResultSerializer
 from ._scenario_status import ScenarioStatus
 
-__all__ = ("ScenarioResult", "AggregatedResult", "ScenarioStatus",)
+__all__ = ("ScenarioResult", "AggregatedResult", "ScenarioStatus", "ScenarioResultSerializer",
+           "RemoteError",)
@@ -0,0 +1,310 @@
+from base64 import b64decode, b64encode
+from pathlib import Path
+from traceback import format_exception
+from types import TracebackType
+from typing import Any, Dict, Optional, Tuple, Type, cast
+
+from vedro.core._artifacts import Artifact, FileArtifact, MemoryArtifact, StreamArtifact
+from vedro.core._exc_info import ExcInfo
+from vedro.core._step_result import StepResult, StepStatus
+from vedro.core._virtual_scenario import VirtualScenario
+from vedro.core._virtual_step import VirtualStep
+from vedro.core.output_capturer import CapturedOutput
+
+from ._scenario_result import ScenarioResult
+from ._scenario_status import ScenarioStatus
+
+__all__ = ("ScenarioResultSerializer", "RemoteError",)
+
+SerializedType = Dict[str, Any]
+
+
+class RemoteError(Exception):
+    """
+    Represents an exception raised in another process.
+
+    Exceptions and tracebacks can't be transferred between processes, so a deserialized
+    exception is an instance of a RemoteError subclass named after the original type.
+    The formatted original traceback is available as `remote_traceback`.
+    """
+
+    def __init__(self, message: str, remote_traceback: str = "") -> None:
+        """
+        Initialize the RemoteError.
+
+        :param message: The message of the original exception.
+        :param remote_traceback: The formatted traceback of the original exception.
+        """
+        super().__init__(message)
+        self.message = message
+        self.remote_traceback = remote_traceback
+
+    def __str__(self) -> str:
+        return self.message
+
+
+class ScenarioResultSerializer:
+    """
+    Converts scenario results to JSON-compatible dictionaries and back.
+
+    Serialized results are used to pass results between processes (e.g. from workers
+    to a coordinator). Step results, timings, captured output, artifacts and exceptions
+    are preserved, while scope and extra details are not: scope values are arbitrary
+    objects, and extra details are added by plugins on the receiving side.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the ScenarioResultSerializer.
+        """
+        self._error_types: Dict[Tuple[str, str], Type[RemoteError]] = {}
+
+    def serialize(self, scenario_result: ScenarioResult) -> SerializedType:
+        """
+        Serialize a scenario result.
+
+        :param scenario_result: The scenario result to serialize.
+        :return: A JSON-compatible dictionary.
+        """
+        return {
+            "unique_id": scenario_result.scenario.unique_id,
+            "status": scenario_result.status.value,
+            "started_at": scenario_result.started_at,
+            "ended_at": scenario_result.ended_at,
+            "step_results": [self.serialize_step(x) for x in scenario_result.step_results],
+            "captured_output": self._serialize_captured_output(scenario_result.captured_output),
+            "artifacts": [self._serialize_artifact(x) for x in scenario_result.artifacts],
+        }
+
+    def serialize_step(self, step_result: StepResult) -> SerializedType:
+        """
+        Serialize a step result.
+
+        :param step_result: The step result to serialize.
+        :return: A JSON-compatible dictionary.
+        """
+        return {
+            "name": step_result.step_name,
+            "status": step_result.status.value,
+            "started_at": step_result.started_at,
+            "ended_at": step_result.ended_at,
+            "exc_info": self.serialize_exc_info(step_result.exc_info),
+            "captured_output": self._serialize_captured_output(step_result.captured_output),
+            "artifacts": [self._serialize_artifact(x) for x in step_result.artifacts],
+        }
+
+    def deserialize(self, data: SerializedType, scenario: VirtualScenario) -> ScenarioResult:
+        """
+        Deserialize a scenario result.
+
+        :param data: The dictionary produced by `serialize`.
+        :param scenario: The virtual scenario the result belongs to.
+        :return: The restored scenario result.
+        """
+        scenario_result = ScenarioResult(scenario)
+        scenario_result.set_scope({})
+        for step_data in data["step_results"]:
+            scenario_result.add_step_result(self.deserialize_step(step_data, scenario))
+        self.load(data, scenario_result)
+        return scenario_result
+
+    def load(self, data: SerializedType, scenario_result: ScenarioResult) -> ScenarioResult:
+        """
+        Apply the status, timings, output and artifacts of a serialized result.
+
+        Step results are not loaded, which allows replaying them one by one.
+
+        :param data: The dictionary produced by `serialize`.
+        :param scenario_result: The pending scenario result to update.
+        :return: The updated scenario result.
+        """
+        if data["started_at"] is not None:
+            scenario_result.set_started_at(data["started_at"])
+        if data["ended_at"] is not None:
+            scenario_result.set_ended_at(data["ended_at"])
+
+        status = ScenarioStatus(data["status"])
+        if status == ScenarioStatus.PASSED:
+            scenario_result.mark_passed()
+        elif status == ScenarioStatus.FAILED:
+            scenario_result.mark_failed()
+        elif status == ScenarioStatus.SKIPPED:
+            scenario_result.mark_skipped()
+
+        captured_output = self._deserialize_captured_output(data["captured_output"])
+        if captured_output is not None:
+            scenario_result.set_captured_output(captured_output)
+        for artifact in data["artifacts"]:
+            scenario_result.attach(self._deserialize_artifact(artifact))
+        return scenario_result
+
+    def deserialize_step(self, data: SerializedType, scenario: VirtualScenario) -> StepResult:
+        """
+        Deserialize a step result.
+
+        The step is looked up in the scenario by name. Steps that are not declared
+        in the scenario (e.g. recorded steps of function-based scenarios) are created.
+
+        :param data: The dictionary produced by `serialize_step`.
+        :param scenario: The virtual scenario the step belongs to.
+        :return: The restored step result.
+        """
+        step_result = StepResult(self._get_step(data["name"], scenario))
+        if data["started_at"] is not None:
+            step_result.set_started_at(data["started_at"])
+        if data["ended_at"] is not None:
+            step_result.set_ended_at(data["ended_at"])
+
+        status = StepStatus(data["status"])
+        if status == StepStatus.PASSED:
+            step_result.mark_passed()
+        elif status == StepStatus.FAILED:
+            step_result.mark_failed()
+
+        exc_info = self.deserialize_exc_info(data["exc_info"])
+        if exc_info is not None:
+            step_result.set_exc_info(exc_info)
+        captured_output = self._deserialize_captured_output(data["captured_output"])
+        if captured_output is not None:
+            step_result.set_captured_output(captured_output)
+        for artifact in data["artifacts"]:
+            step_result.attach(self._deserialize_artifact(artifact))
+        return step_result
+
+    def _get_step(self, name: str, scenario: VirtualScenario) -> VirtualStep:
+        """
+        Find a step of the scenario by name, or create a step with that name.
+
+        :param name: The step name.
+        :param scenario: The virtual scenario.
+        :return: The virtual step.
+        """
+        for step in scenario.steps:
+            if step.name == name:
+                return step
+
+        def step_wrapper(*args: Any, **kwargs: Any) -> None:
+            pass  # pragma: no cover
+
+        step_wrapper.__name__ = name
+        return VirtualStep(step_wrapper)
+
+    def serialize_exc_info(self, exc_info: Optional[ExcInfo]) -> Optional[SerializedType]:
+        """
+        Serialize exception information.
+
+        :param exc_info: The exception information, or None.
+        :return: A dictionary with the exception type, message and formatted traceback.
+        """
+        if exc_info is None:
+            return None
+        if exc_info.snapshot is not None:
+            formatted = exc_info.snapshot.format(exc_info.type, exc_info.value)
+        else:
+            formatted = format_exception(exc_info.type, exc_info.value, exc_info.traceback)
+        return {
+            "module": exc_info.type.__module__,
+            "name": exc_info.type.__qualname__,
+            "message": str(exc_info.value),
+            "traceback": "".join(formatted),
+        }
+
+    def deserialize_exc_info(self, data: Optional[SerializedType]) -> Optional[ExcInfo]:
+        """
+        Deserialize exception information into a RemoteError.
+
+        :param data: The dictionary produced by `serialize_exc_info`, or None.
+        :return: The exception information, or None.
+        """
+        if data is None:
+            return None
+        error_type = self._get_error_type(data["module"], data["name"])
+        error = error_type(data["message"], data["traceback"])
+        # The original traceback can't be restored, it's kept as text in the exception
+        return ExcInfo(error_type, error, cast(TracebackType, None))
+
+    def _get_error_type(self, module: str, name: str) -> Type[RemoteError]:
+        """
+        Get a RemoteError subclass named after the original exception type.
+
+        :param module: The module of the original exception type.
+        :param name: The qualified name of the original exception type.
+        :return: The RemoteError subclass.
+        """
+        key = (module, name)
+        if key not in self._error_types:
+            error_type = type(name.rsplit(".", 1)[-1], (RemoteError,), {"__module__": module})
+            error_type.__qualname__ = name
+            self._error_types[key] = error_type
+        return self._error_types[key]
+
+    def _serialize_captured_output(self,
+                                   captured_output: Optional[CapturedOutput]
+                                   ) -> Optional[SerializedType]:
+        """
+        Serialize captured output.
+
+        :param captured_output: The captured output, or None.
+        :return: A dictionary with stdout and stderr, or None.
+        """
+        if captured_output is None:
+            return None
+        return {
+            "stdout": captured_output.stdout.get_value(),
+            "stderr": captured_output.stderr.get_value(),
+        }
+
+    def _deserialize_captured_output(self,
+                                     data: Optional[SerializedType]) -> Optional[CapturedOutput]:
+        """
+        Deserialize captured output.
+
+        :param data: The dictionary produced by `_serialize_captured_output`, or None.
+        :return: The captured output, or None.
+        """
+        if data is None:
+            return None
+        captured_output = CapturedOutput()
+        captured_output._stdout_buffer.write(data["stdout"])
+        captured_output._stderr_buffer.write(data["stderr"])
+        return captured_output
+
+    def _serialize_artifact(self, artifact: Artifact) -> SerializedType:
+        """
+        Serialize an artifact.
+
+        Memory artifacts are transferred with their data, file artifacts by path.
+        Stream artifacts can't be replayed, so once saved they are transferred
+        as file artifacts pointing to the saved file.
+
+        :param artifact: The artifact to serialize.
+        :return: A JSON-compatible dictionary.
+        :raises TypeError: If the artifact type is not supported.
+        """
+        if isinstance(artifact, MemoryArtifact):
+            return {"type": "memory", "name": artifact.name, "mime_type": artifact.mime_type,
+                    "data": b64encode(artifact.data).decode()}
+        elif isinstance(artifact, FileArtifact):
+            return {"type": "file", "name": artifact.name, "mime_type": artifact.mime_type,
+                    "path": str(artifact.path)}
+        elif isinstance(artifact, StreamArtifact) and (artifact.saved_path is not None):
+            return {"type": "file", "name": artifact.name, "mime_type": artifact.mime_type,
+                    "path": str(artifact.saved_path)}
+        raise TypeError(f"Can't serialize artifact {artifact!r}")
+
+    def _deserialize_artifact(self, data: SerializedType) -> Artifact:
+        """
+        Deserialize an artifact.
+
+        :param data: The dictionary produced by `_serialize_artifact`.
+        :return: The restored artifact.
+        :raises ValueError: If the artifact type is unknown.
+        """
+        if data["type"] == "memory":
+            return MemoryArtifact(data["name"], data["mime_type"], b64decode(data["data"]))
+        elif data["type"] == "file":
+            return FileArtifact(data["name"], data["mime_type"], Path(data["path"]))
+        raise ValueError(f"Unknown artifact type {data['type']!r}")
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
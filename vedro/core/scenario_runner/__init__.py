@@ -1,6 +1,8 @@
 from ._interrupted import Interrupted, RunInterrupted, ScenarioInterrupted, StepInterrupted
 from ._monotonic_scenario_runner import MonotonicScenarioRunner
+from ._scenario_result_replayer import ScenarioResultReplayer
 from ._scenario_runner import ScenarioRunner
 
 __all__ = ("ScenarioRunner", "MonotonicScenarioRunner",
-           "Interrupted", "StepInterrupted", "ScenarioInterrupted", "RunInterrupted",)
+           "Interrupted", "StepInterrupted", "ScenarioInterrupted", "RunInterrupted",
+           "ScenarioResultReplayer",)
@@ -1,7 +1,9 @@
 import os
 import sys
+from functools import partial
 from time import time
-from typing import Any, List, Optional, Tuple, Type, cast
+from typing import Any, Dict, List, Optional, Tuple, Type, cast
+from weakref import WeakKeyDictionary
 
 from vedro.plugins.functioner._step_recorder import StepRecorder, get_step_recorder
 
@@ -20,10 +22,12 @@ from ...events import (
 from .._dispatcher import Dispatcher
 from .._exc_info import ExcInfo
 from .._report import Report
+from .._run_in_executor import run_in_executor
 from .._step_result import StepResult
 from .._virtual_scenario import VirtualScenario
 from .._virtual_step import VirtualStep
 from ..output_capturer import CapturedOutput, OutputCapturer
+from ..scenario_collector import LazyVirtualScenario
 from ..scenario_result import ScenarioResult
 from ..scenario_scheduler import ScenarioScheduler
 from ._interrupted import Interrupted, RunInterrupted, ScenarioInterrupted, StepInterrupted
@@ -42,16 +46,23 @@ class MonotonicScenarioRunner(ScenarioRunner):
 
     def __init__(self, dispatcher: Dispatcher, *,
                  interrupt_exceptions: Tuple[Type[BaseException], ...] = (),
-                 step_recorder: Optional[StepRecorder] = None) -> None:
+                 step_recorder: Optional[StepRecorder] = None,
+                 snapshot_tracebacks: bool = False) -> None:
         """
         Initialize the MonotonicScenarioRunner.
 
         :param dispatcher: The event dispatcher for firing execution events.
         :param interrupt_exceptions: Additional exception types that should interrupt execution.
         :param step_recorder: The step recorder for tracking functional scenario steps.
-                              Defaults to the global singleton instance.
+                              Defaults to the global singleton instance, which keeps
+                              separate records for each task.
+        :param snapshot_tracebacks: Whether to replace the tracebacks of step exceptions
+                                    with snapshots once ExceptionRaisedEvent is handled,
+                                    releasing the frames (see `ExcInfo.snapshot_traceback`).
+                                    Can also be enabled for a run via `run` kwargs.
         """
         self._dispatcher = dispatcher
+        self._snapshot_tracebacks = snapshot_tracebacks
         assert isinstance(interrupt_exceptions, tuple)
         self._interrupt_exceptions = interrupt_exceptions + (Interrupted,)
 
@@ -59,12 +70,17 @@ class MonotonicScenarioRunner(ScenarioRunner):
         # without introducing breaking changes. This violates architectural principles:
         # 1. Core components (ScenarioRunner, lower level) should not depend on or know
         #    about plugin components (StepRecorder, higher level) — dependency inversion violation
-        # 2. Using a global singleton (step_recorder) is not ideal for testability and concurrency
+        # 2. Using a global singleton (step_recorder) is not ideal for testability
+        #    (concurrency is fine though: its records are local to the current task)
         # 3. The coupling between runner and functioner plugin is too tight
         # This will be properly refactored in v2 when breaking changes are greenlit,
         # with a proper abstraction layer for step tracking to be introduced.
         self._step_recorder = step_recorder if (step_recorder is not None) else get_step_recorder()
 
+        # Virtual steps representing recorded given/when/then steps, grouped by the "do" step.
+        # Steps with the same name (e.g. recorded in a loop or on reruns) share a single wrapper
+        self._fn_steps: WeakKeyDictionary[Any, Dict[str, VirtualStep]] = WeakKeyDictionary()
+
     def _is_interruption(self, exc_info: ExcInfo,
                          exceptions: Tuple[Type[BaseException], ...]) -> bool:
         """
@@ -79,6 +95,19 @@ class MonotonicScenarioRunner(ScenarioRunner):
                 return True
         return False
 
+    async def _fire_exception_raised(self, exc_info: ExcInfo) -> None:
+        """
+        Fire ExceptionRaisedEvent and then snapshot the traceback, if enabled.
+
+        Handlers of the event still see the live traceback, while later events
+        (and the report) get the snapshot instead.
+
+        :param exc_info: The exception information of the failed step.
+        """
+        await self._dispatcher.fire(ExceptionRaisedEvent(exc_info))
+        if self._snapshot_tracebacks:
+            exc_info.snapshot_traceback()
+
     async def run_step(self, step: VirtualStep, ref: Scenario, **kwargs: Any) -> StepResult:
         """
         Execute a single step within a scenario.
@@ -103,6 +132,8 @@ class MonotonicScenarioRunner(ScenarioRunner):
                 try:
                     if step.is_coro():
                         await step(ref)
+                    elif step.is_offloaded():
+                        await self._run_in_thread(step, ref)
                     else:
                         step(ref)
                 finally:
@@ -112,7 +143,7 @@ class MonotonicScenarioRunner(ScenarioRunner):
             step_result.set_ended_at(time()).mark_failed()
 
             exc_info = ExcInfo(*sys.exc_info())
-            await self._dispatcher.fire(ExceptionRaisedEvent(exc_info))
+            await self._fire_exception_raised(exc_info)
             step_result.set_exc_info(exc_info)
 
             await self._dispatcher.fire(StepFailedEvent(step_result))
@@ -125,6 +156,17 @@ class MonotonicScenarioRunner(ScenarioRunner):
 
         return step_result
 
+    async def _run_in_thread(self, step: VirtualStep, ref: Scenario) -> None:
+        """
+        Execute a synchronous step in a worker thread of the default executor.
+
+        See `run_in_executor` for how context variables are propagated.
+
+        :param step: The virtual step to execute.
+        :param ref: The scenario instance containing the step context.
+        """
+        await run_in_executor(partial(step, ref))
+
     async def _run_fn_step(self, step: VirtualStep, ref: Scenario, **kwargs: Any) -> StepResult:
         """
         Execute a function-based scenario's single "do" step.
@@ -190,7 +232,7 @@ class MonotonicScenarioRunner(ScenarioRunner):
         if len(self._step_recorder) == 0:
             await self._dispatcher.fire(StepRunEvent(step_result))
             if step_result.exc_info is not None:
-                await self._dispatcher.fire(ExceptionRaisedEvent(step_result.exc_info))
+                await self._fire_exception_raised(step_result.exc_info)
                 await self._dispatcher.fire(StepFailedEvent(step_result))
 
                 scenario_result.add_step_result(step_result)
@@ -215,7 +257,7 @@ class MonotonicScenarioRunner(ScenarioRunner):
             if (exc is not None) and (exc_info is not None) and (exc is exc_info.value):
                 ctx_step_result.set_ended_at(ended_at).mark_failed()
 
-                await self._dispatcher.fire(ExceptionRaisedEvent(exc_info))
+                await self._fire_exception_raised(exc_info)
                 ctx_step_result.set_exc_info(exc_info)
 
                 await self._dispatcher.fire(StepFailedEvent(ctx_step_result))
@@ -242,7 +284,7 @@ class MonotonicScenarioRunner(ScenarioRunner):
             synthetic_step_result.set_started_at(step_result.started_at or time())
 
             synthetic_step_result.set_ended_at(step_result.ended_at or time()).mark_failed()
-            await self._dispatcher.fire(ExceptionRaisedEvent(step_result.exc_info))
+            await self._fire_exception_raised(step_result.exc_info)
             synthetic_step_result.set_exc_info(step_result.exc_info)
             await self._dispatcher.fire(StepFailedEvent(synthetic_step_result))
 
@@ -258,18 +300,27 @@ class MonotonicScenarioRunner(ScenarioRunner):
         Create a virtual step result for a recorded given/when/then step.
 
         Wraps the original step function with a new name to represent the
-        specific given/when/then step that was executed.
+        specific given/when/then step that was executed. Wrappers are created once
+        per original step and name, and reused afterwards.
 
         :param name: The formatted step name (e.g., "given initial setup").
         :param orig_step: The original step function to wrap.
         :return: A StepResult with the appropriately named virtual step.
         """
-        def step_wrapper(*args, **kwargs):  # type: ignore
-            return orig_step(*args, **kwargs)
+        try:
+            steps = self._fn_steps.setdefault(orig_step, {})
+        except TypeError:
+            # The original step can't be weakly referenced, do not pool its wrappers
+            steps = {}
+
+        virtual_step = steps.get(name)
+        if virtual_step is None:
+            def step_wrapper(*args, **kwargs):  # type: ignore
+                return orig_step(*args, **kwargs)
 
-        step_wrapper.__name__ = name
+            step_wrapper.__name__ = name
 
-        virtual_step = VirtualStep(step_wrapper)
+            virtual_step = steps[name] = VirtualStep(step_wrapper)
         return StepResult(virtual_step)
 
     async def run_scenario(self, scenario: VirtualScenario, **kwargs: Any) -> ScenarioResult:
@@ -283,6 +334,9 @@ class MonotonicScenarioRunner(ScenarioRunner):
         executes the single "do" step while recording given/when/then blocks,
         then generates individual step events for proper reporting.
 
+        Lazy scenarios (LazyVirtualScenario) are materialized here, after the skip
+        check, so their modules are imported only if they actually run.
+
         :param scenario: The virtual scenario to execute.
         :param kwargs: Additional keyword arguments (e.g., output_capturer).
         :return: The result of the scenario execution.
@@ -298,6 +352,10 @@ class MonotonicScenarioRunner(ScenarioRunner):
             await self._dispatcher.fire(ScenarioSkippedEvent(scenario_result))
             return scenario_result
 
+        if isinstance(scenario, LazyVirtualScenario):
+            # Import the scenario module only when the scenario is actually going to run
+            await scenario.materialize()
+
         os.chdir(scenario._project_dir)  # TODO: Avoid using private attributes directly
         await self._dispatcher.fire(ScenarioRunEvent(scenario_result))
         scenario_result.set_started_at(time())
@@ -373,7 +431,9 @@ class MonotonicScenarioRunner(ScenarioRunner):
         Execute all scenarios provided by the scheduler.
 
         Groups results by scenario unique_id and reports them when switching
-        to a different scenario or when execution completes.
+        to a different scenario or when execution completes. Results of a scenario that
+        the scheduler will run again later (see `ScenarioScheduler.has_pending`) are held
+        back and reported together with the results of its later executions.
 
         :param scheduler: The scheduler providing scenarios to execute.
         :param report: The report to add results to.
@@ -383,12 +443,16 @@ class MonotonicScenarioRunner(ScenarioRunner):
         output_capturer = self._get_output_capturer(**kwargs)
 
         scenario_results: List[ScenarioResult] = []
+        held_results: Dict[str, List[ScenarioResult]] = {}
 
         async for scenario in scheduler:
             prev_scenario = scenario_results[-1].scenario if len(scenario_results) > 0 else None
             if prev_scenario and prev_scenario.unique_id != scenario.unique_id:
-                await self._report_scenario_results(scenario_results, report, scheduler)
-                scenario_results = []
+                if scheduler.has_pending(prev_scenario):
+                    held_results[prev_scenario.unique_id] = scenario_results
+                else:
+                    await self._report_scenario_results(scenario_results, report, scheduler)
+                scenario_results = held_results.pop(scenario.unique_id, [])
 
             try:
                 scenario_result = await self.run_scenario(scenario,
@@ -399,14 +463,17 @@ class MonotonicScenarioRunner(ScenarioRunner):
                     exc_info = e.exc_info
                 else:
                     exc_info = ExcInfo(*sys.exc_info())
-                if len(scenario_results) > 0:
-                    await self._report_scenario_results(scenario_results, report, scheduler)
+                for results in [scenario_results, *held_results.values()]:
+                    if len(results) > 0:
+                        await self._report_scenario_results(results, report, scheduler)
                 raise RunInterrupted(exc_info)
             else:
                 scenario_results.append(scenario_result)
 
-        if len(scenario_results) > 0:
-            await self._report_scenario_results(scenario_results, report, scheduler)
+        # Results still held back belong to executions that never happened
+        for results in [scenario_results, *held_results.values()]:
+            if len(results) > 0:
+                await self._report_scenario_results(results, report, scheduler)
 
     async def run(self, scheduler: ScenarioScheduler, **kwargs: Any) -> Report:
         """
@@ -416,10 +483,13 @@ class MonotonicScenarioRunner(ScenarioRunner):
         execution lifecycle and handles any interruptions.
 
         :param scheduler: The scheduler providing scenarios to execute.
-        :param kwargs: Additional keyword arguments (e.g., reporter, output_capturer).
+        :param kwargs: Additional keyword arguments (e.g., reporter, output_capturer,
+                       snapshot_tracebacks).
         :return: A report containing all execution results and any interruption information.
         """
         output_capturer = self._get_output_capturer(**kwargs)
+        if "snapshot_tracebacks" in kwargs:
+            self._snapshot_tracebacks = bool(kwargs["snapshot_tracebacks"])
         report = kwargs.get("report", Report())
         assert isinstance(report, Report)
 
@@ -0,0 +1,72 @@
+from typing import Any, Dict, Optional
+
+from ...events import (
+    ExceptionRaisedEvent,
+    ScenarioFailedEvent,
+    ScenarioPassedEvent,
+    ScenarioRunEvent,
+    ScenarioSkippedEvent,
+    StepFailedEvent,
+    StepPassedEvent,
+    StepRunEvent,
+)
+from .._dispatcher import Dispatcher
+from .._virtual_scenario import VirtualScenario
+from ..scenario_result import ScenarioResult, ScenarioResultSerializer
+
+__all__ = ("ScenarioResultReplayer",)
+
+
+class ScenarioResultReplayer:
+    """
+    Restores serialized scenario results and fires the events they were produced with.
+
+    Replaying lets reporters and plugins handle results of scenarios that were run
+    elsewhere (e.g. in another process or another CI job) as if they were run locally.
+    """
+
+    def __init__(self, dispatcher: Dispatcher, *,
+                 serializer: Optional[ScenarioResultSerializer] = None) -> None:
+        """
+        Initialize the ScenarioResultReplayer.
+
+        :param dispatcher: The event dispatcher for firing execution events.
+        :param serializer: The serializer used to restore results.
+        """
+        self._dispatcher = dispatcher
+        self._serializer = serializer or ScenarioResultSerializer()
+
+    async def replay(self, scenario: VirtualScenario, data: Dict[str, Any]) -> ScenarioResult:
+        """
+        Restore a serialized result and fire the events the scenario produced.
+
+        :param scenario: The scenario the result belongs to.
+        :param data: The serialized scenario result.
+        :return: The restored scenario result.
+        """
+        scenario_result = ScenarioResult(scenario)
+        scenario_result.set_scope({})
+
+        if data["status"] == "SKIPPED":
+            self._serializer.load(data, scenario_result)
+            await self._dispatcher.fire(ScenarioSkippedEvent(scenario_result))
+            return scenario_result
+
+        await self._dispatcher.fire(ScenarioRunEvent(scenario_result))
+        for step_data in data["step_results"]:
+            step_result = self._serializer.deserialize_step(step_data, scenario)
+            await self._dispatcher.fire(StepRunEvent(step_result))
+            if step_result.is_failed():
+                if step_result.exc_info is not None:
+                    await self._dispatcher.fire(ExceptionRaisedEvent(step_result.exc_info))
+                await self._dispatcher.fire(StepFailedEvent(step_result))
+            else:
+                await self._dispatcher.fire(StepPassedEvent(step_result))
+            scenario_result.add_step_result(step_result)
+
+        self._serializer.load(data, scenario_result)
+        if scenario_result.is_failed():
+            await self._dispatcher.fire(ScenarioFailedEvent(scenario_result))
+        else:
+            await self._dispatcher.fire(ScenarioPassedEvent(scenario_result))
+        return scenario_result
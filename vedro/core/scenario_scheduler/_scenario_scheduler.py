@@ -86,6 +86,19 @@ class ScenarioScheduler(ABC):
         """
         pass
 
+    def has_pending(self, scenario: VirtualScenario) -> bool:
+        """
+        Check whether the scenario will run again later in the run.
+
+        Runners don't report the results of such a scenario until its pending executions
+        are finished, so all executions are aggregated together. By default, a scenario
+        is never pending: repeated executions are expected to follow each other.
+
+        :param scenario: The virtual scenario to check.
+        :return: True if the scenario has pending executions, False otherwise.
+        """
+        return False
+
     def __aiter__(self) -> "ScenarioScheduler":
         """
         Prepare the scheduler for asynchronous iteration.
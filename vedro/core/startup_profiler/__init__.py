@@ -0,0 +1,3 @@
+from ._startup_profiler import ProfileSpan, StartupProfiler, get_startup_profiler
+
+__all__ = ("StartupProfiler", "ProfileSpan", "get_startup_profiler",)
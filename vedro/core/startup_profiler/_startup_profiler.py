@@ -0,0 +1,183 @@
+import json
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Union
+
+__all__ = ("StartupProfiler", "ProfileSpan", "get_startup_profiler",)
+
+
+class ProfileSpan(NamedTuple):
+    """
+    Represents a timed part of the startup (a phase, an event handler or an import).
+    """
+
+    name: str
+    category: str
+    started_at: float
+    ended_at: float
+    depth: int
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Get the duration of the span in seconds.
+
+        :return: The elapsed time.
+        """
+        return self.ended_at - self.started_at
+
+
+_current_profiler: ContextVar[Optional["StartupProfiler"]] = ContextVar(
+    "vedro_startup_profiler", default=None)
+
+
+def get_startup_profiler() -> Optional["StartupProfiler"]:
+    """
+    Get the startup profiler activated in the current context.
+
+    Components that are not wired to the profiler explicitly (e.g., scenario sources
+    loading modules) use it to report their spans.
+
+    :return: The active profiler, or None if startup is not being profiled.
+    """
+    return _current_profiler.get()
+
+
+class StartupProfiler:
+    """
+    Records how long each part of the startup takes.
+
+    Spans may be nested (e.g., event handlers within a phase); each one is recorded
+    with its depth. Spans are recorded only while the profiler is running, so the
+    instrumented code costs nothing once the startup is over.
+    """
+
+    def __init__(self, *, clock: Callable[[], float] = perf_counter) -> None:
+        """
+        Initialize the StartupProfiler.
+
+        :param clock: The monotonic clock returning the time in seconds.
+        """
+        self._clock = clock
+        self._spans: List[ProfileSpan] = []
+        self._depth = 0
+        self._started_at: Optional[float] = None
+        self._ended_at: Optional[float] = None
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Check if the profiler is recording spans.
+
+        :return: True if the profiler is started and not stopped yet.
+        """
+        return (self._started_at is not None) and (self._ended_at is None)
+
+    @property
+    def spans(self) -> List[ProfileSpan]:
+        """
+        Get the recorded spans, in the order they ended.
+
+        :return: A list of spans.
+        """
+        return list(self._spans)
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Get the time between the start of the profiler and its stop (or now).
+
+        :return: The elapsed time in seconds, or 0.0 if the profiler is not started.
+        """
+        if self._started_at is None:
+            return 0.0
+        ended_at = self._ended_at if (self._ended_at is not None) else self._clock()
+        return ended_at - self._started_at
+
+    def start(self) -> None:
+        """
+        Start recording spans (once).
+        """
+        if self._started_at is None:
+            self._started_at = self._clock()
+
+    def stop(self) -> None:
+        """
+        Stop recording spans.
+        """
+        if self.is_running:
+            self._ended_at = self._clock()
+
+    @contextmanager
+    def span(self, name: str, category: str) -> Iterator[None]:
+        """
+        Time the enclosed block as a span, if the profiler is running.
+
+        :param name: The name of the span (e.g., the handler or the file name).
+        :param category: The category of the span (e.g., "phase", "handler", "import").
+        """
+        if not self.is_running:
+            yield
+            return
+
+        started_at = self._clock()
+        depth = self._depth
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self._spans.append(ProfileSpan(name, category, started_at, self._clock(), depth))
+
+    @contextmanager
+    def activate(self) -> Iterator["StartupProfiler"]:
+        """
+        Make the profiler available via `get_startup_profiler` within the enclosed block.
+
+        :return: The profiler itself.
+        """
+        token = _current_profiler.set(self)
+        try:
+            yield self
+        finally:
+            _current_profiler.reset(token)
+
+    def get_ranked_spans(self, limit: Optional[int] = None) -> List[ProfileSpan]:
+        """
+        Get the recorded spans, the slowest first.
+
+        :param limit: The maximum number of spans to return, or None for all of them.
+        :return: A list of spans sorted by their duration in descending order.
+        """
+        ranked = sorted(self._spans, key=lambda span: span.elapsed, reverse=True)
+        return ranked if (limit is None) else ranked[:limit]
+
+    def to_trace_events(self) -> Dict[str, Any]:
+        """
+        Convert the spans to the Chrome trace-event format (chrome://tracing, Perfetto).
+
+        :return: A JSON-serializable trace object with "complete" (X) events.
+        """
+        origin = self._started_at if (self._started_at is not None) else 0.0
+        pid = os.getpid()
+        events = [{
+            "name": span.name,
+            "cat": span.category,
+            "ph": "X",
+            "ts": round((span.started_at - origin) * 1_000_000, 3),
+            "dur": round(span.elapsed * 1_000_000, 3),
+            "pid": pid,
+            "tid": 0,
+        } for span in sorted(self._spans, key=lambda span: (span.started_at, span.depth))]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_trace(self, path: Union[Path, str]) -> None:
+        """
+        Write the spans to a file in the Chrome trace-event format.
+
+        :param path: The path to the JSON file.
+        """
+        Path(path).write_text(json.dumps(self.to_trace_events()))
@@ -1,6 +1,7 @@
-from vedro.core import Artifact, FileArtifact, MemoryArtifact
+from vedro.core import Artifact, FileArtifact, MemoryArtifact, StreamArtifact
 
 from ._artifact_manager import ArtifactManager
+from ._artifact_writer import ArtifactWriter, ArtifactWriterStats
 from ._artifacted import (
     Artifacted,
     ArtifactedPlugin,
@@ -9,7 +10,9 @@ from ._artifacted import (
     attach_scenario_artifact,
     attach_step_artifact,
 )
+from ._content_addressed_artifact_manager import ContentAddressedArtifactManager
 
 __all__ = ("Artifacted", "ArtifactedPlugin", "attach_artifact", "attach_step_artifact",
            "attach_scenario_artifact", "attach_global_artifact", "Artifact",
-           "MemoryArtifact", "FileArtifact", "ArtifactManager",)
+           "MemoryArtifact", "FileArtifact", "StreamArtifact", "ArtifactManager",
+           "ArtifactWriter", "ArtifactWriterStats", "ContentAddressedArtifactManager",)
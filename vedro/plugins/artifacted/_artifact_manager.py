@@ -1,9 +1,12 @@
+import gzip
 import shutil
+from contextlib import nullcontext
 from os import linesep
 from pathlib import Path
-from typing import Callable, Type, Union
+from time import time_ns
+from typing import Any, BinaryIO, Callable, ContextManager, List, Type, Union
 
-from vedro.core import Artifact, FileArtifact, MemoryArtifact
+from vedro.core import Artifact, FileArtifact, MemoryArtifact, StreamArtifact
 
 __all__ = ("ArtifactManager", "ArtifactManagerFactory",)
 
@@ -17,6 +20,8 @@ class ArtifactManager:
     and handles cleanup operations for artifacts directories.
     """
 
+    RETIRED_SUFFIX = ".old-"
+
     def __init__(self, artifacts_dir: Path, project_dir: Path) -> None:
         """
         Initialize the ArtifactManager with the specified directories.
@@ -55,14 +60,79 @@ class ArtifactManager:
                 f"Failed to clean up artifacts directory '{self._artifacts_dir}': {e}"
             ) from e
 
+    def retire_artifacts(self) -> Union[Path, None]:
+        """
+        Move the artifacts directory aside, so it can be deleted later.
+
+        The directory is renamed to a sibling named `<artifacts_dir>.old-<timestamp>`,
+        which is a single atomic operation regardless of the number of files.
+
+        :return: The new path of the directory, or None if it does not exist.
+        :raises PermissionError: If the directory cannot be renamed due to permissions issues.
+        :raises OSError: If an unexpected OS error occurs while renaming the directory.
+        """
+        if not self._artifacts_dir.exists():
+            return None
+
+        retired_dir = self._artifacts_dir.with_name(
+            f"{self._artifacts_dir.name}{self.RETIRED_SUFFIX}{time_ns()}"
+        )
+        try:
+            self._artifacts_dir.rename(retired_dir)
+        except FileNotFoundError:
+            # The directory was deleted between the check and the rename call
+            return None
+        except PermissionError as e:
+            raise self._make_permissions_error(
+                f"Failed to move artifacts directory '{self._artifacts_dir}' aside."
+            ) from e
+        except OSError as e:
+            raise OSError(
+                f"Failed to move artifacts directory '{self._artifacts_dir}' aside: {e}"
+            ) from e
+        return retired_dir
+
+    def get_retired_artifacts(self) -> List[Path]:
+        """
+        Get the directories moved aside by `retire_artifacts`, including the ones
+        left by previous (possibly crashed) runs.
+
+        :return: The retired directories, the oldest first.
+        """
+        parent_dir = self._artifacts_dir.parent
+        if not parent_dir.exists():
+            return []
+
+        prefix = f"{self._artifacts_dir.name}{self.RETIRED_SUFFIX}"
+        retired_dirs = []
+        for path in parent_dir.iterdir():
+            timestamp = path.name[len(prefix):]
+            if path.name.startswith(prefix) and timestamp.isdigit() and path.is_dir():
+                retired_dirs.append((int(timestamp), path))
+        return [path for _, path in sorted(retired_dirs)]
+
+    def cleanup_retired_artifacts(self, *, keep: int = 0) -> None:
+        """
+        Delete the retired artifacts directories, except the most recent ones.
+
+        Errors are ignored: this method is meant to run in the background, and whatever
+        is left is deleted by the next call.
+
+        :param keep: The number of the most recent retired directories to keep.
+        """
+        retired_dirs = self.get_retired_artifacts()
+        for path in retired_dirs[:max(0, len(retired_dirs) - keep)]:
+            shutil.rmtree(path, ignore_errors=True)
+
     def save_artifact(self, artifact: Artifact, path: Path) -> Path:
         """
         Save an artifact to the specified path.
 
-        Depending on the type of artifact, this method saves either a memory-based artifact
-        or a file-based artifact. Ensures that the target directory exists before saving.
+        Depending on the type of artifact, this method saves a memory-based artifact,
+        a file-based artifact or a stream. Ensures that the target directory exists before saving.
 
-        :param artifact: The artifact to save, which can be a MemoryArtifact or FileArtifact.
+        :param artifact: The artifact to save, which can be a MemoryArtifact, FileArtifact
+                         or StreamArtifact (with a synchronous source).
         :param path: The directory where the artifact should be saved.
         :return: The path to the saved artifact.
         :raises TypeError: If the artifact type is unknown.
@@ -76,11 +146,27 @@ class ArtifactManager:
             return self._save_memory_artifact(artifact, path)
         elif isinstance(artifact, FileArtifact):
             return self._save_file_artifact(artifact, path)
+        elif isinstance(artifact, StreamArtifact):
+            return self._save_stream_artifact(artifact, path)
         else:
             artifact_type = type(artifact).__name__
             message = f"Can't save artifact to '{path}': unknown type '{artifact_type}'"
             raise TypeError(message)
 
+    def get_artifact_path(self, artifact: Artifact, path: Path) -> Path:
+        """
+        Get the path an artifact is saved to, without saving it.
+
+        :param artifact: The artifact to get the path for.
+        :param path: The directory where the artifact should be saved.
+        :return: The path to the artifact within the directory.
+        :raises TypeError: If the artifact type is unknown.
+        """
+        if not isinstance(artifact, (MemoryArtifact, FileArtifact, StreamArtifact)):
+            artifact_type = type(artifact).__name__
+            raise TypeError(f"Can't save artifact to '{path}': unknown type '{artifact_type}'")
+        return (path / artifact.name).resolve()
+
     def _ensure_directory_exists(self, path: Path) -> None:
         """
         Ensure that the specified directory exists, creating it if necessary.
@@ -109,7 +195,7 @@ class ArtifactManager:
         :raises PermissionError: If writing to the file is denied.
         :raises OSError: If an unexpected OS error occurs while writing the file.
         """
-        artifact_dest = (path / artifact.name).resolve()
+        artifact_dest = self.get_artifact_path(artifact, path)
         try:
             artifact_dest.write_bytes(artifact.data)
         except PermissionError as e:
@@ -134,7 +220,7 @@ class ArtifactManager:
         :raises PermissionError: If copying the file is denied.
         :raises OSError: If an unexpected OS error occurs while copying the file.
         """
-        artifact_dest = (path / artifact.name).resolve()
+        artifact_dest = self.get_artifact_path(artifact, path)
         artifact_source = artifact.path
         if not artifact_source.is_absolute():
             artifact_source = (self._project_dir / artifact_source).resolve()
@@ -153,6 +239,75 @@ class ArtifactManager:
         else:
             return artifact_dest
 
+    def _save_stream_artifact(self, artifact: StreamArtifact, path: Path) -> Path:
+        """
+        Save a StreamArtifact to the specified path.
+
+        Writes the chunks of the stream to a file as they are produced, compressing
+        them if the artifact requires it.
+
+        :param artifact: The StreamArtifact to save.
+        :param path: The directory where the artifact should be saved.
+        :return: The path to the saved artifact.
+        :raises PermissionError: If writing to the file is denied.
+        :raises OSError: If an unexpected OS error occurs while writing the file.
+        """
+        artifact_dest = self.get_artifact_path(artifact, path)
+        try:
+            self._write_stream(artifact, artifact_dest)
+        except PermissionError as e:
+            raise self._make_permissions_error(
+                f"Permission denied when writing to '{artifact_dest}'."
+            ) from e
+        except OSError as e:
+            raise OSError(f"Failed to write StreamArtifact to '{artifact_dest}': {e}") from e
+        else:
+            artifact.mark_saved(artifact_dest)
+            return artifact_dest
+
+    def _write_stream(self, artifact: StreamArtifact, dest: Path) -> None:
+        """
+        Write the chunks of a StreamArtifact to a file.
+
+        :param artifact: The StreamArtifact to write.
+        :param dest: The path to the file, which is overwritten.
+        """
+        chunks = artifact.iter_chunks()
+        with open(dest, "wb") as file:
+            with self._open_compressor(file, artifact.compression) as writer:
+                for chunk in chunks:
+                    writer.write(chunk)
+
+    def _open_compressor(self, file: BinaryIO,
+                         compression: Union[str, None]) -> ContextManager[Any]:
+        """
+        Wrap a file to compress the data written to it. The file itself is not closed.
+
+        :param file: The file opened for binary writing.
+        :param compression: The compression name ("gzip" or "zstd"), or None.
+        :return: A context manager providing the writable object.
+        :raises ModuleNotFoundError: If zstd is requested, but no zstd implementation
+                                     is available.
+        """
+        if compression == "gzip":
+            return gzip.GzipFile(fileobj=file, mode="wb")
+        if compression == "zstd":
+            try:
+                from compression import zstd  # type: ignore
+            except ModuleNotFoundError:
+                try:
+                    import zstandard  # type: ignore
+                except ModuleNotFoundError:
+                    raise ModuleNotFoundError(
+                        "Package 'zstandard' is not found, install it via 'pip install zstandard'"
+                    )
+                else:
+                    return zstandard.ZstdCompressor().stream_writer(  # type: ignore
+                        file, closefd=False)
+            else:
+                return zstd.ZstdFile(file, mode="wb")  # type: ignore
+        return nullcontext(file)
+
     def _make_permissions_error(self, failure_message: str) -> PermissionError:
         """
         Create a detailed PermissionError with resolution suggestions.
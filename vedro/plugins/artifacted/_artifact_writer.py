@@ -0,0 +1,295 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from functools import partial
+from pathlib import Path
+from threading import Lock
+from time import perf_counter
+from typing import AsyncIterator, Dict, Iterator, List, Tuple, Union
+
+from vedro.core import Artifact, MemoryArtifact, StreamArtifact
+
+from ._artifact_manager import ArtifactManager
+
+__all__ = ("ArtifactWriter", "ArtifactWriterStats",)
+
+
+class ArtifactWriterStats:
+    """
+    Holds the statistics of artifacts saved during a run.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize empty ArtifactWriterStats.
+        """
+        self.artifacts = 0
+        self.bytes_written = 0
+        self.write_time = 0.0
+        self.wait_time = 0.0
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the ArtifactWriterStats.
+
+        :return: A string representation of the stats.
+        """
+        return (f"<{self.__class__.__name__} artifacts={self.artifacts} "
+                f"bytes_written={self.bytes_written} write_time={self.write_time:.3f} "
+                f"wait_time={self.wait_time:.3f}>")
+
+
+class ArtifactWriter:
+    """
+    Saves artifacts in a thread pool, so large artifacts don't stall the event loop.
+
+    The destination of an artifact is known before it is written, so `save` returns it
+    right away and the actual write happens in the background. At most `max_pending`
+    writes can be in flight: when the limit is reached, `save` waits for a free slot
+    (back-pressure), which bounds the memory held by queued artifacts. Call `flush`
+    to wait for all pending writes.
+
+    A background write that fails is recorded against the path of its artifact (see
+    `failures`), rather than raised by an unrelated `save` call; `flush` raises an error
+    listing all the failed artifacts.
+
+    With `workers=0` (default) artifacts are saved synchronously, as they are passed
+    to `save`, and errors are raised right away.
+
+    Stream artifacts with an async source are consumed in the event loop, while their
+    chunks are written by a thread (the default executor one, if `workers=0`).
+    """
+
+    def __init__(self, artifact_manager: ArtifactManager, *,
+                 workers: int = 0, max_pending: int = 32) -> None:
+        """
+        Initialize the ArtifactWriter.
+
+        :param artifact_manager: The manager that writes the artifacts.
+        :param workers: The number of writer threads, 0 to save artifacts synchronously.
+        :param max_pending: The maximum number of writes in flight.
+        :raises ValueError: If workers is negative or max_pending is less than 1.
+        """
+        if workers < 0:
+            raise ValueError("'workers' must be greater than or equal to 0")
+        if max_pending < 1:
+            raise ValueError("'max_pending' must be greater than or equal to 1")
+        self._artifact_manager = artifact_manager
+        self._workers = workers
+        self._max_pending = max_pending
+        self._executor: Union[ThreadPoolExecutor, None] = None
+        # Created lazily, so it is bound to the running event loop
+        self._slots: Union[asyncio.Semaphore, None] = None
+        # Maps pending writes to the paths of their artifacts
+        self._pending: Dict["asyncio.Future[Path]", Path] = {}
+        self._failures: List[Tuple[Path, BaseException]] = []
+        self._stats = ArtifactWriterStats()
+        # Stats are updated from the writer threads
+        self._stats_lock = Lock()
+
+    @property
+    def stats(self) -> ArtifactWriterStats:
+        """
+        Get the statistics of the saved artifacts.
+
+        :return: The statistics, updated as writes complete.
+        """
+        return self._stats
+
+    @property
+    def failures(self) -> List[Tuple[Path, BaseException]]:
+        """
+        Get the background writes that failed.
+
+        :return: A list of tuples of the artifact path and the error it failed with.
+        """
+        return list(self._failures)
+
+    async def save(self, artifact: Artifact, path: Path) -> Path:
+        """
+        Save an artifact to the specified directory, in the background if workers are enabled.
+
+        :param artifact: The artifact to save.
+        :param path: The directory where the artifact should be saved.
+        :return: The path the artifact is (or will be) saved to.
+        :raises BaseException: The error of the write, if artifacts are saved synchronously.
+        """
+        loop = asyncio.get_running_loop()
+        artifact_to_write = artifact
+        if isinstance(artifact, StreamArtifact) and artifact.is_async:
+            artifact_to_write = self._bridge_stream(artifact, loop)
+
+        if self._workers == 0:
+            started_at = perf_counter()
+            if artifact_to_write is artifact:
+                artifact_path = self._write(artifact, path)
+            else:
+                # The chunks are produced by the event loop, so it must not be blocked
+                context = copy_context()
+                artifact_path = await loop.run_in_executor(
+                    None, partial(context.run, self._write, artifact_to_write, path)
+                )
+            self._add_wait_time(perf_counter() - started_at)
+            self._mark_saved(artifact, artifact_path)
+            return artifact_path
+
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self._max_pending)
+        if self._slots.locked():
+            started_at = perf_counter()
+            await self._slots.acquire()
+            self._add_wait_time(perf_counter() - started_at)
+        else:
+            await self._slots.acquire()
+
+        artifact_path = self._artifact_manager.get_artifact_path(artifact, path)
+
+        context = copy_context()
+        future = loop.run_in_executor(self._get_executor(),
+                                      partial(context.run, self._write, artifact_to_write, path))
+        self._pending[future] = artifact_path
+        future.add_done_callback(self._on_written)
+
+        self._mark_saved(artifact, artifact_path)
+        return artifact_path
+
+    async def flush(self) -> None:
+        """
+        Wait for all pending writes to complete.
+
+        :raises RuntimeError: If any background write failed, listing the failed artifacts
+                              (the error of the first one is chained).
+        """
+        if self._pending:
+            started_at = perf_counter()
+            await asyncio.wait(list(self._pending))
+            self._add_wait_time(perf_counter() - started_at)
+
+        if self._failures:
+            failures, self._failures = self._failures, []
+            bullet_prefix = f"{os.linesep}  - "
+            details = [f"{path}: {type(e).__name__}: {e}" for path, e in failures]
+            raise RuntimeError(
+                f"Failed to save {len(failures)} artifact(s):"
+                f"{bullet_prefix + bullet_prefix.join(details)}"
+            ) from failures[0][1]
+
+    def close(self) -> None:
+        """
+        Shut down the writer threads. Writes that are still pending are completed
+        in the background.
+        """
+        if self._executor is not None:
+            # Don't wait here: a pending stream write may need the event loop to proceed
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the thread pool, creating it on the first use.
+
+        :return: The thread pool executor.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._workers,
+                                                thread_name_prefix="vedro-artifacts")
+        return self._executor
+
+    def _write(self, artifact: Artifact, path: Path) -> Path:
+        """
+        Save an artifact and record the statistics. Runs in a writer thread,
+        unless artifacts are saved synchronously.
+
+        :param artifact: The artifact to save.
+        :param path: The directory where the artifact should be saved.
+        :return: The path to the saved artifact.
+        """
+        started_at = perf_counter()
+        artifact_path = self._artifact_manager.save_artifact(artifact, path)
+        elapsed = perf_counter() - started_at
+
+        if isinstance(artifact, MemoryArtifact):
+            size = len(artifact.data)
+        else:
+            try:
+                size = os.path.getsize(artifact_path)
+            except OSError:
+                size = 0
+
+        with self._stats_lock:
+            self._stats.artifacts += 1
+            self._stats.bytes_written += size
+            self._stats.write_time += elapsed
+        return artifact_path
+
+    def _bridge_stream(self, artifact: StreamArtifact,
+                       loop: asyncio.AbstractEventLoop) -> StreamArtifact:
+        """
+        Make a stream with a synchronous source out of a stream with an async one.
+
+        The returned stream is meant to be written by a thread: each chunk is taken
+        from the async source in the event loop, while the thread waits for it.
+
+        :param artifact: The StreamArtifact with an async source.
+        :param loop: The running event loop.
+        :return: A StreamArtifact with the same name, MIME type and compression.
+        """
+        chunks = artifact.aiter_chunks()
+
+        def iter_chunks() -> Iterator[bytes]:
+            while True:
+                chunk = asyncio.run_coroutine_threadsafe(self._next_chunk(chunks), loop).result()
+                if chunk is None:
+                    return
+                yield chunk
+
+        return StreamArtifact(artifact.name, artifact.mime_type, iter_chunks(),
+                              compression=artifact.compression)
+
+    async def _next_chunk(self, chunks: AsyncIterator[bytes]) -> Union[bytes, None]:
+        """
+        Take the next chunk of an async source.
+
+        :param chunks: The async iterator of chunks.
+        :return: The chunk, or None if the source is exhausted.
+        """
+        try:
+            return await chunks.__anext__()
+        except StopAsyncIteration:
+            return None
+
+    def _mark_saved(self, artifact: Artifact, artifact_path: Path) -> None:
+        """
+        Record the path of a saved stream artifact, so results that are serialized
+        before the write completes can refer to the file.
+
+        :param artifact: The saved artifact.
+        :param artifact_path: The path the artifact is (or will be) saved to.
+        """
+        if isinstance(artifact, StreamArtifact):
+            artifact.mark_saved(artifact_path)
+
+    def _on_written(self, future: "asyncio.Future[Path]") -> None:
+        """
+        Release the slot of a completed write and record its failure, if any.
+
+        :param future: The future of the completed write.
+        """
+        artifact_path = self._pending.pop(future)
+        assert self._slots is not None  # for type checker
+        self._slots.release()
+        if future.cancelled():
+            return
+        exception = future.exception()
+        if exception is not None:
+            self._failures.append((artifact_path, exception))
+
+    def _add_wait_time(self, elapsed: float) -> None:
+        """
+        Record the time the event loop was blocked waiting for writes.
+
+        :param elapsed: The waiting time in seconds.
+        """
+        with self._stats_lock:
+            self._stats.wait_time += elapsed
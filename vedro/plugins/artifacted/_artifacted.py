@@ -1,7 +1,9 @@
 from collections import deque
+from contextvars import ContextVar
 from os import linesep
 from pathlib import Path
-from typing import Deque, Type, Union, final
+from threading import Thread
+from typing import Deque, Optional, Type, Union, final
 
 from vedro.core import (
     Artifact,
@@ -27,14 +29,19 @@ from vedro.events import (
 )
 
 from ._artifact_manager import ArtifactManager, ArtifactManagerFactory
+from ._artifact_writer import ArtifactWriter
+from ._content_addressed_artifact_manager import ContentAddressedArtifactManager
 from ._utils import is_relative_to
 
 __all__ = ("Artifacted", "ArtifactedPlugin", "attach_artifact", "attach_step_artifact",
            "attach_scenario_artifact", "attach_global_artifact")
 
 
-_scenario_artifacts: Deque[Artifact] = deque()
-_step_artifacts: Deque[Artifact] = deque()
+# Scenario and step artifacts are kept per context, so that scenarios running
+# concurrently (e.g., parallel repeats) don't see each other's artifacts
+_scenario_artifacts: ContextVar[Deque[Artifact]] = ContextVar("_scenario_artifacts",
+                                                              default=deque())
+_step_artifacts: ContextVar[Deque[Artifact]] = ContextVar("_step_artifacts", default=deque())
 _global_artifacts: Deque[Artifact] = deque()
 
 
@@ -44,7 +51,7 @@ def attach_scenario_artifact(artifact: Artifact) -> None:
 
     :param artifact: The artifact to be attached to the scenario.
     """
-    _scenario_artifacts.append(artifact)
+    _scenario_artifacts.get().append(artifact)
 
 
 def attach_step_artifact(artifact: Artifact) -> None:
@@ -53,7 +60,7 @@ def attach_step_artifact(artifact: Artifact) -> None:
 
     :param artifact: The artifact to be attached to the step.
     """
-    _step_artifacts.append(artifact)
+    _step_artifacts.get().append(artifact)
 
 
 def attach_artifact(artifact: Artifact) -> None:
@@ -84,18 +91,20 @@ class ArtifactedPlugin(Plugin):
     """
 
     def __init__(self, config: Type["Artifacted"], *,
-                 artifact_manager_factory: ArtifactManagerFactory = ArtifactManager,
+                 artifact_manager_factory: Optional[ArtifactManagerFactory] = None,
                  global_artifacts: Deque[Artifact] = _global_artifacts,
-                 scenario_artifacts: Deque[Artifact] = _scenario_artifacts,
-                 step_artifacts: Deque[Artifact] = _step_artifacts) -> None:
+                 scenario_artifacts: ContextVar[Deque[Artifact]] = _scenario_artifacts,
+                 step_artifacts: ContextVar[Deque[Artifact]] = _step_artifacts) -> None:
         """
         Initialize the ArtifactedPlugin instance with configuration and artifact queues.
 
         :param config: The Artifacted plugin configuration.
         :param artifact_manager_factory: A factory for creating ArtifactManager instances.
+                                         If None, the manager is chosen by the configuration
+                                         (see `deduplicate_artifacts`).
         :param global_artifacts: A deque to store global artifacts.
-        :param scenario_artifacts: A deque to store scenario artifacts.
-        :param step_artifacts: A deque to store step artifacts.
+        :param scenario_artifacts: A context variable holding the deque of scenario artifacts.
+        :param step_artifacts: A context variable holding the deque of step artifacts.
         """
         super().__init__(config)
         self._artifact_manager_factory = artifact_manager_factory
@@ -106,8 +115,17 @@ class ArtifactedPlugin(Plugin):
         self._artifacts_dir = Path(config.artifacts_dir)
         self._add_artifact_details = config.add_artifact_details
         self._cleanup_artifacts_dir = config.cleanup_artifacts_dir
+        self._background_cleanup = config.background_cleanup
+        self._keep_artifacts_runs = config.keep_artifacts_runs
+        self._save_workers = config.save_workers
+        self._max_pending_artifacts = config.max_pending_artifacts
+        self._show_artifacts_stats = config.show_artifacts_stats
+        self._deduplicate_artifacts = config.deduplicate_artifacts
+        self._file_artifact_mode = config.file_artifact_mode
         self._global_config: Union[ConfigType, None] = None
         self._artifact_manager: Union[ArtifactManager, None] = None
+        self._artifact_writer: Union[ArtifactWriter, None] = None
+        self._cleanup_thread: Union[Thread, None] = None
 
     def subscribe(self, dispatcher: Dispatcher) -> None:
         """
@@ -193,10 +211,13 @@ class ArtifactedPlugin(Plugin):
             raise ValueError(f"Artifacts directory '{self._artifacts_dir}' "
                              f"must be within the project directory '{project_dir}'")
 
-        self._artifact_manager = self._artifact_manager_factory(self._artifacts_dir,
-                                                                self._get_project_dir())
+        self._artifact_manager = self._create_artifact_manager(project_dir)
         if self._cleanup_artifacts_dir:
-            self._artifact_manager.cleanup_artifacts()
+            self._cleanup_artifacts(self._artifact_manager)
+
+        self._artifact_writer = ArtifactWriter(self._artifact_manager,
+                                               workers=self._save_workers,
+                                               max_pending=self._max_pending_artifacts)
 
     def on_startup(self, event: StartupEvent) -> None:
         """
@@ -208,12 +229,15 @@ class ArtifactedPlugin(Plugin):
 
     def on_scenario_run(self, event: ScenarioRunEvent) -> None:
         """
-        Handle the event when a scenario run starts, clearing artifact deques.
+        Handle the event when a scenario run starts, starting new artifact deques.
+
+        The deques are set in the context of the scenario run, so each of the scenarios
+        running concurrently collects its own artifacts.
 
         :param event: The ScenarioRunEvent instance.
         """
-        self._scenario_artifacts.clear()
-        self._step_artifacts.clear()
+        self._scenario_artifacts.set(deque())
+        self._step_artifacts.set(deque())
 
     async def on_step_end(self, event: Union[StepPassedEvent, StepFailedEvent]) -> None:
         """
@@ -221,8 +245,9 @@ class ArtifactedPlugin(Plugin):
 
         :param event: The StepPassedEvent or StepFailedEvent instance.
         """
-        while len(self._step_artifacts) > 0:
-            artifact = self._step_artifacts.popleft()
+        step_artifacts = self._step_artifacts.get()
+        while len(step_artifacts) > 0:
+            artifact = step_artifacts.popleft()
             event.step_result.attach(artifact)
 
     async def on_scenario_end(self,
@@ -232,20 +257,24 @@ class ArtifactedPlugin(Plugin):
 
         :param event: The ScenarioPassedEvent or ScenarioFailedEvent instance.
         """
-        while len(self._scenario_artifacts) > 0:
-            artifact = self._scenario_artifacts.popleft()
+        scenario_artifacts = self._scenario_artifacts.get()
+        while len(scenario_artifacts) > 0:
+            artifact = scenario_artifacts.popleft()
             event.scenario_result.attach(artifact)
 
     async def on_scenario_reported(self, event: ScenarioReportedEvent) -> None:
         """
         Handle the event after a scenario has been reported, saving artifacts if configured.
 
+        If `save_workers` is set, artifacts are written in the background, and the extra
+        details are added right away, as the artifact paths are known in advance.
+
         :param event: The ScenarioReportedEvent instance.
         """
         if not self._save_artifacts:
             return
 
-        assert self._artifact_manager is not None  # for type checker
+        assert self._artifact_writer is not None  # for type checker
 
         aggregated_result = event.aggregated_result
         for scenario_result in aggregated_result.scenario_results:
@@ -253,25 +282,27 @@ class ArtifactedPlugin(Plugin):
 
             for step_result in scenario_result.step_results:
                 for artifact in step_result.artifacts:
-                    artifact_path = self._artifact_manager.save_artifact(artifact,
-                                                                         scenario_artifacts_dir)
+                    artifact_path = await self._artifact_writer.save(artifact,
+                                                                     scenario_artifacts_dir)
                     self._add_extra_details(step_result, artifact_path)
 
             for artifact in scenario_result.artifacts:
-                artifact_path = self._artifact_manager.save_artifact(artifact,
-                                                                     scenario_artifacts_dir)
+                artifact_path = await self._artifact_writer.save(artifact,
+                                                                 scenario_artifacts_dir)
                 self._add_extra_details(scenario_result, artifact_path)
 
     async def on_cleanup(self, event: CleanupEvent) -> None:
         """
         Handle the cleanup event, saving and summarizing global artifacts if configured.
 
+        Waits for all pending artifact writes to complete before the run ends.
+
         :param event: The CleanupEvent instance.
         """
         if not self._save_artifacts:
             return
 
-        assert self._artifact_manager is not None  # for type checker
+        assert self._artifact_writer is not None  # for type checker
 
         while len(self._global_artifacts) > 0:
             artifact = self._global_artifacts.popleft()
@@ -279,15 +310,85 @@ class ArtifactedPlugin(Plugin):
 
         global_artifacts_dir = self._get_global_artifacts_dir()
         artifacts = []
-        for artifact in event.report.artifacts:
-            artifact_path = self._artifact_manager.save_artifact(artifact, global_artifacts_dir)
-            artifacts.append(self._get_rel_path(artifact_path))
+        try:
+            for artifact in event.report.artifacts:
+                artifact_path = await self._artifact_writer.save(artifact, global_artifacts_dir)
+                artifacts.append(self._get_rel_path(artifact_path))
+        finally:
+            # Pending writes of scenario artifacts are awaited even if a global one fails
+            try:
+                await self._artifact_writer.flush()
+            finally:
+                self._artifact_writer.close()
 
         if self._add_artifact_details and len(artifacts) > 0:
             sep = f"{linesep}#   - "
             summary = f"global artifacts:{sep}" + f"{sep}".join(str(x) for x in artifacts)
             event.report.add_summary(summary)
 
+        stats = self._artifact_writer.stats
+        if self._show_artifacts_stats and stats.artifacts > 0:
+            event.report.add_summary(
+                f"artifacts: {stats.artifacts} saved ({self._format_size(stats.bytes_written)}), "
+                f"write time {stats.write_time:.2f}s, waited {stats.wait_time:.2f}s"
+            )
+
+    def _cleanup_artifacts(self, artifact_manager: ArtifactManager) -> None:
+        """
+        Clean up the artifacts of previous runs.
+
+        By default, the artifacts directory is deleted right away. If a background cleanup
+        or a retention is configured, the directory is moved aside instead, and the retired
+        directories (including leftovers of crashed runs) beyond `keep_artifacts_runs`
+        are deleted, in a background thread if configured.
+
+        :param artifact_manager: The ArtifactManager instance.
+        """
+        if not self._background_cleanup and self._keep_artifacts_runs == 0:
+            artifact_manager.cleanup_artifacts()
+            return
+
+        artifact_manager.retire_artifacts()
+        if not self._background_cleanup:
+            artifact_manager.cleanup_retired_artifacts(keep=self._keep_artifacts_runs)
+            return
+
+        # A daemon thread doesn't delay the exit, whatever is left is deleted by the next run
+        self._cleanup_thread = Thread(target=artifact_manager.cleanup_retired_artifacts,
+                                      kwargs={"keep": self._keep_artifacts_runs},
+                                      name="vedro-artifacts-cleanup", daemon=True)
+        self._cleanup_thread.start()
+
+    def _create_artifact_manager(self, project_dir: Path) -> ArtifactManager:
+        """
+        Create the artifact manager using the factory, or the one chosen by the configuration.
+
+        :param project_dir: The project's root directory.
+        :return: The ArtifactManager instance.
+        """
+        if self._artifact_manager_factory is not None:
+            return self._artifact_manager_factory(self._artifacts_dir, project_dir)
+        if self._deduplicate_artifacts:
+            return ContentAddressedArtifactManager(self._artifacts_dir, project_dir,
+                                                   file_artifact_mode=self._file_artifact_mode)
+        return ArtifactManager(self._artifacts_dir, project_dir)
+
+    def _format_size(self, size: int) -> str:
+        """
+        Format a size in bytes as a human-readable string.
+
+        :param size: The size in bytes.
+        :return: The size with a binary unit suffix (e.g., "1.5 MiB").
+        """
+        if size < 1024:
+            return f"{size} B"
+        value = float(size)
+        for unit in ("KiB", "MiB", "GiB"):
+            value /= 1024
+            if value < 1024 or unit == "GiB":
+                break
+        return f"{value:.1f} {unit}"
+
     def _add_extra_details(self, result: Union[ScenarioResult, StepResult],
                            artifact_path: Path) -> None:
         """
@@ -383,3 +484,64 @@ class Artifacted(PluginConfig):
 
     If True, the artifacts directory will be removed at the start of the test run.
     """
+
+    background_cleanup: bool = False
+    """
+    Enable or disable deleting the previous artifacts in a background thread.
+
+    If True, the artifacts directory is renamed aside (a single fast operation) and deleted
+    while the run proceeds, so a large directory doesn't delay the first scenario.
+    Directories left by interrupted or crashed runs are deleted as well.
+    """
+
+    keep_artifacts_runs: int = 0
+    """
+    Number of previous runs whose artifacts are kept.
+
+    If greater than 0, the artifacts directory is renamed aside to
+    `<artifacts_dir>.old-<timestamp>` instead of being deleted, and only the most recent
+    `keep_artifacts_runs` of such directories are kept.
+    """
+
+    save_workers: int = 0
+    """
+    Number of threads that save artifacts in the background.
+
+    If 0 (default), artifacts are saved synchronously in event handlers. Otherwise saving
+    large artifacts doesn't delay the next scenario, and all pending writes are awaited
+    at cleanup, where the artifacts that failed to save are reported.
+    """
+
+    max_pending_artifacts: int = 32
+    """
+    Maximum number of artifact writes in flight.
+
+    When the limit is reached, the run waits for a write to complete (back-pressure),
+    which bounds the memory held by queued artifacts.
+    """
+
+    deduplicate_artifacts: bool = False
+    """
+    Enable or disable storing each distinct artifact content only once.
+
+    If True, contents are saved to `.blobs` inside `artifacts_dir`, named after their
+    SHA-256 hash, and artifacts are hardlinks to them (copies, if hardlinks are not
+    supported). Artifacts that share content share the same file, so they must not be
+    modified after the run.
+    """
+
+    file_artifact_mode: str = "copy"
+    """
+    How the source of a file artifact is stored, if `deduplicate_artifacts` is True.
+
+    "copy" leaves the source intact, "link" hardlinks the source (it must not change
+    after it is attached), and "move" moves the source into the artifacts directory.
+    """
+
+    show_artifacts_stats: bool = False
+    """
+    Enable or disable adding artifact saving statistics to the report summary.
+
+    The summary contains the number of saved artifacts, bytes written, total write time
+    and the time the run spent waiting for writes.
+    """
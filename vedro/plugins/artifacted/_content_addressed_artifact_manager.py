@@ -0,0 +1,231 @@
+import hashlib
+import os
+import shutil
+from pathlib import Path
+from typing import Callable
+from uuid import uuid4
+
+from vedro.core import FileArtifact, MemoryArtifact, StreamArtifact
+
+from ._artifact_manager import ArtifactManager
+
+__all__ = ("ContentAddressedArtifactManager", "FILE_ARTIFACT_MODES",)
+
+FILE_ARTIFACT_MODES = ("copy", "link", "move")
+
+
+class ContentAddressedArtifactManager(ArtifactManager):
+    """
+    Manages artifacts, storing each distinct content only once.
+
+    The content of an artifact is written to a blob named after its SHA-256 hash
+    in the `.blobs` directory inside the artifacts directory. The artifact itself
+    is a hardlink to the blob, so the same payload attached to many scenarios takes
+    the disk space (and the write time) of a single copy. If hardlinks are not
+    supported (e.g., the blobs directory is on another file system), the blob is copied.
+
+    Since artifacts that share content share the same file, they must be treated
+    as read-only.
+    """
+
+    BLOBS_DIR = ".blobs"
+
+    def __init__(self, artifacts_dir: Path, project_dir: Path, *,
+                 file_artifact_mode: str = "copy") -> None:
+        """
+        Initialize the ContentAddressedArtifactManager with the specified directories.
+
+        :param artifacts_dir: The directory where artifacts will be stored.
+        :param project_dir: The base project directory, used to resolve relative paths
+                            for file artifacts.
+        :param file_artifact_mode: How the source of a file artifact is stored in a blob,
+                                   one of FILE_ARTIFACT_MODES. "copy" leaves the source
+                                   intact, "link" hardlinks it (the source must not change
+                                   afterwards), and "move" moves it into the blobs directory.
+        :raises ValueError: If the file artifact mode is unknown.
+        """
+        if file_artifact_mode not in FILE_ARTIFACT_MODES:
+            modes = ", ".join(repr(x) for x in FILE_ARTIFACT_MODES)
+            raise ValueError(
+                f"Unknown file artifact mode {file_artifact_mode!r}, expected one of {modes}"
+            )
+        super().__init__(artifacts_dir, project_dir)
+        self._blobs_dir = artifacts_dir / self.BLOBS_DIR
+        self._file_artifact_mode = file_artifact_mode
+
+    def _save_memory_artifact(self, artifact: MemoryArtifact, path: Path) -> Path:
+        """
+        Save a MemoryArtifact as a link to the blob with its content.
+
+        :param artifact: The MemoryArtifact to save.
+        :param path: The directory where the artifact should be saved.
+        :return: The path to the saved artifact.
+        :raises PermissionError: If writing to the file is denied.
+        :raises OSError: If an unexpected OS error occurs while writing the file.
+        """
+        artifact_dest = self.get_artifact_path(artifact, path)
+        digest = hashlib.sha256(artifact.data).hexdigest()
+        try:
+            blob_path = self._store_blob(digest, lambda tmp: tmp.write_bytes(artifact.data))
+            self._link_blob(blob_path, artifact_dest)
+        except PermissionError as e:
+            raise self._make_permissions_error(
+                f"Permission denied when writing to '{artifact_dest}'."
+            ) from e
+        except OSError as e:
+            raise OSError(f"Failed to write MemoryArtifact to '{artifact_dest}': {e}") from e
+        else:
+            return artifact_dest
+
+    def _save_file_artifact(self, artifact: FileArtifact, path: Path) -> Path:
+        """
+        Save a FileArtifact as a link to the blob with its content.
+
+        The source file is copied, linked or moved to the blob, depending on
+        the file artifact mode. If the blob already exists, a moved source is removed.
+
+        :param artifact: The FileArtifact to save.
+        :param path: The directory where the artifact should be saved.
+        :return: The path to the saved artifact.
+        :raises FileNotFoundError: If the source file does not exist.
+        :raises PermissionError: If copying the file is denied.
+        :raises OSError: If an unexpected OS error occurs while copying the file.
+        """
+        artifact_dest = self.get_artifact_path(artifact, path)
+        artifact_source = artifact.path
+        if not artifact_source.is_absolute():
+            artifact_source = (self._project_dir / artifact_source).resolve()
+        try:
+            digest = self._hash_file(artifact_source)
+            blob_path = self._store_blob(digest,
+                                         lambda tmp: self._transfer_file(artifact_source, tmp))
+            if self._file_artifact_mode == "move" and artifact_source.exists():
+                artifact_source.unlink()
+            self._link_blob(blob_path, artifact_dest)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Source file '{artifact_source}' not found: {e}") from e
+        except PermissionError as e:
+            raise self._make_permissions_error(
+                f"Permission denied when copying from '{artifact_source}' to '{artifact_dest}'."
+            ) from e
+        except OSError as e:
+            raise OSError(
+                f"Failed to copy FileArtifact from '{artifact_source}' to '{artifact_dest}': {e}"
+            ) from e
+        else:
+            return artifact_dest
+
+    def _save_stream_artifact(self, artifact: StreamArtifact, path: Path) -> Path:
+        """
+        Save a StreamArtifact as a link to the blob with its (possibly compressed) content.
+
+        The stream is written to a temporary file in the blobs directory, which becomes
+        the blob, unless a blob with the same content already exists.
+
+        :param artifact: The StreamArtifact to save.
+        :param path: The directory where the artifact should be saved.
+        :return: The path to the saved artifact.
+        :raises PermissionError: If writing to the file is denied.
+        :raises OSError: If an unexpected OS error occurs while writing the file.
+        """
+        artifact_dest = self.get_artifact_path(artifact, path)
+        self._blobs_dir.mkdir(parents=True, exist_ok=True)
+        stream_path = self._blobs_dir / f".stream-{uuid4().hex}"
+        try:
+            self._write_stream(artifact, stream_path)
+            digest = self._hash_file(stream_path)
+            blob_path = self._store_blob(digest, lambda tmp: os.replace(stream_path, tmp))
+            self._link_blob(blob_path, artifact_dest)
+        except PermissionError as e:
+            raise self._make_permissions_error(
+                f"Permission denied when writing to '{artifact_dest}'."
+            ) from e
+        except OSError as e:
+            raise OSError(f"Failed to write StreamArtifact to '{artifact_dest}': {e}") from e
+        else:
+            artifact.mark_saved(artifact_dest)
+            return artifact_dest
+        finally:
+            stream_path.unlink(missing_ok=True)
+
+    def _hash_file(self, path: Path) -> str:
+        """
+        Compute the SHA-256 hash of a file's content.
+
+        :param path: The path to the file.
+        :return: The hexadecimal digest.
+        """
+        sha256 = hashlib.sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                sha256.update(chunk)
+        return sha256.hexdigest()
+
+    def _store_blob(self, digest: str, write: Callable[[Path], object]) -> Path:
+        """
+        Store the blob with the given digest, unless it already exists.
+
+        The content is written to a temporary file in the blobs directory and then linked
+        to the blob path, so a blob is never observed partially written. If concurrent writers
+        store the same content, the first one wins and all artifacts link to the same blob.
+
+        :param digest: The hash of the content.
+        :param write: A function that writes the content to the given path.
+        :return: The path to the blob.
+        """
+        blob_path = self._blobs_dir / digest
+        if blob_path.exists():
+            return blob_path
+
+        self._blobs_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._blobs_dir / f".{digest}-{uuid4().hex}"
+        try:
+            write(tmp_path)
+            try:
+                os.link(tmp_path, blob_path)
+            except FileExistsError:
+                pass
+            except OSError:
+                os.replace(tmp_path, blob_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return blob_path
+
+    def _transfer_file(self, source: Path, dest: Path) -> None:
+        """
+        Transfer the source of a file artifact to a (temporary) blob path,
+        according to the file artifact mode. Falls back to copying if the source
+        can't be linked or moved (e.g., it is on another file system).
+
+        :param source: The source file.
+        :param dest: The destination path, which must not exist.
+        """
+        if self._file_artifact_mode != "copy":
+            try:
+                if self._file_artifact_mode == "link":
+                    os.link(source, dest)
+                else:
+                    os.replace(source, dest)
+                return
+            except FileNotFoundError:
+                raise
+            except OSError:
+                pass
+        shutil.copy2(source, dest)
+
+    def _link_blob(self, blob_path: Path, dest: Path) -> None:
+        """
+        Make the artifact at `dest` point to the blob, replacing an existing file.
+
+        :param blob_path: The path to the blob.
+        :param dest: The path to the artifact.
+        """
+        dest.unlink(missing_ok=True)
+        try:
+            os.link(blob_path, dest)
+        except FileExistsError:
+            # Another writer saved an artifact with the same name meanwhile
+            dest.unlink()
+            os.link(blob_path, dest)
+        except OSError:
+            shutil.copy2(blob_path, dest)
@@ -1,8 +1,11 @@
+import os
+import site
+import sysconfig
 from importlib.abc import MetaPathFinder
 from importlib.machinery import ModuleSpec, PathFinder
 from pathlib import Path
 from types import ModuleType
-from typing import List, Optional, Sequence, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from ._assert_rewriter_adapter import AssertRewriterAdapter
 
@@ -19,17 +22,40 @@ class AssertRewriterFinder(MetaPathFinder):
     modules that reside under any configured rewrite directory, it wraps the
     discovered loader with :class:`AssertRewriterAdapter`. This enables AST
     transformations that enrich assertion failures while preserving semantics.
+
+    Since the finder is consulted on every import in the process, the decision
+    is cheap for the vast majority of (third-party and standard library) modules:
+    modules in library locations (see ``skip_paths``) are never rewritten and
+    are recognised by a string prefix before anything is resolved, and the
+    verdict for any other directory is resolved once and cached.
     """
 
-    def __init__(self, rewrite_paths: RewritePathsType) -> None:
+    def __init__(self, rewrite_paths: RewritePathsType, *,
+                 skip_paths: Optional[Iterable[str]] = None) -> None:
         """
         Initialize the finder with directories to rewrite.
 
         :param rewrite_paths: Iterable of directories whose Python modules
                               should have their ``assert`` statements rewritten. Paths are stored
                               as a tuple in the order they are provided.
+        :param skip_paths: Library directories whose modules are never rewritten, unless
+                           they contain one of the rewrite paths. Defaults to the standard
+                           library and site-packages directories.
         """
         self._rewrite_paths = tuple(rewrite_paths)
+        self._rewrite_prefixes = tuple(self._make_prefix(os.path.realpath(path))
+                                       for path in self._rewrite_paths)
+
+        if skip_paths is None:
+            skip_paths = self._get_library_paths()
+        skip_prefixes = {self._make_prefix(path) for path in skip_paths}
+        skip_prefixes |= {self._make_prefix(os.path.realpath(path)) for path in skip_paths}
+        self._skip_prefixes = tuple(sorted(
+            prefix for prefix in skip_prefixes
+            if not any(root.startswith(prefix) for root in self._rewrite_prefixes)
+        ))
+
+        self._dir_verdicts: Dict[str, bool] = {}
 
     @property
     def rewrite_paths(self) -> Tuple[Path, ...]:
@@ -61,6 +87,12 @@ class AssertRewriterFinder(MetaPathFinder):
         :return: A possibly modified :class:`ModuleSpec` if the module is found,
                  or ``None`` if the module cannot be found.
         """
+        # Submodules of library packages are left to the default finders
+        # (paths are compared case-normalised, as the prefixes are, e.g., on Windows)
+        if path and all(os.path.normcase(entry).startswith(self._skip_prefixes)
+                        for entry in path):
+            return None
+
         # Use PathFinder as a class, not instance
         spec = PathFinder.find_spec(fullname, path, target)
 
@@ -73,43 +105,72 @@ class AssertRewriterFinder(MetaPathFinder):
             return spec
 
         # Skip special origins
-        if spec.origin in (None, "built-in", "frozen"):
+        origin = spec.origin
+        if (origin is None) or (origin in ("built-in", "frozen")):
             return spec
 
         # Ensure loader exists before wrapping
         if not spec.loader:
             return spec
 
-        # Only rewrite Python source files
-        try:
-            module_path = Path(spec.origin).resolve()  # type: ignore
-        except (ValueError, OSError):
-            # Can't resolve path, skip rewriting
-            return spec
-
-        if module_path.suffix != ".py":
-            # Skip .pyc, .pyd, .so, etc.
+        # Only rewrite Python source files (skip .pyc, .pyd, .so, etc.)
+        if not origin.endswith(".py"):
             return spec
 
-        # Check if module is under any of the rewrite paths
-        for rewrite_path in self._rewrite_paths:
-            if self._is_relative_to(module_path, rewrite_path):
-                spec.loader = AssertRewriterAdapter(spec.loader)
-                break
+        if self._is_rewritable(origin):
+            spec.loader = AssertRewriterAdapter(spec.loader)
 
         return spec
 
-    def _is_relative_to(self, path: Path, parent: Path) -> bool:
+    def _is_rewritable(self, origin: str) -> bool:
         """
-        Check if the given path is relative to the specified parent directory.
+        Check if the module at the given location is under any of the rewrite paths.
+
+        Modules in library locations are rejected without resolving their paths.
+        For other modules, the real path of the directory is resolved once, and the
+        verdict is cached for all the modules in that directory.
 
-        :param path: The path to check.
-        :param parent: The parent directory to check against.
-        :return: True if the path is relative to the parent directory, False otherwise.
+        :param origin: The (unresolved) path to the module file.
+        :return: True if the module should be rewritten, False otherwise.
         """
-        try:
-            path.relative_to(parent)
-        except ValueError:
+        origin = os.path.normcase(origin)
+        if origin.startswith(self._skip_prefixes):
             return False
-        else:
-            return True
+
+        dirname = os.path.dirname(origin)
+        verdict = self._dir_verdicts.get(dirname)
+        if verdict is None:
+            try:
+                real_dirname = self._make_prefix(os.path.realpath(dirname))
+            except (ValueError, OSError):
+                # Can't resolve path, skip rewriting
+                verdict = False
+            else:
+                verdict = real_dirname.startswith(self._rewrite_prefixes)
+            self._dir_verdicts[dirname] = verdict
+        return verdict
+
+    def _make_prefix(self, path: Union[str, Path]) -> str:
+        """
+        Normalise a directory path into a string prefix ending with a separator,
+        so that ``/app/effects`` does not match ``/app/effects_old``.
+
+        :param path: The directory path.
+        :return: The normalised prefix.
+        """
+        return os.path.join(os.path.normcase(os.path.abspath(path)), "")
+
+    def _get_library_paths(self) -> List[str]:
+        """
+        Return the standard library and site-packages directories.
+
+        :return: A list of library directories.
+        """
+        paths = sysconfig.get_paths()
+        library_paths = [paths[name] for name in ("stdlib", "platstdlib", "purelib", "platlib")
+                         if name in paths]
+        if hasattr(site, "getsitepackages"):
+            library_paths += site.getsitepackages()
+        if site.ENABLE_USER_SITE and hasattr(site, "getusersitepackages"):
+            library_paths.append(site.getusersitepackages())
+        return library_paths
@@ -26,21 +26,21 @@ class AssertRewriterLoader(ModuleFileLoader):  # TODO: consider renaming to Asse
     assert_module = "vedro.plugins.assert_rewriter"
     assert_tool = "assert_"
     assert_methods = {
-        ast.Eq: "assert_equal",
-        ast.NotEq: "assert_not_equal",
+        ast.Eq: "fail_equal",
+        ast.NotEq: "fail_not_equal",
 
-        ast.Lt: "assert_less",
-        ast.LtE: "assert_less_equal",
-        ast.Gt: "assert_greater",
-        ast.GtE: "assert_greater_equal",
+        ast.Lt: "fail_less",
+        ast.LtE: "fail_less_equal",
+        ast.Gt: "fail_greater",
+        ast.GtE: "fail_greater_equal",
 
-        ast.Is: "assert_is",
-        ast.IsNot: "assert_is_not",
+        ast.Is: "fail_is",
+        ast.IsNot: "fail_is_not",
 
-        ast.In: "assert_in",
-        ast.NotIn: "assert_not_in",
+        ast.In: "fail_in",
+        ast.NotIn: "fail_not_in",
 
-        type(None): "assert_truthy",
+        type(None): "fail_truthy",
     }
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Any, Union
+from typing import Any, NoReturn, Union
 
 from niltype import Nil, Nilable, NilType
 
@@ -52,7 +52,7 @@ class AssertionTool:
         """
         if left:
             return True
-        raise self._create_assertion_error(left=left, message=message)
+        self.fail_truthy(left, message)
 
     def assert_equal(self, left: Any, right: Any, message: Nilable[Any] = Nil) -> bool:
         """
@@ -66,9 +66,7 @@ class AssertionTool:
         """
         if left == right:
             return True
-        raise self._create_assertion_error(left=left, right=right,
-                                           operator=CompareOperator.EQUAL,
-                                           message=message)
+        self.fail_equal(left, right, message)
 
     def assert_not_equal(self, left: Any, right: Any, message: Nilable[Any] = Nil) -> bool:
         """
@@ -82,10 +80,7 @@ class AssertionTool:
         """
         if left != right:
             return True
-
-        raise self._create_assertion_error(left=left, right=right,
-                                           operator=CompareOperator.NOT_EQUAL,
-                                           message=message)
+        self.fail_not_equal(left, right, message)
 
     def assert_less(self, left: Any, right: Any, message: Nilable[Any] = Nil) -> bool:
         """
@@ -99,9 +94,7 @@ class AssertionTool:
         """
         if left < right:
             return True
-        raise self._create_assertion_error(left=left, right=right,
-                                           operator=CompareOperator.LESS,
-                                           message=message)
+        self.fail_less(left, right, message)
 
     def assert_less_equal(self, left: Any, right: Any, message: Nilable[Any] = Nil) -> bool:
         """
@@ -115,9 +108,7 @@ class AssertionTool:
         """
         if left <= right:
             return True
-        raise self._create_assertion_error(left=left, right=right,
-                                           operator=CompareOperator.LESS_EQUAL,
-                                           message=message)
+        self.fail_less_equal(left, right, message)
 
     def assert_greater(self, left: Any, right: Any, message: Nilable[Any] = Nil) -> bool:
         """
@@ -131,9 +122,7 @@ class AssertionTool:
         """
         if left > right:
             return True
-        raise self._create_assertion_error(left=left, right=right,
-                                           operator=CompareOperator.GREATER,
-                                           message=message)
+        self.fail_greater(left, right, message)
 
     def assert_greater_equal(self, left: Any, right: Any, message: Nilable[Any] = Nil) -> bool:
         """
@@ -148,10 +137,7 @@ class AssertionTool:
         """
         if left >= right:
             return True
-
-        raise self._create_assertion_error(left=left, right=right,
-                                           operator=CompareOperator.GREATER_EQUAL,
-                                           message=message)
+        self.fail_greater_equal(left, right, message)
 
     def assert_is(self, left: Any, right: Any, message: Nilable[Any] = Nil) -> bool:
         """
@@ -165,9 +151,7 @@ class AssertionTool:
         """
         if left is right:
             return True
-        raise self._create_assertion_error(left=left, right=right,
-                                           operator=CompareOperator.IS,
-                                           message=message)
+        self.fail_is(left, right, message)
 
     def assert_is_not(self, left: Any, right: Any, message: Nilable[Any] = Nil) -> bool:
         """
@@ -181,9 +165,7 @@ class AssertionTool:
         """
         if left is not right:
             return True
-        raise self._create_assertion_error(left=left, right=right,
-                                           operator=CompareOperator.IS_NOT,
-                                           message=message)
+        self.fail_is_not(left, right, message)
 
     def assert_in(self, left: Any, right: Any, message: Nilable[Any] = Nil) -> bool:
         """
@@ -197,9 +179,7 @@ class AssertionTool:
         """
         if left in right:
             return True
-        raise self._create_assertion_error(left=left, right=right,
-                                           operator=CompareOperator.IN,
-                                           message=message)
+        self.fail_in(left, right, message)
 
     def assert_not_in(self, left: Any, right: Any, message: Nilable[Any] = Nil) -> bool:
         """
@@ -213,6 +193,147 @@ class AssertionTool:
         """
         if left not in right:
             return True
+        self.fail_not_in(left, right, message)
+
+    def fail_truthy(self, left: Any, message: Nilable[Any] = Nil) -> NoReturn:
+        """
+        Fail the assertion that the value is truthy.
+
+        Rewritten assert statements check their conditions inline and call
+        the `fail_*` methods only when a condition does not hold.
+
+        :param left: The value that is not truthy.
+        :param message: An optional message to include in the assertion error.
+        :raises AssertionError: Always.
+        """
+        raise self._create_assertion_error(left=left, message=message)
+
+    def fail_equal(self, left: Any, right: Any, message: Nilable[Any] = Nil) -> NoReturn:
+        """
+        Fail the assertion that two values are equal.
+
+        :param left: The first compared value.
+        :param right: The second compared value.
+        :param message: An optional message to include in the assertion error.
+        :raises AssertionError: Always.
+        """
+        raise self._create_assertion_error(left=left, right=right,
+                                           operator=CompareOperator.EQUAL,
+                                           message=message)
+
+    def fail_not_equal(self, left: Any, right: Any, message: Nilable[Any] = Nil) -> NoReturn:
+        """
+        Fail the assertion that two values are not equal.
+
+        :param left: The first compared value.
+        :param right: The second compared value.
+        :param message: An optional message to include in the assertion error.
+        :raises AssertionError: Always.
+        """
+        raise self._create_assertion_error(left=left, right=right,
+                                           operator=CompareOperator.NOT_EQUAL,
+                                           message=message)
+
+    def fail_less(self, left: Any, right: Any, message: Nilable[Any] = Nil) -> NoReturn:
+        """
+        Fail the assertion that the first value is less than the second value.
+
+        :param left: The first compared value.
+        :param right: The second compared value.
+        :param message: An optional message to include in the assertion error.
+        :raises AssertionError: Always.
+        """
+        raise self._create_assertion_error(left=left, right=right,
+                                           operator=CompareOperator.LESS,
+                                           message=message)
+
+    def fail_less_equal(self, left: Any, right: Any, message: Nilable[Any] = Nil) -> NoReturn:
+        """
+        Fail the assertion that the first value is less than or equal to the second value.
+
+        :param left: The first compared value.
+        :param right: The second compared value.
+        :param message: An optional message to include in the assertion error.
+        :raises AssertionError: Always.
+        """
+        raise self._create_assertion_error(left=left, right=right,
+                                           operator=CompareOperator.LESS_EQUAL,
+                                           message=message)
+
+    def fail_greater(self, left: Any, right: Any, message: Nilable[Any] = Nil) -> NoReturn:
+        """
+        Fail the assertion that the first value is greater than the second value.
+
+        :param left: The first compared value.
+        :param right: The second compared value.
+        :param message: An optional message to include in the assertion error.
+        :raises AssertionError: Always.
+        """
+        raise self._create_assertion_error(left=left, right=right,
+                                           operator=CompareOperator.GREATER,
+                                           message=message)
+
+    def fail_greater_equal(self, left: Any, right: Any, message: Nilable[Any] = Nil) -> NoReturn:
+        """
+        Fail the assertion that the first value is greater than or equal to the second value.
+
+        :param left: The first compared value.
+        :param right: The second compared value.
+        :param message: An optional message to include in the assertion error.
+        :raises AssertionError: Always.
+        """
+        raise self._create_assertion_error(left=left, right=right,
+                                           operator=CompareOperator.GREATER_EQUAL,
+                                           message=message)
+
+    def fail_is(self, left: Any, right: Any, message: Nilable[Any] = Nil) -> NoReturn:
+        """
+        Fail the assertion that the first value is the same object as the second value.
+
+        :param left: The first compared value.
+        :param right: The second compared value.
+        :param message: An optional message to include in the assertion error.
+        :raises AssertionError: Always.
+        """
+        raise self._create_assertion_error(left=left, right=right,
+                                           operator=CompareOperator.IS,
+                                           message=message)
+
+    def fail_is_not(self, left: Any, right: Any, message: Nilable[Any] = Nil) -> NoReturn:
+        """
+        Fail the assertion that the first value is not the same object as the second value.
+
+        :param left: The first compared value.
+        :param right: The second compared value.
+        :param message: An optional message to include in the assertion error.
+        :raises AssertionError: Always.
+        """
+        raise self._create_assertion_error(left=left, right=right,
+                                           operator=CompareOperator.IS_NOT,
+                                           message=message)
+
+    def fail_in(self, left: Any, right: Any, message: Nilable[Any] = Nil) -> NoReturn:
+        """
+        Fail the assertion that the first value is in the second value.
+
+        :param left: The first compared value.
+        :param right: The second compared value.
+        :param message: An optional message to include in the assertion error.
+        :raises AssertionError: Always.
+        """
+        raise self._create_assertion_error(left=left, right=right,
+                                           operator=CompareOperator.IN,
+                                           message=message)
+
+    def fail_not_in(self, left: Any, right: Any, message: Nilable[Any] = Nil) -> NoReturn:
+        """
+        Fail the assertion that the first value is not in the second value.
+
+        :param left: The first compared value.
+        :param right: The second compared value.
+        :param message: An optional message to include in the assertion error.
+        :raises AssertionError: Always.
+        """
         raise self._create_assertion_error(left=left, right=right,
                                            operator=CompareOperator.NOT_IN,
                                            message=message)
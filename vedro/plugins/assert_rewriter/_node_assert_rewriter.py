@@ -1,6 +1,6 @@
 import ast
 import warnings
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
 from niltype import Nil
 
@@ -9,87 +9,151 @@ __all__ = ("NodeAssertRewriter",)
 
 class NodeAssertRewriter(ast.NodeTransformer):
     """
-    Transforms assert statements into calls to custom assertion methods.
+    Transforms assert statements into inline checks with calls to custom assertion methods.
 
     This class rewrites assert statements in the abstract syntax tree (AST)
-    to use a specified assertion tool with custom assertion methods.
+    to use a specified assertion tool with custom assertion methods. The condition
+    is checked inline, and the assertion method is called only when it does not hold,
+    so passing assertions cost no more than plain comparisons:
+
+        assert f(x) == y, "message"
+
+    becomes
+
+        if not (__vedro_operand_0__ := f(x)) == y:
+            assert_tool.fail_equal(__vedro_operand_0__, y, message="message")
+        del __vedro_operand_0__
+
+    Operands other than names and constants are evaluated once and kept in temporary
+    variables. The temporaries are deleted once the check passes, so they neither keep
+    the values alive nor leak into module globals. If the check fails, they stay in
+    the frame, but their dunder names are hidden from the locals shown in tracebacks.
     """
 
+    operand_name = "__vedro_operand_{}__"
+
     def __init__(self, assert_tool: str, assert_methods: Dict[Any, str]) -> None:
         """
         Initialize the AssertRewriter with the specified assertion tool and methods.
 
         :param assert_tool: The tool used for assertions.
-        :param assert_methods: A dictionary mapping AST comparison operators to assertion methods.
+        :param assert_methods: A dictionary mapping AST comparison operators to assertion methods,
+                               which are called when the corresponding comparison fails.
         """
         super().__init__()
         self._assert_tool = assert_tool
         self._assert_methods = assert_methods
 
-    def visit_Assert(self, node: ast.Assert) -> Union[ast.Assert, ast.Expr]:
+    def visit_Assert(self, node: ast.Assert) -> Union[ast.Assert, List[ast.stmt]]:
         """
         Visit assert nodes and rewrite them using the custom assertion methods.
 
         :param node: The assert node in the AST.
-        :return: The rewritten assert node or the original if rewriting fails.
+        :return: The rewritten statements or the original node if rewriting fails.
         """
         try:
-            new_node = self._rewrite_expr(node.test, node.msg)
+            new_nodes = self._rewrite_expr(node.test, node.msg)
         except:  # noqa
             return node
         else:
-            ast.copy_location(new_node, node)
-            ast.fix_missing_locations(new_node)
-            return new_node
+            for new_node in new_nodes:
+                ast.copy_location(new_node, node)
+                ast.fix_missing_locations(new_node)
+            return new_nodes
 
-    def _rewrite_expr(self, node: ast.expr, msg: Union[ast.AST, None] = None) -> ast.Expr:
+    def _rewrite_expr(self, node: ast.expr, msg: Union[ast.AST, None] = None) -> List[ast.stmt]:
         """
         Rewrite the expression of an assert node.
 
         :param node: The expression node in the assert statement.
         :param msg: The message node in the assert statement, if any.
-        :return: An expression node containing the rewritten assertion call.
-                 Returns ast.Expr instead of ast.Assert to survive -O optimization.
+        :return: A list of statements containing the rewritten assertion.
+                 Returns ast.If instead of ast.Assert to survive -O optimization.
         """
         if isinstance(node, ast.Compare):
             return self._rewrite_compare(node, msg)
-        return ast.Expr(value=self._create_assert(node, msg=msg))
+        test, left = self._bind_operand(node, 0)
+        return [self._create_assert(test, left, msg=msg)] + self._delete_operands([test])
 
-    def _rewrite_compare(self, node: ast.Compare, msg: Optional[ast.AST] = None) -> ast.Expr:
+    def _rewrite_compare(self, node: ast.Compare, msg: Optional[ast.AST] = None) -> List[ast.stmt]:
         """
         Rewrite a comparison expression in an assert statement.
 
         :param node: The comparison node in the assert statement.
         :param msg: The message node in the assert statement, if any.
-        :return: An expression node with the rewritten comparison as chained assertion calls.
-                 Returns ast.Expr instead of ast.Assert to survive -O optimization.
+        :return: A list of statements checking the comparisons of the chain one by one,
+                 each operand being evaluated once.
+                 Returns ast.If instead of ast.Assert to survive -O optimization.
         """
-        assertions = []
+        assertions: List[ast.stmt] = []
 
-        left = node.left
-        for op, right in zip(node.ops, node.comparators):
-            assert_expr = self._create_assert(left, right, op, msg)
-            assertions.append(assert_expr)
-            left = right
+        left_expr, left = self._bind_operand(node.left, 0)
+        operands = [left_expr]
+        for idx, (op, right) in enumerate(zip(node.ops, node.comparators), start=1):
+            right_expr, right_ref = self._bind_operand(right, idx)
+            operands.append(right_expr)
+            test = ast.Compare(left=left_expr, ops=[op], comparators=[right_expr])
+            assertions.append(self._create_assert(test, left, right_ref, op, msg))
+            left_expr, left = self._copy_ref(right_ref), right_ref
 
-        and_expr = assertions[0]
-        for assert_expr in assertions[1:]:
-            and_expr = ast.BoolOp(op=ast.And(), values=[and_expr, assert_expr])  # type: ignore
+        return assertions + self._delete_operands(operands)
+
+    def _bind_operand(self, node: ast.expr, index: int) -> Tuple[ast.expr, ast.expr]:
+        """
+        Make an operand reusable in the assertion call without evaluating it twice.
+
+        :param node: The operand node.
+        :param index: The index of the operand in the assert statement.
+        :return: A tuple of the expression evaluating the operand (to be used in the check)
+                 and the expression referring to its value (to be used in the assertion call).
+        """
+        if isinstance(node, (ast.Name, ast.Constant)):
+            return node, self._copy_ref(node)
+        name = self.operand_name.format(index)
+        named_expr = ast.NamedExpr(target=ast.Name(id=name, ctx=ast.Store()), value=node)
+        return named_expr, ast.Name(id=name, ctx=ast.Load())
 
-        return ast.Expr(value=and_expr)
+    def _delete_operands(self, operands: List[ast.expr]) -> List[ast.stmt]:
+        """
+        Create a statement deleting the temporary variables bound by the operands.
+
+        The statement is reached only when all the checks pass, and by then every
+        temporary variable has been bound.
+
+        :param operands: The expressions evaluating the operands (see `_bind_operand`).
+        :return: A list with the del statement, or an empty list if nothing is bound.
+        """
+        targets: List[ast.expr] = [
+            ast.Name(id=operand.target.id, ctx=ast.Del())
+            for operand in operands if isinstance(operand, ast.NamedExpr)
+        ]
+        return [ast.Delete(targets=targets)] if targets else []
+
+    def _copy_ref(self, node: ast.expr) -> ast.expr:
+        """
+        Copy a reference to an operand (a name or a constant).
+
+        :param node: The name or constant node.
+        :return: A new node referring to the same value.
+        """
+        if isinstance(node, ast.Constant):
+            return ast.Constant(value=node.value)
+        return ast.Name(id=cast(ast.Name, node).id, ctx=ast.Load())
 
-    def _create_assert(self, left: ast.AST,
+    def _create_assert(self, test: ast.expr,
+                       left: ast.AST,
                        right: Optional[ast.AST] = None,
                        operator: Optional[ast.AST] = None,
-                       msg: Optional[ast.AST] = None) -> ast.Call:
+                       msg: Optional[ast.AST] = None) -> ast.If:
         """
-        Create an assertion call.
+        Create an inline check calling the assertion method when it fails.
 
+        :param test: The condition of the assertion.
         :param left: The left operand of the assertion.
         :param right: The right operand of the assertion, if any.
         :param operator: The comparison operator, if any.
         :param msg: The message for the assertion, if any.
-        :return: An AST node representing the assertion call.
+        :return: An AST node representing the check.
         :raises ValueError: If the operator is unsupported.
         """
         args = [left, right] if (right is not None) else [left]
@@ -97,7 +161,9 @@ class NodeAssertRewriter(ast.NodeTransformer):
 
         method = self._assert_methods.get(type(operator), Nil)
         if method is not Nil:
-            return self._create_assert_call(method, args, keywords)
+            call = self._create_assert_call(method, args, keywords)
+            return ast.If(test=ast.UnaryOp(op=ast.Not(), operand=test),
+                          body=[ast.Expr(value=call)], orelse=[])
         else:
             warnings.warn(f"NodeAssertRewriter: Unsupported operator '{operator}'")
             raise ValueError(f"Unsupported operator: '{operator}'")
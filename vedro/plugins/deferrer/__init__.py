@@ -1,3 +1,6 @@
 from ._deferrer import Deferrer, DeferrerPlugin, defer, defer_global
+from ._session_context import session_context
+from ._session_resources import SessionResources, SessionResourceStats
 
-__all__ = ("Deferrer", "DeferrerPlugin", "defer", "defer_global",)
+__all__ = ("Deferrer", "DeferrerPlugin", "defer", "defer_global", "session_context",
+           "SessionResources", "SessionResourceStats",)
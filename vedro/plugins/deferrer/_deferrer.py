@@ -1,5 +1,6 @@
 from asyncio import iscoroutinefunction
 from collections import deque
+from contextvars import ContextVar
 from typing import Any, Callable, Deque, Dict, Tuple, Type, Union, final
 
 from vedro.core import Dispatcher, Plugin, PluginConfig
@@ -11,12 +12,16 @@ from vedro.events import (
     StartupEvent,
 )
 
+from ._session_resources import SessionResources, _resources
+
 __all__ = ("Deferrer", "DeferrerPlugin", "defer", "defer_global", "Deferrable",)
 
 
 Deferrable = Tuple[Callable[..., Any], Tuple[Any, ...], Dict[str, Any]]
 
-_queue: Deque[Deferrable] = deque()
+# The queue is kept per context, so that scenarios running concurrently
+# (e.g., parallel repeats) don't run each other's deferred functions
+_queue: ContextVar[Deque[Deferrable]] = ContextVar("_queue", default=deque())
 _global_queue: Deque[Deferrable] = deque()
 
 
@@ -34,7 +39,7 @@ def defer(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
     :param args: Positional arguments to be passed to the function.
     :param kwargs: Keyword arguments to be passed to the function.
     """
-    _queue.append((fn, args, kwargs))
+    _queue.get().append((fn, args, kwargs))
 
 
 def defer_global(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
@@ -63,19 +68,23 @@ class DeferrerPlugin(Plugin):
     """
 
     def __init__(self, config: Type["Deferrer"], *,
-                 queue: Deque[Deferrable] = _queue,
-                 global_queue: Deque[Deferrable] = _global_queue) -> None:
+                 queue: ContextVar[Deque[Deferrable]] = _queue,
+                 global_queue: Deque[Deferrable] = _global_queue,
+                 resources: SessionResources = _resources) -> None:
         """
         Initialize the DeferrerPlugin with the provided configuration.
 
         :param config: The Deferrer configuration class.
-        :param queue: The queue holding deferred functions.
+        :param queue: A context variable holding the queue of deferred functions.
         :param global_queue: The global queue holding deferred functions for the entire
                              test session.
+        :param resources: The pool of resources created by session contexts.
         """
         super().__init__(config)
         self._queue = queue
         self._global_queue = global_queue
+        self._resources = resources
+        self._show_session_resources = config.show_session_resources
 
     def subscribe(self, dispatcher: Dispatcher) -> None:
         """
@@ -96,14 +105,18 @@ class DeferrerPlugin(Plugin):
         :param event: The StartupEvent instance.
         """
         self._global_queue.clear()
+        self._resources.clear()
 
     def on_scenario_run(self, event: ScenarioRunEvent) -> None:
         """
-        Handle the event when a scenario run starts, clearing the deferred function queue.
+        Handle the event when a scenario run starts, starting a new deferred function queue.
+
+        The queue is set in the context of the scenario run, so each of the scenarios
+        running concurrently defers its own functions.
 
         :param event: The ScenarioRunEvent instance.
         """
-        self._queue.clear()
+        self._queue.set(deque())
 
     async def on_scenario_end(self,
                               event: Union[ScenarioPassedEvent, ScenarioFailedEvent]) -> None:
@@ -115,8 +128,9 @@ class DeferrerPlugin(Plugin):
 
         :param event: The ScenarioPassedEvent or ScenarioFailedEvent instance.
         """
-        while len(self._queue) > 0:
-            fn, args, kwargs = self._queue.pop()
+        queue = self._queue.get()
+        while len(queue) > 0:
+            fn, args, kwargs = queue.pop()
             if iscoroutinefunction(fn):
                 await fn(*args, **kwargs)
             else:
@@ -128,6 +142,8 @@ class DeferrerPlugin(Plugin):
 
         Globally deferred functions are executed in reverse order (LIFO). If a deferred function
         is a coroutine, it will be awaited. Otherwise, it will be called as a regular function.
+        Session resources are torn down the same way, after that their usage statistics
+        are added to the report summary.
 
         :param event: The CleanupEvent instance.
         """
@@ -138,6 +154,22 @@ class DeferrerPlugin(Plugin):
             else:
                 fn(*args, **kwargs)
 
+        if self._show_session_resources and self._resources.stats:
+            event.report.add_summary(self._format_session_resources())
+        self._resources.clear()
+
+    def _format_session_resources(self) -> str:
+        """
+        Format usage statistics of session resources for the report summary.
+
+        :return: The summary line.
+        """
+        parts = []
+        for stats in self._resources.stats:
+            parts.append(f"{stats.name} (setup {stats.setups}x in {stats.setup_time:.2f}s, "
+                         f"used {stats.uses}x)")
+        return "session resources: " + ", ".join(parts)
+
 
 class Deferrer(PluginConfig):
     """
@@ -149,3 +181,9 @@ class Deferrer(PluginConfig):
 
     plugin = DeferrerPlugin
     description = "Executes deferred functions at the end of each scenario"
+
+    show_session_resources: bool = True
+    """
+    Add setup time and use counts of session resources (see `session_context`)
+    to the report summary.
+    """
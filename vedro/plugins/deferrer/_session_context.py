@@ -0,0 +1,148 @@
+from functools import wraps
+from inspect import isasyncgenfunction, iscoroutinefunction, isgeneratorfunction
+from time import perf_counter
+from typing import Any, AsyncGenerator, Callable, Dict, Generator, Tuple, TypeVar, cast
+
+from ._deferrer import defer_global
+from ._session_resources import ResourceKey, _resources
+
+__all__ = ("session_context",)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def session_context(fn: F) -> F:
+    """
+    Turn a context function into a session resource shared by all scenarios.
+
+    The function runs once per process (per worker in a distributed run) for each
+    set of arguments, the result is reused by the following calls. A generator function
+    yields the resource and tears it down after the yield, at the end of the run.
+    Teardowns go to the `defer_global` queue, so they run in reverse (LIFO) order
+    together with other globally deferred functions. Coroutine and async generator
+    functions are supported as well.
+
+    Example:
+        @vedro.session_context
+        async def db_pool():
+            pool = await create_pool(DSN)
+            yield pool
+            await pool.close()
+
+    :param fn: The context function to wrap.
+    :return: The wrapped function, marked as a context.
+    :raises TypeError: If the function is called with unhashable arguments.
+    """
+    if isasyncgenfunction(fn) or iscoroutinefunction(fn):
+        wrapper = _make_async_wrapper(fn)
+    else:
+        wrapper = _make_sync_wrapper(fn)
+    setattr(wrapper, "__vedro__context__", True)
+    return cast(F, wrapper)
+
+
+def _make_key(fn: Callable[..., Any],
+              args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> ResourceKey:
+    """
+    Build the key of a resource from its function and call arguments.
+
+    :param fn: The context function.
+    :param args: Positional arguments of the call.
+    :param kwargs: Keyword arguments of the call.
+    :return: The key.
+    :raises TypeError: If the arguments are not hashable.
+    """
+    key = (args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        raise TypeError(f"Arguments of session context {fn.__qualname__}() "
+                        "must be hashable") from None
+    return fn, key
+
+
+def _make_sync_wrapper(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wrap a regular or generator function.
+
+    :param fn: The context function.
+    :return: The wrapper.
+    """
+    @wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        key = _make_key(fn, args, kwargs)
+        with _resources.lock():
+            found, value = _resources.get(key)
+            if found:
+                return value
+
+            started_at = perf_counter()
+            if isgeneratorfunction(fn):
+                generator = fn(*args, **kwargs)
+                value = next(generator)
+                defer_global(_close_generator, fn, generator)
+            else:
+                value = fn(*args, **kwargs)
+            _resources.add(key, value, setup_time=perf_counter() - started_at)
+            return value
+
+    return wrapper
+
+
+def _make_async_wrapper(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wrap a coroutine or async generator function.
+
+    :param fn: The context function.
+    :return: The wrapper.
+    """
+    @wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        key = _make_key(fn, args, kwargs)
+        async with _resources.async_lock(key):
+            found, value = _resources.get(key)
+            if found:
+                return value
+
+            started_at = perf_counter()
+            if isasyncgenfunction(fn):
+                generator = fn(*args, **kwargs)
+                value = await generator.__anext__()
+                defer_global(_aclose_generator, fn, generator)
+            else:
+                value = await fn(*args, **kwargs)
+            _resources.add(key, value, setup_time=perf_counter() - started_at)
+            return value
+
+    return wrapper
+
+
+def _close_generator(fn: Callable[..., Any], generator: Generator[Any, None, None]) -> None:
+    """
+    Run the teardown part of a generator session context.
+
+    :param fn: The context function.
+    :param generator: The generator suspended at its yield.
+    :raises RuntimeError: If the generator yields more than once.
+    """
+    try:
+        next(generator)
+    except StopIteration:
+        return
+    raise RuntimeError(f"Session context {fn.__qualname__}() must yield only once")
+
+
+async def _aclose_generator(fn: Callable[..., Any],
+                            generator: AsyncGenerator[Any, None]) -> None:
+    """
+    Run the teardown part of an async generator session context.
+
+    :param fn: The context function.
+    :param generator: The async generator suspended at its yield.
+    :raises RuntimeError: If the generator yields more than once.
+    """
+    try:
+        await generator.__anext__()
+    except StopAsyncIteration:
+        return
+    raise RuntimeError(f"Session context {fn.__qualname__}() must yield only once")
@@ -0,0 +1,125 @@
+from asyncio import Lock as AsyncLock
+from threading import RLock
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+__all__ = ("SessionResources", "SessionResourceStats", "ResourceKey",)
+
+# (context function, call arguments)
+ResourceKey = Tuple[Callable[..., Any], Hashable]
+
+
+class SessionResourceStats:
+    """
+    Holds usage statistics of a session resource.
+
+    A resource created with different arguments counts as a separate setup.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Initialize the SessionResourceStats.
+
+        :param name: The name of the resource (the qualified name of its function).
+        """
+        self.name = name
+        self.setups = 0
+        self.uses = 0
+        self.setup_time = 0.0
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the SessionResourceStats.
+
+        :return: A string representation of the stats.
+        """
+        return (f"<{self.__class__.__name__} {self.name!r} setups={self.setups} "
+                f"uses={self.uses} setup_time={self.setup_time:.3f}>")
+
+
+class SessionResources:
+    """
+    Keeps session resources created by `session_context` functions.
+
+    Resources live until the end of the run, when the DeferrerPlugin tears them down
+    and clears the pool. The pool is per process, so each worker of a distributed run
+    has its own resources.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty SessionResources pool.
+        """
+        self._values: Dict[ResourceKey, Any] = {}
+        self._stats: Dict[Callable[..., Any], SessionResourceStats] = {}
+        self._async_locks: Dict[ResourceKey, AsyncLock] = {}
+        self._lock = RLock()
+
+    @property
+    def stats(self) -> List[SessionResourceStats]:
+        """
+        Get usage statistics of the resources, in the order they were first set up.
+
+        :return: A list of resource statistics.
+        """
+        return list(self._stats.values())
+
+    def get(self, key: ResourceKey) -> Tuple[bool, Any]:
+        """
+        Get a resource and count the use.
+
+        :param key: The key of the resource.
+        :return: A tuple of (found, value).
+        """
+        if key not in self._values:
+            return False, None
+        self._stats[key[0]].uses += 1
+        return True, self._values[key]
+
+    def add(self, key: ResourceKey, value: Any, *, setup_time: float) -> None:
+        """
+        Add a new resource and count its setup as the first use.
+
+        :param key: The key of the resource.
+        :param value: The resource.
+        :param setup_time: The time it took to set up the resource, in seconds.
+        """
+        fn = key[0]
+        if fn not in self._stats:
+            self._stats[fn] = SessionResourceStats(fn.__qualname__)
+        stats = self._stats[fn]
+        stats.setups += 1
+        stats.uses += 1
+        stats.setup_time += setup_time
+        self._values[key] = value
+
+    def lock(self) -> RLock:
+        """
+        Get the lock that serializes setups of sync resources.
+
+        The lock is reentrant, so a session context may use other session contexts.
+
+        :return: The lock.
+        """
+        return self._lock
+
+    def async_lock(self, key: ResourceKey) -> AsyncLock:
+        """
+        Get the lock that serializes concurrent setups of an async resource.
+
+        :param key: The key of the resource.
+        :return: The lock.
+        """
+        if key not in self._async_locks:
+            self._async_locks[key] = AsyncLock()
+        return self._async_locks[key]
+
+    def clear(self) -> None:
+        """
+        Forget all resources and their statistics.
+        """
+        self._values.clear()
+        self._stats.clear()
+        self._async_locks.clear()
+
+
+_resources = SessionResources()
@@ -222,6 +222,11 @@ class ScenarioReportedEventDict(EventDict):
     Ordered list of step results for the scenario.
     """
 
+    extra_details: List[str]
+    """
+    Extra details of the aggregated result (e.g., latency of repeats), if any.
+    """
+
     rich_output: Optional[str]
     """
     Pre-rendered terminal output captured from the rich reporter, if available.
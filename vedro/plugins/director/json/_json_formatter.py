@@ -1,6 +1,6 @@
 from time import time
 from types import TracebackType
-from typing import Callable, List, Optional, Tuple, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
 
 from vedro.core import (
     AggregatedResult,
@@ -11,7 +11,7 @@ from vedro.core import (
     StepResult,
     VirtualScenario,
 )
-from vedro.core.exc_info import TracebackFilter
+from vedro.core.exc_info import TracebackFilter, TracebackSnapshot
 
 from ._event_types import (
     CleanupEventDict,
@@ -198,7 +198,7 @@ class JsonFormatter:
         :param rich_output: Optional rich output content to include.
         :return: Dictionary containing formatted scenario reported event data with steps.
         """
-        event = {
+        event: Dict[str, Any] = {
             "event": "scenario_reported",
             "timestamp": self._format_timestamp(self._time_fn()),
             "scenario": self.format_scenario(
@@ -208,6 +208,8 @@ class JsonFormatter:
             ),
             "steps": self._format_steps(aggregated_result.step_results),
         }
+        if aggregated_result.extra_details:
+            event["extra_details"] = aggregated_result.extra_details
         if rich_output:
             event["rich_output"] = rich_output
         return cast(ScenarioReportedEventDict, event)
@@ -307,12 +309,15 @@ class JsonFormatter:
         Format exception information into a dictionary.
 
         Extracts the exception type, message, and location (file and line number)
-        from the traceback.
+        from the traceback, or from its snapshot if the traceback is released.
 
         :param exc_info: Exception information object containing type, value, and traceback.
         :return: Dictionary containing formatted exception data.
         """
-        file, lineno = self._get_traceback_lineno(exc_info.traceback)
+        if exc_info.snapshot is not None:
+            file, lineno = self._get_snapshot_lineno(exc_info.snapshot)
+        else:
+            file, lineno = self._get_traceback_lineno(exc_info.traceback)
         return cast(ExcInfoDict, {
             "type": exc_info.type.__name__,
             "message": str(exc_info.value),
@@ -320,16 +325,34 @@ class JsonFormatter:
             "lineno": lineno,
         })
 
-    def _get_traceback_lineno(self, traceback: TracebackType) -> TracebackLineInfo:
+    def _get_traceback_lineno(self,
+                              traceback: Optional[TracebackType]) -> TracebackLineInfo:
         """
         Extract file path and line number from the last frame of a traceback.
 
         :param traceback: The traceback object to analyze.
-        :return: Tuple of (file_path, line_number) from the last traceback frame.
+        :return: Tuple of (file_path, line_number) from the last traceback frame,
+                 or (None, None) if there is no traceback (e.g. for restored results).
         """
+        if traceback is None:
+            return None, None
+
         tb = self._tb_filter.filter_tb(traceback)
 
         while tb.tb_next is not None:
             tb = tb.tb_next
 
         return tb.tb_frame.f_code.co_filename, tb.tb_lineno
+
+    def _get_snapshot_lineno(self, snapshot: TracebackSnapshot) -> TracebackLineInfo:
+        """
+        Extract file path and line number from the last frame of a traceback snapshot.
+
+        :param snapshot: The traceback snapshot to analyze.
+        :return: Tuple of (file_path, line_number) from the last snapshot frame,
+                 or (None, None) if no frames are left after filtering.
+        """
+        frames = self._tb_filter.filter_snapshot(snapshot).frames
+        if len(frames) == 0:
+            return None, None
+        return frames[-1].filename, frames[-1].lineno
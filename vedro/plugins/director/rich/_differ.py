@@ -1,35 +1,110 @@
-from difflib import Differ, SequenceMatcher
-from typing import Iterator, Sequence
+from difflib import Differ
+from time import perf_counter
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+from ._sequence_matcher import BoundedSequenceMatcher, OpCode
 
 __all__ = ("AdvancedDiffer",)
 
 
 class AdvancedDiffer(Differ):
+    """
+    Compares sequences of lines like `difflib.Differ`, within size and time budgets.
+
+    Lines are matched by `BoundedSequenceMatcher`, similar lines of replaced blocks
+    are paired (with intraline "?" hints) only if the blocks are small enough,
+    and no more than `max_differences` changed lines are yielded; the rest
+    is summarised as "... N more differences".
+    """
+
+    def __init__(self, *, max_differences: Optional[int] = None,
+                 max_edit_distance: int = 1000,
+                 max_fancy_pairs: int = 10_000,
+                 time_limit: Optional[float] = None) -> None:
+        """
+        Initialize the AdvancedDiffer.
+
+        :param max_differences: The maximum number of changed lines to yield,
+                                or None for no limit.
+        :param max_edit_distance: The edit distance budget of the line matcher.
+        :param max_fancy_pairs: The maximum number of line pairs in a replaced block
+                                to look for similar lines in; larger blocks are shown
+                                as plain removals and additions.
+        :param time_limit: The time budget in seconds, or None for no limit.
+        """
+        super().__init__()
+        self._max_differences = max_differences
+        self._max_edit_distance = max_edit_distance
+        self._max_fancy_pairs = max_fancy_pairs
+        self._time_limit = time_limit
+        self._deadline = float("inf")
+
     def compare(self, a: Sequence[str], b: Sequence[str]) -> Iterator[str]:
-        return super().compare(a, b)
+        opcodes = self._get_matcher(a, b).get_opcodes()
+        yield from self._limit(self._dump_opcodes(a, b, opcodes),
+                               self._count_differences(opcodes))
 
     def compare_unified(self, a: Sequence[str], b: Sequence[str], n: int) -> Iterator[str]:
-        groups = SequenceMatcher(None, a, b).get_grouped_opcodes(n)
+        groups = list(self._get_matcher(a, b).get_grouped_opcodes(n))
+        total = sum(self._count_differences(group) for group in groups)
+        yield from self._limit(self._dump_groups(a, b, groups), total)
+
+    def _dump_groups(self, a: Sequence[str], b: Sequence[str],
+                     groups: List[List[OpCode]]) -> Iterator[str]:
         for idx, group in enumerate(groups):
             if idx > 0:
                 yield "..."
+            yield from self._dump_opcodes(a, b, group)
 
-            for tag, i1, i2, j1, j2 in group:
-                if tag == "equal":
-                    g = self._dump(" ", a, i1, i2)
-                elif tag == "replace":
-                    g = self._fancy_replace(a, i1, i2, b, j1, j2)
-                elif tag == "delete":
-                    g = self._dump("-", a, i1, i2)
-                elif tag == "insert":
-                    g = self._dump("+", b, j1, j2)
-                else:  # pragma: no cover
-                    raise ValueError(f"unknown tag {tag!r}")
-                yield from g
+    def _dump_opcodes(self, a: Sequence[str], b: Sequence[str],
+                      opcodes: Iterable[OpCode]) -> Iterator[str]:
+        for tag, i1, i2, j1, j2 in opcodes:
+            if tag == "equal":
+                g = self._dump(" ", a, i1, i2)
+            elif tag == "replace":
+                g = self._fancy_replace(a, i1, i2, b, j1, j2)
+            elif tag == "delete":
+                g = self._dump("-", a, i1, i2)
+            elif tag == "insert":
+                g = self._dump("+", b, j1, j2)
+            else:  # pragma: no cover
+                raise ValueError(f"unknown tag {tag!r}")
+            yield from g
+
+    def _get_matcher(self, a: Sequence[str], b: Sequence[str]) -> BoundedSequenceMatcher:
+        if self._time_limit is not None:
+            self._deadline = perf_counter() + self._time_limit
+        return BoundedSequenceMatcher(a, b, max_edit_distance=self._max_edit_distance,
+                                      time_limit=self._time_limit)
+
+    def _count_differences(self, opcodes: Iterable[OpCode]) -> int:
+        return sum((i2 - i1) + (j2 - j1) for tag, i1, i2, j1, j2 in opcodes if tag != "equal")
+
+    def _limit(self, lines: Iterator[str], total: int) -> Iterator[str]:
+        if self._max_differences is None:
+            yield from lines
+            return
+
+        emitted = 0
+        for line in lines:
+            if line.startswith(("-", "+")):
+                if emitted == self._max_differences:
+                    yield f"... {total - emitted} more differences"
+                    return
+                emitted += 1
+            yield line
 
     def _dump(self, tag: str, x: Sequence[str], lo: int, hi: int) -> Iterator[str]:
         return super()._dump(tag, x, lo, hi)  # type: ignore
 
+    def _plain_replace(self, a: Sequence[str], alo: int, ahi: int,
+                       b: Sequence[str], blo: int, bhi: int) -> Iterator[str]:
+        return super()._plain_replace(a, alo, ahi, b, blo, bhi)  # type: ignore
+
     def _fancy_replace(self, a: Sequence[str], alo: int, ahi: int,
                        b: Sequence[str], blo: int, bhi: int) -> Iterator[str]:
+        # Looking for similar lines is quadratic in the size of the block
+        too_large = (ahi - alo) * (bhi - blo) > self._max_fancy_pairs
+        if too_large or (perf_counter() > self._deadline):
+            return self._plain_replace(a, alo, ahi, b, blo, bhi)
         return super()._fancy_replace(a, alo, ahi, b, blo, bhi)  # type: ignore
@@ -9,6 +9,7 @@ from rich.style import Style
 from rich.text import Text
 
 from ._differ import AdvancedDiffer
+from ._subtree_pruner import SubtreePruner
 
 __all__ = ("PrettyDiff",)
 
@@ -18,7 +19,9 @@ class PrettyDiff:
                  max_context_lines: Optional[int] = None,
                  max_nested_level: Optional[int] = None,
                  max_container_length: Optional[int] = None,
-                 expand_containers: bool = False) -> None:
+                 expand_containers: bool = False,
+                 max_differences: Optional[int] = 1000,
+                 time_limit: Optional[float] = 1.0) -> None:
         self._left = left
         self._right = right
         self._operator = operator
@@ -26,8 +29,12 @@ class PrettyDiff:
         self._max_nested_level = max_nested_level
         self._max_container_length = max_container_length
         self._expand_containers = expand_containers
+        self._max_differences = max_differences
 
-        self._differ = AdvancedDiffer()
+        # Diffing is bounded, so that a failure report with huge operands
+        # (e.g., long lists or large JSON payloads) is still rendered quickly
+        self._pruner = SubtreePruner(time_limit=time_limit)
+        self._differ = AdvancedDiffer(max_differences=max_differences, time_limit=time_limit)
 
         self._color_red = "red"
         self._color_green = "green"
@@ -78,6 +85,7 @@ class PrettyDiff:
         return Group(*colored_diff)
 
     def _compare(self, left: Any, right: Any) -> Generator[str, None, None]:
+        right, left = self._pruner.prune(right, left)
         if self._max_context_lines is not None:
             yield from self._differ.compare_unified(self._format(right), self._format(left),
                                                     self._max_context_lines)
@@ -85,7 +93,10 @@ class PrettyDiff:
             yield from self._differ.compare(self._format(right), self._format(left))
 
     def _format(self, val: Any) -> List[str]:
-        formatted = pretty_repr(val, indent_size=self._indent_size, expand_all=True)
+        # Containers that are still longer than the number of differences to show
+        # (after pruning) would not be shown in full anyway
+        formatted = pretty_repr(val, indent_size=self._indent_size, expand_all=True,
+                                max_length=self._max_differences)
         return formatted.splitlines()
 
     def _color_diff(self, diff: Iterable[str]) -> List[Text]:
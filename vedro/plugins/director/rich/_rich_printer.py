@@ -1,4 +1,5 @@
 import json
+import os
 import sys
 import warnings
 from atexit import register as on_exit
@@ -6,15 +7,17 @@ from os import linesep
 from traceback import format_exception
 from typing import Any, Callable, Dict, List, Optional, Union
 
+import rich
 from niltype import Nil
 from rich.console import Console, RenderableType
 from rich.pretty import Pretty
 from rich.status import Status
 from rich.style import Style
-from rich.traceback import Trace, Traceback
+from rich.traceback import Frame, Trace, Traceback
 
 import vedro
 from vedro.core import ExcInfo, ScenarioStatus, StepStatus
+from vedro.core.exc_info import FrameSnapshot, TracebackSnapshot
 
 from ._pretty_diff import PrettyDiff
 from .utils import TracebackFilter
@@ -132,21 +135,70 @@ class RichPrinter:
 
     def print_exception(self, exc_info: ExcInfo, *,
                         max_frames: int = 8, show_internal_calls: bool = False) -> None:
-        traceback = exc_info.traceback
+        traceback, snapshot = exc_info.traceback, exc_info.snapshot
         if not show_internal_calls:
             warnings.warn("Deprecated: show_internal_calls param will be removed in v2.0",
                           DeprecationWarning)
-            traceback = self._traceback_filter.filter_tb(traceback)
+            if snapshot is not None:
+                snapshot = self._traceback_filter.filter_snapshot(snapshot)
+            elif traceback is not None:
+                traceback = self._traceback_filter.filter_tb(traceback)
 
-        formatted = format_exception(exc_info.type, exc_info.value, traceback, limit=max_frames)
+        if snapshot is not None:
+            formatted = snapshot.format(exc_info.type, exc_info.value, limit=max_frames)
+        else:
+            formatted = format_exception(exc_info.type, exc_info.value, traceback,
+                                         limit=max_frames)
         self._console.out("".join(formatted), style=Style(color="yellow"))
 
+    def print_remote_exception(self, exc_info: ExcInfo) -> None:
+        # Exceptions restored from results of other processes keep the traceback as text
+        formatted = getattr(exc_info.value, "remote_traceback", "") or str(exc_info.value)
+        self._console.out(formatted.rstrip(), style=Style(color="yellow"))
+        self.print_empty_line()
+
     def _filter_locals(self, trace: Trace) -> None:
+        # Dunder names (e.g., temporaries of rewritten asserts) are filtered here as well,
+        # since older versions of rich don't hide them
         for stack in trace.stacks:
             for frame in stack.frames:
                 if frame.locals is not None:
                     frame.locals = {k: v for k, v in frame.locals.items()
-                                    if k != "self" and k.isidentifier()}
+                                    if k != "self" and k.isidentifier()
+                                    and not (k.startswith("__") and k.endswith("__"))}
+
+    def _restore_frames(self, trace: Trace, snapshot: TracebackSnapshot, *,
+                        show_locals: bool) -> None:
+        # Stacks follow the chain of exceptions the same way snapshots do:
+        # the cause if there is one, otherwise the context (unless it is suppressed)
+        stacks_snapshot: Optional[TracebackSnapshot] = snapshot
+        for stack in trace.stacks:
+            if stacks_snapshot is None:
+                break
+            stack.frames = [self._make_frame(frame, show_locals=show_locals)
+                            for frame in stacks_snapshot.frames]
+            if stacks_snapshot.cause is not None:
+                stacks_snapshot = stacks_snapshot.cause
+            else:
+                stacks_snapshot = stacks_snapshot.context
+
+    def _make_frame(self, frame_snapshot: FrameSnapshot, *, show_locals: bool) -> Frame:
+        filename = frame_snapshot.filename
+        import_cwd = getattr(rich, "_IMPORT_CWD", None)
+        if filename and not filename.startswith("<") and not os.path.isabs(filename):
+            if import_cwd:
+                filename = os.path.join(import_cwd, filename)
+
+        locals_ = None
+        if show_locals:
+            locals_ = dict(frame_snapshot.locals or {})
+
+        frame = Frame(filename=filename or "?", lineno=frame_snapshot.lineno or 0,
+                      name=frame_snapshot.name, locals=locals_)
+        if hasattr(frame, "last_instruction"):
+            # Available in newer versions of rich (Python 3.11+ only)
+            frame.last_instruction = frame_snapshot.last_instruction
+        return frame
 
     def print_pretty_exception(self, exc_info: ExcInfo, *,
                                max_frames: int = 8,  # min=4 (see rich.traceback.Traceback impl)
@@ -155,14 +207,24 @@ class RichPrinter:
                                word_wrap: bool = False,
                                width: Optional[int] = None,
                                show_full_diff: bool = False) -> None:
-        traceback = exc_info.traceback
+        traceback, snapshot = exc_info.traceback, exc_info.snapshot
         if not show_internal_calls:
             warnings.warn("Deprecated: show_internal_calls param will be removed in v2.0",
                           DeprecationWarning)
-            traceback = self._traceback_filter.filter_tb(traceback)
-
-        trace = Traceback.extract(exc_info.type, exc_info.value, traceback,
-                                  show_locals=show_locals)
+            if snapshot is not None:
+                snapshot = self._traceback_filter.filter_snapshot(snapshot)
+            elif traceback is not None:
+                traceback = self._traceback_filter.filter_tb(traceback)
+
+        if snapshot is not None:
+            # The exception (and its chained exceptions) is extracted without the traceback,
+            # then the frames are taken from the snapshot
+            trace = Traceback.extract(exc_info.type, exc_info.value, None,
+                                      show_locals=show_locals)
+            self._restore_frames(trace, snapshot, show_locals=show_locals)
+        else:
+            trace = Traceback.extract(exc_info.type, exc_info.value, traceback,
+                                      show_locals=show_locals)
 
         if show_locals:
             self._filter_locals(trace)
@@ -1,9 +1,10 @@
 import sys
 from types import ModuleType
-from typing import Callable, Tuple, Type, Union, final
+from typing import Callable, List, Tuple, Type, Union, final
 
 import vedro
 from vedro.core import (
+    AggregatedResult,
     ConfigType,
     Dispatcher,
     ExcInfo,
@@ -13,6 +14,7 @@ from vedro.core import (
     StepResult,
 )
 from vedro.core.exc_info import TracebackFilter
+from vedro.core.scenario_result import RemoteError
 from vedro.events import (
     ArgParsedEvent,
     ArgParseEvent,
@@ -311,10 +313,18 @@ class RichReporterPlugin(Reporter):
         self._print_namespace(event.scenario_result.scenario.namespace)
 
     def _print_exception(self, exc_info: ExcInfo) -> None:
+        if isinstance(exc_info.value, RemoteError):
+            self._printer.print_remote_exception(exc_info)
+            return
+
         if self._tb_suppress_modules:
             assert self._tb_filter  # for type checker
-            traceback = self._tb_filter.filter_tb(exc_info.traceback)
-            exc_info = ExcInfo(exc_info.type, exc_info.value, traceback)
+            if exc_info.snapshot is not None:
+                snapshot = self._tb_filter.filter_snapshot(exc_info.snapshot)
+                exc_info = ExcInfo(exc_info.type, exc_info.value, exc_info.traceback, snapshot)
+            elif exc_info.traceback is not None:
+                traceback = self._tb_filter.filter_tb(exc_info.traceback)
+                exc_info = ExcInfo(exc_info.type, exc_info.value, traceback)
 
         if self._tb_pretty and not self._is_exception_group(exc_info):
             self._printer.print_pretty_exception(exc_info,
@@ -437,12 +447,22 @@ class RichReporterPlugin(Reporter):
 
         self._printer.print_scenario_subject(aggregated_result.scenario.subject,
                                              aggregated_result.status, elapsed=None, prefix=" ")
+        extras = self._get_aggregated_extra_details(aggregated_result)
+        if self._show_scenario_extras and extras:
+            prefix = self._prefix_to_indent(" ", indent=2)
+            self._printer.print_scenario_extra_details(extras, prefix=prefix)
         for index, scenario_result in enumerate(aggregated_result.scenario_results, start=1):
             prefix = f" │\n ├─[{index}/{rescheduled}] "
             self._print_scenario_result(scenario_result, prefix=prefix)
 
         self._printer.print_empty_line()
 
+    def _get_aggregated_extra_details(self, aggregated_result: AggregatedResult) -> List[str]:
+        own_extras = set()
+        for scenario_result in aggregated_result.scenario_results:
+            own_extras.update(scenario_result.extra_details)
+        return [x for x in aggregated_result.extra_details if x not in own_extras]
+
     def on_cleanup(self, event: CleanupEvent) -> None:
         self._printer.print_empty_line()
 
@@ -0,0 +1,313 @@
+from bisect import bisect_left
+from difflib import SequenceMatcher
+from time import perf_counter
+from typing import Dict, Hashable, Iterator, List, Optional, Sequence, Tuple
+
+__all__ = ("BoundedSequenceMatcher", "Match", "OpCode",)
+
+Match = Tuple[int, int, int]  # (i, j, size): a[i:i+size] == b[j:j+size]
+OpCode = Tuple[str, int, int, int, int]  # (tag, i1, i2, j1, j2), as in difflib
+
+
+class BoundedSequenceMatcher:
+    """
+    Finds matching blocks of two sequences of hashable items within size and time budgets.
+
+    Small inputs are matched by `difflib.SequenceMatcher`, so the results are the same
+    as difflib's ones. Large inputs are matched in roughly linear time:
+
+    - the common prefix and suffix are matched first;
+    - items that occur exactly once in both sequences are used as anchors
+      (the patience diff algorithm), splitting the inputs into smaller gaps;
+    - gaps without anchors are matched by the Myers algorithm, which gives up once
+      the edit distance exceeds `max_edit_distance`.
+
+    Once the time limit is reached, the remaining gaps are left unmatched
+    (reported as replaced), and `completed` becomes False.
+
+    The API mirrors the one of `difflib.SequenceMatcher`.
+    """
+
+    def __init__(self, a: Sequence[Hashable], b: Sequence[Hashable], *,
+                 max_edit_distance: int = 1000,
+                 time_limit: Optional[float] = 1.0,
+                 max_difflib_size: int = 1_000_000) -> None:
+        """
+        Initialize the BoundedSequenceMatcher.
+
+        :param a: The first sequence.
+        :param b: The second sequence.
+        :param max_edit_distance: The maximum number of insertions and deletions the Myers
+                                  algorithm looks for in a gap before giving up on it.
+        :param time_limit: The time budget in seconds, or None for no limit.
+        :param max_difflib_size: The maximum product of the sequence lengths matched by
+                                 `difflib.SequenceMatcher` (its worst case is quadratic).
+        """
+        self._a = a
+        self._b = b
+        self._max_edit_distance = max_edit_distance
+        self._time_limit = time_limit
+        self._max_difflib_size = max_difflib_size
+        self._deadline = float("inf")
+        self._matching_blocks: Optional[List[Match]] = None
+        self._completed = True
+
+    @property
+    def completed(self) -> bool:
+        """
+        Check if the sequences were matched completely, within the budgets.
+
+        :return: False if some gaps were left unmatched, True otherwise.
+        """
+        self.get_matching_blocks()
+        return self._completed
+
+    def get_matching_blocks(self) -> List[Match]:
+        """
+        Return the list of matching blocks, ending with the (len(a), len(b), 0) sentinel.
+
+        :return: A list of (i, j, size) triples, monotonically increasing in i and j.
+        """
+        if self._matching_blocks is not None:
+            return self._matching_blocks
+
+        a, b = self._a, self._b
+        if len(a) * len(b) <= self._max_difflib_size:
+            matcher = SequenceMatcher(None, a, b)
+            self._matching_blocks = [(x.a, x.b, x.size) for x in matcher.get_matching_blocks()]
+            return self._matching_blocks
+
+        if self._time_limit is not None:
+            self._deadline = perf_counter() + self._time_limit
+
+        matches = sorted(self._match(a, b))
+        self._matching_blocks = self._merge(matches) + [(len(a), len(b), 0)]
+        return self._matching_blocks
+
+    def get_opcodes(self) -> List[OpCode]:
+        """
+        Return the list of operations that turn `a` into `b`, as in `difflib`.
+
+        :return: A list of (tag, i1, i2, j1, j2) tuples, where tag is one of
+                 "equal", "replace", "delete" and "insert".
+        """
+        i = j = 0
+        opcodes: List[OpCode] = []
+        for ai, bj, size in self.get_matching_blocks():
+            tag = ""
+            if i < ai and j < bj:
+                tag = "replace"
+            elif i < ai:
+                tag = "delete"
+            elif j < bj:
+                tag = "insert"
+            if tag:
+                opcodes.append((tag, i, ai, j, bj))
+            i, j = ai + size, bj + size
+            if size:
+                opcodes.append(("equal", ai, i, bj, j))
+        return opcodes
+
+    def get_grouped_opcodes(self, n: int = 3) -> Iterator[List[OpCode]]:
+        """
+        Isolate change clusters, keeping up to `n` lines of context, as in `difflib`.
+
+        :param n: The number of context items around each change.
+        :return: An iterator of opcode groups.
+        """
+        opcodes = self.get_opcodes()
+        if not opcodes:
+            opcodes = [("equal", 0, 1, 0, 1)]
+        # Fixup leading and trailing groups if they show no changes
+        if opcodes[0][0] == "equal":
+            tag, i1, i2, j1, j2 = opcodes[0]
+            opcodes[0] = tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2
+        if opcodes[-1][0] == "equal":
+            tag, i1, i2, j1, j2 = opcodes[-1]
+            opcodes[-1] = tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)
+
+        nn = n + n
+        group: List[OpCode] = []
+        for tag, i1, i2, j1, j2 in opcodes:
+            # End the current group and start a new one whenever
+            # there is a large range with no changes
+            if tag == "equal" and i2 - i1 > nn:
+                group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+                yield group
+                group = []
+                i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+            group.append((tag, i1, i2, j1, j2))
+        if group and not (len(group) == 1 and group[0][0] == "equal"):
+            yield group
+
+    def _match(self, a: Sequence[Hashable], b: Sequence[Hashable]) -> List[Match]:
+        """
+        Find matches of the whole sequences, gap by gap.
+
+        :param a: The first sequence.
+        :param b: The second sequence.
+        :return: An unordered list of matches.
+        """
+        matches: List[Match] = []
+        gaps = [(0, len(a), 0, len(b))]
+        while gaps:
+            alo, ahi, blo, bhi = gaps.pop()
+
+            start = alo
+            while alo < ahi and blo < bhi and a[alo] == b[blo]:
+                alo, blo = alo + 1, blo + 1
+            if alo > start:
+                matches.append((start, blo - (alo - start), alo - start))
+
+            end = ahi
+            while alo < ahi and blo < bhi and a[ahi - 1] == b[bhi - 1]:
+                ahi, bhi = ahi - 1, bhi - 1
+            if ahi < end:
+                matches.append((ahi, bhi, end - ahi))
+
+            if (alo == ahi) or (blo == bhi) or self._is_out_of_time():
+                continue
+
+            anchors = self._find_anchors(a, alo, ahi, b, blo, bhi)
+            if anchors:
+                for i, j in anchors:
+                    matches.append((i, j, 1))
+                    gaps.append((alo, i, blo, j))
+                    alo, blo = i + 1, j + 1
+                gaps.append((alo, ahi, blo, bhi))
+                continue
+
+            myers_matches = self._myers(a, alo, ahi, b, blo, bhi)
+            if myers_matches is None:
+                self._completed = False
+            else:
+                matches += myers_matches
+        return matches
+
+    def _find_anchors(self, a: Sequence[Hashable], alo: int, ahi: int,
+                      b: Sequence[Hashable], blo: int, bhi: int) -> List[Tuple[int, int]]:
+        """
+        Find the longest increasing sequence of items that occur exactly once in both gaps.
+
+        :return: A list of (i, j) pairs of matched unique items, ordered by i and j.
+        """
+        counts: Dict[Hashable, List[int]] = {}  # item -> [count in a, index in a, count in b]
+        for i in range(alo, ahi):
+            entry = counts.setdefault(a[i], [0, i, 0])
+            entry[0] += 1
+        for j in range(blo, bhi):
+            b_entry = counts.get(b[j])
+            if b_entry is not None:
+                b_entry[2] += 1
+                b_entry.append(j)
+
+        unique = sorted((entry[1], entry[3]) for entry in counts.values()
+                        if entry[0] == 1 and entry[2] == 1)
+        if not unique:
+            return []
+
+        # Patience sorting: the longest increasing subsequence of j (ordered by i)
+        tails: List[int] = []  # the smallest tail j of an increasing subsequence by length
+        tail_indexes: List[int] = []
+        prev_indexes: List[int] = []
+        for index, (_, j) in enumerate(unique):
+            pos = bisect_left(tails, j)
+            if pos == len(tails):
+                tails.append(j)
+                tail_indexes.append(index)
+            else:
+                tails[pos] = j
+                tail_indexes[pos] = index
+            prev_indexes.append(tail_indexes[pos - 1] if pos > 0 else -1)
+
+        anchors = []
+        index = tail_indexes[-1]
+        while index != -1:
+            anchors.append(unique[index])
+            index = prev_indexes[index]
+        anchors.reverse()
+        return anchors
+
+    def _myers(self, a: Sequence[Hashable], alo: int, ahi: int,
+               b: Sequence[Hashable], blo: int, bhi: int) -> Optional[List[Match]]:
+        """
+        Find the matches of a gap with the Myers algorithm.
+
+        :return: A list of matches, or None if the edit distance of the gap exceeds
+                 the maximum one or the time is out.
+        """
+        n, m = ahi - alo, bhi - blo
+        max_d = min(n + m, self._max_edit_distance)
+
+        v = {1: 0}
+        trace = []
+        for d in range(max_d + 1):
+            if self._is_out_of_time():
+                return None
+            trace.append(dict(v))
+            for k in range(-d, d + 1, 2):
+                if k == -d or (k != d and v[k - 1] < v[k + 1]):
+                    x = v[k + 1]
+                else:
+                    x = v[k - 1] + 1
+                y = x - k
+                while x < n and y < m and a[alo + x] == b[blo + y]:
+                    x, y = x + 1, y + 1
+                v[k] = x
+                if x >= n and y >= m:
+                    return self._backtrack(trace, n, m, alo, blo)
+        return None
+
+    def _backtrack(self, trace: List[Dict[int, int]], x: int, y: int,
+                   alo: int, blo: int) -> List[Match]:
+        """
+        Walk the Myers trace back from the end of a gap, collecting the diagonals (matches).
+
+        :return: A list of matches, in absolute indexes.
+        """
+        matches = []
+        for d in range(len(trace) - 1, -1, -1):
+            v = trace[d]
+            k = x - y
+            if k == -d or (k != d and v[k - 1] < v[k + 1]):
+                prev_k = k + 1
+            else:
+                prev_k = k - 1
+            prev_x = v[prev_k]
+            prev_y = prev_x - prev_k
+
+            # The snake of this step starts right after the edit from (prev_x, prev_y)
+            start_x = prev_x if prev_k == k + 1 else prev_x + 1
+            size = x - start_x
+            if size > 0:
+                matches.append((alo + start_x, blo + y - size, size))
+            x, y = prev_x, prev_y
+        return matches
+
+    def _merge(self, matches: List[Match]) -> List[Match]:
+        """
+        Merge adjacent matches, as difflib does.
+
+        :param matches: The matches, ordered by i and j.
+        :return: The merged matches.
+        """
+        merged: List[Match] = []
+        for i, j, size in matches:
+            if merged:
+                pi, pj, psize = merged[-1]
+                if pi + psize == i and pj + psize == j:
+                    merged[-1] = (pi, pj, psize + size)
+                    continue
+            merged.append((i, j, size))
+        return merged
+
+    def _is_out_of_time(self) -> bool:
+        """
+        Check if the time budget is exhausted, marking the result as incomplete.
+
+        :return: True if the deadline has passed, False otherwise.
+        """
+        if perf_counter() > self._deadline:
+            self._completed = False
+            return True
+        return False
@@ -0,0 +1,225 @@
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ._sequence_matcher import BoundedSequenceMatcher
+
+__all__ = ("SubtreePruner",)
+
+
+class _Elided:
+    """
+    Stands for a part of a value that is equal on both sides of the comparison.
+    """
+
+    __slots__ = ("_repr",)
+
+    def __init__(self, repr_: str) -> None:
+        self._repr = repr_
+
+    def __repr__(self) -> str:
+        return self._repr
+
+
+_CONTAINER_REPRS: Dict[type, str] = {dict: "{...}", list: "[...]", tuple: "(...)"}
+
+
+class SubtreePruner:
+    """
+    Collapses identical branches of two large nested values before they are diffed.
+
+    Values under the same dict key are compared directly, while list items are aligned
+    by their structural fingerprints (a hash of the fingerprints of the nested items,
+    computed once per container), so inserted or removed items don't make the rest
+    of the list differ. Equal containers are replaced with `{...}` (or `[...]`, `(...)`),
+    and runs of equal items are replaced with a single `... N equal items` marker,
+    keeping the items at both ends of a run as context. Only the branches that differ
+    are left to be formatted and diffed.
+
+    Small values (fewer than `min_size` items in total) are left untouched, so they are
+    rendered in full.
+    """
+
+    def __init__(self, *, min_size: int = 1000, time_limit: Optional[float] = 1.0,
+                 max_edit_distance: int = 1000) -> None:
+        """
+        Initialize the SubtreePruner.
+
+        :param min_size: The number of nested items a value must have to be pruned.
+        :param time_limit: The time budget in seconds, or None for no limit.
+                           Once it is exhausted, the remaining branches are left as is.
+        :param max_edit_distance: The edit distance budget used to align list items.
+        """
+        self._min_size = min_size
+        self._time_limit = time_limit
+        self._max_edit_distance = max_edit_distance
+        self._deadline = float("inf")
+        self._fingerprints: Dict[int, int] = {}
+
+    def prune(self, left: Any, right: Any) -> Tuple[Any, Any]:
+        """
+        Return copies of both values with their common branches collapsed.
+
+        :param left: The left value.
+        :param right: The right value.
+        :return: A tuple of the pruned values, or the values themselves if they are small
+                 (or can't be pruned, e.g., if they are recursive).
+        """
+        if not self._is_large(left) and not self._is_large(right):
+            return left, right
+
+        if self._time_limit is not None:
+            self._deadline = perf_counter() + self._time_limit
+        try:
+            return self._prune(left, right)
+        except RecursionError:
+            return left, right
+        finally:
+            self._fingerprints.clear()
+
+    def _is_large(self, value: Any) -> bool:
+        """
+        Check if the value has at least `min_size` nested items, without counting them all.
+        """
+        count = 0
+        stack = [value]
+        while stack:
+            val = stack.pop()
+            if type(val) is dict:
+                count += len(val)
+                stack.extend(val.values())
+            elif type(val) in (list, tuple):
+                count += len(val)
+                stack.extend(val)
+            if count >= self._min_size:
+                return True
+        return False
+
+    def _prune(self, left: Any, right: Any) -> Tuple[Any, Any]:
+        if perf_counter() > self._deadline:
+            return left, right
+        if type(left) is dict and type(right) is dict:
+            return self._prune_dicts(left, right)
+        if type(left) in (list, tuple) and type(left) is type(right):
+            pruned_left, pruned_right = self._prune_sequences(left, right)
+            return type(left)(pruned_left), type(right)(pruned_right)
+        return left, right
+
+    def _prune_dicts(self, left: Dict[Any, Any],
+                     right: Dict[Any, Any]) -> Tuple[Dict[Any, Any], Dict[Any, Any]]:
+        pruned: Dict[Any, Tuple[Any, Any]] = {}
+        equal_keys = set()
+        for key, value in left.items():
+            if key not in right:
+                continue
+            if self._is_equal(value, right[key]):
+                equal_keys.add(key)
+            else:
+                pruned[key] = self._prune(value, right[key])
+
+        left_pruned = {k: v[0] for k, v in pruned.items()}
+        right_pruned = {k: v[1] for k, v in pruned.items()}
+        return (self._collapse_items(left, equal_keys, left_pruned),
+                self._collapse_items(right, equal_keys, right_pruned))
+
+    def _collapse_items(self, value: Dict[Any, Any], equal_keys: Set[Any],
+                        pruned: Dict[Any, Any]) -> Dict[Any, Any]:
+        collapsed: Dict[Any, Any] = {}
+        run: List[Any] = []
+        for key, val in value.items():
+            if key in equal_keys:
+                run.append(key)
+                continue
+            self._collapse_items_run(collapsed, value, run)
+            run = []
+            collapsed[key] = pruned.get(key, val)
+        self._collapse_items_run(collapsed, value, run)
+        return collapsed
+
+    def _collapse_items_run(self, collapsed: Dict[Any, Any], value: Dict[Any, Any],
+                            run: List[Any]) -> None:
+        if len(run) <= 3:
+            collapsed.update((k, self._elide(value[k])) for k in run)
+            return
+        collapsed[run[0]] = self._elide(value[run[0]])
+        collapsed[_Elided(f"... {len(run) - 2} equal items")] = _Elided("...")
+        collapsed[run[-1]] = self._elide(value[run[-1]])
+
+    def _prune_sequences(self, left: Any, right: Any) -> Tuple[List[Any], List[Any]]:
+        time_limit = None
+        if self._deadline != float("inf"):
+            time_limit = max(0.0, self._deadline - perf_counter())
+        matcher = BoundedSequenceMatcher([self._fingerprint(x) for x in left],
+                                         [self._fingerprint(x) for x in right],
+                                         max_edit_distance=self._max_edit_distance,
+                                         time_limit=time_limit)
+        pruned_left: List[Any] = []
+        pruned_right: List[Any] = []
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                pruned_left += self._collapse_run(left[i1:i2])
+                pruned_right += self._collapse_run(right[j1:j2])
+            elif tag == "replace":
+                size = min(i2 - i1, j2 - j1)
+                for lv, rv in zip(left[i1:i1 + size], right[j1:j1 + size]):
+                    lv, rv = self._prune_pair(lv, rv)
+                    pruned_left.append(lv)
+                    pruned_right.append(rv)
+                pruned_left += left[i1 + size:i2]
+                pruned_right += right[j1 + size:j2]
+            else:
+                pruned_left += left[i1:i2]
+                pruned_right += right[j1:j2]
+        return pruned_left, pruned_right
+
+    def _prune_pair(self, left: Any, right: Any) -> Tuple[Any, Any]:
+        if self._fingerprint(left) == self._fingerprint(right):
+            return self._elide(left), self._elide(right)
+        return self._prune(left, right)
+
+    def _collapse_run(self, items: Any) -> List[Any]:
+        if len(items) <= 3:
+            return [self._elide(x) for x in items]
+        marker = _Elided(f"... {len(items) - 2} equal items")
+        return [self._elide(items[0]), marker, self._elide(items[-1])]
+
+    def _is_equal(self, left: Any, right: Any) -> bool:
+        if type(left) is not type(right):
+            return False
+        try:
+            return bool(left == right)
+        except Exception:
+            return False
+
+    def _elide(self, value: Any) -> Any:
+        container_repr = _CONTAINER_REPRS.get(type(value))
+        if container_repr is None or len(value) == 0:
+            return value
+        return _Elided(container_repr)
+
+    def _fingerprint(self, value: Any) -> int:
+        """
+        Compute the structural hash of a value; equal values have equal fingerprints.
+
+        The type of every item is hashed too, so `1`, `1.0` and `True` (which are equal,
+        but are rendered differently) have different fingerprints.
+        """
+        value_type = type(value)
+        if value_type is dict:
+            key = id(value)
+            if key not in self._fingerprints:
+                dict_items = frozenset((self._fingerprint(k), self._fingerprint(v))
+                                       for k, v in value.items())
+                self._fingerprints[key] = hash((dict, dict_items))
+            return self._fingerprints[key]
+
+        if value_type is list or value_type is tuple:
+            key = id(value)
+            if key not in self._fingerprints:
+                seq_items = tuple(self._fingerprint(x) for x in value)
+                self._fingerprints[key] = hash((value_type, seq_items))
+            return self._fingerprints[key]
+
+        try:
+            return hash((value_type, value))
+        except TypeError:
+            return hash((value_type, repr(value)))
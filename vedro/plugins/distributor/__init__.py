@@ -0,0 +1,7 @@
+from ._coordinator_runner import CoordinatorRunner
+from ._distributor import Distributor, DistributorPlugin
+from ._protocol import format_address, parse_address
+from ._worker_runner import WorkerRunner
+
+__all__ = ("Distributor", "DistributorPlugin", "CoordinatorRunner", "WorkerRunner",
+           "parse_address", "format_address",)
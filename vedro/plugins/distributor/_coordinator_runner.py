@@ -0,0 +1,330 @@
+import asyncio
+import sys
+from collections import Counter, deque
+from itertools import count
+from subprocess import DEVNULL
+from time import time
+from typing import Any, Deque, Dict, List, Optional, Sequence, Set, Tuple, Type, Union
+
+from vedro.core import Dispatcher, Report, VirtualScenario
+from vedro.core.scenario_result import ScenarioResult, ScenarioResultSerializer
+from vedro.core.scenario_runner import MonotonicScenarioRunner, ScenarioResultReplayer
+from vedro.core.scenario_scheduler import ScenarioScheduler
+from vedro.events import ScenarioFailedEvent, ScenarioRunEvent, ScenarioSkippedEvent
+
+from ._protocol import (
+    Address,
+    ProtocolError,
+    format_address,
+    read_message,
+    start_server,
+    write_message,
+)
+
+__all__ = ("CoordinatorRunner",)
+
+# (kind, scenario, payload): kind is one of "result", "skipped", "crashed" or "aborted"
+_ItemType = Tuple[str, Optional[VirtualScenario], Any]
+
+
+class CoordinatorRunner(MonotonicScenarioRunner):
+    """
+    Serves scheduled scenarios to worker processes and merges their results.
+
+    Workers connect to the coordinator and pull scenarios one at a time. Their serialized
+    results are replayed as regular scenario and step events, so reporters and plugins of
+    the coordinator produce a single report and output stream. If a worker disconnects
+    (or sends a malformed message) while running a scenario, the scenario is re-queued
+    and picked up by another worker.
+    """
+
+    def __init__(self, dispatcher: Dispatcher, *,
+                 address: Address,
+                 workers: int = 0,
+                 worker_args: Sequence[str] = (),
+                 max_requeues: int = 2,
+                 max_worker_restarts: int = 10,
+                 shutdown_timeout: float = 10.0,
+                 interrupt_exceptions: Tuple[Type[BaseException], ...] = (),
+                 serializer: Optional[ScenarioResultSerializer] = None) -> None:
+        """
+        Initialize the CoordinatorRunner.
+
+        :param dispatcher: The event dispatcher for firing execution events.
+        :param address: The address to listen on. Port 0 picks a free port.
+        :param workers: The number of local worker processes to spawn.
+        :param worker_args: The command-line arguments for spawned workers
+                            (e.g. ["run", "scenarios/"]), without the worker address.
+        :param max_requeues: How many times a scenario is re-queued after its worker
+                             crashed before the scenario is reported as failed.
+        :param max_worker_restarts: How many times crashed local workers are restarted
+                                    in total before the run is aborted.
+        :param shutdown_timeout: Time to wait for local workers to exit, in seconds.
+        :param interrupt_exceptions: Additional exception types that should interrupt execution.
+        :param serializer: The serializer used to restore worker results.
+        """
+        super().__init__(dispatcher, interrupt_exceptions=interrupt_exceptions)
+        self._address = address
+        self._workers = workers
+        self._worker_args = tuple(worker_args)
+        self._max_requeues = max_requeues
+        self._max_worker_restarts = max_worker_restarts
+        self._shutdown_timeout = shutdown_timeout
+        self._replayer = ScenarioResultReplayer(dispatcher, serializer=serializer)
+
+        self._scheduler: Union[ScenarioScheduler, None] = None
+        self._pending: Deque[VirtualScenario] = deque()
+        self._in_flight: Dict[int, VirtualScenario] = {}
+        self._results: "asyncio.Queue[_ItemType]" = asyncio.Queue()
+        self._remaining: Counter[str] = Counter()
+        self._requeues: Counter[str] = Counter()
+        self._groups: Dict[str, List[ScenarioResult]] = {}
+        self._task_ids = count(1)
+        self._worker_restarts = 0
+        self._processing = False
+        self._finishing = False
+        self._finished = False
+        self._changed: Union[asyncio.Condition, None] = None
+        self._handlers: Set["asyncio.Task[None]"] = set()
+
+    async def _run_scenarios(self,
+                             scheduler: ScenarioScheduler,
+                             report: Report,
+                             **kwargs: Any) -> None:
+        """
+        Serve the scheduled scenarios to workers until all of them are reported.
+
+        :param scheduler: The scheduler providing scenarios to execute.
+        :param report: The report to add results to.
+        :param kwargs: Additional keyword arguments (ignored, scenarios run in workers).
+        """
+        self._scheduler = scheduler.__aiter__()
+        self._changed = asyncio.Condition()
+
+        server, address = await start_server(self._handle_worker, self._address)
+        sys.stderr.write(f"Coordinator is listening on {format_address(address)}\n")
+
+        supervisors = [asyncio.ensure_future(self._supervise_worker(address))
+                       for _ in range(self._workers)]
+        try:
+            await self._process_results(report)
+        finally:
+            self._finished = True
+            server.close()
+            await self._notify()
+            # Let connected workers receive "done" and local workers exit
+            await self._shutdown([*self._handlers, *supervisors])
+
+    async def _shutdown(self, tasks: List["asyncio.Future[None]"]) -> None:
+        """
+        Wait for the tasks to finish, cancelling the ones that don't finish in time.
+
+        :param tasks: The worker connection handlers and local worker supervisors.
+        """
+        if not tasks:
+            return
+        _, running = await asyncio.wait(tasks, timeout=self._shutdown_timeout)
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _process_results(self, report: Report) -> None:
+        """
+        Process worker results until every scheduled scenario is reported.
+
+        :param report: The report to add results to.
+        :raises RuntimeError: If the run is aborted (e.g. local workers keep crashing).
+        """
+        while True:
+            if self._results.empty() and not self._in_flight and not self._pending:
+                if not await self._pull():
+                    break
+                continue
+
+            kind, scenario, payload = await self._results.get()
+            if kind == "aborted":
+                raise payload
+
+            assert scenario is not None  # for type checking
+            self._processing = True
+            try:
+                await self._process(kind, scenario, payload, report)
+            finally:
+                self._processing = False
+            await self._notify()
+
+    async def _process(self, kind: str, scenario: VirtualScenario, payload: Any,
+                       report: Report) -> None:
+        """
+        Process a single item produced by the workers.
+
+        :param kind: The kind of the item ("result", "skipped" or "crashed").
+        :param scenario: The scenario the item refers to.
+        :param payload: The serialized result for "result" items.
+        :param report: The report to add results to.
+        """
+        if kind == "crashed":
+            self._requeues[scenario.unique_id] += 1
+            if self._requeues[scenario.unique_id] <= self._max_requeues:
+                self._pending.appendleft(scenario)
+                return
+            scenario_result = await self._fail_crashed(scenario)
+        elif kind == "skipped":
+            scenario_result = ScenarioResult(scenario).mark_skipped()
+            await self._dispatcher.fire(ScenarioSkippedEvent(scenario_result))
+        else:
+            scenario_result = await self._replayer.replay(scenario, payload)
+
+        unique_id = scenario.unique_id
+        self._groups.setdefault(unique_id, []).append(scenario_result)
+        self._remaining[unique_id] -= 1
+        if self._remaining[unique_id] == 0:
+            # Plugins (e.g. Repeater) may have just scheduled the scenario again,
+            # in which case the results are reported together
+            await self._pull()
+        assert self._scheduler is not None  # for type checking
+        if self._remaining[unique_id] == 0 and not self._scheduler.has_pending(scenario):
+            del self._remaining[unique_id]
+            await self._report_scenario_results(self._groups.pop(unique_id), report,
+                                                self._scheduler)
+
+    async def _fail_crashed(self, scenario: VirtualScenario) -> ScenarioResult:
+        """
+        Report a scenario that crashed its workers too many times as failed.
+
+        :param scenario: The scenario.
+        :return: The failed scenario result.
+        """
+        scenario_result = ScenarioResult(scenario)
+        scenario_result.set_scope({})
+        await self._dispatcher.fire(ScenarioRunEvent(scenario_result))
+
+        attempts = self._requeues[scenario.unique_id]
+        scenario_result.add_extra_details(
+            f"worker exited while running the scenario ({attempts} attempts)")
+        scenario_result.set_started_at(time()).set_ended_at(time()).mark_failed()
+        await self._dispatcher.fire(ScenarioFailedEvent(scenario_result))
+        return scenario_result
+
+    async def _pull(self) -> bool:
+        """
+        Take the next scenario from the scheduler.
+
+        Skipped scenarios are not sent to workers, they are reported directly.
+
+        :return: True if a scenario was taken, False if the scheduler is exhausted.
+        """
+        assert self._scheduler is not None  # for type checking
+        try:
+            scenario = await self._scheduler.__anext__()
+        except StopAsyncIteration:
+            return False
+
+        self._remaining[scenario.unique_id] += 1
+        if scenario.is_skipped():
+            self._results.put_nowait(("skipped", scenario, None))
+        else:
+            self._pending.append(scenario)
+        return True
+
+    async def _next_scenario(self) -> Optional[VirtualScenario]:
+        """
+        Get the next scenario for a worker, waiting while results are still expected.
+
+        :return: The scenario, or None if there is nothing left to run.
+        """
+        assert self._changed is not None  # for type checking
+        while True:
+            if self._pending:
+                return self._pending.popleft()
+            if self._finished:
+                return None
+            if await self._pull():
+                continue
+            if not self._in_flight and self._results.empty() and not self._processing:
+                self._finishing = True
+                return None
+            async with self._changed:
+                await self._changed.wait()
+
+    async def _notify(self) -> None:
+        """
+        Wake up workers waiting for scenarios.
+        """
+        assert self._changed is not None  # for type checking
+        async with self._changed:
+            self._changed.notify_all()
+
+    async def _handle_worker(self, reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter) -> None:
+        """
+        Serve a single worker connection.
+
+        A malformed message closes the connection, as if the worker disconnected.
+
+        :param reader: The stream reader of the connection.
+        :param writer: The stream writer of the connection.
+        """
+        handler = asyncio.current_task()
+        assert handler is not None  # for type checking
+        self._handlers.add(handler)
+
+        task_id: Optional[int] = None
+        try:
+            while True:
+                message = await read_message(reader)
+                if message is None:
+                    break
+
+                if message["type"] == "next":
+                    scenario = await self._next_scenario()
+                    if scenario is None:
+                        await write_message(writer, {"type": "done"})
+                        break
+                    task_id = next(self._task_ids)
+                    self._in_flight[task_id] = scenario
+                    await write_message(writer, {"type": "scenario", "task": task_id,
+                                                 "unique_id": scenario.unique_id})
+
+                elif message["type"] == "result":
+                    scenario = self._in_flight.pop(message["task"])
+                    task_id = None
+                    self._results.put_nowait(("result", scenario, message["result"]))
+        except (ConnectionError, ProtocolError):
+            pass
+        finally:
+            if (task_id is not None) and (task_id in self._in_flight):
+                # The worker disconnected (or broke the protocol) while running the scenario
+                self._results.put_nowait(("crashed", self._in_flight.pop(task_id), None))
+            writer.close()
+            self._handlers.discard(handler)
+
+    async def _supervise_worker(self, address: Address) -> None:
+        """
+        Run a local worker process, restarting it if it crashes before the run is over.
+
+        :param address: The address of the coordinator.
+        """
+        command = [sys.executable, "-m", "vedro", *self._worker_args,
+                   "--worker", format_address(address)]
+        while True:
+            process = await asyncio.create_subprocess_exec(*command, stdout=DEVNULL)
+            try:
+                await process.wait()
+            except asyncio.CancelledError:
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
+                raise
+
+            # Workers exit with a non-zero code if their scenarios failed,
+            # so the exit code doesn't tell whether the worker crashed
+            if self._finished or self._finishing:
+                return
+
+            self._worker_restarts += 1
+            if self._worker_restarts > self._max_worker_restarts:
+                error = RuntimeError(f"Local workers exited {self._worker_restarts} times, "
+                                     "aborting the run")
+                self._results.put_nowait(("aborted", None, error))
+                return
@@ -0,0 +1,179 @@
+import sys
+from asyncio import CancelledError
+from typing import List, Sequence, Tuple, Type, Union, final
+
+from vedro.core import ConfigType, Dispatcher, Plugin, PluginConfig
+from vedro.events import ArgParsedEvent, ArgParseEvent, ConfigLoadedEvent
+
+from ._coordinator_runner import CoordinatorRunner
+from ._protocol import parse_address
+from ._worker_runner import WorkerRunner
+
+__all__ = ("Distributor", "DistributorPlugin",)
+
+
+@final
+class DistributorPlugin(Plugin):
+    """
+    Plugin to balance scenarios dynamically between worker processes.
+
+    With `--coordinator <addr>` the run serves its scheduled scenarios to workers
+    and merges their results into a single report. With `--worker <addr>` the run
+    executes scenarios pulled from the coordinator one at a time. Unlike static slicing,
+    a slow worker takes fewer scenarios instead of holding up the whole run.
+    """
+
+    def __init__(self, config: Type["Distributor"]) -> None:
+        """
+        Initialize the DistributorPlugin with the provided configuration.
+
+        :param config: The Distributor configuration class.
+        """
+        super().__init__(config)
+        self._max_requeues = config.max_requeues
+        self._max_worker_restarts = config.max_worker_restarts
+        self._connect_timeout = config.connect_timeout
+        self._interrupt_exceptions = config.interrupt_exceptions
+        self._coordinator: Union[str, None] = None
+        self._worker: Union[str, None] = None
+        self._workers: int = 0
+
+    def subscribe(self, dispatcher: Dispatcher) -> None:
+        """
+        Subscribe to Vedro events to register the coordinator or worker runner.
+
+        :param dispatcher: The dispatcher to listen to events.
+        """
+        dispatcher.listen(ConfigLoadedEvent, self.on_config_loaded) \
+                  .listen(ArgParseEvent, self.on_arg_parse) \
+                  .listen(ArgParsedEvent, self.on_arg_parsed)
+
+    def on_config_loaded(self, event: ConfigLoadedEvent) -> None:
+        """
+        Store the global configuration to register runners later.
+
+        :param event: The ConfigLoadedEvent instance containing the configuration.
+        """
+        self._global_config: ConfigType = event.config
+
+    def on_arg_parse(self, event: ArgParseEvent) -> None:
+        """
+        Add command-line arguments for the coordinator and worker modes.
+
+        :param event: The ArgParseEvent instance used to add arguments.
+        """
+        group = event.arg_parser.add_argument_group("Distributor")
+        group.add_argument("--coordinator", metavar="ADDR",
+                           help="Serve scenarios to workers on ADDR "
+                                "('<host>:<port>' or 'unix:<path>', port 0 picks a free port)")
+        group.add_argument("--worker", metavar="ADDR",
+                           help="Run scenarios pulled from the coordinator at ADDR")
+        group.add_argument("--workers", type=int, default=self._workers,
+                           help="Number of local worker processes spawned by the coordinator")
+
+    def on_arg_parsed(self, event: ArgParsedEvent) -> None:
+        """
+        Validate the arguments and register the coordinator or worker runner.
+
+        :param event: The ArgParsedEvent instance containing parsed arguments.
+        :raises ValueError: If the arguments are invalid.
+        """
+        self._coordinator = event.args.coordinator
+        self._worker = event.args.worker
+        self._workers = event.args.workers
+
+        if (self._coordinator is not None) and (self._worker is not None):
+            raise ValueError("`--coordinator` and `--worker` can't be used together")
+        if self._workers < 0:
+            raise ValueError(f"`--workers` must be greater than or equal to 0, "
+                             f"{self._workers} given")
+        if self._workers and (self._coordinator is None):
+            raise ValueError("`--workers` can only be used with `--coordinator`")
+
+        if self._coordinator is not None:
+            address = parse_address(self._coordinator)
+            worker_args = self._get_worker_args(sys.argv[1:])
+            self._global_config.Registry.ScenarioRunner.register(
+                lambda: CoordinatorRunner(
+                    self._global_config.Registry.Dispatcher(),
+                    address=address,
+                    workers=self._workers,
+                    worker_args=worker_args,
+                    max_requeues=self._max_requeues,
+                    max_worker_restarts=self._max_worker_restarts,
+                    interrupt_exceptions=self._interrupt_exceptions,
+                ),
+                self
+            )
+        elif self._worker is not None:
+            address = parse_address(self._worker)
+            self._global_config.Registry.ScenarioRunner.register(
+                lambda: WorkerRunner(
+                    self._global_config.Registry.Dispatcher(),
+                    address=address,
+                    connect_timeout=self._connect_timeout,
+                    interrupt_exceptions=self._interrupt_exceptions,
+                ),
+                self
+            )
+
+    def _get_worker_args(self, argv: Sequence[str]) -> List[str]:
+        """
+        Build the arguments of local workers from the coordinator's arguments.
+
+        Workers must discover the same scenarios as the coordinator, so they get
+        the same arguments except for the coordinator-only ones.
+
+        :param argv: The command-line arguments of the coordinator (without the program).
+        :return: The command-line arguments for workers.
+        """
+        excluded = ("--coordinator", "--workers")
+        args: List[str] = []
+        skip_next = False
+        for arg in argv:
+            if skip_next:
+                skip_next = False
+            elif arg in excluded:
+                skip_next = True
+            elif not arg.startswith(tuple(f"{x}=" for x in excluded)):
+                args.append(arg)
+        return args
+
+
+class Distributor(PluginConfig):
+    """
+    Configuration for the DistributorPlugin.
+
+    Example:
+        $ vedro run --coordinator 127.0.0.1:0 --workers 4
+
+        $ vedro run --coordinator 0.0.0.0:8765
+        $ vedro run --worker coordinator-host:8765  # on each worker machine
+    """
+
+    plugin = DistributorPlugin
+    description = "Balances scenarios between worker processes pulling from a coordinator"
+
+    max_requeues: int = 2
+    """
+    How many times a scenario is re-queued after its worker crashed,
+    before the scenario is reported as failed.
+    """
+
+    max_worker_restarts: int = 10
+    """
+    How many times crashed local workers (see `--workers`) are restarted in total,
+    before the run is aborted.
+    """
+
+    connect_timeout: float = 30.0
+    """
+    Time to wait for the coordinator to accept a worker connection, in seconds.
+    """
+
+    interrupt_exceptions: Tuple[Type[BaseException], ...] = (
+        KeyboardInterrupt, SystemExit, CancelledError,
+    )
+    """
+    Exceptions that will interrupt scenario execution.
+    """
@@ -0,0 +1,149 @@
+import asyncio
+import json
+import os
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+
+__all__ = ("Address", "parse_address", "format_address", "read_message", "write_message",
+           "start_server", "open_connection", "ProtocolError",)
+
+MessageType = Dict[str, Any]
+Address = Union[Tuple[str, int], str]
+"""
+A TCP address as a (host, port) tuple, or a path to a Unix socket.
+"""
+
+_HEADER_SIZE = 4
+_UNIX_PREFIX = "unix:"
+
+
+class ProtocolError(ValueError):
+    """
+    Raised when a peer sends a message that can't be decoded.
+    """
+    pass
+
+
+def parse_address(raw: str) -> Address:
+    """
+    Parse an address in the "host:port" or "unix:/path/to/socket" format.
+
+    :param raw: The address string.
+    :return: A (host, port) tuple for TCP addresses or a path for Unix sockets.
+    :raises ValueError: If the address is invalid.
+    """
+    if raw.startswith(_UNIX_PREFIX):
+        path = raw[len(_UNIX_PREFIX):]
+        if not path:
+            raise ValueError(f"Invalid address '{raw}': socket path is empty")
+        return path
+
+    host, sep, port = raw.rpartition(":")
+    if not sep or not port.isdigit():
+        raise ValueError(f"Invalid address '{raw}'. "
+                         "Expected '<host>:<port>' or 'unix:<path>'")
+    return (host or "127.0.0.1", int(port))
+
+
+def format_address(address: Address) -> str:
+    """
+    Format an address in the form accepted by `parse_address`.
+
+    :param address: The address to format.
+    :return: The address string.
+    """
+    if isinstance(address, str):
+        return f"{_UNIX_PREFIX}{address}"
+    host, port = address
+    return f"{host}:{port}"
+
+
+async def read_message(reader: asyncio.StreamReader) -> Optional[MessageType]:
+    """
+    Read a single message from the stream.
+
+    Messages are JSON documents prefixed with their length (4 bytes, big-endian).
+
+    :param reader: The stream reader.
+    :return: The message, or None if the connection was closed.
+    :raises ProtocolError: If the payload is not a JSON object.
+    """
+    try:
+        header = await reader.readexactly(_HEADER_SIZE)
+        payload = await reader.readexactly(int.from_bytes(header, "big"))
+    except (asyncio.IncompleteReadError, ConnectionError):
+        return None
+
+    try:
+        message = json.loads(payload)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ProtocolError(f"Malformed message: {e}") from None
+    if not isinstance(message, dict):
+        raise ProtocolError(f"Malformed message: expected a JSON object, "
+                            f"got {type(message).__name__}")
+    return message
+
+
+async def write_message(writer: asyncio.StreamWriter, message: MessageType) -> None:
+    """
+    Write a single message to the stream.
+
+    :param writer: The stream writer.
+    :param message: The JSON-compatible message.
+    """
+    payload = json.dumps(message).encode()
+    writer.write(len(payload).to_bytes(_HEADER_SIZE, "big") + payload)
+    await writer.drain()
+
+
+ConnectionHandler = Callable[[asyncio.StreamReader, asyncio.StreamWriter], Awaitable[None]]
+
+
+async def start_server(handler: ConnectionHandler,
+                       address: Address) -> Tuple[asyncio.AbstractServer, Address]:
+    """
+    Start a server listening on the given address.
+
+    :param handler: The coroutine function called for each connection.
+    :param address: The address to listen on. Port 0 picks a free port.
+    :return: The server and the actual address it listens on.
+    """
+    if isinstance(address, str):
+        if os.path.exists(address):
+            os.unlink(address)
+        server = await asyncio.start_unix_server(handler, address)
+        return server, address
+
+    host, port = address
+    server = await asyncio.start_server(handler, host, port)
+    _, actual_port = server.sockets[0].getsockname()[:2]
+    return server, (host, actual_port)
+
+
+async def open_connection(address: Address, *, timeout: float,
+                          interval: float = 0.1
+                          ) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """
+    Connect to the given address, retrying until the timeout expires.
+
+    Workers may be started before the coordinator is ready, so refused connections
+    are retried.
+
+    :param address: The address to connect to.
+    :param timeout: The maximum time to wait for the connection, in seconds.
+    :param interval: The delay between attempts, in seconds.
+    :return: The stream reader and writer of the connection.
+    :raises ConnectionError: If the connection could not be established in time.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        try:
+            if isinstance(address, str):
+                return await asyncio.open_unix_connection(address)
+            return await asyncio.open_connection(*address)
+        except OSError as e:
+            if loop.time() >= deadline:
+                raise ConnectionError(
+                    f"Failed to connect to coordinator at {format_address(address)}: {e}"
+                ) from None
+            await asyncio.sleep(interval)
@@ -0,0 +1,86 @@
+from typing import Any, Dict, Optional, Tuple, Type
+
+from vedro.core import Dispatcher, Report, VirtualScenario
+from vedro.core.scenario_result import ScenarioResultSerializer
+from vedro.core.scenario_runner import MonotonicScenarioRunner, RunInterrupted, ScenarioInterrupted
+from vedro.core.scenario_scheduler import ScenarioScheduler
+
+from ._protocol import Address, open_connection, read_message, write_message
+
+__all__ = ("WorkerRunner",)
+
+
+class WorkerRunner(MonotonicScenarioRunner):
+    """
+    Runs scenarios pulled one at a time from a coordinator.
+
+    The worker discovers scenarios as usual, then asks the coordinator which scenario
+    to run next, runs it and sends the serialized result back, until the coordinator
+    has nothing left. Results are also added to the worker's own report.
+    """
+
+    def __init__(self, dispatcher: Dispatcher, *,
+                 address: Address,
+                 connect_timeout: float = 30.0,
+                 interrupt_exceptions: Tuple[Type[BaseException], ...] = (),
+                 serializer: Optional[ScenarioResultSerializer] = None) -> None:
+        """
+        Initialize the WorkerRunner.
+
+        :param dispatcher: The event dispatcher for firing execution events.
+        :param address: The address of the coordinator.
+        :param connect_timeout: Time to wait for the coordinator to accept the connection,
+                                in seconds.
+        :param interrupt_exceptions: Additional exception types that should interrupt execution.
+        :param serializer: The serializer used to send results to the coordinator.
+        """
+        super().__init__(dispatcher, interrupt_exceptions=interrupt_exceptions)
+        self._address = address
+        self._connect_timeout = connect_timeout
+        self._serializer = serializer or ScenarioResultSerializer()
+
+    async def _run_scenarios(self,
+                             scheduler: ScenarioScheduler,
+                             report: Report,
+                             **kwargs: Any) -> None:
+        """
+        Run the scenarios assigned by the coordinator.
+
+        :param scheduler: The scheduler of the worker, used to look up scenarios.
+        :param report: The report to add results to.
+        :param kwargs: Additional keyword arguments (e.g., output_capturer).
+        :raises RunInterrupted: If execution is interrupted by a configured exception.
+        :raises KeyError: If the coordinator sends a scenario the worker hasn't discovered.
+        """
+        output_capturer = self._get_output_capturer(**kwargs)
+        scenarios: Dict[str, VirtualScenario] = {x.unique_id: x for x in scheduler.discovered}
+
+        reader, writer = await open_connection(self._address, timeout=self._connect_timeout)
+        try:
+            await write_message(writer, {"type": "next"})
+            while True:
+                message = await read_message(reader)
+                if (message is None) or (message["type"] == "done"):
+                    break
+
+                unique_id = message["unique_id"]
+                if unique_id not in scenarios:
+                    raise KeyError(f"Scenario {unique_id!r} not found, "
+                                   "make sure the worker is run with the coordinator's arguments")
+
+                try:
+                    scenario_result = await self.run_scenario(scenarios[unique_id],
+                                                              output_capturer=output_capturer)
+                except ScenarioInterrupted as e:
+                    await self._report_scenario_results([e.scenario_result], report, scheduler)
+                    raise RunInterrupted(e.exc_info)
+
+                # Serialize before reporting, plugins may extend the result when it's reported
+                result = self._serializer.serialize(scenario_result)
+                await write_message(writer, {"type": "result", "task": message["task"],
+                                             "result": result})
+                await self._report_scenario_results([scenario_result], report, scheduler)
+
+                await write_message(writer, {"type": "next"})
+        finally:
+            writer.close()
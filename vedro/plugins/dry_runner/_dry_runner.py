@@ -12,6 +12,7 @@ from vedro.core import (
     VirtualScenario,
     VirtualStep,
 )
+from vedro.core.scenario_collector import LazyVirtualScenario
 from vedro.core.scenario_runner import Interrupted, ScenarioRunner
 from vedro.events import (
     ScenarioFailedEvent,
@@ -51,6 +52,9 @@ class DryRunner(ScenarioRunner):
             await self._dispatcher.fire(ScenarioSkippedEvent(scenario_result))
             return scenario_result
 
+        if isinstance(scenario, LazyVirtualScenario):
+            await scenario.materialize()
+
         await self._dispatcher.fire(ScenarioRunEvent(scenario_result))
         scenario_result.set_started_at(time())
 
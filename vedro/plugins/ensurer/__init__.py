@@ -1,4 +1,7 @@
-from ._ensure import Ensure
+from ._backoff import Backoff
+from ._ensure import Ensure, RejectedResult
+from ._ensure_metrics import EnsureFunctionStats, EnsureMetrics
 from ._ensurer import Ensurer, EnsurerPlugin, ensure
 
-__all__ = ("Ensurer", "EnsurerPlugin", "ensure", "Ensure",)
+__all__ = ("Ensurer", "EnsurerPlugin", "ensure", "Ensure", "Backoff", "RejectedResult",
+           "EnsureMetrics", "EnsureFunctionStats",)
@@ -0,0 +1,62 @@
+import random
+
+__all__ = ("Backoff",)
+
+
+class Backoff:
+    """
+    Computes exponential delays between attempts, optionally with jitter.
+
+    An instance is a delay callable and can be passed as `delay` to `ensure`.
+    The delay before the next attempt is `base * factor ** (attempt - 1)`, capped by
+    `max_delay`. With jitter enabled ("full jitter"), a random delay between zero and
+    the computed one is used, so retrying scenarios don't hit a service in lockstep.
+    Jitter uses the `random` module, which is seeded by the Seeder plugin,
+    so delays are reproducible with the same `--seed`.
+    """
+
+    def __init__(self, base: float = 0.1, *,
+                 factor: float = 2.0,
+                 max_delay: float = 10.0,
+                 jitter: bool = True) -> None:
+        """
+        Initialize the Backoff instance.
+
+        :param base: The delay after the first attempt, in seconds. Default is 0.1.
+        :param factor: The multiplier applied after each attempt. Default is 2.0.
+        :param max_delay: The upper limit for a single delay, in seconds. Default is 10.0.
+        :param jitter: Whether to randomize delays. Default is True.
+        :raises ValueError: If any of the values is negative or factor is less than 1.
+        """
+        if base < 0 or max_delay < 0:
+            raise ValueError("'base' and 'max_delay' must be non-negative")
+        if factor < 1:
+            raise ValueError("'factor' must be greater than or equal to 1")
+        self._base = base
+        self._factor = factor
+        self._max_delay = max_delay
+        self._jitter = jitter
+
+    def __call__(self, attempt: int) -> float:
+        """
+        Compute the delay after the given attempt.
+
+        :param attempt: The number of the attempt that has just failed, starting from 1.
+        :return: The delay in seconds.
+        """
+        try:
+            delay = min(self._max_delay, self._base * self._factor ** (attempt - 1))
+        except OverflowError:
+            delay = self._max_delay
+        if self._jitter:
+            return random.uniform(0, delay)
+        return delay
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the Backoff instance.
+
+        :return: A string representation of the Backoff instance with its configuration.
+        """
+        return (f"{self.__class__.__name__}({self._base!r}, factor={self._factor!r}, "
+                f"max_delay={self._max_delay!r}, jitter={self._jitter!r})")
@@ -3,8 +3,10 @@ import time
 from functools import wraps
 from typing import Any, Callable, Coroutine, Optional, Tuple, Type, TypeVar, Union, cast, overload
 
-__all__ = ("Ensure", "AttemptType", "DelayValueType", "DelayCallableType", "DelayType",
-           "ExceptionType", "SwallowExceptionType", "LoggerType",)
+from ._ensure_metrics import EnsureMetrics
+
+__all__ = ("Ensure", "RejectedResult", "AttemptType", "DelayValueType", "DelayCallableType",
+           "DelayType", "ExceptionType", "SwallowExceptionType", "LoggerType", "RetryOnType",)
 
 F = TypeVar("F", bound=Callable[..., Any])
 AF = TypeVar("AF", bound=Callable[..., Coroutine[Any, Any, Any]])
@@ -19,32 +21,69 @@ SwallowExceptionType = Union[Tuple[ExceptionType, ...], ExceptionType]
 
 LoggerType = Callable[[Callable[..., Any], AttemptType, Union[BaseException, None]], Any]
 
+RetryOnType = Callable[[Any], bool]
+
+
+class RejectedResult(Exception):
+    """
+    Describes an attempt whose result was rejected by the `retry_on` predicate.
+
+    It is never raised, only passed to the logger in place of an exception.
+    """
+
+    def __init__(self, result: Any) -> None:
+        """
+        Initialize the RejectedResult with the rejected value.
+
+        :param result: The value returned by the attempt.
+        """
+        super().__init__(result)
+        self.result = result
+
 
 class Ensure:
     """
     Provides functionality to ensure a function succeeds within a specified number of attempts.
 
     This class retries a given function or coroutine function a specified number of times,
-    optionally with a delay between attempts, and can log each attempt.
+    optionally with a delay between attempts and within a total time budget, and can log
+    each attempt. Besides exceptions, an attempt fails when its result is rejected by
+    the `retry_on` predicate.
     """
 
     def __init__(self, *, attempts: AttemptType = 3,
                  delay: DelayType = 0.0,
                  swallow: SwallowExceptionType = BaseException,
-                 logger: Optional[LoggerType] = None) -> None:
+                 logger: Optional[LoggerType] = None,
+                 deadline: Optional[float] = None,
+                 retry_on: Optional[RetryOnType] = None,
+                 metrics: Optional[EnsureMetrics] = None,
+                 offload: bool = False) -> None:
         """
         Initialize the Ensure instance with retry configurations.
 
         :param attempts: The number of attempts to try executing the function. Default is 3.
         :param delay: The delay between attempts. Can be a fixed value or a callable
-            returning a value.
+            returning a value (e.g. `Backoff`).
         :param swallow: The exception(s) to be caught and retried. Default is BaseException.
         :param logger: An optional logging callable to log each attempt. Default is None.
+        :param deadline: An optional total time budget in seconds. No new attempt is made
+            if it would start after the budget is spent. Default is None (no budget).
+        :param retry_on: An optional predicate that receives the result of an attempt and
+            returns True if the attempt should be retried. When attempts run out,
+            the last result is returned. Default is None.
+        :param metrics: An optional collector of per-function attempts and latency.
+        :param offload: Whether a decorated synchronous step should be run in a worker
+            thread, so its retries and delays don't block the event loop. Default is False.
         """
         self._attempts = attempts
         self._delay = delay
         self._swallow = swallow
         self._logger = logger
+        self._deadline = deadline
+        self._retry_on = retry_on
+        self._metrics = metrics
+        self._offload = offload
 
     @overload
     def __call__(self, fn: F) -> F:
@@ -87,22 +126,37 @@ class Ensure:
         """
         @wraps(fn)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            exception = None
-            for attempt in range(1, self._attempts + 1):
-                try:
-                    res = fn(*args, **kwargs)
-                    if self._logger and attempt > 1:
-                        self._logger(fn, attempt, None)
-                    return res
-                except self._swallow as e:
-                    exception = e
-                    delay = self._delay(attempt) if callable(self._delay) else self._delay
+            started_at = time.monotonic()
+            attempt, succeeded = 0, False
+            failure: Union[BaseException, None] = None
+            try:
+                for attempt in range(1, self._attempts + 1):
+                    try:
+                        res = fn(*args, **kwargs)
+                    except self._swallow as e:
+                        failure = e
+                    else:
+                        if not self._is_rejected(res):
+                            succeeded = True
+                            if self._logger and attempt > 1:
+                                self._logger(fn, attempt, None)
+                            return res
+                        failure = RejectedResult(res)
+                    delay = self._get_delay(attempt)
                     if self._logger and self._attempts > 1:
-                        self._logger(fn, attempt, e)
+                        self._logger(fn, attempt, failure)
+                    if self._is_out_of_time(started_at, delay):
+                        break
                     time.sleep(delay)
-            if exception:  # pragma: no branch
-                raise exception
+                if isinstance(failure, RejectedResult):
+                    return failure.result
+                if failure is not None:  # pragma: no branch
+                    raise failure
+            finally:
+                self._record(fn, attempt, started_at, succeeded)
 
+        if self._offload:
+            setattr(sync_wrapper, "__vedro__offload__", True)
         return cast(F, sync_wrapper)
 
     def _async_wrapper(self, fn: AF) -> AF:
@@ -114,29 +168,91 @@ class Ensure:
         """
         @wraps(fn)
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            exception = None
-            for attempt in range(1, self._attempts + 1):
-                try:
-                    res = await fn(*args, **kwargs)
-                    if self._logger and attempt > 1:
-                        self._logger(fn, attempt, None)
-                    return res
-                except self._swallow as e:
-                    exception = e
-                    delay = self._delay(attempt) if callable(self._delay) else self._delay
+            started_at = time.monotonic()
+            attempt, succeeded = 0, False
+            failure: Union[BaseException, None] = None
+            try:
+                for attempt in range(1, self._attempts + 1):
+                    try:
+                        res = await fn(*args, **kwargs)
+                    except self._swallow as e:
+                        failure = e
+                    else:
+                        if not self._is_rejected(res):
+                            succeeded = True
+                            if self._logger and attempt > 1:
+                                self._logger(fn, attempt, None)
+                            return res
+                        failure = RejectedResult(res)
+                    delay = self._get_delay(attempt)
                     if self._logger and self._attempts > 1:
-                        self._logger(fn, attempt, e)
+                        self._logger(fn, attempt, failure)
+                    if self._is_out_of_time(started_at, delay):
+                        break
                     await asyncio.sleep(delay)
-            if exception:  # pragma: no branch
-                raise exception
+                if isinstance(failure, RejectedResult):
+                    return failure.result
+                if failure is not None:  # pragma: no branch
+                    raise failure
+            finally:
+                self._record(fn, attempt, started_at, succeeded)
 
         return cast(AF, async_wrapper)
 
+    def _is_rejected(self, result: Any) -> bool:
+        """
+        Check whether the result of an attempt should be retried.
+
+        :param result: The value returned by the attempt.
+        :return: True if the `retry_on` predicate rejects the result, False otherwise.
+        """
+        return self._retry_on is not None and bool(self._retry_on(result))
+
+    def _get_delay(self, attempt: AttemptType) -> DelayValueType:
+        """
+        Get the delay after a failed attempt.
+
+        :param attempt: The number of the failed attempt.
+        :return: The delay in seconds.
+        """
+        return self._delay(attempt) if callable(self._delay) else self._delay
+
+    def _is_out_of_time(self, started_at: float, delay: DelayValueType) -> bool:
+        """
+        Check whether the next attempt would start after the deadline.
+
+        :param started_at: The monotonic time of the first attempt.
+        :param delay: The delay before the next attempt.
+        :return: True if the time budget doesn't allow another attempt, False otherwise.
+        """
+        if self._deadline is None:
+            return False
+        return time.monotonic() - started_at + delay >= self._deadline
+
+    def _record(self, fn: Callable[..., Any], attempts: AttemptType, started_at: float,
+                succeeded: bool) -> None:
+        """
+        Record a finished call in the metrics collector, if any.
+
+        :param fn: The ensured function.
+        :param attempts: The number of attempts made.
+        :param started_at: The monotonic time of the first attempt.
+        :param succeeded: Whether the call eventually succeeded.
+        """
+        if self._metrics is not None:
+            self._metrics.record(fn, attempts, time.monotonic() - started_at, succeeded)
+
     def __repr__(self) -> str:
         """
         Return a string representation of the Ensure instance.
 
         :return: A string representation of the Ensure instance with its configurations.
         """
+        extra = ""
+        if self._deadline is not None:
+            extra += f", deadline={self._deadline!r}"
+        if self._retry_on is not None:
+            extra += f", retry_on={self._retry_on!r}"
         return (f"{self.__class__.__name__}"
-                f"(attempts={self._attempts}, delay={self._delay!r}, swallow={self._swallow!r})")
+                f"(attempts={self._attempts}, delay={self._delay!r}, swallow={self._swallow!r}"
+                f"{extra})")
@@ -0,0 +1,97 @@
+from inspect import unwrap
+from threading import Lock
+from typing import Any, Callable, Dict, List
+
+__all__ = ("EnsureMetrics", "EnsureFunctionStats",)
+
+
+class EnsureFunctionStats:
+    """
+    Holds attempt and latency statistics of a single ensured function.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Initialize the EnsureFunctionStats.
+
+        :param name: The qualified name of the function.
+        """
+        self.name = name
+        self.calls = 0
+        self.attempts = 0
+        self.failures = 0
+        self.total_elapsed = 0.0
+        self.max_elapsed = 0.0
+
+    @property
+    def avg_elapsed(self) -> float:
+        """
+        Get the average latency of a call, including retries and delays.
+
+        :return: The average latency in seconds, or 0.0 if there were no calls.
+        """
+        return self.total_elapsed / self.calls if self.calls else 0.0
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the EnsureFunctionStats.
+
+        :return: A string representation of the stats.
+        """
+        return (f"<{self.__class__.__name__} {self.name!r} calls={self.calls} "
+                f"attempts={self.attempts} failures={self.failures}>")
+
+
+class EnsureMetrics:
+    """
+    Collects per-function statistics of ensured calls.
+
+    Calls may come from worker threads (see offloaded sync steps), so recording
+    is guarded by a lock.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty EnsureMetrics collector.
+        """
+        self._stats: Dict[Callable[..., Any], EnsureFunctionStats] = {}
+        self._lock = Lock()
+
+    @property
+    def stats(self) -> List[EnsureFunctionStats]:
+        """
+        Get the statistics, in the order the functions were first called.
+
+        :return: A list of function statistics.
+        """
+        with self._lock:
+            return list(self._stats.values())
+
+    def record(self, fn: Callable[..., Any], attempts: int, elapsed: float,
+               succeeded: bool) -> None:
+        """
+        Record a finished call of an ensured function.
+
+        :param fn: The ensured function.
+        :param attempts: The number of attempts made.
+        :param elapsed: The latency of the call, including retries and delays, in seconds.
+        :param succeeded: Whether the call eventually succeeded.
+        """
+        orig_fn = unwrap(fn)
+        with self._lock:
+            if orig_fn not in self._stats:
+                name = getattr(orig_fn, "__qualname__", repr(orig_fn))
+                self._stats[orig_fn] = EnsureFunctionStats(name)
+            stats = self._stats[orig_fn]
+            stats.calls += 1
+            stats.attempts += attempts
+            stats.failures += 0 if succeeded else 1
+            stats.total_elapsed += elapsed
+            stats.max_elapsed = max(stats.max_elapsed, elapsed)
+
+    def clear(self) -> None:
+        """
+        Forget all collected statistics.
+        """
+        with self._lock:
+            self._stats.clear()
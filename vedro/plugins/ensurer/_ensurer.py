@@ -2,9 +2,10 @@ from inspect import unwrap
 from typing import Any, Callable, List, Optional, Tuple, Type, Union, final
 
 from vedro.core import Dispatcher, Plugin, PluginConfig
-from vedro.events import StepFailedEvent, StepPassedEvent, StepRunEvent
+from vedro.events import CleanupEvent, StepFailedEvent, StepPassedEvent, StepRunEvent
 
-from ._ensure import AttemptType, DelayType, Ensure, SwallowExceptionType
+from ._ensure import AttemptType, DelayType, Ensure, RetryOnType, SwallowExceptionType
+from ._ensure_metrics import EnsureMetrics
 from ._runtime_config import RuntimeConfig
 from ._runtime_config import runtime_config as _runtime_config
 
@@ -13,7 +14,9 @@ __all__ = ("Ensurer", "EnsurerPlugin", "ensure",)
 
 def ensure(*, attempts: Optional[AttemptType] = None,
            delay: Optional[DelayType] = None,
-           swallow: Optional[SwallowExceptionType] = None) -> Ensure:
+           swallow: Optional[SwallowExceptionType] = None,
+           deadline: Optional[float] = None,
+           retry_on: Optional[RetryOnType] = None) -> Ensure:
     """
     Decorator to add retry logic to a function or coroutine.
 
@@ -25,12 +28,20 @@ def ensure(*, attempts: Optional[AttemptType] = None,
         returning a value. Default value can be configured via Ensurer plugin params.
     :param swallow: The exception(s) to be caught and retried.
         Default value can be configured via Ensurer plugin params.
+    :param deadline: The total time budget in seconds. No new attempt is made once
+        the budget (including delays) is spent. Default is no budget.
+    :param retry_on: A predicate that receives the result of an attempt and returns True
+        if the attempt should be retried, e.g. `lambda resp: resp.status_code >= 500`.
     :return: An instance of Ensure configured with the provided or default parameters.
     """
     return Ensure(attempts=attempts or _runtime_config.get_attempts(),
                   delay=delay or _runtime_config.get_delay(),
                   swallow=swallow or _runtime_config.get_swallow(),
-                  logger=_runtime_config.get_logger())
+                  logger=_runtime_config.get_logger(),
+                  deadline=deadline,
+                  retry_on=retry_on,
+                  metrics=_runtime_config.get_metrics(),
+                  offload=_runtime_config.get_offload())
 
 
 @final
@@ -38,18 +49,20 @@ class EnsurerPlugin(Plugin):
     """
     A plugin to integrate the Ensure functionality with the Vedro testing framework.
 
-    This plugin sets up runtime configuration and logs the results of each retry attempt
-    during test steps.
+    This plugin sets up runtime configuration, logs the results of each retry attempt
+    during test steps and adds per-function attempt and latency metrics to the report summary.
     """
 
     def __init__(self, config: Type["Ensurer"], *,
-                 runtime_config: RuntimeConfig = _runtime_config) -> None:
+                 runtime_config: RuntimeConfig = _runtime_config,
+                 metrics_factory: Callable[[], EnsureMetrics] = EnsureMetrics) -> None:
         """
         Initialize the EnsurerPlugin with the provided configuration and runtime configuration.
 
         :param config: The Ensurer configuration class.
         :param runtime_config: The runtime configuration instance.
             Defaults to the module-level runtime_config.
+        :param metrics_factory: A factory to create the metrics collector.
         """
         super().__init__(config)
         self._runtime_config = runtime_config
@@ -63,19 +76,25 @@ class EnsurerPlugin(Plugin):
         else:
             self._runtime_config.set_logger(None)
 
+        self._show_metrics = config.show_metrics
+        self._metrics = metrics_factory() if self._show_metrics else None
+        self._runtime_config.set_metrics(self._metrics)
+        self._runtime_config.set_offload(config.offload_sync_steps)
+
         self._attempt_log: List[
             Tuple[Callable[..., Any], AttemptType, Union[BaseException, None]]
         ] = []
 
     def subscribe(self, dispatcher: Dispatcher) -> None:
         """
-        Subscribe to Vedro events for step run, step passed, and step failed.
+        Subscribe to Vedro events for step run, step passed, step failed, and cleanup.
 
         :param dispatcher: The dispatcher to listen to events.
         """
         dispatcher.listen(StepRunEvent, self.on_step_run) \
                   .listen(StepPassedEvent, self.on_step_end) \
-                  .listen(StepFailedEvent, self.on_step_end)
+                  .listen(StepFailedEvent, self.on_step_end) \
+                  .listen(CleanupEvent, self.on_cleanup)
 
     def on_step_run(self, event: StepRunEvent) -> None:
         """
@@ -100,6 +119,22 @@ class EnsurerPlugin(Plugin):
                                  f"[{attempt}] attempt succeeded")
                 event.step_result.add_extra_details(extra_details)
 
+    def on_cleanup(self, event: CleanupEvent) -> None:
+        """
+        Handle the cleanup event, adding per-function metrics to the report summary.
+
+        :param event: The CleanupEvent instance.
+        """
+        if self._metrics is None:
+            return
+
+        for stats in self._metrics.stats:
+            event.report.add_summary(
+                f"ensure: {stats.name} (calls {stats.calls}, attempts {stats.attempts}, "
+                f"failed {stats.failures}, avg {stats.avg_elapsed:.2f}s, "
+                f"max {stats.max_elapsed:.2f}s)"
+            )
+
     def _logger(self, fn: Callable[..., Any],
                 attempt: AttemptType,
                 exc: Union[BaseException, None]) -> None:
@@ -146,3 +181,18 @@ class Ensurer(PluginConfig):
     """
     Default exceptions to swallow during retries.
     """
+
+    show_metrics: bool = False
+    """
+    Whether to add per-function attempt and latency metrics to the report summary.
+    """
+
+    offload_sync_steps: bool = False
+    """
+    Whether synchronous steps decorated with `ensure` run in a worker thread.
+
+    Retries and delays of such steps then don't block the event loop and other
+    scenarios running concurrently. Disabled by default: objects bound to the thread
+    that created them (e.g., sqlite3 connections, thread-locals) can't be used
+    by offloaded steps.
+    """
@@ -3,6 +3,7 @@ from typing import Union
 from niltype import Nil, Nilable
 
 from ._ensure import AttemptType, DelayType, LoggerType, SwallowExceptionType
+from ._ensure_metrics import EnsureMetrics
 
 __all__ = ("RuntimeConfig", "runtime_config",)
 
@@ -13,7 +14,8 @@ class RuntimeConfig:
 
     This class allows setting and retrieving configuration parameters that control the behavior
     of retry mechanisms, including the number of attempts, delay between attempts,
-    exceptions to swallow, and logging of attempts.
+    exceptions to swallow, logging of attempts, metrics collection and offloading
+    of synchronous steps.
     """
 
     def __init__(self) -> None:
@@ -24,6 +26,8 @@ class RuntimeConfig:
         self._delay: Nilable[DelayType] = Nil
         self._swallow: Nilable[SwallowExceptionType] = Nil
         self._logger: Nilable[Union[LoggerType, None]] = Nil
+        self._metrics: Nilable[Union[EnsureMetrics, None]] = Nil
+        self._offload: Nilable[bool] = Nil
 
     def get_attempts(self) -> AttemptType:
         """
@@ -101,5 +105,43 @@ class RuntimeConfig:
         """
         self._logger = logger
 
+    def get_metrics(self) -> Union[EnsureMetrics, None]:
+        """
+        Retrieve the configured metrics collector.
+
+        :return: The metrics collector, or None if metrics are disabled.
+        :raises ValueError: If metrics have not been set.
+        """
+        if self._metrics is Nil:
+            raise ValueError("'metrics' is not set")
+        return self._metrics
+
+    def set_metrics(self, metrics: Union[EnsureMetrics, None]) -> None:
+        """
+        Set the metrics collector.
+
+        :param metrics: The metrics collector to set, or None to disable metrics.
+        """
+        self._metrics = metrics
+
+    def get_offload(self) -> bool:
+        """
+        Retrieve whether synchronous steps should be offloaded to a worker thread.
+
+        :return: The offload flag.
+        :raises ValueError: If offload has not been set.
+        """
+        if self._offload is Nil:
+            raise ValueError("'offload' is not set")
+        return self._offload
+
+    def set_offload(self, offload: bool) -> None:
+        """
+        Set whether synchronous steps should be offloaded to a worker thread.
+
+        :param offload: The offload flag to set.
+        """
+        self._offload = offload
+
 
 runtime_config = RuntimeConfig()
@@ -23,6 +23,7 @@ class FunctionerPlugin(Plugin):
         :param config: The configuration class associated with this plugin.
         """
         super().__init__(config)
+        self._static_precheck = config.static_precheck
 
     def subscribe(self, dispatcher: Dispatcher) -> None:
         """
@@ -39,7 +40,8 @@ class FunctionerPlugin(Plugin):
         :param event: The event containing the loaded configuration.
         """
         scenario_collector = event.config.Registry.ScenarioCollector()
-        scenario_collector.register_provider(FuncBasedScenarioProvider(), self)
+        provider = FuncBasedScenarioProvider(static_precheck=self._static_precheck)
+        scenario_collector.register_provider(provider, self)
 
 
 class Functioner(PluginConfig):
@@ -50,3 +52,11 @@ class Functioner(PluginConfig):
     """
     plugin = FunctionerPlugin
     description = "Enables a functional-style syntax for defining Vedro scenarios"
+
+    static_precheck: bool = False
+    """
+    Skip importing modules whose source never references the `scenario` decorator.
+
+    Enable together with `LazyScenarioProvider` so that class-based scenario modules
+    are not imported during collection.
+    """
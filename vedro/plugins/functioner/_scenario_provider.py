@@ -1,19 +1,27 @@
+import ast
 import inspect
 from functools import WRAPPER_ASSIGNMENTS, wraps
 from inspect import Parameter, Signature, iscoroutinefunction, unwrap
 from pathlib import Path
 from types import ModuleType
-from typing import Any, Dict, List, Tuple, Type, Union, cast
+from typing import Any, Dict, List, Tuple, Type, Union
 
-from vedro._scenario import Scenario
+from vedro._scenario import Scenario, lazy_template_expansion
 from vedro.core import VirtualScenario
-from vedro.core.scenario_collector import ScenarioProvider, ScenarioSource
+from vedro.core.scenario_collector import (
+    ScenarioProvider,
+    ScenarioSource,
+    create_template_vscenarios,
+)
 from vedro.core.scenario_discoverer import create_vscenario
 
 from ._scenario_descriptor import ScenarioDescriptor
 
 __all__ = ("FuncBasedScenarioProvider",)
 
+# Attributes to copy when wrapping functions, '__name__' is excluded to preserve the wrapper's name
+_WRAPPER_ASSIGNMENTS = tuple(x for x in WRAPPER_ASSIGNMENTS if x != '__name__')
+
 
 class FuncBasedScenarioProvider(ScenarioProvider):
     """
@@ -25,6 +33,16 @@ class FuncBasedScenarioProvider(ScenarioProvider):
     scenario classes.
     """
 
+    def __init__(self, *, static_precheck: bool = False) -> None:
+        """
+        Initialize the FuncBasedScenarioProvider.
+
+        :param static_precheck: If True, modules whose source never references
+                                `scenario` are not imported. This keeps class-based
+                                modules collected by `LazyScenarioProvider` lazy.
+        """
+        self._static_precheck = static_precheck
+
     async def provide(self, source: ScenarioSource) -> List[VirtualScenario]:
         """
         Extract and return all VirtualScenario instances from the given source.
@@ -34,51 +52,75 @@ class FuncBasedScenarioProvider(ScenarioProvider):
         """
         if source.path.suffix != ".py":
             return []
+        if self._static_precheck and not await self._may_declare_scenarios(source):
+            return []
         module = await source.get_module()
-        scenarios = self._collect_scenarios(module, source.path)
-        return [create_vscenario(scn, project_dir=source.project_dir) for scn in scenarios]
+        return self._collect_vscenarios(module, source)
 
-    def _collect_scenarios(self, module: ModuleType, source_path: Path) -> List[Type[Scenario]]:
+    async def _may_declare_scenarios(self, source: ScenarioSource) -> bool:
         """
-        Collect all scenario classes from the specified module.
+        Check whether the source may declare function-based scenarios.
+
+        Function-based scenarios are declared with the `scenario` decorator, so a module
+        that never mentions this name can't declare any. The check errs on the side
+        of importing the module whenever the source can't be read or parsed.
+
+        :param source: The scenario source to check.
+        :return: False if the module certainly declares no scenarios, True otherwise.
+        """
+        try:
+            tree = ast.parse(await source.get_content(), filename=str(source.path))
+        except Exception:
+            return True
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name) and node.id == "scenario":
+                return True
+            if isinstance(node, ast.Attribute) and node.attr == "scenario":
+                return True
+            if isinstance(node, ast.alias) and node.name == "scenario":
+                return True
+        return False
+
+    def _collect_vscenarios(self, module: ModuleType,
+                            source: ScenarioSource) -> List[VirtualScenario]:
+        """
+        Collect virtual scenarios from the scenario descriptors of the specified module.
 
         :param module: The module from which to collect scenario descriptors.
-        :param source_path: The path to the source file.
-        :return: A list of Scenario classes built from descriptors found in the module.
+        :param source: The source the module was loaded from.
+        :return: A list of VirtualScenario instances, one for each parameterization.
         """
-        loaded = []
+        loaded: List[VirtualScenario] = []
         for name, val in module.__dict__.items():
             if isinstance(val, ScenarioDescriptor):
                 if not name.startswith("_"):
-                    scenarios = self._build_vedro_scenarios(val, module, source_path)
+                    scenarios = self._build_vscenarios(val, module, source)
                     loaded.extend(scenarios)
         return loaded
 
-    def _build_vedro_scenarios(self, descriptor: ScenarioDescriptor,
-                               module: ModuleType, source_path: Path) -> List[Type[Scenario]]:
+    def _build_vscenarios(self, descriptor: ScenarioDescriptor, module: ModuleType,
+                          source: ScenarioSource) -> List[VirtualScenario]:
         """
-        Build one or more Scenario classes from a given descriptor.
+        Build one or more virtual scenarios from a given descriptor.
+
+        A single Scenario class is built per descriptor. For parameterized descriptors
+        it is a template whose cases are kept as records, and the class of each case
+        is built only when the case is about to run.
 
         :param descriptor: The descriptor containing scenario definition and metadata.
         :param module: The module in which the scenario is defined.
-        :param source_path: The path to the source file.
-        :return: A list of Scenario classes, one for each parameterization if applicable.
+        :param source: The source the module was loaded from.
+        :return: A list of VirtualScenario instances, one for each parameterization.
         """
         if len(descriptor.cases) == 0:
-            scenario_cls = self._build_vedro_scenario(descriptor, module, source_path)
-            return [scenario_cls]
+            scenario_cls = self._build_vedro_scenario(descriptor, module, source.path)
+            return [create_vscenario(scenario_cls, project_dir=source.project_dir)]
 
-        scenario_cls = self._build_vedro_scenario_with_cases(descriptor, module, source_path)
+        scenario_cls = self._build_vedro_scenario_with_cases(descriptor, module, source.path)
 
-        scenarios = []
-        for idx, _ in enumerate(descriptor.cases, start=1):
-            scn_name = f"{self._create_scenario_name(descriptor)}_{idx}_VedroScenario"
-            scenarios.append(
-                # This is a temporary and dirty workaround; to be revisited after the v2 release
-                # Logic adapted from the `_Meta` class in vedro/_scenario.py
-                cast(Type[Scenario], scenario_cls.__init__.__globals__[scn_name])
-            )
-        return scenarios
+        return create_template_vscenarios(scenario_cls, path=source.path,
+                                          project_dir=source.project_dir)
 
     def _build_vedro_scenario(self, descriptor: ScenarioDescriptor,
                               module: ModuleType, source_path: Path) -> Type[Scenario]:
@@ -108,7 +150,7 @@ class FuncBasedScenarioProvider(ScenarioProvider):
         :param descriptor: The descriptor containing parameterized test data and metadata.
         :param module: The module where the scenario is defined.
         :param source_path: The path to the source file.
-        :return: A Scenario class with parameterized initialization.
+        :return: A template Scenario class with the cases stored as records.
         """
         sig = inspect.signature(descriptor.fn)
         param_names = list(sig.parameters.keys())
@@ -132,13 +174,13 @@ class FuncBasedScenarioProvider(ScenarioProvider):
             __init__ = params(__init__)
 
         if iscoroutinefunction(descriptor.fn):
-            @wraps(descriptor.fn, assigned=self._get_wrapper_assignments())
+            @wraps(descriptor.fn, assigned=_WRAPPER_ASSIGNMENTS)
             async def do(self, *args: Any, **kwargs: Any):  # type: ignore
                 params_kwargs = {name: getattr(self, name) for name in param_names}
                 merged_kwargs = {**params_kwargs, **kwargs}
                 return await descriptor.fn(*args, **merged_kwargs)
         else:
-            @wraps(descriptor.fn, assigned=self._get_wrapper_assignments())
+            @wraps(descriptor.fn, assigned=_WRAPPER_ASSIGNMENTS)
             def do(self, *args: Any, **kwargs: Any):  # type: ignore
                 params_kwargs = {name: getattr(self, name) for name in param_names}
                 merged_kwargs = {**params_kwargs, **kwargs}
@@ -149,7 +191,9 @@ class FuncBasedScenarioProvider(ScenarioProvider):
             "__init__": __init__,
             "do": do,
         })
-        scenario_cls = type(self._create_scenario_name(descriptor), (Scenario,), attrs)
+        # Case classes are not created upfront, see `LazyTemplateScenario`
+        with lazy_template_expansion():
+            scenario_cls = type(self._create_scenario_name(descriptor), (Scenario,), attrs)
 
         for decorator in descriptor.decorators:
             scenario_cls = decorator(scenario_cls)
@@ -207,13 +251,13 @@ class FuncBasedScenarioProvider(ScenarioProvider):
         :return: A method suitable for the 'do' attribute of a scenario class.
         """
         if iscoroutinefunction(fn):
-            @wraps(fn, assigned=self._get_wrapper_assignments())
+            @wraps(fn, assigned=_WRAPPER_ASSIGNMENTS)
             async def do(self, *args: Any, **kwargs: Any):  # type: ignore
                 return await fn(*args, **kwargs)
 
             return do
         else:
-            @wraps(fn, assigned=self._get_wrapper_assignments())
+            @wraps(fn, assigned=_WRAPPER_ASSIGNMENTS)
             def do(self, *args: Any, **kwargs: Any):  # type: ignore
                 return fn(*args, **kwargs)
 
@@ -226,7 +270,7 @@ class FuncBasedScenarioProvider(ScenarioProvider):
         :return: A tuple of attribute names to copy from the wrapped function,
                  excluding '__name__' to preserve the wrapper's name.
         """
-        return tuple(x for x in WRAPPER_ASSIGNMENTS if x != '__name__')
+        return _WRAPPER_ASSIGNMENTS
 
     def _get_lineno(self, fn: Any, source_path: Path) -> Union[int, None]:
         """
@@ -1,6 +1,7 @@
+from contextvars import ContextVar
 from time import time
 from types import TracebackType
-from typing import Optional, Type, Union
+from typing import Optional, Tuple, Type, Union
 
 from ._step_recorder import StepRecorder, get_step_recorder
 
@@ -17,6 +18,9 @@ class Step:
 
     For function-based scenarios, this class automatically records step execution
     details (timing, name, exceptions) to a StepRecorder for deferred event processing.
+
+    The name and start time are kept in a context variable, so a single instance
+    (e.g. `given`) can be used by scenarios running concurrently in different tasks.
     """
 
     def __init__(self, *, step_recorder: Optional[StepRecorder] = None) -> None:
@@ -27,10 +31,37 @@ class Step:
                               If not provided, uses the global singleton recorder.
                               This is primarily used for function-based scenario support.
         """
-        self._name: Union[str, None] = None
-        self._started_at: Union[float, None] = None
+        self._state: ContextVar[Tuple[Union[str, None], Union[float, None]]] = ContextVar(
+            f"{self.__class__.__name__}_state", default=(None, None)
+        )
         self._step_recorder = step_recorder if (step_recorder is not None) else get_step_recorder()
 
+    @property
+    def _name(self) -> Union[str, None]:
+        """
+        Get the name of the step in the current context.
+
+        :return: The step name, or None if not set.
+        """
+        return self._state.get()[0]
+
+    @_name.setter
+    def _name(self, value: Union[str, None]) -> None:
+        self._state.set((value, self._state.get()[1]))
+
+    @property
+    def _started_at(self) -> Union[float, None]:
+        """
+        Get the start time of the step in the current context.
+
+        :return: The start timestamp, or None if the step is not entered.
+        """
+        return self._state.get()[1]
+
+    @_started_at.setter
+    def _started_at(self, value: Union[float, None]) -> None:
+        self._state.set((self._state.get()[0], value))
+
     def __enter__(self) -> None:
         """
         Enter the synchronous context manager and record the start time.
@@ -68,11 +99,11 @@ class Step:
         :return: True if no exception occurred; otherwise False.
         """
         ended_at = time()
-        self._step_recorder.record(self.__class__.__name__, self._name or "",
-                                   self._started_at or ended_at, ended_at, exc=exc_val)
+        name, started_at = self._state.get()
+        self._step_recorder.record(self.__class__.__name__, name or "",
+                                   started_at or ended_at, ended_at, exc=exc_val)
 
-        self._name = None
-        self._started_at = None
+        self._state.set((None, None))
 
         return exc_type is None
 
@@ -1,6 +1,7 @@
+from contextvars import ContextVar
 from typing import Iterator, List, Optional, Tuple, Union
 
-__all__ = ("StepRecorder", "get_step_recorder",)
+__all__ = ("StepRecorder", "ContextStepRecorder", "get_step_recorder",)
 
 RecordType = Tuple[str, str, float, float, Union[BaseException, None]]
 """
@@ -69,6 +70,48 @@ class StepRecorder:
         return len(self._records)
 
 
+class ContextStepRecorder(StepRecorder):
+    """
+    Records step executions separately for each execution context.
+
+    Records are stored in a context variable, so every asyncio task (and thread)
+    has its own list of records. Clearing the recorder starts a new list in the
+    current context only, which lets function-based scenarios run concurrently
+    without mixing up each other's steps and without any locking.
+
+    Tasks inherit the records of the context they were created in, so steps executed
+    in tasks spawned by a scenario are recorded for that scenario.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the recorder with no records in any context.
+        """
+        self._context_records: ContextVar[List[RecordType]] = ContextVar("step_records")
+
+    @property
+    def _records(self) -> List[RecordType]:  # type: ignore[override]
+        """
+        Get the records of the current context, creating them if necessary.
+
+        :return: The list of records of the current context.
+        """
+        try:
+            return self._context_records.get()
+        except LookupError:
+            records: List[RecordType] = []
+            self._context_records.set(records)
+            return records
+
+    def clear(self) -> None:
+        """
+        Start a new list of records in the current context.
+
+        Records shared with other contexts (e.g. the parent task) are left intact.
+        """
+        self._context_records.set([])
+
+
 _step_recorder = None
 
 
@@ -78,7 +121,8 @@ def get_step_recorder() -> StepRecorder:
 
     This function implements a lazy singleton pattern to provide a global
     StepRecorder instance. This is used as the default recorder when no
-    specific instance is provided.
+    specific instance is provided. The instance is a `ContextStepRecorder`,
+    so the records are local to the current task.
 
     Note: This global singleton approach is a temporary solution to avoid
     breaking changes. It will be refactored in v2 to use proper dependency
@@ -88,5 +132,5 @@ def get_step_recorder() -> StepRecorder:
     """
     global _step_recorder
     if _step_recorder is None:
-        _step_recorder = StepRecorder()
+        _step_recorder = ContextStepRecorder()
     return _step_recorder
@@ -1,5 +1,6 @@
 from ._repeater import Repeater, RepeaterExecutionInterrupted, RepeaterPlugin
+from ._runner import RepeaterScenarioRunner
 from ._scheduler import RepeaterScenarioScheduler
 
 __all__ = ("Repeater", "RepeaterPlugin", "RepeaterScenarioScheduler",
-           "RepeaterExecutionInterrupted",)
+           "RepeaterScenarioRunner", "RepeaterExecutionInterrupted",)
@@ -1,5 +1,7 @@
 import asyncio
-from typing import Any, Callable, Coroutine, Type, Union, final
+from asyncio import CancelledError
+from math import ceil
+from typing import Any, Callable, Coroutine, List, Tuple, Type, Union, final
 
 from vedro.core import ConfigType, Dispatcher, Plugin, PluginConfig, ScenarioScheduler
 from vedro.core.scenario_runner import Interrupted
@@ -10,11 +12,13 @@ from vedro.events import (
     ConfigLoadedEvent,
     ScenarioFailedEvent,
     ScenarioPassedEvent,
+    ScenarioReportedEvent,
     ScenarioRunEvent,
     ScenarioSkippedEvent,
     StartupEvent,
 )
 
+from ._runner import RepeaterScenarioRunner
 from ._scheduler import RepeaterScenarioScheduler
 
 __all__ = ("Repeater", "RepeaterPlugin", "RepeaterExecutionInterrupted",)
@@ -42,7 +46,9 @@ class RepeaterPlugin(Plugin):
 
     The RepeaterPlugin allows scenarios to be executed multiple times as configured.
     It supports delays between repetitions and can stop execution early if the
-    fail-fast-on-repeat option is enabled.
+    fail-fast-on-repeat option is enabled. Repeats of async scenarios can also run
+    concurrently (stress mode), in which case the latency distribution of the repeats
+    is added to the aggregated result.
     """
 
     def __init__(self, config: Type["Repeater"], *, sleep: SleepType = asyncio.sleep) -> None:
@@ -58,9 +64,12 @@ class RepeaterPlugin(Plugin):
         """
         super().__init__(config)
         self._scheduler_factory = config.scheduler_factory
+        self._runner_factory = config.runner_factory
+        self._interrupt_exceptions = config.interrupt_exceptions
         self._sleep = sleep
         self._repeats: int = 1
         self._repeats_delay: float = 0.0
+        self._repeats_parallel: int = 1
         self._fail_fast: bool = False
         self._global_config: Union[ConfigType, None] = None
         self._scheduler: Union[ScenarioScheduler, None] = None
@@ -85,6 +94,7 @@ class RepeaterPlugin(Plugin):
                   .listen(ScenarioSkippedEvent, self.on_scenario_execute) \
                   .listen(ScenarioPassedEvent, self.on_scenario_end) \
                   .listen(ScenarioFailedEvent, self.on_scenario_end) \
+                  .listen(ScenarioReportedEvent, self.on_scenario_reported) \
                   .listen(CleanupEvent, self.on_cleanup)
 
     def on_config_loaded(self, event: ConfigLoadedEvent) -> None:
@@ -113,6 +123,9 @@ class RepeaterPlugin(Plugin):
         group.add_argument("-N", "--repeats", type=int, default=self._repeats, help=help_message)
         group.add_argument("--repeats-delay", type=float, default=self._repeats_delay,
                            help="Delay in seconds between scenario repeats (default: 0.0s)")
+        group.add_argument("--repeats-parallel", type=int, default=self._repeats_parallel,
+                           help="Number of repeats of async scenarios to run concurrently "
+                                "(default: 1)")
         group.add_argument("--fail-fast-on-repeat", action="store_true", default=self._fail_fast,
                            help="Stop repeating scenarios after the first failure")
 
@@ -130,6 +143,7 @@ class RepeaterPlugin(Plugin):
         self._repeats = event.args.repeats
         self._repeats_delay = event.args.repeats_delay
         self._fail_fast = event.args.fail_fast_on_repeat
+        self._repeats_parallel = event.args.repeats_parallel
 
         if self._repeats < 1:
             raise ValueError("--repeats must be >= 1")
@@ -143,10 +157,31 @@ class RepeaterPlugin(Plugin):
         if self._fail_fast and (self._repeats <= 1):
             raise ValueError("--fail-fast-on-repeat must be used with --repeats > 1")
 
+        if self._repeats_parallel < 1:
+            raise ValueError("--repeats-parallel must be >= 1")
+
+        if (self._repeats_parallel > 1) and (self._repeats <= 1):
+            raise ValueError("--repeats-parallel must be used with --repeats > 1")
+
+        if (self._repeats_parallel > 1) and (self._repeats_delay > 0.0):
+            raise ValueError("--repeats-parallel can't be used with --repeats-delay")
+
         if self._is_repeating_enabled():
             assert self._global_config is not None  # for type checking
             self._global_config.Registry.ScenarioScheduler.register(self._scheduler_factory, self)
 
+        if self._is_parallel_enabled():
+            assert self._global_config is not None  # for type checking
+            global_config = self._global_config
+            self._global_config.Registry.ScenarioRunner.register(
+                lambda: self._runner_factory(
+                    global_config.Registry.Dispatcher(),
+                    concurrency=self._repeats_parallel,
+                    interrupt_exceptions=self._interrupt_exceptions,
+                ),
+                self
+            )
+
     def on_startup(self, event: StartupEvent) -> None:
         """
         Handle the startup event, storing the scenario scheduler.
@@ -205,6 +240,25 @@ class RepeaterPlugin(Plugin):
             if event.scenario_result.is_failed():
                 self._failed_count += 1
 
+    def on_scenario_reported(self, event: ScenarioReportedEvent) -> None:
+        """
+        Handle the event when a scenario is reported, adding the latency distribution.
+
+        In parallel mode, this method adds the min, median, 95th percentile and max
+        durations of the scenario executions to the aggregated result.
+
+        :param event: The ScenarioReportedEvent instance.
+        """
+        if not self._is_parallel_enabled():
+            return
+
+        aggregated_result = event.aggregated_result
+        if len(aggregated_result.scenario_results) <= 1:
+            return
+
+        durations = sorted(x.elapsed for x in aggregated_result.scenario_results)
+        aggregated_result.add_extra_details(self._format_latency(durations))
+
     def on_cleanup(self, event: CleanupEvent) -> None:
         """
         Handle the cleanup event, adding a summary of the repetition process.
@@ -229,6 +283,30 @@ class RepeaterPlugin(Plugin):
         """
         return self._repeats > 1
 
+    def _is_parallel_enabled(self) -> bool:
+        """
+        Check if repeats run concurrently.
+
+        :return: True if repetitions are enabled with concurrency, False otherwise.
+        """
+        return self._is_repeating_enabled() and (self._repeats_parallel > 1)
+
+    def _format_latency(self, durations: List[float]) -> str:
+        """
+        Format the latency distribution of scenario executions.
+
+        Percentiles are computed with the nearest-rank method.
+
+        :param durations: The sorted durations of the executions, in seconds.
+        :return: A string describing the distribution.
+        """
+        def percentile(p: int) -> float:
+            return durations[max(0, ceil(p / 100 * len(durations)) - 1)]
+
+        return (f"latency x{len(durations)}: min {durations[0]:.3f}s, "
+                f"p50 {percentile(50):.3f}s, p95 {percentile(95):.3f}s, "
+                f"max {durations[-1]:.3f}s")
+
     def _get_summary_message(self) -> str:
         """
         Generate a summary message for the repetition process.
@@ -241,6 +319,8 @@ class RepeaterPlugin(Plugin):
         message = f"repeated x{self._repeats}"
         if self._repeats_delay > 0.0:
             message += f" with delay {self._repeats_delay!r}s"
+        if self._is_parallel_enabled():
+            message += f" with concurrency {self._repeats_parallel}"
         return message
 
 
@@ -258,3 +338,15 @@ class Repeater(PluginConfig):
     """
     Scheduler that will be used to create aggregated result for repeated scenarios.
     """
+
+    runner_factory: Type[RepeaterScenarioRunner] = RepeaterScenarioRunner
+    """
+    Runner that will be used when repeats run concurrently (see `--repeats-parallel`).
+    """
+
+    interrupt_exceptions: Tuple[Type[BaseException], ...] = (
+        KeyboardInterrupt, SystemExit, CancelledError,
+    )
+    """
+    Exceptions that will interrupt scenario execution in parallel mode.
+    """
@@ -0,0 +1,164 @@
+import asyncio
+import sys
+from typing import Any, List, Optional, Tuple, Type
+
+from vedro.core import Dispatcher, Report, ScenarioScheduler, VirtualScenario
+from vedro.core.exc_info import ExcInfo
+from vedro.core.output_capturer import OutputCapturer
+from vedro.core.scenario_result import ScenarioResult
+from vedro.core.scenario_runner import MonotonicScenarioRunner, RunInterrupted, ScenarioInterrupted
+
+__all__ = ("RepeaterScenarioRunner",)
+
+
+class RepeaterScenarioRunner(MonotonicScenarioRunner):
+    """
+    Runs the repeats of async scenarios concurrently.
+
+    The first execution of a scenario runs alone, so the RepeaterPlugin can schedule
+    its repeats. The repeats that follow it in the scheduler are then run together,
+    at most `concurrency` at a time, and all executions are reported as one aggregated
+    result. Scenarios with synchronous steps, and runs that capture output by swapping
+    process-wide streams, are repeated sequentially.
+
+    Each repeat runs in its own task, so per-scenario state kept in context variables
+    (e.g., attached artifacts and `defer` queues) is isolated between concurrent repeats.
+    """
+
+    def __init__(self, dispatcher: Dispatcher, *,
+                 concurrency: int,
+                 interrupt_exceptions: Tuple[Type[BaseException], ...] = ()) -> None:
+        """
+        Initialize the RepeaterScenarioRunner.
+
+        :param dispatcher: The event dispatcher for firing execution events.
+        :param concurrency: The maximum number of repeats running at the same time.
+        :param interrupt_exceptions: Additional exception types that should interrupt execution.
+        """
+        super().__init__(dispatcher, interrupt_exceptions=interrupt_exceptions)
+        self._concurrency = concurrency
+
+    async def _run_scenarios(self,
+                             scheduler: ScenarioScheduler,
+                             report: Report,
+                             **kwargs: Any) -> None:
+        """
+        Execute all scenarios provided by the scheduler, running repeats concurrently.
+
+        :param scheduler: The scheduler providing scenarios to execute.
+        :param report: The report to add results to.
+        :param kwargs: Additional keyword arguments (e.g., output_capturer).
+        :raises RunInterrupted: If execution is interrupted by a configured exception.
+        """
+        output_capturer = self._get_output_capturer(**kwargs)
+
+        scenarios = scheduler.__aiter__()
+        scenario = await self._next_scenario(scenarios)
+        while scenario is not None:
+            scenario_results: List[ScenarioResult] = []
+            try:
+                scenario_result = await self.run_scenario(scenario,
+                                                          output_capturer=output_capturer)
+                scenario_results.append(scenario_result)
+
+                repeats, next_scenario = await self._take_repeats(scenarios, scenario)
+                await self._run_repeats(repeats, scenario_results,
+                                        output_capturer=output_capturer)
+            except self._interrupt_exceptions as e:
+                if isinstance(e, ScenarioInterrupted):
+                    scenario_results.append(e.scenario_result)
+                    exc_info = e.exc_info
+                else:
+                    exc_info = ExcInfo(*sys.exc_info())
+                if len(scenario_results) > 0:
+                    await self._report_scenario_results(scenario_results, report, scheduler)
+                raise RunInterrupted(exc_info)
+
+            await self._report_scenario_results(scenario_results, report, scheduler)
+            scenario = next_scenario
+
+    async def _next_scenario(self, scenarios: ScenarioScheduler) -> Optional[VirtualScenario]:
+        """
+        Take the next scenario from the scheduler.
+
+        :param scenarios: The scheduler being iterated.
+        :return: The next scenario, or None if the scheduler is exhausted.
+        """
+        try:
+            return await scenarios.__anext__()
+        except StopAsyncIteration:
+            return None
+
+    async def _take_repeats(self, scenarios: ScenarioScheduler, scenario: VirtualScenario
+                            ) -> Tuple[List[VirtualScenario], Optional[VirtualScenario]]:
+        """
+        Take the repeats of a scenario that directly follow it in the scheduler.
+
+        :param scenarios: The scheduler being iterated.
+        :param scenario: The scenario that has just been executed.
+        :return: A tuple of the repeats and the next different scenario (or None).
+        """
+        repeats = []
+        next_scenario = await self._next_scenario(scenarios)
+        while (next_scenario is not None) and (next_scenario.unique_id == scenario.unique_id):
+            repeats.append(next_scenario)
+            next_scenario = await self._next_scenario(scenarios)
+        return repeats, next_scenario
+
+    async def _run_repeats(self, repeats: List[VirtualScenario],
+                           scenario_results: List[ScenarioResult], *,
+                           output_capturer: OutputCapturer) -> None:
+        """
+        Execute the repeats of a scenario, concurrently when possible.
+
+        Results are appended to `scenario_results` in the order the repeats were scheduled.
+        Repeats that are already running when one of them is interrupted are allowed
+        to finish, and their results are kept.
+
+        :param repeats: The scenarios to execute.
+        :param scenario_results: The list to append the results to.
+        :param output_capturer: The output capturer for the executions.
+        :raises BaseException: The first exception raised by a repeat, if any.
+        """
+        if len(repeats) == 0:
+            return
+
+        if not self._can_run_concurrently(repeats[0], output_capturer):
+            for scenario in repeats:
+                scenario_result = await self.run_scenario(scenario,
+                                                          output_capturer=output_capturer)
+                scenario_results.append(scenario_result)
+            return
+
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def run(scenario: VirtualScenario) -> ScenarioResult:
+            async with semaphore:
+                return await self.run_scenario(scenario, output_capturer=output_capturer)
+
+        outcomes = await asyncio.gather(*(run(x) for x in repeats), return_exceptions=True)
+
+        exception: Optional[BaseException] = None
+        for outcome in outcomes:
+            if isinstance(outcome, ScenarioResult):
+                scenario_results.append(outcome)
+            elif exception is None:
+                exception = outcome
+        if exception is not None:
+            raise exception
+
+    def _can_run_concurrently(self, scenario: VirtualScenario,
+                              output_capturer: OutputCapturer) -> bool:
+        """
+        Check whether the repeats of a scenario can run concurrently.
+
+        :param scenario: The scenario to check.
+        :param output_capturer: The output capturer for the executions.
+        :return: True if all steps are coroutines and output capturing (if any)
+                 is local to the current context, False otherwise.
+        """
+        if self._concurrency <= 1:
+            return False
+        if output_capturer.enabled and (output_capturer.mode != "context"):
+            return False
+        return all(step.is_coro() for step in scenario.steps)
@@ -1,4 +1,6 @@
+from ._flakiness import FlakinessHistory, FlakinessTracker
 from ._rerunner import Rerunner, RerunnerPlugin
 from ._scheduler import RerunnerScenarioScheduler
 
-__all__ = ("Rerunner", "RerunnerPlugin", "RerunnerScenarioScheduler",)
+__all__ = ("Rerunner", "RerunnerPlugin", "RerunnerScenarioScheduler",
+           "FlakinessHistory", "FlakinessTracker",)
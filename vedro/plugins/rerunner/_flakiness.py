@@ -0,0 +1,181 @@
+from typing import Any, Dict, List, Optional
+
+__all__ = ("FlakinessHistory", "FlakinessTracker",)
+
+
+class FlakinessHistory:
+    """
+    Holds the last outcomes of a scenario as a compact bitset.
+
+    Outcomes are packed into an integer, one bit per execution (1 for a failure),
+    with the most recent outcome in the lowest bit. Only the last `capacity`
+    outcomes are kept.
+    """
+
+    def __init__(self, bits: int = 0, size: int = 0, *, capacity: int = 32) -> None:
+        """
+        Initialize the FlakinessHistory.
+
+        :param bits: The packed outcomes, the most recent one in the lowest bit.
+        :param size: The number of outcomes stored in `bits`.
+        :param capacity: The maximum number of outcomes to keep.
+        :raises ValueError: If capacity is less than 2.
+        """
+        if capacity < 2:
+            raise ValueError("'capacity' must be greater than or equal to 2")
+        self._capacity = capacity
+        self._size = max(0, min(size, capacity))
+        self._bits = bits & self._mask(self._size)
+
+    @property
+    def bits(self) -> int:
+        """
+        Get the packed outcomes.
+
+        :return: The outcomes as an integer, the most recent one in the lowest bit.
+        """
+        return self._bits
+
+    @property
+    def size(self) -> int:
+        """
+        Get the number of stored outcomes.
+
+        :return: The number of outcomes.
+        """
+        return self._size
+
+    @property
+    def failures(self) -> int:
+        """
+        Get the number of failed outcomes.
+
+        :return: The number of failures among the stored outcomes.
+        """
+        return bin(self._bits).count("1")
+
+    @property
+    def flip_rate(self) -> float:
+        """
+        Get how often consecutive outcomes differ.
+
+        A stable scenario (always passing or always failing) has a flip rate of 0.0,
+        a scenario that alternates between passing and failing has a flip rate of 1.0.
+
+        :return: The share of status changes between consecutive outcomes,
+                 or 0.0 if fewer than two outcomes are stored.
+        """
+        if self._size < 2:
+            return 0.0
+        flips = (self._bits ^ (self._bits >> 1)) & self._mask(self._size - 1)
+        return bin(flips).count("1") / (self._size - 1)
+
+    def record(self, failed: bool) -> None:
+        """
+        Record the outcome of an execution, dropping the oldest one if the history is full.
+
+        :param failed: Whether the execution failed.
+        """
+        self._size = min(self._size + 1, self._capacity)
+        self._bits = ((self._bits << 1) | int(failed)) & self._mask(self._size)
+
+    def _mask(self, size: int) -> int:
+        """
+        Build a mask for the given number of outcomes.
+
+        :param size: The number of outcomes.
+        :return: An integer with the lowest `size` bits set.
+        """
+        return (1 << size) - 1
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the FlakinessHistory.
+
+        :return: A string representation of the history, the oldest outcome first.
+        """
+        outcomes = format(self._bits, "b").zfill(self._size) if self._size else ""
+        return f"<{self.__class__.__name__} {outcomes!r} flip_rate={self.flip_rate:.2f}>"
+
+
+class FlakinessTracker:
+    """
+    Tracks the outcome history of scenarios across runs.
+
+    The history is keyed by the scenario unique id and can be dumped to
+    (and loaded from) a JSON-serializable mapping of `[bits, size]` pairs,
+    which keeps the stored state compact.
+    """
+
+    def __init__(self, *, history_size: int = 32) -> None:
+        """
+        Initialize the FlakinessTracker.
+
+        :param history_size: The number of last outcomes to keep per scenario.
+        """
+        self._history_size = history_size
+        self._histories: Dict[str, FlakinessHistory] = {}
+
+    def load(self, data: Any) -> None:
+        """
+        Load the histories from previously dumped data.
+
+        Malformed entries are ignored, so a corrupted or outdated storage
+        doesn't break the run.
+
+        :param data: The data returned by `dump`.
+        """
+        self._histories = {}
+        if not isinstance(data, dict):
+            return
+        for unique_id, entry in data.items():
+            if not (isinstance(entry, list) and len(entry) == 2):
+                continue
+            bits, size = entry
+            if isinstance(bits, int) and isinstance(size, int):
+                self._histories[unique_id] = FlakinessHistory(bits, size,
+                                                              capacity=self._history_size)
+
+    def dump(self) -> Dict[str, List[int]]:
+        """
+        Dump the histories to a JSON-serializable mapping.
+
+        :return: A mapping of scenario unique ids to `[bits, size]` pairs.
+        """
+        return {unique_id: [history.bits, history.size]
+                for unique_id, history in self._histories.items()}
+
+    def record(self, unique_id: str, failed: bool) -> None:
+        """
+        Record the outcome of a scenario execution.
+
+        :param unique_id: The unique id of the scenario.
+        :param failed: Whether the execution failed.
+        """
+        if unique_id not in self._histories:
+            self._histories[unique_id] = FlakinessHistory(capacity=self._history_size)
+        self._histories[unique_id].record(failed)
+
+    def get(self, unique_id: str) -> Optional[FlakinessHistory]:
+        """
+        Get the history of a scenario.
+
+        :param unique_id: The unique id of the scenario.
+        :return: The history, or None if the scenario has no recorded outcomes.
+        """
+        return self._histories.get(unique_id)
+
+    def is_flaky(self, unique_id: str, threshold: float) -> bool:
+        """
+        Check whether a scenario is known to be flaky.
+
+        :param unique_id: The unique id of the scenario.
+        :param threshold: The minimum flip rate of a flaky scenario.
+        :return: True if the scenario changed its status at least once and its
+                 flip rate reaches the threshold, False otherwise.
+        """
+        history = self._histories.get(unique_id)
+        if history is None:
+            return False
+        flip_rate = history.flip_rate
+        return flip_rate > 0.0 and flip_rate >= threshold
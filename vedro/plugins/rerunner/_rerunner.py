@@ -1,7 +1,8 @@
 import asyncio
-from typing import Any, Callable, Coroutine, Type, Union, final
+from typing import Set, Type, Union, final
 
 from vedro.core import ConfigType, Dispatcher, Plugin, PluginConfig, ScenarioScheduler
+from vedro.core.exp.local_storage import LocalStorageFactory, create_local_storage
 from vedro.events import (
     ArgParsedEvent,
     ArgParseEvent,
@@ -14,12 +15,11 @@ from vedro.events import (
     StartupEvent,
 )
 
-from ._scheduler import RerunnerScenarioScheduler
+from ._flakiness import FlakinessTracker
+from ._scheduler import RerunnerScenarioScheduler, SleepType
 
 __all__ = ("Rerunner", "RerunnerPlugin",)
 
-SleepType = Callable[[float], Coroutine[Any, Any, None]]
-
 
 @final
 class RerunnerPlugin(Plugin):
@@ -28,10 +28,16 @@ class RerunnerPlugin(Plugin):
 
     The RerunnerPlugin allows failed scenarios to be rerun multiple times as configured.
     It supports delays between reruns and aggregates the results to determine the final
-    outcome based on the majority of rerun attempts.
+    outcome based on the majority of rerun attempts. In deferred mode, failed scenarios
+    are rerun as a batch after the main pass instead of right after the failure.
+
+    The plugin can also track the outcome history of scenarios across runs in the local
+    storage, and rerun only the scenarios that are known to be flaky.
     """
 
-    def __init__(self, config: Type["Rerunner"], *, sleep: SleepType = asyncio.sleep) -> None:
+    def __init__(self, config: Type["Rerunner"], *,
+                 sleep: SleepType = asyncio.sleep,
+                 local_storage_factory: LocalStorageFactory = create_local_storage) -> None:
         """
         Initialize the RerunnerPlugin with the provided configuration.
 
@@ -41,12 +47,22 @@ class RerunnerPlugin(Plugin):
 
         :param config: The Rerunner configuration class.
         :param sleep: Coroutine for introducing delays (default: `asyncio.sleep`).
+        :param local_storage_factory: Factory function to create local storage
+            for the flakiness history. Defaults to `create_local_storage`.
         """
         super().__init__(config)
         self._scheduler_factory = config.scheduler_factory
         self._sleep = sleep
+        self._local_storage_factory = local_storage_factory
+        self._track_flakiness = config.track_flakiness
+        self._flaky_threshold = config.flaky_threshold
+        self._tracker = FlakinessTracker(history_size=config.flakiness_history_size)
         self._reruns: int = 0
         self._reruns_delay: float = 0.0
+        self._reruns_deferred: bool = False
+        self._reruns_flaky_only: bool = False
+        self._deferred_ids: Set[str] = set()
+        self._recorded_ids: Set[str] = set()
         self._global_config: Union[ConfigType, None] = None
         self._scheduler: Union[ScenarioScheduler, None] = None
         self._rerun_scenario_id: Union[str, None] = None
@@ -78,11 +94,13 @@ class RerunnerPlugin(Plugin):
         Handle the event when the configuration is loaded.
 
         This method stores the global configuration, which is necessary for
-        registering the custom scenario scheduler for rerunning failed scenarios.
+        registering the custom scenario scheduler for rerunning failed scenarios,
+        and initializes the local storage for the flakiness history.
 
         :param event: The ConfigLoadedEvent containing the loaded configuration.
         """
         self._global_config = event.config
+        self._local_storage = self._local_storage_factory(self, event.config.project_dir)
 
     def on_arg_parse(self, event: ArgParseEvent) -> None:
         """
@@ -99,6 +117,15 @@ class RerunnerPlugin(Plugin):
         group.add_argument("--reruns", type=int, default=self._reruns, help=help_message)
         group.add_argument("--reruns-delay", type=float, default=self._reruns_delay,
                            help="Delay in seconds between reruns (default: 0.0s)")
+        group.add_argument("--reruns-deferred", action="store_true",
+                           default=self._reruns_deferred,
+                           help=("Rerun failed scenarios as a batch after all other scenarios "
+                                 "(in parallel when run by the distributor). "
+                                 "--reruns-delay is applied once before the batch"))
+        group.add_argument("--reruns-flaky-only", action="store_true",
+                           default=self._reruns_flaky_only,
+                           help=("Rerun only scenarios that are known to be flaky "
+                                 "according to their outcome history from previous runs"))
 
     def on_arg_parsed(self, event: ArgParsedEvent) -> None:
         """
@@ -113,6 +140,8 @@ class RerunnerPlugin(Plugin):
         """
         self._reruns = event.args.reruns
         self._reruns_delay = event.args.reruns_delay
+        self._reruns_deferred = event.args.reruns_deferred
+        self._reruns_flaky_only = event.args.reruns_flaky_only
 
         if self._reruns < 0:
             raise ValueError("--reruns must be >= 0")
@@ -123,32 +152,52 @@ class RerunnerPlugin(Plugin):
         if (self._reruns_delay > 0.0) and (self._reruns < 1):
             raise ValueError("--reruns-delay must be used with --reruns > 0")
 
+        if self._reruns_deferred and (self._reruns < 1):
+            raise ValueError("--reruns-deferred must be used with --reruns > 0")
+
+        if self._reruns_flaky_only and (self._reruns < 1):
+            raise ValueError("--reruns-flaky-only must be used with --reruns > 0")
+
         if self._is_rerunning_enabled():
             assert self._global_config is not None  # for type checking
             self._global_config.Registry.ScenarioScheduler.register(self._scheduler_factory, self)
 
-    def on_startup(self, event: StartupEvent) -> None:
+    async def on_startup(self, event: StartupEvent) -> None:
         """
         Handle the startup event, storing the scenario scheduler.
 
         This method captures the scenario scheduler from the startup event,
-        enabling it to manage scheduling of rerun scenarios.
+        enabling it to manage scheduling of rerun scenarios. If flakiness tracking
+        is enabled, it also loads the outcome history from the local storage.
 
         :param event: The StartupEvent instance signaling system startup.
+        :raises TypeError: If deferred reruns are enabled, but the scheduler
+                           doesn't support them.
         """
         self._scheduler = event.scheduler
 
+        if self._is_rerunning_enabled() and self._reruns_deferred:
+            if not isinstance(self._scheduler, RerunnerScenarioScheduler):
+                raise TypeError("--reruns-deferred requires the scenario scheduler to be "
+                                f"a subclass of {RerunnerScenarioScheduler.__name__}, "
+                                f"got {type(self._scheduler).__name__}")
+            self._scheduler.set_batch_delay(self._reruns_delay, sleep=self._sleep)
+
+        if self._is_tracking_enabled():
+            self._tracker.load(await self._local_storage.get("flakiness"))
+
     async def on_scenario_execute(self,
                                   event: Union[ScenarioRunEvent, ScenarioSkippedEvent]) -> None:
         """
         Handle the event when a scenario is executed or skipped, managing reruns.
 
         This method ensures that if a scenario is rerun, a delay is applied
-        between reruns if configured.
+        between reruns if configured. Deferred reruns are delayed by the scheduler
+        once per batch instead.
 
         :param event: The ScenarioRunEvent or ScenarioSkippedEvent instance.
         """
-        if not self._is_rerunning_enabled():
+        if not self._is_rerunning_enabled() or self._reruns_deferred:
             return
 
         scenario = event.scenario_result.scenario
@@ -161,33 +210,58 @@ class RerunnerPlugin(Plugin):
         Handle the event when a scenario ends, scheduling additional reruns if necessary.
 
         This method tracks scenario results and schedules additional reruns if the
-        scenario has not been rerun the configured number of times.
+        scenario has not been rerun the configured number of times. With
+        --reruns-flaky-only, only scenarios that are flaky according to the history
+        from previous runs are rerun.
+
+        Only the first execution of a scenario is recorded in the outcome history,
+        so the history holds one outcome per run regardless of the number of reruns.
 
         :param event: The ScenarioPassedEvent or ScenarioFailedEvent instance.
         """
+        scenario = event.scenario_result.scenario
+        is_rerunnable = self._is_rerunnable(scenario.unique_id)
+        if self._is_tracking_enabled() and (scenario.unique_id not in self._recorded_ids):
+            self._recorded_ids.add(scenario.unique_id)
+            self._tracker.record(scenario.unique_id, event.scenario_result.is_failed())
+
         if not self._is_rerunning_enabled():
             return
         assert isinstance(self._scheduler, ScenarioScheduler)  # for type checking
 
-        scenario = event.scenario_result.scenario
+        if self._reruns_deferred:
+            assert isinstance(self._scheduler, RerunnerScenarioScheduler)  # for type checking
+            if (scenario.unique_id not in self._deferred_ids) and \
+               event.scenario_result.is_failed() and is_rerunnable:
+                self._deferred_ids.add(scenario.unique_id)
+                self._reran += 1
+                self._scheduler.defer(scenario, self._reruns)
+                self._times += self._reruns
+            return
+
         if scenario.unique_id != self._rerun_scenario_id:
             self._rerun_scenario_id = scenario.unique_id
 
-            if event.scenario_result.is_failed():
+            if event.scenario_result.is_failed() and is_rerunnable:
                 self._reran += 1
                 for _ in range(self._reruns):
                     self._scheduler.schedule(scenario)
                     self._times += 1
 
-    def on_cleanup(self, event: CleanupEvent) -> None:
+    async def on_cleanup(self, event: CleanupEvent) -> None:
         """
         Handle the cleanup event, adding a summary of the rerun process.
 
         This method generates a summary message detailing how many scenarios were rerun,
-        how many reruns occurred in total, and if any delays were applied.
+        how many reruns occurred in total, and if any delays were applied. If flakiness
+        tracking is enabled, the outcome history is saved to the local storage.
 
         :param event: The CleanupEvent signaling the end of execution.
         """
+        if self._is_tracking_enabled():
+            await self._local_storage.put("flakiness", self._tracker.dump())
+            await self._local_storage.flush()
+
         if not self._is_rerunning_enabled():
             return
         message = self._get_summary_message()
@@ -201,6 +275,29 @@ class RerunnerPlugin(Plugin):
         """
         return self._reruns > 0
 
+    def _is_tracking_enabled(self) -> bool:
+        """
+        Check if the outcome history of scenarios is tracked.
+
+        :return: True if tracking is enabled in the config or implied
+                 by --reruns-flaky-only, False otherwise.
+        """
+        return self._track_flakiness or self._reruns_flaky_only
+
+    def _is_rerunnable(self, unique_id: str) -> bool:
+        """
+        Check if a failed scenario can be rerun.
+
+        The decision is based on the history recorded before the current execution.
+
+        :param unique_id: The unique id of the scenario.
+        :return: True if reruns are not limited to flaky scenarios or the scenario
+                 is known to be flaky, False otherwise.
+        """
+        if not self._reruns_flaky_only:
+            return True
+        return self._tracker.is_flaky(unique_id, self._flaky_threshold)
+
     def _get_summary_message(self) -> str:
         """
         Generate a summary message for the rerun process.
@@ -215,6 +312,10 @@ class RerunnerPlugin(Plugin):
         message = f"rerun {self._reran} scenario{ss}, {self._times} time{ts}"
         if self._reruns_delay:
             message += f", with delay {self._reruns_delay!r}s"
+        if self._reruns_deferred:
+            message += ", deferred"
+        if self._reruns_flaky_only:
+            message += ", flaky only"
         return message
 
 
@@ -233,3 +334,20 @@ class Rerunner(PluginConfig):
     """
     Scheduler that will be used to create aggregated result for rerun scenarios.
     """
+
+    track_flakiness: bool = False
+    """
+    Store the outcome history of scenarios in the local storage on every run.
+    Always enabled with `--reruns-flaky-only`.
+    """
+
+    flakiness_history_size: int = 32
+    """
+    Number of last outcomes to keep per scenario.
+    """
+
+    flaky_threshold: float = 0.1
+    """
+    Minimum flip rate (the share of status changes between consecutive outcomes)
+    of a scenario to be considered flaky.
+    """
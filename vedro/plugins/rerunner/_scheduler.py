@@ -1,9 +1,18 @@
-from typing import List
+import asyncio
+from collections import OrderedDict
+from typing import Any, Callable, Coroutine, List, Tuple
 
-from vedro.core import AggregatedResult, MonotonicScenarioScheduler, ScenarioResult
+from vedro.core import (
+    AggregatedResult,
+    MonotonicScenarioScheduler,
+    ScenarioResult,
+    VirtualScenario,
+)
 
 __all__ = ("RerunnerScenarioScheduler",)
 
+SleepType = Callable[[float], Coroutine[Any, Any, None]]
+
 
 class RerunnerScenarioScheduler(MonotonicScenarioScheduler):
     """
@@ -12,8 +21,88 @@ class RerunnerScenarioScheduler(MonotonicScenarioScheduler):
     This scheduler aggregates the results of rerun scenario executions. The final
     result is determined based on the majority outcome of the reruns: if more reruns
     passed than failed, the final result will be considered passed, and vice versa.
+
+    Reruns can also be deferred: they are collected during the main pass and scheduled
+    as a single batch once all other scenarios have been taken, after an optional delay.
+    Runners hold back the results of deferred scenarios, so they are aggregated the same
+    way as inline reruns.
     """
 
+    def __init__(self, scenarios: List[VirtualScenario]) -> None:
+        """
+        Initialize the RerunnerScenarioScheduler with the provided scenarios.
+
+        :param scenarios: A list of virtual scenarios to be managed by the scheduler.
+        """
+        super().__init__(scenarios)
+        self._deferred: OrderedDict[str, Tuple[VirtualScenario, int]] = OrderedDict()
+        self._batch_delay = 0.0
+        self._sleep: SleepType = asyncio.sleep
+
+    def set_batch_delay(self, delay: float, *, sleep: SleepType = asyncio.sleep) -> None:
+        """
+        Set the delay before the batch of deferred reruns starts.
+
+        :param delay: The delay in seconds, applied once per batch.
+        :param sleep: Coroutine for introducing the delay (default: `asyncio.sleep`).
+        """
+        self._batch_delay = delay
+        self._sleep = sleep
+
+    def defer(self, scenario: VirtualScenario, times: int = 1) -> None:
+        """
+        Schedule a scenario to be rerun in the deferred batch.
+
+        :param scenario: The virtual scenario to rerun.
+        :param times: How many times to rerun the scenario.
+        """
+        if times < 1:
+            return
+        _, deferred = self._deferred.get(scenario.unique_id, (scenario, 0))
+        self._deferred[scenario.unique_id] = (scenario, deferred + times)
+
+    def has_pending(self, scenario: VirtualScenario) -> bool:
+        """
+        Check whether the scenario is queued or waiting in the deferred batch.
+
+        :param scenario: The virtual scenario to check.
+        :return: True if the scenario will run (again) later, False otherwise.
+        """
+        return (scenario.unique_id in self._deferred) or (scenario.unique_id in self._queue)
+
+    def ignore(self, scenario: VirtualScenario) -> None:
+        """
+        Remove a scenario from the scheduler, including its deferred reruns.
+
+        :param scenario: The virtual scenario to be ignored.
+        """
+        super().ignore(scenario)
+        self._deferred.pop(scenario.unique_id, None)
+
+    async def __anext__(self) -> VirtualScenario:
+        """
+        Retrieve the next scenario, starting the deferred batch when the queue is empty.
+
+        :return: The next virtual scenario to be executed.
+        :raises StopAsyncIteration: If no more scenarios are available.
+        """
+        try:
+            return await super().__anext__()
+        except StopAsyncIteration:
+            if len(self._deferred) == 0:
+                raise
+
+        if self._batch_delay > 0.0:
+            await self._sleep(self._batch_delay)
+
+        # The queue is consumed from its end, so the batch is added in reverse order
+        # to rerun scenarios in the order they failed
+        deferred, self._deferred = self._deferred, OrderedDict()
+        for scenario, times in reversed(deferred.values()):
+            for _ in range(times):
+                self.schedule(scenario)
+        return await super().__anext__()
+
     def aggregate_results(self, scenario_results: List[ScenarioResult]) -> AggregatedResult:
         """
         Aggregate results from rerun scenario executions into a single result.
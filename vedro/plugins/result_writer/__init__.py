@@ -0,0 +1,12 @@
+from ._recorded_scenario import RecordedScenario
+from ._result_writer import ResultWriter, ResultWriterPlugin
+from ._results_file import (
+    RESULTS_FORMAT,
+    RESULTS_VERSION,
+    ResultsFileReader,
+    ResultsFileWriter,
+    ScenarioRecord,
+)
+
+__all__ = ("ResultWriter", "ResultWriterPlugin", "RecordedScenario", "ResultsFileWriter",
+           "ResultsFileReader", "ScenarioRecord", "RESULTS_FORMAT", "RESULTS_VERSION",)
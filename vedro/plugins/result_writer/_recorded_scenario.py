@@ -0,0 +1,174 @@
+from pathlib import Path
+from typing import Any, Dict, Optional, Type, Union, cast
+
+from niltype import Nil
+
+from vedro._scenario import Scenario
+from vedro._tags import TagsType
+from vedro.core import VirtualScenario
+from vedro.core._virtual_scenario import ScenarioInitError
+
+__all__ = ("RecordedScenario",)
+
+
+class RecordedScenario(VirtualScenario):
+    """
+    Represents a scenario restored from a results file.
+
+    Scenarios of a results file may no longer exist (or may not be importable)
+    when the file is read, so a recorded scenario only keeps the attributes that
+    describe the scenario in reports. It can't be run.
+    """
+
+    def __init__(self, data: Dict[str, Any], *, project_dir: Path) -> None:
+        """
+        Initialize the RecordedScenario.
+
+        :param data: The dictionary produced by `serialize`.
+        :param project_dir: The project directory path.
+        """
+        super().__init__(cast(Type[Scenario], None), [], project_dir=project_dir)
+        self._data = data
+        self._path = self._project_dir / data["rel_path"]
+        if data["is_skipped"]:
+            self.skip(data["skip_reason"])
+
+    @staticmethod
+    def serialize(scenario: VirtualScenario) -> Dict[str, Any]:
+        """
+        Serialize the attributes that describe a scenario in reports.
+
+        :param scenario: The virtual scenario to serialize.
+        :return: A JSON-compatible dictionary.
+        """
+        return {
+            "unique_id": scenario.unique_id,
+            "name": scenario.name,
+            "subject": scenario.subject,
+            "rel_path": scenario.rel_path.as_posix(),
+            "lineno": scenario.lineno,
+            "template_index": scenario.template_index,
+            "template_total": scenario.template_total,
+            "is_skipped": scenario.is_skipped(),
+            "skip_reason": scenario.skip_reason,
+        }
+
+    @property
+    def doc(self) -> Optional[str]:
+        """
+        Get the docstring of the scenario, which is not recorded.
+
+        :return: None.
+        """
+        return None
+
+    @property
+    def unique_id(self) -> str:
+        """
+        Get the recorded unique identifier of the scenario.
+
+        :return: A string representing the unique ID of the scenario.
+        """
+        return cast(str, self._data["unique_id"])
+
+    @property
+    def template_index(self) -> Union[int, None]:
+        """
+        Get the recorded template index of the scenario.
+
+        :return: An integer representing the template index, or None if not applicable.
+        """
+        return cast(Union[int, None], self._data["template_index"])
+
+    @property
+    def template_total(self) -> Union[int, None]:
+        """
+        Get the recorded total number of scenarios in the templated scenario.
+
+        :return: An integer representing the total number of scenarios, or None if not applicable.
+        """
+        return cast(Union[int, None], self._data["template_total"])
+
+    @property
+    def template_args(self) -> None:
+        """
+        Get the bound arguments of the templated scenario, which are not recorded.
+
+        :return: None.
+        """
+        return None
+
+    @property
+    def rel_path(self) -> Path:
+        """
+        Get the recorded relative path to the scenario file.
+
+        :return: A Path object representing the relative path to the scenario file.
+        """
+        return Path(self._data["rel_path"])
+
+    @property
+    def name(self) -> str:
+        """
+        Get the recorded name of the scenario.
+
+        :return: A string representing the name of the scenario.
+        """
+        return cast(str, self._data["name"])
+
+    @property
+    def subject(self) -> str:
+        """
+        Get the recorded subject of the scenario.
+
+        :return: A string representing the subject of the scenario.
+        """
+        return cast(str, self._data["subject"])
+
+    @property
+    def lineno(self) -> Union[int, None]:
+        """
+        Get the recorded line number where the scenario class is defined.
+
+        :return: An integer representing the line number, or None if not available.
+        """
+        return cast(Union[int, None], self._data["lineno"])
+
+    @property
+    def tags(self) -> TagsType:
+        """
+        Get the tags of the scenario, which are not recorded.
+
+        :return: An empty tuple.
+        """
+        return ()
+
+    def set_meta(self, key: str, value: Any, **kwargs: Any) -> None:
+        """
+        Ignore metadata, recorded scenarios have no scenario class to keep it.
+
+        :param key: The metadata key.
+        :param value: The metadata value.
+        :param kwargs: Additional keyword arguments (plugin, fallback_key).
+        """
+        pass
+
+    def get_meta(self, key: str, *, default: Any = Nil, **kwargs: Any) -> Any:  # type: ignore
+        """
+        Get metadata of the scenario, which is never recorded.
+
+        :param key: The metadata key.
+        :param default: The value to return. Defaults to Nil.
+        :param kwargs: Additional keyword arguments (plugin, fallback_key).
+        :return: The default value.
+        """
+        return default
+
+    def __call__(self) -> Scenario:
+        """
+        Refuse to initialize the scenario, recorded scenarios can't be run.
+
+        :raises ScenarioInitError: Always.
+        """
+        raise ScenarioInitError(f'Can\'t initialize recorded scenario "{self.subject}" '
+                                f'at "{self.rel_path}"')
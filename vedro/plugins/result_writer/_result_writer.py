@@ -0,0 +1,113 @@
+from pathlib import Path
+from typing import Type, Union, final
+
+from vedro.core import Dispatcher, Plugin, PluginConfig
+from vedro.events import (
+    ArgParsedEvent,
+    ArgParseEvent,
+    CleanupEvent,
+    ScenarioReportedEvent,
+    StartupEvent,
+)
+
+from ._results_file import ResultsFileWriter
+
+__all__ = ("ResultWriter", "ResultWriterPlugin",)
+
+
+@final
+class ResultWriterPlugin(Plugin):
+    """
+    Plugin to save the results of a run to a results file.
+
+    Results files of several runs (e.g. of CI jobs running `--slice 1/N` … `N/N`)
+    can be merged into a single report with `vedro report merge`.
+    """
+
+    def __init__(self, config: Type["ResultWriter"]) -> None:
+        """
+        Initialize the ResultWriterPlugin with the provided configuration.
+
+        :param config: The ResultWriter configuration class.
+        """
+        super().__init__(config)
+        self._results_path: Union[Path, None] = None
+        self._writer: Union[ResultsFileWriter, None] = None
+
+    def subscribe(self, dispatcher: Dispatcher) -> None:
+        """
+        Subscribe to Vedro events to save results.
+
+        :param dispatcher: The dispatcher to listen to events.
+        """
+        dispatcher.listen(ArgParseEvent, self.on_arg_parse) \
+                  .listen(ArgParsedEvent, self.on_arg_parsed) \
+                  .listen(StartupEvent, self.on_startup) \
+                  .listen(ScenarioReportedEvent, self.on_scenario_reported) \
+                  .listen(CleanupEvent, self.on_cleanup)
+
+    def on_arg_parse(self, event: ArgParseEvent) -> None:
+        """
+        Add the command-line argument for the results file.
+
+        :param event: The ArgParseEvent instance used to add arguments.
+        """
+        group = event.arg_parser.add_argument_group("Result Writer")
+        group.add_argument("--save-results", type=Path, default=None, metavar="PATH",
+                           help="Save results to PATH to merge them later "
+                                "with `vedro report merge`")
+
+    def on_arg_parsed(self, event: ArgParsedEvent) -> None:
+        """
+        Store the path of the results file.
+
+        :param event: The ArgParsedEvent instance containing parsed arguments.
+        """
+        self._results_path = event.args.save_results
+
+    def on_startup(self, event: StartupEvent) -> None:
+        """
+        Start writing the results file.
+
+        :param event: The StartupEvent instance.
+        """
+        if self._results_path is None:
+            return
+        self._writer = ResultsFileWriter(self._results_path)
+        self._writer.open()
+
+    def on_scenario_reported(self, event: ScenarioReportedEvent) -> None:
+        """
+        Write the result of a reported scenario.
+
+        Results are written as they are reported, so they are not kept in memory.
+
+        :param event: The ScenarioReportedEvent instance containing the aggregated result.
+        """
+        if self._writer is not None:
+            self._writer.write_result(event.aggregated_result)
+
+    def on_cleanup(self, event: CleanupEvent) -> None:
+        """
+        Finish the results file with the report totals.
+
+        :param event: The CleanupEvent instance containing the report.
+        """
+        if self._writer is None:
+            return
+        self._writer.close(event.report)
+        self._writer = None
+
+
+class ResultWriter(PluginConfig):
+    """
+    Configuration for the ResultWriterPlugin.
+
+    Example:
+        $ vedro run --slice 1/2 --save-results results/1.jsonl
+        $ vedro run --slice 2/2 --save-results results/2.jsonl
+        $ vedro report merge results/1.jsonl results/2.jsonl
+    """
+
+    plugin = ResultWriterPlugin
+    description = "Saves run results to a file that can be merged with other runs"
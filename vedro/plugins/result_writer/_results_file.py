@@ -0,0 +1,209 @@
+import json
+import os
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional, Union
+
+from vedro.core import Report
+from vedro.core.scenario_result import AggregatedResult, ScenarioResultSerializer
+
+from ._recorded_scenario import RecordedScenario
+
+__all__ = ("ResultsFileWriter", "ResultsFileReader", "ScenarioRecord",
+           "RESULTS_FORMAT", "RESULTS_VERSION",)
+
+RESULTS_FORMAT = "vedro-results"
+RESULTS_VERSION = 1
+
+RecordType = Dict[str, Any]
+
+
+class ScenarioRecord:
+    """
+    Represents the recorded results of one scenario, as read from a results file.
+
+    The scenario results are kept serialized, so they can be replayed as events.
+    """
+
+    def __init__(self, scenario: RecordedScenario,
+                 scenario_results: List[RecordType], main_index: int) -> None:
+        """
+        Initialize the ScenarioRecord.
+
+        :param scenario: The recorded scenario.
+        :param scenario_results: The serialized results of each execution of the scenario.
+        :param main_index: The index of the result the aggregated result was based on.
+        """
+        self.scenario = scenario
+        self.scenario_results = scenario_results
+        self.main_index = main_index
+
+
+class ResultsFileWriter:
+    """
+    Writes run results to a results file, one scenario at a time.
+
+    A results file is a JSON Lines file: a header record, a record for each reported
+    scenario and a final report record. Records are written to a temporary file that
+    replaces the results file when the writer is closed, so a results file is
+    always complete.
+    """
+
+    def __init__(self, path: Path, *,
+                 serializer: Optional[ScenarioResultSerializer] = None) -> None:
+        """
+        Initialize the ResultsFileWriter.
+
+        :param path: The path of the results file.
+        :param serializer: The serializer used to serialize scenario results.
+        """
+        self._path = path
+        self._tmp_path = path.with_name(f".{path.name}.tmp")
+        self._serializer = serializer or ScenarioResultSerializer()
+        self._file: Union[IO[str], None] = None
+
+    @property
+    def path(self) -> Path:
+        """
+        Get the path of the results file.
+
+        :return: The path of the results file.
+        """
+        return self._path
+
+    def open(self) -> None:
+        """
+        Create the temporary file and write the header record.
+        """
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self._tmp_path.open("w", encoding="utf-8")
+        self._write({"type": "header", "format": RESULTS_FORMAT, "version": RESULTS_VERSION})
+
+    def write_result(self, aggregated_result: AggregatedResult) -> None:
+        """
+        Write a scenario record.
+
+        :param aggregated_result: The aggregated result of the scenario.
+        """
+        scenario_results = aggregated_result.scenario_results
+        self._write({
+            "type": "scenario",
+            "scenario": RecordedScenario.serialize(aggregated_result.scenario),
+            "main": self._get_main_index(aggregated_result),
+            "scenario_results": [self._serializer.serialize(x) for x in scenario_results],
+        })
+
+    def close(self, report: Report) -> None:
+        """
+        Write the report record and replace the results file with the temporary file.
+
+        :param report: The report of the run.
+        """
+        self._write({
+            "type": "report",
+            "started_at": report.started_at,
+            "ended_at": report.ended_at,
+            "total": report.total,
+            "passed": report.passed,
+            "failed": report.failed,
+            "skipped": report.skipped,
+            "interrupted": self._serializer.serialize_exc_info(report.interrupted),
+        })
+        assert self._file is not None  # for type checking
+        self._file.close()
+        self._file = None
+        os.replace(self._tmp_path, self._path)
+
+    def _write(self, record: RecordType) -> None:
+        """
+        Write a record as a line of JSON.
+
+        :param record: The record to write.
+        """
+        assert self._file is not None  # for type checking
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def _get_main_index(self, aggregated_result: AggregatedResult) -> int:
+        """
+        Find the result the aggregated result was based on.
+
+        :param aggregated_result: The aggregated result.
+        :return: The index of the result in `scenario_results`.
+        """
+        for index, scenario_result in enumerate(aggregated_result.scenario_results):
+            if (scenario_result.status == aggregated_result.status) and \
+               (scenario_result.step_results == aggregated_result.step_results):
+                return index
+        return 0
+
+
+class ResultsFileReader:
+    """
+    Reads a results file written by ResultsFileWriter, one record at a time.
+
+    Records are read lazily, so reading doesn't depend on the size of the file.
+    The report record is available once all scenario records have been read.
+    """
+
+    def __init__(self, path: Path, *, project_dir: Path) -> None:
+        """
+        Initialize the ResultsFileReader.
+
+        :param path: The path of the results file.
+        :param project_dir: The project directory, used to resolve scenario paths.
+        """
+        self._path = path
+        self._project_dir = project_dir
+        self._report: Union[RecordType, None] = None
+
+    @property
+    def report(self) -> Union[RecordType, None]:
+        """
+        Get the report record, which is read after all scenario records.
+
+        :return: The report record, or None if the scenarios haven't been read yet.
+        """
+        return self._report
+
+    def __iter__(self) -> Iterator[ScenarioRecord]:
+        """
+        Iterate over the scenario records of the file.
+
+        :return: An iterator over the scenario records.
+        :raises ValueError: If the file is not a results file of a supported version,
+                            or if it is incomplete.
+        """
+        self._report = None
+        with self._path.open("r", encoding="utf-8") as file:
+            header = self._read_record(file.readline())
+            if (header.get("type") != "header") or (header.get("format") != RESULTS_FORMAT):
+                raise ValueError(f"'{self._path}' is not a results file")
+            if header.get("version") != RESULTS_VERSION:
+                raise ValueError(f"Unsupported results file version {header.get('version')!r} "
+                                 f"in '{self._path}' (expected {RESULTS_VERSION})")
+
+            for line in file:
+                record = self._read_record(line)
+                if record["type"] == "scenario":
+                    scenario = RecordedScenario(record["scenario"], project_dir=self._project_dir)
+                    yield ScenarioRecord(scenario, record["scenario_results"], record["main"])
+                elif record["type"] == "report":
+                    self._report = record
+
+        if self._report is None:
+            raise ValueError(f"Results file '{self._path}' is incomplete (no report record)")
+
+    def _read_record(self, line: str) -> RecordType:
+        """
+        Parse a line of the file.
+
+        :param line: The line to parse.
+        :return: The record.
+        :raises ValueError: If the line is not a JSON object.
+        """
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        if not isinstance(record, dict):
+            raise ValueError(f"Malformed record in results file '{self._path}': {line[:80]!r}")
+        return record
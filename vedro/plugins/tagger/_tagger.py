@@ -5,10 +5,25 @@ from vedro.core import Dispatcher, Plugin, PluginConfig, VirtualScenario
 from vedro.events import ArgParsedEvent, ArgParseEvent, StartupEvent
 
 from ._tag_matcher import TagMatcher
-from .logic_tag_matcher import LogicTagMatcher
 
 __all__ = ("Tagger", "TaggerPlugin",)
 
+TagMatcherFactory = Callable[[str], TagMatcher]
+
+
+def create_logic_tag_matcher(expr: str) -> TagMatcher:
+    """
+    Create a `LogicTagMatcher` for the given tag expression.
+
+    The matcher module (and pyparsing) is imported on first call, so that importing
+    the plugin doesn't slow down the startup of every vedro command.
+
+    :param expr: The tag expression to match scenarios against.
+    :return: A LogicTagMatcher instance.
+    """
+    from .logic_tag_matcher import LogicTagMatcher
+    return LogicTagMatcher(expr)
+
 
 @final
 class TaggerPlugin(Plugin):
@@ -22,13 +37,13 @@ class TaggerPlugin(Plugin):
     """
 
     def __init__(self, config: Type["Tagger"], *,
-                 tag_matcher_factory: Callable[[str], TagMatcher] = LogicTagMatcher) -> None:
+                 tag_matcher_factory: TagMatcherFactory = create_logic_tag_matcher) -> None:
         """
         Initialize the TaggerPlugin with a configuration and a tag matcher factory.
 
         :param config: The configuration class for the TaggerPlugin.
         :param tag_matcher_factory: A callable that creates a TagMatcher instance given a tag
-                                    expression. Defaults to `LogicTagMatcher`.
+                                    expression. Defaults to creating a `LogicTagMatcher`.
         """
         super().__init__(config)
         self._matcher_factory = tag_matcher_factory